@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from rest_framework.routers import DefaultRouter
 
-from .viewsets import CategoryViewSet, ProductViewSet
+from .viewsets import CatalogSyncViewSet, CategoryViewSet, ProductViewSet
 
 
 router = DefaultRouter()
 
 router.register(r'products', ProductViewSet, basename='products')
 router.register(r'categories', CategoryViewSet, basename='categories')
+router.register(r'catalog', CatalogSyncViewSet, basename='catalog')
 
 urlpatterns = router.urls
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+from django.http import HttpRequest
+from rest_framework import status
+
+from contrib.clean_architecture.interfaces import RequestDTO
+from contrib.clean_architecture.utils.method import clean_method
+from contrib.exceptions.utils import responses_from_exceptions
+from contrib.localization.services import gettext_lazy as _
 from contrib.module_manager import Depend
-from contrib.clean_architecture.views.bases import CleanViewSet, RetrieveCleanViewSetMixin, SearchCleanViewSetMixin
+from contrib.clean_architecture.views.bases import (
+    AutocompleteCleanViewSetMixin,
+    CleanViewSet,
+    RetrieveCleanViewSetMixin,
+    SearchCleanViewSetMixin,
+)
 
-from catalog.application.controllers import CategoryController, ProductController
-from catalog.application.boundaries.dtos.category import CategoryInfoDTO
-from catalog.application.boundaries.dtos.product import ProductSearchDTO, ProductInfoDTO
+from catalog.application.controllers import CatalogSyncController, CategoryController, ProductController
+from catalog.application.boundaries.dtos.category import CategoryFilterDTO, CategoryInfoDTO
+from catalog.application.boundaries.dtos.sync import CatalogSyncDTO, CatalogSyncQueryDTO
+from catalog.application.boundaries.dtos.product import (
+    ProductAutocompleteDTO,
+    ProductAutocompleteQueryDTO,
+    ProductInfoDTO,
+    ProductSearchDTO,
+)
 
 
 class CategoryViewSet(RetrieveCleanViewSetMixin, CleanViewSet, injects=("catalog",)):
@@ -14,12 +32,14 @@ class CategoryViewSet(RetrieveCleanViewSetMixin, CleanViewSet, injects=("catalog
     permission_classes = []
 
     retrieve_paginated = False
+    retrieve_request_model = CategoryFilterDTO
     retrieve_return_type = CategoryInfoDTO
     retrieve_return_pagination_type = CategoryInfoDTO.paginated
     retrieve_controller_extra_kwargs = {"is_active": True}
+    retrieve_coalesce = True
 
 
-class ProductViewSet(SearchCleanViewSetMixin, CleanViewSet, injects=("catalog",)):
+class ProductViewSet(AutocompleteCleanViewSetMixin, SearchCleanViewSetMixin, CleanViewSet, injects=("catalog",)):
 
     controller: Depend[ProductController]
     permission_classes = []
@@ -29,3 +49,43 @@ class ProductViewSet(SearchCleanViewSetMixin, CleanViewSet, injects=("catalog",)
     search_return_pagination_type = ProductInfoDTO.paginated
     search_request_model = ProductSearchDTO
     search_controller_extra_kwargs = {"is_active": True}
+    search_coalesce = True
+
+    autocomplete_return_type = ProductAutocompleteDTO
+    autocomplete_request_model = ProductAutocompleteQueryDTO
+    autocomplete_controller_extra_kwargs = {"is_active": True}
+
+
+class CatalogSyncViewSet(CleanViewSet, injects=("catalog",)):
+    """Синхронизация каталога: изменения после версии, известной клиенту."""
+
+    controller: Depend[CatalogSyncController]
+    permission_classes = []
+
+    sync_methods = ["get"]
+    sync_permissions = ()
+    sync_url_path = None
+    sync_url_name = None
+    sync_request_model = CatalogSyncQueryDTO
+    sync_response_schema = CatalogSyncDTO
+    sync_responses = responses_from_exceptions()
+    sync_status_map = {"GET": status.HTTP_200_OK}
+    sync_description = _("Изменения каталога после версии: добавленные и измененные записи, ID удаленных")
+    sync_summary = None
+    sync_tags = None
+
+    @classmethod
+    def get_sync_url_path(cls):
+        if cls.sync_url_path is not None:
+            return cls.sync_url_path
+        return f"{cls.get_path_prefix()}/sync"
+
+    @classmethod
+    def get_sync_url_name(cls):
+        if cls.sync_url_name is not None:
+            return cls.sync_url_name
+        return f"{cls.get_snake_view_name_by_class()}-sync"
+
+    @clean_method(name="sync")
+    def sync_action(self, request: HttpRequest, payload: RequestDTO, *args, **kwargs):
+        return self.controller.sync(**payload.model_dump(exclude_none=True))
@@ -1,8 +1,15 @@
 __all__ = [
+    "CatalogSyncDTO",
+    "CatalogSyncQueryDTO",
+    "CategoryFilterDTO",
     "CategoryInfoDTO",
+    "ProductAutocompleteDTO",
+    "ProductAutocompleteQueryDTO",
     "ProductInfoDTO",
     "ProductSearchDTO",
+    "ProductSyncDTO",
 ]
 
-from .category import CategoryInfoDTO
-from .product import ProductInfoDTO, ProductSearchDTO
+from .category import CategoryFilterDTO, CategoryInfoDTO
+from .product import ProductAutocompleteDTO, ProductAutocompleteQueryDTO, ProductInfoDTO, ProductSearchDTO
+from .sync import CatalogSyncDTO, CatalogSyncQueryDTO, ProductSyncDTO
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+from pydantic import Field
+
 from contrib.mixins.pydantic_model import IdMixin, NameMixin
+from contrib.pydantic.model import FilterQueryDTO
+
+from django.utils.translation import gettext as _
+
+from .product import ProductInfoDTO
+
+
+class CategoryFilterDTO(FilterQueryDTO):
+    with_products_count: bool = Field(title=_("Добавить количество активных товаров"), default=False)
+    products_limit: int = Field(title=_("Количество товаров в каждой категории"), default=0, ge=0, le=20)
 
 
-class CategoryInfoDTO(IdMixin, NameMixin, response_model=True):
-    ...
+class CategoryInfoDTO(IdMixin, NameMixin, response_model=True, with_paginated=True):
+    products_count: int | None = Field(title=_("Количество активных товаров"), default=None)
+    products: list[ProductInfoDTO] | None = Field(title=_("Первые активные товары"), default=None)
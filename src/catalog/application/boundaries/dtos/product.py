@@ -7,15 +7,27 @@ from contrib.mixins.pydantic_model import IdMixin, NameMixin, DescriptionMixin
 
 from django.utils.translation import gettext as _
 
-from contrib.pydantic.model import SearchQueryDTO
+from contrib.pydantic.model import AutocompleteQueryDTO, SearchQueryDTO
 
 
 class ProductSearchDTO(SearchQueryDTO):
     category_id: int | None = Field(title=_("ID категории"), default=None)
 
 
+class ProductAutocompleteQueryDTO(AutocompleteQueryDTO):
+    category_id: int | None = Field(title=_("ID категории"), default=None)
+
+
+class ProductAutocompleteDTO(IdMixin, NameMixin, response_model=True):
+    ...
+
+
 class ProductInfoDTO(IdMixin, NameMixin, DescriptionMixin, response_model=True, with_paginated=True):
 
     price: Decimal = Field(title=_("Цена"))
     currency: str = Field(title=_("Валюта"), default="RUB")
     image_url: str = Field(title=_("Изображение URL"))
+    image_variants: dict[str, dict[str, str]] = Field(
+        title=_("URL вариантов изображения по форматам и ширинам"), default_factory=dict
+    )
+    image_srcset: dict[str, str] = Field(title=_("srcset изображения по форматам"), default_factory=dict)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from contrib.pydantic.model import PydanticModel
+
+from django.utils.translation import gettext as _
+
+from .category import CategoryInfoDTO
+from .product import ProductInfoDTO
+
+
+class CatalogSyncQueryDTO(PydanticModel, request_model=True):
+    version: int = Field(title=_("Версия каталога на клиенте"), default=0, ge=0)
+    limit: int = Field(title=_("Количество изменений в пачке"), default=500, ge=1, le=1000)
+
+
+class ProductSyncDTO(ProductInfoDTO):
+    category_id: int | None = Field(title=_("ID категории"), default=None)
+
+
+class CatalogSyncDTO(PydanticModel, response_model=True):
+    version: int = Field(title=_("Версия каталога после применения изменений"))
+    has_more: bool = Field(title=_("Есть ли еще изменения"), default=False)
+    categories: list[CategoryInfoDTO] = Field(title=_("Добавленные и измененные категории"), default_factory=list)
+    products: list[ProductSyncDTO] = Field(title=_("Добавленные и измененные товары"), default_factory=list)
+    deleted_categories: list[int] = Field(title=_("ID удаленных категорий"), default_factory=list)
+    deleted_products: list[int] = Field(title=_("ID удаленных товаров"), default_factory=list)
@@ -1,7 +1,9 @@
 __all__ = [
+    "ICatalogChangeRepository",
     "ICategoryRepository",
     "IProductRepository",
 ]
 
+from .change import ICatalogChangeRepository
 from .category import ICategoryRepository
 from .product import IProductRepository
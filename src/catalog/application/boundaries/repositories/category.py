@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from abc import ABC
+from abc import ABC, abstractmethod
+from typing import Any
 
+from contrib.clean_architecture.interfaces import DTO, Entity
 from contrib.clean_architecture.providers.repositories.interfaces import (
     IRepository,
     IRetrieveRepositoryMixin,
@@ -10,3 +12,29 @@ from contrib.clean_architecture.providers.repositories.interfaces import (
 
 class ICategoryRepository(IRetrieveRepositoryMixin, IRepository, ABC):
     """Репозиторий категория."""
+
+    @abstractmethod
+    def retrieve_with_products(
+        self,
+        *conditions: Any,
+        limit: int = None,
+        offset: int = None,
+        order_by: tuple[str] = (),
+        products_limit: int = 0,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[Entity | DTO]:
+        """Возвращает категории с количеством активных товаров и первыми products_limit активными товарами
+
+        Args:
+            *conditions: Условия фильтрации
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            products_limit: Количество товаров в каждой категории. 0 - без товаров
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность Entity или DTO
+        """
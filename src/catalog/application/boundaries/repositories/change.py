@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from abc import ABC
+
+from contrib.clean_architecture.providers.repositories.interfaces import (
+    IRepository,
+    IRetrieveRepositoryMixin,
+)
+
+
+class ICatalogChangeRepository(IRetrieveRepositoryMixin, IRepository, ABC):
+    """Репозиторий изменений каталога."""
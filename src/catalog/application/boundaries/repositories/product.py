@@ -4,9 +4,9 @@ from abc import ABC
 
 from contrib.clean_architecture.providers.repositories.interfaces import (
     IRepository,
-    ISearchRepositoryMixin, IRetrieveRepositoryMixin,
+    ISearchRepositoryMixin, IRetrieveRepositoryMixin, IAutocompleteRepositoryMixin,
 )
 
 
-class IProductRepository(ISearchRepositoryMixin, IRetrieveRepositoryMixin, IRepository, ABC):
+class IProductRepository(IAutocompleteRepositoryMixin, ISearchRepositoryMixin, IRetrieveRepositoryMixin, IRepository, ABC):
     """Репозиторий товара."""
@@ -1,7 +1,9 @@
 __all__ = [
+    "CatalogSyncController",
     "CategoryController",
     "ProductController",
 ]
 
 from catalog.application.controllers.category import CategoryController
 from catalog.application.controllers.product import ProductController
+from catalog.application.controllers.sync import CatalogSyncController
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from catalog.application.interactors import ProductInteractor
-from contrib.clean_architecture.providers.controllers.bases import Controller, SearchControllerMixin
+from contrib.clean_architecture.providers.controllers.bases import (
+    AutocompleteControllerMixin,
+    Controller,
+    SearchControllerMixin,
+)
 from contrib.module_manager import Depend
 
 
-class ProductController(SearchControllerMixin, Controller):
+class ProductController(AutocompleteControllerMixin, SearchControllerMixin, Controller):
     interactor: Depend[ProductInteractor]
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from catalog.application.boundaries.dtos import CatalogSyncDTO
+from catalog.application.interactors import CatalogSyncInteractor
+from contrib.clean_architecture.providers.controllers.bases import Controller
+from contrib.clean_architecture.utils.method import clean_method
+from contrib.module_manager import Depend
+
+
+class CatalogSyncController(Controller):
+    interactor: Depend[CatalogSyncInteractor]
+
+    @clean_method(name="sync")
+    def sync(self, *, version: int = 0, limit: int = 500) -> CatalogSyncDTO:
+        """Возвращает изменения каталога после версии version
+
+        Args:
+            version: Версия каталога на клиенте
+            limit: Максимальное количество изменений в ответе
+
+        Returns:
+            Пачка изменений и новая версия каталога
+        """
+        return self.interactor.sync(version=version, limit=limit)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contrib.images.services import get_srcset, get_variants_urls
 from contrib.pydantic.model import PydanticModel, NestedEntity
 
 from django.conf import settings
@@ -8,6 +9,14 @@ from django.conf import settings
 class CategoryEntity(PydanticModel, proxy_model=True):
     """Категория."""
 
+    @property
+    def products(self) -> list[ProductEntity] | None:
+        """Первые активные товары категории, если они были запрошены."""
+        products = getattr(self.original_object, "active_products", None)
+        if products is None:
+            return None
+        return [ProductEntity.model_validate(product, from_attributes=True) for product in products]
+
 
 class ProductEntity(PydanticModel, proxy_model=True):
     """Товар."""
@@ -17,3 +26,22 @@ class ProductEntity(PydanticModel, proxy_model=True):
     @property
     def image_url(self) -> str:
         return f"{settings.PROJECT_URL}{self.image.url}" if self.image else ""
+
+    @property
+    def image_variants(self) -> dict[str, dict[str, str]]:
+        """URL вариантов изображения вида {формат: {ширина: url}}."""
+        if not self.image:
+            return {}
+        image_variants = self.original_object.image_variants or {}
+        if image_variants.get("source") != self.image.name:
+            return {}
+        return get_variants_urls(image_variants, lambda name: f"{settings.PROJECT_URL}{self.image.storage.url(name)}")
+
+    @property
+    def image_srcset(self) -> dict[str, str]:
+        """Значения srcset для каждого формата."""
+        return get_srcset(self.image_variants)
+
+
+class CatalogChangeEntity(PydanticModel, proxy_model=True):
+    """Изменение каталога."""
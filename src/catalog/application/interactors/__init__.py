@@ -1,7 +1,9 @@
 __all__ = [
+    "CatalogSyncInteractor",
     "CategoryInteractor",
     "ProductInteractor",
 ]
 
 from .category import CategoryInteractor
 from .product import ProductInteractor
+from .sync import CatalogSyncInteractor
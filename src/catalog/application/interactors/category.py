@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from contrib.clean_architecture.consts import CleanMethods
+from contrib.clean_architecture.interfaces import DTO
 from contrib.clean_architecture.providers.interactors.bases import Interactor, RetrieveInteractorMixin
+from contrib.clean_architecture.providers.interactors.utils import bind_return_type, coalesce
+from contrib.clean_architecture.utils.method import clean_method
+from contrib.pydantic.model import PaginatedModel
 
 from contrib.module_manager import Depend
 
@@ -10,3 +15,63 @@ from catalog.application.boundaries.repositories import ICategoryRepository
 class CategoryInteractor(RetrieveInteractorMixin, Interactor):
 
     repository: Depend[ICategoryRepository]
+
+    @bind_return_type(paginated=True)
+    @coalesce
+    @clean_method(name=CleanMethods.RETRIEVE)
+    def retrieve(
+        self,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: tuple[str] = (),
+        paginated: bool = None,
+        return_type: type[DTO] = None,
+        return_pagination_type: type[PaginatedModel] = None,
+        filter_dto: DTO = None,
+        with_products_count: bool = False,
+        products_limit: int = 0,
+        **filters,
+    ) -> list[DTO] | PaginatedModel:
+        """Возвращает категории, при необходимости с количеством активных товаров и первыми товарами
+
+        Args:
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            paginated: Нужна ли пагинация
+            return_type: DTO экземпляр которого нужно вернуть
+            return_pagination_type: DTO с пагинацией экземпляр которого нужно вернуть
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            with_products_count: Добавить количество активных товаров
+            products_limit: Количество активных товаров в каждой категории
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность DTO удовлетворяющих запросу
+        """
+        if not with_products_count and not products_limit:
+            return super().retrieve(
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+                paginated=paginated,
+                return_type=return_type,
+                return_pagination_type=return_pagination_type,
+                filter_dto=filter_dto,
+                **filters,
+            )
+
+        results = self.repository.with_dto(return_type).retrieve_with_products(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            products_limit=products_limit,
+            filter_dto=filter_dto,
+            **filters,
+        )
+        if not paginated:
+            return results
+
+        count = self.repository.count(filter_dto=filter_dto, **filters)
+        return return_pagination_type.create(results, count, limit, offset)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from contrib.clean_architecture.providers.interactors.bases import Interactor, SearchInteractorMixin
+from contrib.clean_architecture.providers.interactors.bases import (
+    AutocompleteInteractorMixin,
+    Interactor,
+    SearchInteractorMixin,
+)
 
 from contrib.module_manager import Depend
 
 from catalog.application.boundaries.repositories import IProductRepository
 
 
-class ProductInteractor(SearchInteractorMixin, Interactor):
+class ProductInteractor(AutocompleteInteractorMixin, SearchInteractorMixin, Interactor):
 
     repository: Depend[IProductRepository]
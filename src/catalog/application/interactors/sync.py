@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from contrib.clean_architecture.providers.interactors.bases import Interactor
+from contrib.clean_architecture.utils.method import clean_method
+
+from contrib.module_manager import Depend
+
+from catalog.application.boundaries.dtos import CatalogSyncDTO, CategoryInfoDTO, ProductSyncDTO
+from catalog.application.boundaries.repositories import (
+    ICatalogChangeRepository,
+    ICategoryRepository,
+    IProductRepository,
+)
+
+
+class CatalogSyncInteractor(Interactor):
+    """Синхронизация каталога по ленте изменений.
+
+    Клиент хранит версию каталога и запрашивает изменения после нее. В ответе - актуальные активные
+    объекты и ID объектов, которые нужно удалить локально (удаленные и ставшие неактивными).
+    Версии выдаются в порядке фиксации транзакций (см. record_catalog_changes), поэтому изменение,
+    зафиксированное позже, всегда получает версию больше уже отданной клиенту.
+    """
+
+    repository: Depend[ICatalogChangeRepository]
+    category_repository: Depend[ICategoryRepository]
+    product_repository: Depend[IProductRepository]
+
+    @clean_method(name="sync")
+    def sync(self, *, version: int = 0, limit: int = 500) -> CatalogSyncDTO:
+        """Возвращает изменения каталога после версии version
+
+        Args:
+            version: Версия каталога на клиенте
+            limit: Максимальное количество изменений в ответе
+
+        Returns:
+            Пачка изменений и новая версия каталога
+        """
+        changes = self.repository.retrieve(id__gt=version, limit=limit + 1, order_by=("id",))
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        if not changes:
+            return CatalogSyncDTO(version=version)
+
+        changed_ids: dict[str, set[int]] = {"category": set(), "product": set()}
+        for change in changes:
+            changed_ids[change.entity].add(change.object_id)
+
+        categories = self._get_active(self.category_repository, CategoryInfoDTO, changed_ids["category"])
+        products = self._get_active(self.product_repository, ProductSyncDTO, changed_ids["product"])
+
+        return CatalogSyncDTO(
+            version=changes[-1].id,
+            has_more=has_more,
+            categories=categories,
+            products=products,
+            deleted_categories=sorted(changed_ids["category"] - {category.id for category in categories}),
+            deleted_products=sorted(changed_ids["product"] - {product.id for product in products}),
+        )
+
+    @staticmethod
+    def _get_active(repository, return_type, ids: set[int]) -> list:
+        """Возвращает активные объекты по ID. Отсутствующие в результате ID считаются удаленными"""
+        if not ids:
+            return []
+        return repository.with_dto(return_type).retrieve(id__in=ids, is_active=True, order_by=("id",))
@@ -8,4 +8,6 @@ class CatalogConfig(AppConfig):
     name = 'catalog'
 
     def ready(self):
+        from . import signals  # noqa: F401
+
         load_modules([app.name for app in apps.get_app_configs()])
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable
+
+from django.db import connections
+from django.db import router
+from django.db import transaction
+
+from catalog.models import CatalogChange
+
+CHANGES_LOCK_KEY = zlib.crc32(b"catalog_change")
+"""Ключ advisory-блокировки записи ленты изменений (PostgreSQL)"""
+
+
+def _lock_changes(using: str) -> None:
+    """Блокирует запись ленты изменений до конца транзакции.
+
+    Клиент запрашивает изменения с id больше своей версии, поэтому id должны выдаваться в порядке
+    фиксации транзакций: иначе изменение, зафиксированное позже изменения с большим id, клиент пропустит.
+    Пока транзакция держит блокировку, другие транзакции не получают id изменений.
+    SQLite не требует блокировки: запись в нем и так последовательна.
+    """
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [CHANGES_LOCK_KEY])
+
+
+def record_catalog_changes(entity: str, object_ids: Iterable[int], deleted: bool = False, using: str = None) -> None:
+    """Записывает изменения объектов каталога в ленту изменений.
+
+    Предыдущие изменения объектов удаляются: клиенту нужна только последняя версия.
+    Блокировка ленты держится до конца внешней транзакции, поэтому транзакции, изменяющие каталог,
+    фиксируют изменения по очереди.
+
+    Args:
+        entity: Сущность (CatalogChange.Entities)
+        object_ids: ID объектов
+        deleted: Объекты удалены
+        using: Алиас БД
+    """
+    object_ids = sorted(set(object_ids))
+    if not object_ids:
+        return
+
+    using = using or router.db_for_write(CatalogChange)
+    changes = CatalogChange.objects.using(using)
+    with transaction.atomic(using=using):
+        _lock_changes(using)
+        changes.filter(entity=entity, object_id__in=object_ids).delete()
+        changes.bulk_create(
+            [CatalogChange(entity=entity, object_id=object_id, deleted=deleted) for object_id in object_ids]
+        )
+
+
+def record_catalog_change(entity: str, object_id: int, deleted: bool = False, using: str = None) -> None:
+    """Записывает изменение объекта каталога в ленту изменений.
+
+    Args:
+        entity: Сущность (CatalogChange.Entities)
+        object_id: ID объекта
+        deleted: Объект удален
+        using: Алиас БД
+    """
+    record_catalog_changes(entity, [object_id], deleted=deleted, using=using)
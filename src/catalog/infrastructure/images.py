@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from contrib.images.services import build_image_variants
+
+from catalog.infrastructure.changes import record_catalog_change
+from catalog.models import CatalogChange, Product
+
+
+def generate_product_image_variants(product_id: int, force: bool = False) -> bool:
+    """Генерирует варианты изображения товара.
+
+    Args:
+        product_id: ID товара
+        force: Перегенерировать, даже если варианты для текущего изображения уже есть
+
+    Returns:
+        Были ли сгенерированы варианты
+    """
+    product = Product.objects.filter(pk=product_id).only("id", "image", "image_variants").first()
+    if not product or not product.image:
+        return False
+    if not force and product.image_variants.get("source") == product.image.name:
+        return False
+
+    image_variants = build_image_variants(
+        product.image,
+        product.image.storage,
+        widths=Product.IMAGE_VARIANTS_WIDTHS,
+        formats=Product.IMAGE_VARIANTS_FORMATS,
+    )
+
+    # Обновляем только если изображение не сменилось за время генерации
+    updated = Product.objects.filter(pk=product_id, image=product.image.name).update(image_variants=image_variants)
+    if updated:
+        # update() не отправляет сигналы, поэтому изменение для синхронизации записываем явно
+        record_catalog_change(CatalogChange.Entities.PRODUCT, product_id)
+    return bool(updated)
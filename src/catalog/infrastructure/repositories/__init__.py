@@ -1,7 +1,9 @@
 __all__ = [
+    "CatalogChangeRepository",
     "ProductRepository",
     "CategoryRepository",
 ]
 
+from catalog.infrastructure.repositories.change import CatalogChangeRepository
 from catalog.infrastructure.repositories.category import CategoryRepository
 from catalog.infrastructure.repositories.product import ProductRepository
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from typing import Any
+
+from django.db.models import Count, F, Prefetch, Q, Window
+from django.db.models.functions import RowNumber
+
 from catalog.application.boundaries.repositories import ICategoryRepository
+from contrib.clean_architecture.interfaces import DTO, Entity
 from contrib.clean_architecture.providers.repositories.bases import RetrieveRepositoryMixin
 from contrib.clean_architecture.providers.repositories.django.bases import DjangoRepository
+from contrib.clean_architecture.providers.repositories.utils import get_query_page
+from contrib.clean_architecture.utils.method import clean_method
 
-from catalog.models import Category
+from catalog.models import Category, Product
 from catalog.application.domain.entities import CategoryEntity
 
 
@@ -13,3 +21,32 @@ class CategoryRepository(ICategoryRepository, RetrieveRepositoryMixin, DjangoRep
 
     entity = CategoryEntity
     model = Category
+
+    retrieve_with_products_convert_return = True
+
+    @clean_method(name="retrieve_with_products")
+    def retrieve_with_products(
+        self,
+        *conditions: Any,
+        limit: int = None,
+        offset: int = None,
+        order_by: tuple[str] = (),
+        products_limit: int = 0,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[Entity | DTO]:
+        # Количество активных товаров считается в том же запросе, что и категории
+        objects = self._filter(*conditions, filter_dto=filter_dto, **filters).annotate(
+            products_count=Count("product", filter=Q(product__is_active=True)),
+        )
+        if products_limit:
+            # Первые products_limit товаров каждой категории одним запросом через оконную функцию
+            products = (
+                Product.objects.filter(is_active=True)
+                .annotate(category_row_number=Window(RowNumber(), partition_by=F("category_id"), order_by=F("id").asc()))
+                .filter(category_row_number__lte=products_limit)
+                .order_by("category_id", "id")
+            )
+            objects = objects.prefetch_related(Prefetch("product_set", queryset=products, to_attr="active_products"))
+
+        return get_query_page(objects, limit, offset, self._match_order_by_fields(order_by))
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from catalog.application.boundaries.repositories import ICatalogChangeRepository
+from contrib.clean_architecture.providers.repositories.bases import RetrieveRepositoryMixin
+from contrib.clean_architecture.providers.repositories.django.bases import DjangoRepository
+
+from catalog.models import CatalogChange
+from catalog.application.domain.entities import CatalogChangeEntity
+
+
+class CatalogChangeRepository(ICatalogChangeRepository, RetrieveRepositoryMixin, DjangoRepository):
+    """Репозиторий изменений каталога."""
+
+    entity = CatalogChangeEntity
+    model = CatalogChange
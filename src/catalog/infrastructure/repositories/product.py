@@ -1,17 +1,28 @@
 from __future__ import annotations
 
 from catalog.application.boundaries.repositories import IProductRepository
-from contrib.clean_architecture.providers.repositories.bases import SearchRepositoryMixin, RetrieveRepositoryMixin
+from contrib.clean_architecture.providers.repositories.bases import (
+    AutocompleteRepositoryMixin,
+    SearchRepositoryMixin,
+    RetrieveRepositoryMixin,
+)
 from contrib.clean_architecture.providers.repositories.django.bases import DjangoRepository
 
 from catalog.models import Product
 from catalog.application.domain.entities import ProductEntity
 
 
-class ProductRepository(IProductRepository, RetrieveRepositoryMixin, SearchRepositoryMixin, DjangoRepository):
+class ProductRepository(
+    IProductRepository,
+    RetrieveRepositoryMixin,
+    SearchRepositoryMixin,
+    AutocompleteRepositoryMixin,
+    DjangoRepository,
+):
     """Репозиторий товара."""
 
     entity = ProductEntity
     model = Product
 
     search_expressions = ["name", "description"]
+    autocomplete_expressions = ["name"]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from catalog.infrastructure.images import generate_product_image_variants
+from catalog.models import Product
+
+
+class Command(BaseCommand):
+    help = "Генерирует варианты изображений (размеры, WebP) для существующих товаров"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ids", nargs="*", type=int, help="ID товаров. По умолчанию все товары с изображением")
+        parser.add_argument("--force", action="store_true", help="Перегенерировать существующие варианты")
+
+    def handle(self, *args, ids: list[int] | None = None, force: bool = False, **options):
+        products = Product.objects.exclude(image="")
+        if ids:
+            products = products.filter(pk__in=ids)
+
+        generated = failed = 0
+        for product_id in products.values_list("id", flat=True).iterator(chunk_size=500):
+            try:
+                generated += generate_product_image_variants(product_id, force=force)
+            except Exception as error:
+                failed += 1
+                self.stderr.write(f"Product {product_id}: {error}")
+
+        self.stdout.write(self.style.SUCCESS(f"Generated: {generated}, failed: {failed}"))
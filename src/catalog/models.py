@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from django.utils.translation import gettext_lazy as l_
 
@@ -21,6 +23,9 @@ class Category(NameMixin, IsActiveMixin):
 class Product(NameMixin, DescriptionMixin, IsActiveMixin):
     """Товар."""
 
+    IMAGE_VARIANTS_WIDTHS = (80, 160, 320, 640)
+    IMAGE_VARIANTS_FORMATS = ("webp", "jpeg")
+
     id: int
 
     category = models.ForeignKey(
@@ -35,6 +40,12 @@ class Product(NameMixin, DescriptionMixin, IsActiveMixin):
         verbose_name=l_("Изображение"),
         upload_to='product'
     )
+    image_variants = models.JSONField(
+        verbose_name=l_("Варианты изображения"),
+        default=dict,
+        blank=True,
+        editable=False,
+    )
     price = models.DecimalField(
         verbose_name=l_("Цена"),
         max_digits=12,
@@ -44,6 +55,51 @@ class Product(NameMixin, DescriptionMixin, IsActiveMixin):
     class Meta:
         verbose_name = l_("Товар")
         verbose_name_plural = l_("Товары")
+        indexes = [
+            # Индекс для поиска по префиксу (name__istartswith) в автодополнении
+            models.Index(OpClass(Upper("name"), name="text_pattern_ops"), name="catalog_product_prefix_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
+
+
+class CatalogChange(models.Model):
+    """Изменение каталога.
+
+    id записи - версия изменения. На каждый объект хранится только последнее изменение,
+    поэтому размер таблицы пропорционален размеру каталога, а не количеству правок.
+    """
+
+    class Entities(models.TextChoices):
+        CATEGORY = "category", l_("Категория")
+        PRODUCT = "product", l_("Товар")
+
+    id: int
+
+    entity = models.CharField(
+        verbose_name=l_("Сущность"),
+        max_length=16,
+        choices=Entities.choices,
+    )
+    object_id = models.BigIntegerField(
+        verbose_name=l_("ID объекта"),
+    )
+    deleted = models.BooleanField(
+        verbose_name=l_("Удален"),
+        default=False,
+    )
+    changed_at = models.DateTimeField(
+        verbose_name=l_("Дата изменения"),
+        auto_now=True,
+    )
+
+    class Meta:
+        verbose_name = l_("Изменение каталога")
+        verbose_name_plural = l_("Изменения каталога")
+        indexes = [
+            models.Index(fields=["entity", "object_id"], name="catalog_change_object_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.entity}:{self.object_id} ({self.id})"
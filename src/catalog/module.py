@@ -12,26 +12,33 @@ class CatalogModule(AppModule):
         # Контроллеры
         controllers.CategoryController,
         controllers.ProductController,
+        controllers.CatalogSyncController,
         # Интеракторы
         interactors.ProductInteractor,
         interactors.CategoryInteractor,
+        interactors.CatalogSyncInteractor,
         # Репозитории
         repositories.ProductRepository,
         repositories.CategoryRepository,
+        repositories.CatalogChangeRepository,
     ]
     providers = [
         # Контроллеры
         controllers.CategoryController,
         controllers.ProductController,
+        controllers.CatalogSyncController,
         # Интеракторы
         interactors.ProductInteractor,
         interactors.CategoryInteractor,
+        interactors.CatalogSyncInteractor,
         # Репозитории
         repositories.ProductRepository,
         repositories.CategoryRepository,
+        repositories.CatalogChangeRepository,
     ]
     mapping = {
         # Репозитории
         repositories_interfaces.IProductRepository: repositories.ProductRepository,
         repositories_interfaces.ICategoryRepository: repositories.CategoryRepository,
+        repositories_interfaces.ICatalogChangeRepository: repositories.CatalogChangeRepository,
     }
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from contrib.clean_architecture.providers.repositories.django.signals import records_saved
+from contrib.django.background import run_in_background_on_commit
+from contrib.module_manager import get_app_module
+
+from .infrastructure.changes import record_catalog_change
+from .infrastructure.changes import record_catalog_changes
+from .models import CatalogChange, Category, Product
+
+CHANGES_ENTITIES = {
+    Category: CatalogChange.Entities.CATEGORY,
+    Product: CatalogChange.Entities.PRODUCT,
+}
+
+
+@receiver(post_save, sender=Product, dispatch_uid="catalog_product_image_variants")
+def schedule_product_image_variants(sender, instance: Product, raw: bool = False, **kwargs):
+    """Ставит в фон генерацию вариантов изображения, если изображение товара изменилось."""
+    if raw or not instance.image:
+        return
+    if (instance.image_variants or {}).get("source") == instance.image.name:
+        return
+
+    from .infrastructure.images import generate_product_image_variants
+
+    run_in_background_on_commit(generate_product_image_variants, instance.pk, using=kwargs.get("using"))
+
+
+@receiver(post_save, sender=Category, dispatch_uid="catalog_category_change_saved")
+@receiver(post_save, sender=Product, dispatch_uid="catalog_product_change_saved")
+def record_saved_change(sender, instance: Category | Product, raw: bool = False, **kwargs):
+    """Записывает изменение категории или товара (в том числе смену is_active) в ленту изменений."""
+    if raw:
+        return
+    record_catalog_change(CHANGES_ENTITIES[sender], instance.pk, using=kwargs.get("using"))
+
+
+@receiver(records_saved, sender=Category, dispatch_uid="catalog_category_changes_saved")
+@receiver(records_saved, sender=Product, dispatch_uid="catalog_product_changes_saved")
+def record_bulk_saved_changes(sender, pks: list[int], using: str = None, **kwargs):
+    """Записывает в ленту изменений записи, сохраненные массовыми методами репозитория (без post_save)."""
+    record_catalog_changes(CHANGES_ENTITIES[sender], pks, using=using)
+
+
+@receiver(post_delete, sender=Category, dispatch_uid="catalog_category_change_deleted")
+@receiver(post_delete, sender=Product, dispatch_uid="catalog_product_change_deleted")
+def record_deleted_change(sender, instance: Category | Product, **kwargs):
+    """Записывает удаление категории или товара в ленту изменений."""
+    record_catalog_change(CHANGES_ENTITIES[sender], instance.pk, deleted=True, using=kwargs.get("using"))
+
+
+def _clear_product_autocomplete_cache():
+    from .application.interactors import ProductInteractor
+
+    get_app_module("catalog").get_service_instance(ProductInteractor).clear_autocomplete_cache()
+
+
+@receiver(post_save, sender=Product, dispatch_uid="catalog_product_autocomplete_saved")
+@receiver(post_delete, sender=Product, dispatch_uid="catalog_product_autocomplete_deleted")
+@receiver(records_saved, sender=Product, dispatch_uid="catalog_product_autocomplete_bulk_saved")
+def clear_product_autocomplete_cache(sender, using: str = None, **kwargs):
+    """Очищает кэш автодополнения товаров процесса после фиксации изменения товаров."""
+    transaction.on_commit(_clear_product_autocomplete_cache, using=using)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from catalog.application.boundaries.dtos.category import CategoryInfoDTO
+from catalog.application.interactors import CategoryInteractor
+from catalog.models import Category, Product
+from contrib.module_manager import get_app_module
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(name="interactor")
+def get_interactor() -> CategoryInteractor:
+    return get_app_module("catalog").get_service_instance(CategoryInteractor)
+
+
+@pytest.fixture(name="categories")
+def get_categories() -> list[Category]:
+    categories = [Category.objects.create(name=f"Категория {index}") for index in range(3)]
+    for category, (active, inactive) in zip(categories, ((3, 1), (1, 2), (0, 0))):
+        for index in range(active + inactive):
+            Product.objects.create(
+                name=f"{category.name} товар {index}",
+                category=category,
+                price=100,
+                is_active=index < active,
+            )
+    return categories
+
+
+def retrieve(interactor: CategoryInteractor, **kwargs):
+    return interactor.retrieve(
+        return_type=CategoryInfoDTO,
+        return_pagination_type=CategoryInfoDTO.paginated,
+        order_by=("id",),
+        **kwargs,
+    )
+
+
+class TestCategoryRetrieve:
+    def test_products_count(self, interactor, categories):
+        """Количество активных товаров считается в запросе категорий"""
+        with CaptureQueriesContext(connection) as queries:
+            results = retrieve(interactor, paginated=False, with_products_count=True)
+
+        assert len(queries) == 1
+        assert [result.products_count for result in results] == [3, 1, 0]
+        assert all(result.products is None for result in results)
+
+    def test_products_limit(self, interactor, categories):
+        """Первые активные товары всех категорий загружаются одним запросом"""
+        with CaptureQueriesContext(connection) as queries:
+            results = retrieve(interactor, paginated=False, products_limit=2)
+
+        assert len(queries) == 2
+        assert [len(result.products) for result in results] == [2, 1, 0]
+        assert [product.name for product in results[0].products] == ["Категория 0 товар 0", "Категория 0 товар 1"]
+
+    def test_paginated(self, interactor, categories):
+        """Пагинация считает общее количество отдельным запросом"""
+        with CaptureQueriesContext(connection) as queries:
+            result = retrieve(interactor, paginated=True, limit=2, with_products_count=True, products_limit=1)
+
+        assert len(queries) == 3
+        assert result.count == 3
+        assert [item.products_count for item in result.results] == [3, 1]
+        assert [len(item.products) for item in result.results] == [1, 1]
+
+    def test_without_products(self, interactor, categories):
+        """Без параметров товаров используется базовый retrieve"""
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(
+                type(interactor.repository),
+                "retrieve_with_products",
+                lambda *args, **kwargs: pytest.fail("retrieve_with_products called"),
+            )
+            results = retrieve(interactor, paginated=False)
+
+        assert [result.id for result in results] == [category.id for category in categories]
+        assert all(result.products_count is None and result.products is None for result in results)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+from unittest import mock
+
+import pytest
+from django.core.files.base import ContentFile
+from PIL import Image
+
+from contrib.images.services import build_image_variants
+
+from catalog.infrastructure.images import generate_product_image_variants
+from catalog.models import CatalogChange, Product
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def media_root(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+def create_product(name: str = "pizza.png") -> Product:
+    output = io.BytesIO()
+    Image.new("RGB", (400, 200), (255, 0, 0)).save(output, format="PNG")
+    product = Product(name="Пицца", price=100)
+    product.image.save(name, ContentFile(output.getvalue()))
+    return product
+
+
+class TestGenerateProductImageVariants:
+    def test_generate(self):
+        """Варианты генерируются для текущего изображения, изменение записывается в ленту"""
+        product = create_product()
+
+        assert generate_product_image_variants(product.pk)
+
+        product.refresh_from_db()
+        assert product.image_variants["source"] == product.image.name
+        assert set(product.image_variants["variants"]["webp"]) == {"80", "160", "320", "400"}
+        assert CatalogChange.objects.filter(entity=CatalogChange.Entities.PRODUCT, object_id=product.pk).exists()
+
+    def test_skip_generated(self):
+        """Варианты текущего изображения не генерируются повторно без force"""
+        product = create_product()
+        generate_product_image_variants(product.pk)
+
+        with mock.patch("catalog.infrastructure.images.build_image_variants") as build:
+            assert not generate_product_image_variants(product.pk)
+            build.assert_not_called()
+
+    def test_image_changed(self):
+        """Варианты не сохраняются, если изображение сменилось за время генерации"""
+        product = create_product()
+
+        def build_and_change_image(*args, **kwargs):
+            result = build_image_variants(*args, **kwargs)
+            Product.objects.filter(pk=product.pk).update(image="product/other.png")
+            return result
+
+        with mock.patch("catalog.infrastructure.images.build_image_variants", side_effect=build_and_change_image):
+            assert not generate_product_image_variants(product.pk)
+
+        product.refresh_from_db()
+        assert product.image_variants == {}
+
+    def test_without_image(self):
+        """Товар без изображения пропускается"""
+        product = Product.objects.create(name="Пицца", price=100)
+
+        assert not generate_product_image_variants(product.pk)
@@ -4,6 +4,7 @@ Classes:
     CleanMethods: Названия методов базовых миксинов модуля
     ViewActionAttrs: Названия основных атрибутов представления
     ReturnTypeAttrs: Типы возвращаемых DTO
+    CoalesceAttrs: Названия атрибутов объединения одновременных одинаковых вызовов
     RepositoryMethodAttrs: Названия основных атрибутов методов репозиториев
 
 """
@@ -22,19 +23,44 @@ class CleanMethods:
     DETAIL_BY_PK = "detail_by_pk"
     DETAIL_BY_EXTERNAL_CODE = "detail_by_external_code"
     RETRIEVE = "retrieve"
+    ITERATE = "iterate"
     SEARCH = "search"
     COUNT = "count"
     SEARCH_COUNT = "search_count"
+    AUTOCOMPLETE = "autocomplete"
     EXISTS = "exists"
+    EXPORT = "export"
     EXPORT_XLS = "export_xls"
+    EXPORT_CSV = "export_csv"
+    EXPORT_JOB = "export_job"
+    EXPORT_FILE = "export_file"
     BULK_CREATE = "bulk_create"
     BULK_DELETE = "bulk_delete"
     BULK_UPDATE = "bulk_update"
+    BULK_UPSERT = "bulk_upsert"
     PATCH_LIST = "patch_list"
     MULTI_UPDATE = "multi_update"
     GET_SOLO = "get_solo"
 
 
+WRITE_CLEAN_METHODS = frozenset(
+    (
+        CleanMethods.CREATE,
+        CleanMethods.UPDATE,
+        CleanMethods.UPDATE_OR_CREATE,
+        CleanMethods.DETAIL_OR_CREATE,
+        CleanMethods.DELETE,
+        CleanMethods.BULK_CREATE,
+        CleanMethods.BULK_DELETE,
+        CleanMethods.BULK_UPDATE,
+        CleanMethods.BULK_UPSERT,
+        CleanMethods.PATCH_LIST,
+        CleanMethods.MULTI_UPDATE,
+    )
+)
+"""Названия методов, изменяющих записи"""
+
+
 class ViewActionAttrs:
     """Названия основных атрибутов представления"""
 
@@ -51,6 +77,10 @@ class ViewActionAttrs:
     TAGS = "tags"
     EXTRA_KWARGS = "extra_kwargs"
     DECORATORS = "decorators"
+    MAX_CONCURRENCY = "max_concurrency"
+    SHARED_MAX_CONCURRENCY = "shared_max_concurrency"
+    QUEUE_TIMEOUT = "queue_timeout"
+    RETRY_AFTER = "retry_after"
 
 
 class ReturnTypeAttrs:
@@ -59,6 +89,17 @@ class ReturnTypeAttrs:
     RETURN_TYPE = "return_type"
     RETURN_DETAIL_TYPE = "return_detail_type"
     RETURN_PAGINATION_TYPE = "return_pagination_type"
+    RETURN_TYPES_SOURCE = "return_types_source"
+    """Ключ контекста с объектом (представлением), из атрибутов которого читаются типы"""
+
+
+class CoalesceAttrs:
+    """Названия атрибутов объединения одновременных одинаковых вызовов"""
+
+    COALESCE = "coalesce"
+    """Объединять одновременные одинаковые вызовы метода в рамках процесса"""
+    COALESCE_SHARED_TIMEOUT = "coalesce_shared_timeout"
+    """Время блокировки в общем кэше, объединяющей вызовы разных процессов. None - не объединять"""
 
 
 class RepositoryMethodAttrs:
@@ -8,7 +8,12 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Mapping
+from copy import copy
+from typing import Any
+from typing import ClassVar
 from typing import Self
 
 from contrib.clean_architecture.dto_based_objects.dtos import MatchedRelation
@@ -33,6 +38,9 @@ class BaseDTOBasedObjectsMixin(RequiredAttrsMixin, IDTOBasedObjectsMixin, ABC):
     sequence_classes = ()
     manager_attr = "objects"
 
+    _relations_plans: ClassVar[dict[tuple[type, type[Model], type[DTO]], Relations]] = {}
+    """Собранные relations по классу, модели ORM и DTO"""
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -49,6 +57,16 @@ class BaseDTOBasedObjectsMixin(RequiredAttrsMixin, IDTOBasedObjectsMixin, ABC):
         self._extra_select_related = {}
         self._extra_prefetch_related = {}
 
+    def copy_with_dto_context(self) -> Self:
+        instance = copy(self)
+        instance._models_managers_attrs = dict(self._models_managers_attrs)
+        instance._models_dtos = dict(self._models_dtos)
+        instance._models_dtos_related = dict(self._models_dtos_related)
+        # Наборы дополнительных relations дополняются на месте, поэтому копируются
+        instance._extra_select_related = {key: set(value) for key, value in self._extra_select_related.items()}
+        instance._extra_prefetch_related = {key: set(value) for key, value in self._extra_prefetch_related.items()}
+        return instance
+
     def with_dto(
         self,
         dto: type[DTO],
@@ -99,7 +117,7 @@ class BaseDTOBasedObjectsMixin(RequiredAttrsMixin, IDTOBasedObjectsMixin, ABC):
         # Собираем relations для всех моделей и dto
         for model, dto in self._models_dtos.items():
             if (model, dto) not in self._models_dtos_related:
-                relations = self._collect_relations(model, dto)
+                relations = self.get_relations_plan(model, dto)
                 relations.select_related |= self._extra_select_related.get((model, dto), set())
                 relations.prefetch_related |= self._extra_prefetch_related.get((model, dto), set())
                 self._models_dtos_related[(model, dto)] = relations
@@ -192,6 +210,28 @@ class BaseDTOBasedObjectsMixin(RequiredAttrsMixin, IDTOBasedObjectsMixin, ABC):
                 )
             )
 
+    @classmethod
+    def get_relations_plan(cls, model: type[Model], dto: type[DTO]) -> Relations:
+        """Возвращает select_related и prefetch_related для модели ORM и DTO
+
+        Notes:
+            Relations собираются один раз для класса, модели и DTO (в том числе при прогреве перед fork воркеров).
+            Возвращается копия, так как `with_dto` дополняет ее extra relations
+
+        Args:
+            model: Модель ORM
+            dto: Целевое DTO
+
+        Returns:
+            Relations
+        """
+        key = (cls, model, dto)
+        if key not in cls._relations_plans:
+            cls._relations_plans[key] = cls._collect_relations(model, dto)
+
+        plan = cls._relations_plans[key]
+        return Relations(select_related=set(plan.select_related), prefetch_related=set(plan.prefetch_related))
+
     @classmethod
     def _collect_relations(cls, model: type[Model], dto: type[DTO]):
         """Рекурсивно собирает select_related и prefetch_related
@@ -210,6 +250,9 @@ class BaseDTOBasedObjectsMixin(RequiredAttrsMixin, IDTOBasedObjectsMixin, ABC):
 
         return relations
 
+    def convert_many(self, objects: Iterable[Any], convert: Callable[[Any], Any]) -> list[Any]:
+        return [convert(instance) for instance in objects]
+
     def get_objects(self, model: type[Model]) -> Manager:
         base_manager = self._get_base_manager(model)
 
@@ -4,30 +4,42 @@ Classes:
     DjangoDTOBasedObjectsMixin: Миксин для django для автоматического присоединения зависимостей для запроса в бд на основании DTO и Model
     DjangoM2MManager: Класс для управления зависимостями m2m
 
+Notes:
+    При конвертации списка записей связи, не сопоставленные с DTO, подгружаются пачкой (RelationBatchLoader)
+
 """
 from __future__ import annotations
 
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Any
 from typing import TYPE_CHECKING
 
 from contrib.clean_architecture.dto_based_objects.bases import BaseDTOBasedObjectsMixin
+from contrib.clean_architecture.dto_based_objects.django.loaders import RelationBatchLoader
 from contrib.clean_architecture.dto_based_objects.dtos import MatchedRelation
 from contrib.clean_architecture.dto_based_objects.enums import RelatedTypes
 from contrib.clean_architecture.interfaces import IM2MManager
 from contrib.pydantic.model import PydanticModel
+from django.db import router
+from django.db.models import ManyToManyRel
 from django.db.models import Model
 from django.db.models import Prefetch
+from django.db.models import Q
 from django.db.models import QuerySet
 from django.db.models.fields.related_descriptors import ForwardManyToOneDescriptor
 from django.db.models.fields.related_descriptors import ForwardOneToOneDescriptor
 from django.db.models.fields.related_descriptors import ManyToManyDescriptor
 from django.db.models.fields.related_descriptors import ReverseManyToOneDescriptor
 from django.db.models.fields.related_descriptors import ReverseOneToOneDescriptor
+from django.db.models.signals import m2m_changed
 
 if TYPE_CHECKING:
     from django.db.models.manager import ManyToManyRelatedManager
 
     from contrib.clean_architecture.dto_based_objects.dtos import M2MUpdateAction
-    from contrib.clean_architecture.interfaces import DTO, M2MManager
+    from contrib.clean_architecture.interfaces import DTO, M2MManager, ObjectId
 
 
 class DjangoDTOBasedObjectsMixin(BaseDTOBasedObjectsMixin, required_attrs_base=True):
@@ -47,6 +59,9 @@ class DjangoDTOBasedObjectsMixin(BaseDTOBasedObjectsMixin, required_attrs_base=T
     sequence_classes = (QuerySet,)
     model: type[Model]
 
+    batch_load_relations: bool = True
+    """Подгружать пачкой связи, загружаемые лениво при конвертации списка записей"""
+
     @classmethod
     def _match_relations(cls, model: type[Model], dto: type[DTO]):
         # Получаем поля модели
@@ -88,17 +103,30 @@ class DjangoDTOBasedObjectsMixin(BaseDTOBasedObjectsMixin, required_attrs_base=T
 
         return matched_relations
 
+    def convert_many(self, objects: Iterable[Any], convert: Callable[[Any], Any]) -> list[Any]:
+        objects = list(objects)
+        if not self.batch_load_relations or len(objects) < 2 or not isinstance(objects[0], Model):
+            return super().convert_many(objects, convert)
+        return RelationBatchLoader(objects).convert(convert)
+
     @property
     def m2m_manager(self) -> type[M2MManager]:
         return DjangoM2MManager
 
 
 class DjangoM2MManager(IM2MManager):
-    """Класс для управления зависимостями m2m"""
+    """Класс для управления зависимостями m2m
+
+    Notes:
+        Изменения применяются к промежуточной таблице напрямую: существующие связи читаются одним запросом,
+        недостающие создаются одним bulk_create, лишние удаляются одним delete на поле.
+        Для симметричных связей и промежуточных моделей с обработчиками m2m_changed используются
+        add / remove менеджера связи
+    """
 
     @classmethod
     def execute(cls, instance: Model, field: str, actions: list[M2MUpdateAction]) -> None:
-        """
+        """Применяет действия над m2m полем экземпляра
 
         Args:
             instance: Экземпляр модели ORM
@@ -106,12 +134,82 @@ class DjangoM2MManager(IM2MManager):
             actions: список действий к выполнению
 
         """
-        relation: ManyToManyRelatedManager = getattr(instance, field)
+        cls.execute_many(type(instance), field, {instance.pk: actions})
 
-        add_actions = filter(lambda a: not a.delete, actions)
-        if add_actions:
-            relation.add(*[action.id for action in add_actions])
+    @classmethod
+    def execute_many(cls, model: type[Model], field: str, actions: Mapping[ObjectId, list[M2MUpdateAction]]) -> None:
+        """Применяет действия над m2m полем нескольких экземпляров
+
+        Args:
+            model: Модель ORM
+            field: название атрибута дескриптора поля
+            actions: Словарь вида {первичный ключ экземпляра: список действий к выполнению}
 
-        delete_actions = filter(lambda a: a.delete, actions)
-        if delete_actions:
-            relation.remove(*[action.id for action in delete_actions])
+        """
+        # Последнее действие над связью определяет ее итоговое состояние
+        changes: dict[ObjectId, dict[ObjectId, bool]] = {}
+        for primary_key, instance_actions in actions.items():
+            for action in instance_actions:
+                changes.setdefault(primary_key, {})[action.id] = action.delete
+        if not changes:
+            return
+
+        through, source, target = cls._get_through(model, field)
+        symmetrical = getattr(model._meta.get_field(field).remote_field, "symmetrical", False)
+        if symmetrical or m2m_changed.has_listeners(through):
+            cls._execute_with_signals(model, field, changes)
+            return
+
+        objects = through._default_manager.db_manager(router.db_for_write(through))
+        target_ids = {target_id for instance_changes in changes.values() for target_id in instance_changes}
+        existing = set(
+            objects.filter(**{f"{source}__in": changes.keys(), f"{target}__in": target_ids}).values_list(source, target)
+        )
+
+        to_create = []
+        to_delete = Q()
+        for primary_key, instance_changes in changes.items():
+            if delete_ids := [i for i, delete in instance_changes.items() if delete and (primary_key, i) in existing]:
+                to_delete |= Q(**{source: primary_key, f"{target}__in": delete_ids})
+            to_create.extend(
+                through(**{source: primary_key, target: target_id})
+                for target_id, delete in instance_changes.items()
+                if not delete and (primary_key, target_id) not in existing
+            )
+
+        if to_create:
+            objects.bulk_create(to_create, ignore_conflicts=True)
+        if to_delete:
+            objects.filter(to_delete).delete()
+
+    @staticmethod
+    def _get_through(model: type[Model], field: str) -> tuple[type[Model], str, str]:
+        """Возвращает промежуточную модель и имена ее колонок исходной и связанной модели
+
+        Args:
+            model: Модель ORM
+            field: Имя m2m поля (прямого или обратного)
+
+        Returns:
+            Промежуточная модель, attname колонки исходной модели, attname колонки связанной модели
+        """
+        m2m_field = model._meta.get_field(field)
+        if isinstance(m2m_field, ManyToManyRel):
+            through = m2m_field.through
+            source, target = m2m_field.field.m2m_reverse_field_name(), m2m_field.field.m2m_field_name()
+        else:
+            through = m2m_field.remote_field.through
+            source, target = m2m_field.m2m_field_name(), m2m_field.m2m_reverse_field_name()
+
+        through_opts = through._meta
+        return through, through_opts.get_field(source).attname, through_opts.get_field(target).attname
+
+    @staticmethod
+    def _execute_with_signals(model: type[Model], field: str, changes: dict[ObjectId, dict[ObjectId, bool]]) -> None:
+        """Применяет изменения через менеджер связи, отправляя сигналы m2m_changed"""
+        for primary_key, instance_changes in changes.items():
+            relation: ManyToManyRelatedManager = getattr(model(pk=primary_key), field)
+            if add_ids := [target_id for target_id, delete in instance_changes.items() if not delete]:
+                relation.add(*add_ids)
+            if delete_ids := [target_id for target_id, delete in instance_changes.items() if delete]:
+                relation.remove(*delete_ids)
@@ -0,0 +1,104 @@
+"""Модуль с пакетной подгрузкой связей при конвертации записей django
+
+Notes:
+    Связи, которые не удалось сопоставить с DTO (computed поля, обращения прокси модели к `original_object`,
+    свойства модели), загружаются лениво - отдельным запросом на каждую запись. RelationBatchLoader
+    отслеживает, какие связи были загружены при конвертации очередной записи, и подгружает их
+    для всех оставшихся записей одним запросом `pk__in` на связь (prefetch_related_objects).
+
+    Отслеживаются связи, кэшируемые в самой записи: ForeignKey / OneToOne (в том числе вложенные,
+    например `category__parent`) и уже подгруженные prefetch_related связи вложенных объектов
+
+Classes:
+    RelationBatchLoader: Пакетная подгрузка связей, к которым обращаются при конвертации записей
+
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Any
+
+from django.db.models import Model
+from django.db.models import prefetch_related_objects
+
+logger = logging.getLogger(__name__)
+
+
+class RelationBatchLoader:
+    """Пакетная подгрузка связей, к которым обращаются при конвертации записей
+
+    Examples:
+        >>> loader = RelationBatchLoader(list(Product.objects.all()))
+        >>> dtos = loader.convert(ProductDTO.model_validate)
+        >>> loader.loaded
+        {'category'}
+    """
+
+    def __init__(self, instances: Sequence[Model], max_depth: int = 3):
+        """
+
+        Args:
+            instances: Записи
+            max_depth: Максимальная глубина вложенных связей
+        """
+        self.instances = instances
+        self.max_depth = max_depth
+        self.loaded: set[str] = set()
+        """Связи, подгруженные пачкой"""
+
+    def convert(self, convert: Callable[[Model], Any]) -> list[Any]:
+        """Конвертирует записи, подгружая пачкой связи, загруженные при конвертации предыдущих записей
+
+        Args:
+            convert: Функция конвертации одной записи
+
+        Returns:
+            Список конвертированных записей
+        """
+        results = []
+        for index, instance in enumerate(self.instances):
+            before = self.get_loaded_relations(instance)
+            results.append(convert(instance))
+
+            lookups = self.get_loaded_relations(instance) - before - self.loaded
+            if lookups and index + 1 < len(self.instances):
+                self.loaded |= lookups
+                self._prefetch(self.instances[index + 1 :], lookups)
+
+        return results
+
+    def get_loaded_relations(self, instance: Model, prefix: str = "", depth: int = 0, seen: set = None) -> set[str]:
+        """Возвращает lookups связей, загруженных в записи
+
+        Args:
+            instance: Запись
+            prefix: Префикс lookup вложенной связи
+            depth: Текущая глубина
+            seen: id уже обойденных записей (защита от циклов)
+
+        Returns:
+            Множество lookups вида `category` / `category__parent`
+        """
+        seen = seen if seen is not None else set()
+        seen.add(id(instance))
+
+        lookups = {f"{prefix}{name}" for name in getattr(instance, "_prefetched_objects_cache", {})}
+        for name, value in instance._state.fields_cache.items():
+            lookup = f"{prefix}{name}"
+            lookups.add(lookup)
+            if isinstance(value, Model) and depth + 1 < self.max_depth and id(value) not in seen:
+                lookups |= self.get_loaded_relations(value, f"{lookup}__", depth + 1, seen)
+
+        return lookups
+
+    @staticmethod
+    def _prefetch(instances: Sequence[Model], lookups: set[str]) -> None:
+        """Подгружает связи для записей. Каждая связь загружается отдельно, ошибка одной не влияет на другие"""
+        # Сортировка гарантирует, что родительская связь загружается раньше вложенной
+        for lookup in sorted(lookups):
+            try:
+                prefetch_related_objects(instances, lookup)
+            except (AttributeError, ValueError):
+                logger.debug("Relation %s can not be batch loaded", lookup, exc_info=True)
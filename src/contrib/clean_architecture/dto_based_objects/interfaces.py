@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Mapping
 from typing import Any
 from typing import Self
@@ -71,10 +73,33 @@ class IDTOBasedObjectsMixin(ABC):
             Self: Экземпляр класса
         """
 
+    @abstractmethod
+    def convert_many(self, objects: Iterable[Any], convert: Callable[[Any], Any]) -> list[Any]:
+        """Конвертирует последовательность объектов
+
+        Args:
+            objects: Последовательность объектов
+            convert: Функция конвертации одного объекта
+
+        Returns:
+            Список конвертированных объектов
+        """
+
     @abstractmethod
     def clean_with_dto_context(self) -> None:
         """Удаляет все DTO добавленные в контекст"""
 
+    @abstractmethod
+    def copy_with_dto_context(self) -> Self:
+        """Возвращает копию экземпляра с независимой копией DTO, добавленных в контекст
+
+        Notes:
+            Последующие вызовы `with_dto` у исходного экземпляра не меняют DTO копии
+
+        Returns:
+            Self: Копия экземпляра
+        """
+
     @abstractmethod
     def get_objects(self, model: type[Model]) -> Manager:
         """Возвращает объектный менеджер для конкретной модели
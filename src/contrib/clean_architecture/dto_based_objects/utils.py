@@ -199,7 +199,7 @@ def convert_return(
                 """
                 if not isinstance(value, (Sequence, *self.sequence_classes)):
                     return return_type.layered_model_validate(value, *layers)
-                return [return_type.layered_model_validate(instance, *layers) for instance in value]
+                return self.convert_many(value, lambda instance: return_type.layered_model_validate(instance, *layers))
 
             if convert_path:
                 return convert_path(result, _convert_function)
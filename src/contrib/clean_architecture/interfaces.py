@@ -10,6 +10,8 @@ from typing import TypeVar
 from contrib.pydantic.model import PydanticModel
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from contrib.clean_architecture.dto_based_objects.dtos import M2MUpdateAction
 
 ObjectId: TypeAlias = int | str
@@ -72,6 +74,10 @@ class IM2MManager(ABC):
     @abstractmethod
     def execute(cls, instance: Model, field: str, actions: list[M2MUpdateAction]) -> None: ...
 
+    @classmethod
+    @abstractmethod
+    def execute_many(cls, model: type[Model], field: str, actions: Mapping[ObjectId, list[M2MUpdateAction]]) -> None: ...
+
 
 class IPrefetch(ABC):
     prefetch_through: str
@@ -15,6 +15,7 @@ Classes:
 Classes:
     UpdateControllerMixin: Миксин контроллера обновления
     PatchListControllerMixin: Миксин контроллера обновление для Patch метода списком. {items: [{delete: true, id: 1, ...}]}
+    BulkUpsertControllerMixin: Миксин контроллера массовой вставки / обновления по уникальным полям
 
 ## Удаление
 
@@ -33,6 +34,7 @@ Classes:
 Classes:
     RetrieveControllerMixin: Миксин контроллера получения списка объектов
     SearchControllerMixin: Миксин контроллера получения списка объектов по полнотекстовому поиску
+    AutocompleteControllerMixin: Миксин контроллера автодополнения по префиксу
 
 ## Экспорт записей
 
@@ -54,12 +56,15 @@ Classes:
 """
 from __future__ import annotations
 
+from collections.abc import Iterable
 from enum import Enum
 from typing import TYPE_CHECKING
 
 from contrib.clean_architecture.consts import CleanMethods
 from contrib.clean_architecture.interfaces import DTO
 from contrib.clean_architecture.interfaces import ObjectId
+from contrib.clean_architecture.providers.interactors.bases import AutocompleteInteractorMixin
+from contrib.clean_architecture.providers.interactors.bases import BulkUpsertInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import CreateDeleteInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import CreateInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import CreateUpdateDeleteInteractorMixin
@@ -82,6 +87,8 @@ from contrib.clean_architecture.providers.interactors.bases import UpdateInterac
 from contrib.clean_architecture.types import mixin_for
 from contrib.clean_architecture.utils.method import clean_method
 from contrib.clean_architecture.utils.method import CleanMethodMixin
+from contrib.pydantic.model import BulkUpsertResultDTO
+from contrib.pydantic.model import ExportStreamResponseDTO
 from contrib.pydantic.model import ExportXLSResponseDTO
 from contrib.pydantic.model import PaginatedModel
 
@@ -164,6 +171,26 @@ class PatchListControllerMixin(mixin_for(Controller)):
         return self.interactor.patch_list(dto, *args, **kwargs)
 
 
+class BulkUpsertControllerMixin(mixin_for(Controller)):
+    """Миксин контроллера массовой вставки / обновления по уникальным полям"""
+
+    interactor: BulkUpsertInteractorMixin
+
+    @clean_method(name=CleanMethods.BULK_UPSERT)
+    def bulk_upsert(self, dtos: Iterable[DTO], *args, **kwargs) -> BulkUpsertResultDTO:
+        """Создает или обновляет записи по уникальным полям
+
+        Args:
+            dtos: DTO записей
+            *args: позиционные аргументы
+            **kwargs: Дополнительные именованные аргументы
+
+        Returns:
+            Количество созданных и обновленных записей
+        """
+        return self.interactor.bulk_upsert(dtos, *args, **kwargs)
+
+
 class DeleteControllerMixin(mixin_for(Controller)):
     """Миксин контроллера удаления"""
 
@@ -202,6 +229,19 @@ class DetailControllerMixin(mixin_for(Controller)):
         """
         return self.interactor.detail(filter_dto=filter_dto, **filters)
 
+    async def adetail(self, filter_dto: DTO = None, **filters) -> DTO:
+        """Асинхронно возвращает DTO записи, удовлетворяющей запросу
+
+        Args:
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            DTO записи, удовлетворяющей запросу
+
+        """
+        return await self.interactor.adetail(filter_dto=filter_dto, **filters)
+
 
 class DetailByPKControllerMixin(mixin_for(Controller)):
     """Миксин контроллера получения деталей по первичному ключу"""
@@ -222,6 +262,19 @@ class DetailByPKControllerMixin(mixin_for(Controller)):
         """
         return self.interactor.detail_by_pk(pk, *args, **kwargs)
 
+    async def adetail_by_pk(self, pk: ObjectId, *args, **kwargs) -> DTO:
+        """Асинхронно возвращает DTO записи, по первичному ключу
+
+        Args:
+            pk: Первичный ключ
+            **kwargs: Дополнительные именованные аргументы
+
+        Returns:
+            DTO записи, удовлетворяющей запросу
+
+        """
+        return await self.interactor.adetail_by_pk(pk, *args, **kwargs)
+
 
 class DetailByExternalCodeControllerMixin(mixin_for(Controller)):
     """Миксин контроллера получения деталей по внешнему коду"""
@@ -282,6 +335,39 @@ class RetrieveControllerMixin(mixin_for(Controller)):
             **filters,
         )
 
+    async def aretrieve(
+        self,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: tuple[str] = (),
+        paginated: bool = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[DTO] | PaginatedModel:
+        """Асинхронно возвращает последовательность DTO удовлетворяющих запросу
+
+        Args:
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            paginated: Нужна ли пагинация
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность DTO удовлетворяющих запросу
+
+        """
+        return await self.interactor.aretrieve(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            paginated=paginated,
+            filter_dto=filter_dto,
+            **filters,
+        )
+
 
 class SearchControllerMixin(mixin_for(Controller)):
     """Миксин контроллера получения списка объектов по полнотекстовому поиску"""
@@ -325,6 +411,64 @@ class SearchControllerMixin(mixin_for(Controller)):
             **filters,
         )
 
+    async def asearch(
+        self,
+        search: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: tuple[str] = (),
+        paginated: bool = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[DTO] | PaginatedModel:
+        """Асинхронно возвращает последовательность DTO удовлетворяющих запросу
+
+        Args:
+            search: Текст запроса
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            paginated: Нужна ли пагинация
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность DTO удовлетворяющих запросу
+
+        """
+        return await self.interactor.asearch(
+            search,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            paginated=paginated,
+            filter_dto=filter_dto,
+            **filters,
+        )
+
+
+class AutocompleteControllerMixin(mixin_for(Controller)):
+    """Миксин контроллера автодополнения по префиксу"""
+
+    interactor: AutocompleteInteractorMixin
+
+    @clean_method(name=CleanMethods.AUTOCOMPLETE)
+    def autocomplete(self, search: str, *, limit: int = 10, filter_dto: DTO = None, **filters) -> list[DTO]:
+        """Возвращает последовательность DTO, поля которых начинаются с search
+
+        Args:
+            search: Префикс
+            limit: Лимит количества записей
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность DTO удовлетворяющих запросу
+
+        """
+        return self.interactor.autocomplete(search, limit=limit, filter_dto=filter_dto, **filters)
+
 
 class ExportXLSControllerMixin(mixin_for(Controller)):
     """Миксин контроллера экспорта списка объектов"""
@@ -346,6 +490,21 @@ class ExportXLSControllerMixin(mixin_for(Controller)):
         """
         return self.interactor.export_xls(ids=ids, fields=fields, **filters)
 
+    @clean_method(name=CleanMethods.EXPORT_CSV)
+    def export_csv(self, *, ids: list[int] | None = None, fields: list[str], **filters) -> ExportStreamResponseDTO:
+        """Возвращает ExportStreamResponseDTO с ленивым содержимым csv файла
+
+        Args:
+            ids: Списой id объектов
+            fields: Список полей
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            ExportStreamResponseDTO
+
+        """
+        return self.interactor.export_csv(ids=ids, fields=fields, **filters)
+
 
 class CreateUpdateControllerMixin(CreateControllerMixin, UpdateControllerMixin):
     """Миксин контроллера создания / обновления"""
@@ -7,6 +7,7 @@ from functools import wraps
 from typing import Any
 from typing import TYPE_CHECKING
 
+from asgiref.sync import sync_to_async
 from contrib.inspect.services import get_params_with_values
 from contrib.localization.services import gettext_lazy as _
 
@@ -70,13 +71,15 @@ class Permissions:
         self._controller = controller
         for method_name, permission in self._permissions.items():
             self.decorate(method_name, permission)
+            # Асинхронный вариант метода (aretrieve для retrieve) проверяется теми же разрешениями
+            if hasattr(controller, f"a{method_name}"):
+                self.decorate(f"a{method_name}", permission)
 
     def decorate(self, method_name: str, permission: Permission):
         method = getattr(self.controller, method_name)
         original_method = inspect.unwrap(method)
 
-        @wraps(method)
-        def wrapper(*args, **kwargs):
+        def check(*args, **kwargs):
             params = [*permission.bind, *permission.mapping.keys()]
             bind_kwargs = get_params_with_values(original_method, "self", *args, params=params, **kwargs)
             for key, value in permission.mapping.items():
@@ -84,9 +87,18 @@ class Permissions:
                 del bind_kwargs[key]
 
             getattr(self.interactor, permission.method)(*permission.args, **bind_kwargs, **permission.kwargs)
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            check(*args, **kwargs)
             return method(*args, **kwargs)
 
-        setattr(self.controller, method_name, wrapper)
+        @wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            await sync_to_async(check)(*args, **kwargs)
+            return await method(*args, **kwargs)
+
+        setattr(self.controller, method_name, async_wrapper if inspect.iscoroutinefunction(original_method) else wrapper)
 
     @property
     def controller(self):
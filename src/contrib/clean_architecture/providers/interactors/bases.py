@@ -15,6 +15,7 @@ Classes:
 Classes:
     UpdateInteractorMixin: Миксин интерактора обновления
     PatchListInteractorMixin: Миксин интерактора обновление для Patch метода списком. {items: [{delete: true, id: 1, ...}]}
+    BulkUpsertInteractorMixin: Миксин интерактора массовой вставки / обновления по уникальным полям
 
 ## Удаление
 
@@ -33,6 +34,7 @@ Classes:
 Classes:
     RetrieveInteractorMixin: Миксин интерактора получения списка объектов
     SearchInteractorMixin: Миксин интерактора получения списка объектов по полнотекстовому поиску
+    AutocompleteInteractorMixin: Миксин интерактора автодополнения по префиксу
 
 ## Экспорт записей
 
@@ -54,13 +56,23 @@ Classes:
 """
 from __future__ import annotations
 
+import asyncio
+import codecs
+import csv
 import io
 from abc import ABC
 from abc import abstractmethod
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from copy import deepcopy
 from enum import Enum
+from functools import cached_property
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from typing import Any
 
-import xlwt
 from contrib.clean_architecture.consts import CleanMethods
 from contrib.clean_architecture.interfaces import DTO
 from contrib.clean_architecture.interfaces import Model
@@ -69,6 +81,9 @@ from contrib.clean_architecture.providers.interactors.exceptions import (
     NothingToUpdateOrCreateException,
 )
 from contrib.clean_architecture.providers.interactors.utils import bind_return_type
+from contrib.clean_architecture.providers.interactors.utils import coalesce
+from contrib.clean_architecture.providers.repositories.interfaces import IAutocompleteRepositoryMixin
+from contrib.clean_architecture.providers.repositories.interfaces import IBulkUpsertRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import ICreateDeleteRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import ICreateRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import ICreateUpdateDeleteRepositoryMixin
@@ -79,6 +94,7 @@ from contrib.clean_architecture.providers.repositories.interfaces import IDetail
 from contrib.clean_architecture.providers.repositories.interfaces import IDetailByPKRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IDetailRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IDetailsRepositoryMixin
+from contrib.clean_architecture.providers.repositories.interfaces import IExportRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IListRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IPatchListRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IReadRepositoryMixin
@@ -88,12 +104,17 @@ from contrib.clean_architecture.providers.repositories.interfaces import ISearch
 from contrib.clean_architecture.providers.repositories.interfaces import IUpdateDeleteRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IUpdateRepositoryMixin
 from contrib.clean_architecture.types import mixin_for
+from contrib.clean_architecture.utils.cache import LocalCache
 from contrib.clean_architecture.utils.method import clean_method
 from contrib.clean_architecture.utils.method import CleanMethodMixin
 from contrib.context.mixins import ContextMixin
 from contrib.context.utils import context_property
+from contrib.exceptions.exceptions import ActionImpossible
+from contrib.exceptions.exceptions import DoesNotExist
 from contrib.exceptions.exceptions import ValidationError
 from contrib.localization.services import gettext as _
+from contrib.pydantic.model import BulkUpsertResultDTO
+from contrib.pydantic.model import ExportStreamResponseDTO
 from contrib.pydantic.model import ExportXLSResponseDTO
 from contrib.pydantic.model import PaginatedModel
 from contrib.pydantic.model import ValidationErrorItemDTO
@@ -349,8 +370,34 @@ class PatchListInteractorMixin(mixin_for(Interactor)):
             self.repository.bulk_delete(need_to_delete)
         if need_to_update:
             self.patch_list_validate_update_objects(need_to_update, *args, **kwargs)
-            for _object in need_to_update:
-                self.repository.update(_object)
+            # Как и при обновлении по одной записи, отсутствующая запись - ошибка
+            primary_keys = {getattr(_object, self.repository.primary_key_attr) for _object in need_to_update}
+            if primary_keys - set(self.repository.get_ids(pk__in=primary_keys)):
+                raise DoesNotExist
+            # Одним запросом на группу записей с одинаковым набором полей
+            self.repository.bulk_update(need_to_update)
+
+
+class BulkUpsertInteractorMixin(mixin_for(Interactor)):
+    """Миксин интерактора массовой вставки / обновления по уникальным полям"""
+
+    repository: IBulkUpsertRepositoryMixin
+
+    @clean_method(name=CleanMethods.BULK_UPSERT)
+    def bulk_upsert(self, dtos: Iterable[DTO], *args, **kwargs) -> BulkUpsertResultDTO:
+        """Создает или обновляет записи по уникальным полям
+
+        Args:
+            dtos: DTO записей
+            *args: позиционные аргументы
+            **kwargs: Дополнительные именованные аргументы репозитория
+
+        Returns:
+            Количество созданных и обновленных записей
+        """
+        entities = (self.repository.entity(**dto.model_dump(exclude_unset=True)) for dto in dtos)
+        created, updated = self.repository.bulk_upsert(entities, *args, **kwargs)
+        return BulkUpsertResultDTO(created=created, updated=updated)
 
 
 class DeleteInteractorMixin(mixin_for(Interactor)):
@@ -378,8 +425,13 @@ class DetailInteractorMixin(mixin_for(Interactor)):
     repository: IDetailRepositoryMixin
     detail_return_type: type[DTO] = None
     """DTO которое, нужно вернуть"""
+    detail_coalesce: bool = False
+    """Объединять одновременные одинаковые вызовы в рамках процесса"""
+    detail_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей вызовы разных процессов. None - не объединять"""
 
     @bind_return_type(detail=True)
+    @coalesce
     @clean_method(name=CleanMethods.DETAIL)
     def detail(self, *, return_type: type[DTO] = None, filter_dto: DTO = None, **filters) -> DTO:
         """Возвращает DTO записи, удовлетворяющей запросу
@@ -395,6 +447,21 @@ class DetailInteractorMixin(mixin_for(Interactor)):
         """
         return self.repository.with_dto(return_type).detail(filter_dto=filter_dto, **filters)
 
+    @bind_return_type(detail=True, name=CleanMethods.DETAIL)
+    async def adetail(self, *, return_type: type[DTO] = None, filter_dto: DTO = None, **filters) -> DTO:
+        """Асинхронно возвращает DTO записи, удовлетворяющей запросу
+
+        Args:
+            return_type: DTO экземпляр которого нужно вернуть
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            DTO записи, удовлетворяющей запросу
+
+        """
+        return await self.repository.with_dto(return_type).adetail(filter_dto=filter_dto, **filters)
+
 
 class DetailByPKInteractorMixin(mixin_for(Interactor)):
     """Миксин интерактора получения деталей по первичному ключу"""
@@ -402,8 +469,13 @@ class DetailByPKInteractorMixin(mixin_for(Interactor)):
     repository: IDetailByPKRepositoryMixin
     detail_by_pk_return_type: type[DTO] = None
     """DTO которое, нужно вернуть"""
+    detail_by_pk_coalesce: bool = False
+    """Объединять одновременные одинаковые вызовы в рамках процесса"""
+    detail_by_pk_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей вызовы разных процессов. None - не объединять"""
 
     @bind_return_type(detail=True)
+    @coalesce
     @clean_method(name=CleanMethods.DETAIL_BY_PK)
     def detail_by_pk(self, pk: ObjectId, *, return_type: type[DTO] = None, **kwargs) -> DTO:
         """Возвращает DTO записи, по первичному ключу
@@ -419,6 +491,21 @@ class DetailByPKInteractorMixin(mixin_for(Interactor)):
         """
         return self.repository.with_dto(return_type).detail_by_pk(pk, **kwargs)
 
+    @bind_return_type(detail=True, name=CleanMethods.DETAIL_BY_PK)
+    async def adetail_by_pk(self, pk: ObjectId, *, return_type: type[DTO] = None, **kwargs) -> DTO:
+        """Асинхронно возвращает DTO записи, по первичному ключу
+
+        Args:
+            pk: Первичный ключ
+            return_type: DTO экземпляр которого нужно вернуть
+            **kwargs: Дополнительные именованные аргументы
+
+        Returns:
+            DTO записи, удовлетворяющей запросу
+
+        """
+        return await self.repository.with_dto(return_type).adetail_by_pk(pk, **kwargs)
+
 
 class DetailByExternalCodeInteractorMixin(mixin_for(Interactor)):
     """Миксин интерактора получения деталей по внешнему коду"""
@@ -426,8 +513,13 @@ class DetailByExternalCodeInteractorMixin(mixin_for(Interactor)):
     repository: IDetailByExternalCodeRepositoryMixin
     detail_by_external_code_return_type: type[DTO] = None
     """DTO которое, нужно вернуть"""
+    detail_by_external_code_coalesce: bool = False
+    """Объединять одновременные одинаковые вызовы в рамках процесса"""
+    detail_by_external_code_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей вызовы разных процессов. None - не объединять"""
 
     @bind_return_type(detail=True)
+    @coalesce
     @clean_method(name=CleanMethods.DETAIL_BY_EXTERNAL_CODE)
     def detail_by_external_code(self, code: str, code_type: str | Enum, *, return_type: type[DTO] = None) -> DTO:
         """Возвращает DTO записи, по внешнему коду
@@ -452,8 +544,13 @@ class RetrieveInteractorMixin(mixin_for(Interactor)):
     """DTO которое, нужно вернуть"""
     retrieve_return_pagination_type: type[PaginatedModel] = None
     """DTO с пагинацией, которое нужно вернуть"""
+    retrieve_coalesce: bool = False
+    """Объединять одновременные одинаковые вызовы в рамках процесса"""
+    retrieve_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей вызовы разных процессов. None - не объединять"""
 
     @bind_return_type(paginated=True)
+    @coalesce
     @clean_method(name=CleanMethods.RETRIEVE)
     def retrieve(
         self,
@@ -496,6 +593,86 @@ class RetrieveInteractorMixin(mixin_for(Interactor)):
         count = self.repository.count(filter_dto=filter_dto, **filters)
         return return_pagination_type.create(results, count, limit, offset)
 
+    @bind_return_type(paginated=True, name=CleanMethods.RETRIEVE)
+    async def aretrieve(
+        self,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: tuple[str] = (),
+        paginated: bool = None,
+        return_type: type[DTO] = None,
+        return_pagination_type: type[PaginatedModel] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[DTO] | PaginatedModel:
+        """Асинхронно возвращает последовательность DTO удовлетворяющих запросу
+
+        Notes:
+            Записи и их количество для пагинации запрашиваются параллельно
+
+        Args:
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            paginated: Нужна ли пагинация
+            return_type: DTO экземпляр которого нужно вернуть
+            return_pagination_type: DTO с пагинацией экземпляр которого нужно вернуть
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность DTO удовлетворяющих запросу
+
+        """
+        results = self.repository.with_dto(return_type).aretrieve(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            filter_dto=filter_dto,
+            **filters,
+        )
+        if not paginated:
+            return await results
+
+        results, count = await asyncio.gather(results, self.repository.acount(filter_dto=filter_dto, **filters))
+        return return_pagination_type.create(results, count, limit, offset)
+
+    @bind_return_type
+    @clean_method(name=CleanMethods.ITERATE)
+    def iterate(
+        self,
+        *,
+        order_by: tuple[str] = (),
+        chunk_size: int = None,
+        return_type: type[DTO] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Iterator[DTO]:
+        """Возвращает ленивый итератор DTO удовлетворяющих запросу
+
+        Notes:
+            Предназначен для внутренних задач (выгрузки, отчеты, переиндексация), обходящих таблицу целиком.
+            Записи читаются и конвертируются пачками по chunk_size
+
+        Args:
+            order_by: Кортеж сортировок записей
+            chunk_size: Количество записей, получаемых из БД за раз
+            return_type: DTO экземпляр которого нужно вернуть
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Итератор DTO удовлетворяющих запросу
+
+        """
+        return self.repository.with_dto(return_type).iterate(
+            order_by=order_by,
+            chunk_size=chunk_size,
+            filter_dto=filter_dto,
+            **filters,
+        )
+
 
 class SearchInteractorMixin(mixin_for(Interactor)):
     """Миксин интерактора получения списка объектов по полнотекстовому поиску"""
@@ -505,8 +682,13 @@ class SearchInteractorMixin(mixin_for(Interactor)):
     """DTO деталей, которое нужно вернуть"""
     search_return_pagination_type: type[PaginatedModel] = None
     """DTO с пагинацией, которое нужно вернуть"""
+    search_coalesce: bool = False
+    """Объединять одновременные одинаковые вызовы в рамках процесса"""
+    search_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей вызовы разных процессов. None - не объединять"""
 
     @bind_return_type(paginated=True)
+    @coalesce
     @clean_method(name=CleanMethods.SEARCH)
     def search(
         self,
@@ -552,20 +734,171 @@ class SearchInteractorMixin(mixin_for(Interactor)):
         count = self.repository.search_count(search, filter_dto=filter_dto, **filters)
         return return_pagination_type.create(results, count, limit, offset)
 
+    @bind_return_type(paginated=True, name=CleanMethods.SEARCH)
+    async def asearch(
+        self,
+        search: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: tuple[str] = (),
+        paginated: bool = None,
+        return_type: type[DTO] = None,
+        return_pagination_type: type[PaginatedModel] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[DTO] | PaginatedModel:
+        """Асинхронно возвращает последовательность DTO удовлетворяющих запросу
+
+        Notes:
+            Записи и их количество для пагинации запрашиваются параллельно
+
+        Args:
+            search: Текст запроса
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            paginated: Нужна ли пагинация
+            return_type: DTO экземпляр которого нужно вернуть
+            return_pagination_type: DTO с пагинацией экземпляр которого нужно вернуть
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность DTO удовлетворяющих запросу
+
+        """
+        results = self.repository.with_dto(return_type).asearch(
+            search,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            filter_dto=filter_dto,
+            **filters,
+        )
+        if not paginated:
+            return await results
+
+        results, count = await asyncio.gather(
+            results, self.repository.asearch_count(search, filter_dto=filter_dto, **filters)
+        )
+        return return_pagination_type.create(results, count, limit, offset)
+
+
+class AutocompleteInteractorMixin(mixin_for(Interactor)):
+    """Миксин интерактора автодополнения по префиксу
+
+    Notes:
+        Результаты кэшируются в процессе на `autocomplete_cache_timeout` секунд. При изменении записей
+        кэш очищается вызовом `clear_autocomplete_cache` (например, из сигналов модели), другие процессы
+        видят изменения после истечения времени жизни. Каждый вызов получает копию закэшированных DTO
+    """
+
+    repository: IAutocompleteRepositoryMixin
+    autocomplete_return_type: type[DTO] = None
+    """DTO которое, нужно вернуть"""
+    autocomplete_min_length: int = 1
+    """Минимальная длина префикса, с которой выполняется запрос"""
+    autocomplete_max_limit: int = 50
+    """Максимальное количество записей в ответе"""
+    autocomplete_cache_size: int = 1024
+    """Количество кэшируемых префиксов. 0 - отключить кэширование"""
+    autocomplete_cache_timeout: float = 60
+    """Время жизни закэшированного префикса в секундах"""
+
+    @cached_property
+    def autocomplete_cache(self) -> LocalCache:
+        """Кэш популярных префиксов, объединяющий одновременные одинаковые запросы"""
+        return LocalCache(maxsize=self.autocomplete_cache_size, timeout=self.autocomplete_cache_timeout)
+
+    @bind_return_type
+    @clean_method(name=CleanMethods.AUTOCOMPLETE)
+    def autocomplete(
+        self,
+        search: str,
+        *,
+        limit: int = 10,
+        return_type: type[DTO] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[DTO]:
+        """Возвращает последовательность DTO, поля которых начинаются с search
+
+        Args:
+            search: Префикс
+            limit: Лимит количества записей
+            return_type: DTO экземпляр которого нужно вернуть
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность DTO удовлетворяющих запросу
+
+        """
+        search = " ".join(search.split())
+        if len(search) < self.autocomplete_min_length:
+            return []
+        limit = min(limit, self.autocomplete_max_limit)
+
+        def _autocomplete():
+            return self.repository.with_dto(return_type).autocomplete(
+                search,
+                limit=limit,
+                filter_dto=filter_dto,
+                **filters,
+            )
+
+        if not self.autocomplete_cache_size:
+            return _autocomplete()
+
+        key = (
+            search.casefold(),
+            limit,
+            return_type,
+            filter_dto.model_dump_json() if filter_dto else None,
+            repr(sorted(filters.items())),
+        )
+        return deepcopy(self.autocomplete_cache.get_or_set(key, _autocomplete))
+
+    def clear_autocomplete_cache(self) -> None:
+        """Очищает кэш автодополнения процесса"""
+        if "autocomplete_cache" in self.__dict__:
+            self.autocomplete_cache.clear()
+
 
 class ExportXLSInteractorMixin(ABC, mixin_for(Interactor)):
-    """Миксин интерактора экспорта списка объектов"""
+    """Миксин интерактора экспорта списка объектов
+
+    Notes:
+        Записи читаются из репозитория пачками по export_chunk_size, если репозиторий реализует
+        IExportRepositoryMixin, поэтому потребление памяти при экспорте в csv не зависит от количества строк.
+        Формат xls ограничен xls_max_rows строками и собирается в памяти целиком
 
-    repository: ISearchRepositoryMixin | IRetrieveRepositoryMixin
+        Перед экспортом по запрошенным полям составляется план (`_compile_export_plan`): если все колонки
+        читаются из полей записи или форматтерами, помеченными `export_formatter`, из БД выбираются только
+        эти колонки через values_list, без создания объектов и DTO
+    """
+
+    repository: IExportRepositoryMixin | ISearchRepositoryMixin | IRetrieveRepositoryMixin
     xls_file_name: str = None
     """Имя xls файла"""
     xls_sheet_name: str = None
     """Имя таблицы в xls файле"""
+    xls_max_rows: int = 65535
+    """Максимальное количество строк с данными в xls файле (ограничение формата)"""
+    export_chunk_size: int = 2000
+    """Количество записей, получаемых из БД и записываемых в файл за раз"""
+    csv_delimiter: str = ";"
+    """Разделитель колонок csv"""
+    export_values: bool = True
+    """Читать ли колонки из БД через values_list, если для всех полей известны колонки"""
 
     export_xls_return_type: type[DTO] = None
     """DTO деталей, которое нужно вернуть"""
     export_xls_return_pagination_type: type[PaginatedModel] = None
     """DTO с пагинацией, которое нужно вернуть"""
+    export_csv_return_type: type[DTO] = None
+    """DTO деталей, которое нужно вернуть при экспорте в csv"""
 
     @bind_return_type(paginated=False)
     @clean_method(name=CleanMethods.EXPORT_XLS)
@@ -588,43 +921,192 @@ class ExportXLSInteractorMixin(ABC, mixin_for(Interactor)):
         Returns:
             ExportXLSResponseDTO
 
+        Raises:
+            ActionImpossible: Количество строк превышает xls_max_rows
+
         """
-        repository = self.repository.with_dto(return_type) if return_type else self.repository
-        objects = repository.retrieve(pk__in=ids) if ids else repository.search(**filters)
+        # xlwt нужен только для экспорта в xls, поэтому не загружается при импорте
+        import xlwt
 
         workbook = xlwt.Workbook()
         worksheet: xlwt.Worksheet = workbook.add_sheet(str(self.xls_sheet_name))
 
+        rows = self.export_rows(ids=ids, fields=fields, return_type=return_type, **filters)
+        for row_index, row in enumerate(rows):
+            if row_index > self.xls_max_rows:
+                raise ActionImpossible(message=_("количество строк превышает допустимое для xls, используйте csv"))
+            worksheet_row = worksheet.row(row_index)
+            for col_index, cell_value in enumerate(row):
+                worksheet_row.write(col_index, cell_value)
+
+        output = io.BytesIO()
+        workbook.save(output)
+
+        return ExportXLSResponseDTO(file_content=output.getvalue(), file_name=str(self.xls_file_name))
+
+    @bind_return_type(paginated=False)
+    @clean_method(name=CleanMethods.EXPORT_CSV)
+    def export_csv(
+        self,
+        *,
+        ids: list[int] | None = None,
+        fields: list[str],
+        return_type: type[DTO] = None,
+        **filters,
+    ) -> ExportStreamResponseDTO:
+        """Возвращает ExportStreamResponseDTO с ленивым содержимым csv файла
+
+        Args:
+            ids: Списой id объектов
+            fields: Список полей
+            return_type: DTO экземпляр которого нужно вернуть
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            ExportStreamResponseDTO. Записи читаются из БД по мере чтения file_content
+
+        """
+        rows = self.export_rows(ids=ids, fields=fields, return_type=return_type, **filters)
+        return ExportStreamResponseDTO(
+            file_content=self._iter_csv(rows),
+            file_name=str(self.xls_file_name),
+            file_extension="csv",
+            content_type="text/csv; charset=utf-8",
+        )
+
+    def export_rows(
+        self,
+        *,
+        ids: list[int] | None = None,
+        fields: list[str],
+        return_type: type[DTO] = None,
+        **filters,
+    ) -> Iterator[list[Any]]:
+        """Возвращает итератор строк экспорта: строка заголовков, затем строки значений
+
+        Args:
+            ids: Списой id объектов
+            fields: Список полей
+            return_type: DTO экземпляр которого нужно вернуть
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Итератор списков значений ячеек
+        """
         field_name_mapping = self._get_fields_mapping()
-        if not fields:
-            fields = field_name_mapping.keys()
+        fields = list(fields or field_name_mapping.keys())
+
+        yield [
+            str(verbose_name if (verbose_name := field_name_mapping.get(field, None)) is not None else field)
+            for field in fields
+        ]
 
-        for i, field in enumerate(fields):
-            verbose_name = field_name_mapping.get(field, None)
-            worksheet.write(0, i, str(verbose_name if verbose_name is not None else field))
+        values, extract_row = self._compile_export_plan(fields)
+        objects = self._get_export_objects(ids=ids, return_type=return_type, values=values, **filters)
+        yield from map(extract_row, objects)
 
+    def _compile_export_plan(self, fields: list[str]) -> tuple[tuple[str, ...] | None, Callable[[Any], list[Any]]]:
+        """Составляет план экспорта: колонки для values_list и функцию получения строки
+
+        Notes:
+            Если для каждого поля известна колонка БД (поле записи без форматтера или форматтер,
+            помеченный export_formatter), записи читаются кортежами через values_list. Иначе строка
+            получается из объекта: поля без форматтеров читаются одним attrgetter на всю строку
+
+        Args:
+            fields: Список полей
+
+        Returns:
+            Кортеж колонок для values_list (None, если нужны объекты) и функция получения строки
+        """
         formatters = self._formatter_mapping()
-        for row_index, obj in enumerate(objects, start=1):
-            for col_index, field in enumerate(fields):
-                field_formatter = formatters.get(field)
-                try:
-                    if field_formatter is not None:
-                        cell_value = field_formatter(obj)
-                    else:
-                        cell_value = getattr(obj, field)
-                        if cell_value is None:
-                            cell_value = ""
-                        if type(cell_value) == bool:
-                            cell_value = "Да" if cell_value else "Нет"
-                except AttributeError:
-                    cell_value = ""
-
-                worksheet.write(row_index, col_index, cell_value)
+        value_fields = (
+            self.repository.get_value_fields()
+            if self.export_values and isinstance(self.repository, IExportRepositoryMixin)
+            else set()
+        )
 
-        output = io.BytesIO()
-        workbook.save(output)
+        values: dict[str, int] = {}
+        columns: list[tuple[Callable | None, tuple[int, ...]]] = []
+        for field in fields:
+            field_formatter = formatters.get(field)
+            if field_formatter is None and field in value_fields:
+                field_values = (field,)
+            elif (field_values := getattr(field_formatter, "export_values", None)) is None:
+                return None, self._compile_object_row(fields, formatters)
+            columns.append((field_formatter, tuple(values.setdefault(value, len(values)) for value in field_values)))
+
+        if all(field_formatter is None for field_formatter, _ in columns) and list(values) == fields:
+            # Колонки совпадают с полями - вся строка обрабатывается одним map
+            return tuple(values), lambda row: list(map(_format_export_value, row))
+
+        def extract_row(row: tuple) -> list[Any]:
+            return [
+                field_formatter(*(row[index] for index in indexes))
+                if field_formatter is not None
+                else _format_export_value(row[indexes[0]])
+                for field_formatter, indexes in columns
+            ]
+
+        return tuple(values), extract_row
+
+    @staticmethod
+    def _compile_object_row(fields: list[str], formatters: dict[str, Callable]) -> Callable[[Any], list[Any]]:
+        """Возвращает функцию получения строки экспорта из объекта"""
+        getters = []
+        for field in fields:
+            field_formatter = formatters.get(field)
+            if field_formatter is None:
+                getters.append(partial(_get_export_attr, attrgetter(field)))
+            elif (field_values := getattr(field_formatter, "export_values", None)) is not None:
+                value_getters = tuple(attrgetter(value.replace("__", ".")) for value in field_values)
+                getters.append(partial(_get_export_formatted, field_formatter, value_getters))
+            else:
+                getters.append(partial(_get_export_formatted, field_formatter, None))
 
-        return ExportXLSResponseDTO(file_content=output.getvalue(), file_name=str(self.xls_file_name))
+        if any(field in formatters for field in fields):
+            return lambda obj: [getter(obj) for getter in getters]
+
+        row_getter = attrgetter(*fields) if len(fields) > 1 else lambda obj: (getattr(obj, fields[0]),)
+
+        def extract_row(obj: Any) -> list[Any]:
+            try:
+                return list(map(_format_export_value, row_getter(obj)))
+            except AttributeError:
+                # Часть полей отсутствует у объекта - получаем значения по одному
+                return [getter(obj) for getter in getters]
+
+        return extract_row
+
+    def _get_export_objects(
+        self,
+        *,
+        ids: list[int] | None,
+        return_type: type[DTO] = None,
+        values: tuple[str, ...] | None = None,
+        **filters,
+    ) -> Iterable:
+        """Возвращает записи для экспорта. Если репозиторий поддерживает выгрузку - итератор по пачкам"""
+        repository = self.repository.with_dto(return_type) if return_type and not values else self.repository
+        if isinstance(repository, IExportRepositoryMixin):
+            if ids:
+                return repository.export(pk__in=ids, chunk_size=self.export_chunk_size, values=values)
+            return repository.export(chunk_size=self.export_chunk_size, values=values, **filters)
+        return repository.retrieve(pk__in=ids) if ids else repository.search(**filters)
+
+    def _iter_csv(self, rows: Iterable[list[Any]]) -> Iterator[bytes]:
+        """Возвращает части csv файла, по export_chunk_size строк в каждой"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=self.csv_delimiter)
+        rows = iter(rows)
+
+        # BOM, чтобы Excel открывал файл в utf-8
+        yield codecs.BOM_UTF8
+        while chunk := list(islice(rows, self.export_chunk_size)):
+            writer.writerows(chunk)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
 
     @abstractmethod
     def _get_fields_mapping(self) -> dict[str, str]:
@@ -632,7 +1114,37 @@ class ExportXLSInteractorMixin(ABC, mixin_for(Interactor)):
 
     @abstractmethod
     def _formatter_mapping(self) -> dict[str, Callable[[Model], str]]:
-        """Набор форматтеров для обработки отображаемого значения для поля."""
+        """Набор форматтеров для обработки отображаемого значения для поля.
+
+        Форматтер получает объект, либо значения полей, если помечен `export_formatter`.
+        """
+
+
+def _format_export_value(value: Any) -> Any:
+    """Возвращает значение ячейки экспорта для значения поля без форматтера"""
+    if value is None:
+        return ""
+    if value is True or value is False:
+        return "Да" if value else "Нет"
+    return value
+
+
+def _get_export_attr(getter: Callable[[Any], Any], obj: Any) -> Any:
+    """Возвращает значение ячейки экспорта из атрибута объекта"""
+    try:
+        return _format_export_value(getter(obj))
+    except AttributeError:
+        return ""
+
+
+def _get_export_formatted(formatter: Callable, value_getters: tuple[Callable] | None, obj: Any) -> Any:
+    """Возвращает значение ячейки экспорта через форматтер"""
+    try:
+        if value_getters is None:
+            return formatter(obj)
+        return formatter(*(getter(obj) for getter in value_getters))
+    except AttributeError:
+        return ""
 
 
 class CreateUpdateInteractorMixin(CreateInteractorMixin, UpdateInteractorMixin):
@@ -2,20 +2,36 @@
 
 Functions:
     bind_return_type: Заполняет return_type и / или return_pagination_type и paginated при вызове декорируемой функции
+    coalesce: Объединяет одновременные одинаковые вызовы метода чтения в одно выполнение
+    get_coalesced_hits: Возвращает количество объединенных вызовов по методам
+    export_formatter: Помечает форматтер экспорта как работающий со значениями полей, а не с объектом
 
 """
 from __future__ import annotations
 
 import inspect
+import threading
 from collections.abc import Callable
+from collections.abc import Hashable
+from copy import deepcopy
+from functools import partial
 from functools import wraps
+from typing import Any
 
+from contrib.clean_architecture.consts import CoalesceAttrs
 from contrib.clean_architecture.consts import ReturnTypeAttrs
+from contrib.clean_architecture.utils.cache import SharedFlight
+from contrib.clean_architecture.utils.cache import SingleFlight
 from contrib.context import get_root_context
 from contrib.inspect.services import replace_args_values
+from pydantic import BaseModel
 
+_single_flight = SingleFlight()
+_shared_flight = SharedFlight()
+_local = threading.local()
 
-def bind_return_type(target: Callable = None, *, detail: bool = False, paginated: bool = False):
+
+def bind_return_type(target: Callable = None, *, detail: bool = False, paginated: bool = False, name: str = None):
     """Заполняет `return_type` и / или `return_pagination_type` и `paginated` при вызове декорируемой функции
 
     Notes:
@@ -36,15 +52,20 @@ def bind_return_type(target: Callable = None, *, detail: bool = False, paginated
         * Детали
         * Общий
 
+        Возвращаемый тип из контекста - значение по ключу контекста, а если его нет, атрибут объекта
+        из `ReturnTypeAttrs.RETURN_TYPES_SOURCE` (представления текущего запроса)
+
     Args:
         target: Декорируемая функция
         detail: Нужно ли вернуть детали
         paginated: Нужно ли вернуть DTO с пагинацией
+        name: Имя метода, типы которого подставляются. По умолчанию имя clean method или функции.
+            Позволяет асинхронному варианту метода (`aretrieve`) использовать типы синхронного (`retrieve`)
 
     """
 
     def decorator(function: Callable):
-        method_name = getattr(function, "__method_name__", function.__name__)
+        method_name = name or getattr(function, "__method_name__", function.__name__)
 
         @wraps(function)
         def wrapper(self, *args, **kwargs):
@@ -52,6 +73,10 @@ def bind_return_type(target: Callable = None, *, detail: bool = False, paginated
             context = get_root_context()
             if not context.initialized:
                 context = {}
+            source = context.get(ReturnTypeAttrs.RETURN_TYPES_SOURCE)
+
+            def from_context(key: str):
+                return context.get(key) or getattr(source, key, None)
 
             # проверяем необходимость пагинации
             _paginated = kwargs.get("paginated")
@@ -65,38 +90,45 @@ def bind_return_type(target: Callable = None, *, detail: bool = False, paginated
             if _paginated:
                 kwargs[ReturnTypeAttrs.RETURN_PAGINATION_TYPE] = (
                     kwargs.get(ReturnTypeAttrs.RETURN_PAGINATION_TYPE, None)
-                    or context.get(f"{method_name}_{ReturnTypeAttrs.RETURN_PAGINATION_TYPE}")
+                    or from_context(f"{method_name}_{ReturnTypeAttrs.RETURN_PAGINATION_TYPE}")
                     or getattr(
                         self,
                         f"{method_name}_{ReturnTypeAttrs.RETURN_PAGINATION_TYPE}",
                         None,
                     )
-                    or context.get(ReturnTypeAttrs.RETURN_PAGINATION_TYPE)
+                    or from_context(ReturnTypeAttrs.RETURN_PAGINATION_TYPE)
                     or getattr(self, ReturnTypeAttrs.RETURN_PAGINATION_TYPE, None)
                 )
 
             # подставляем return_type для метода
             return_type = (
                 kwargs.get(ReturnTypeAttrs.RETURN_TYPE, None)
-                or context.get(f"{method_name}_{ReturnTypeAttrs.RETURN_TYPE}")
+                or from_context(f"{method_name}_{ReturnTypeAttrs.RETURN_TYPE}")
                 or getattr(self, f"{method_name}_{ReturnTypeAttrs.RETURN_TYPE}", None)
             )
             # подставляем return_type для detail
             if detail:
                 return_type = (
                     return_type
-                    or context.get(ReturnTypeAttrs.RETURN_DETAIL_TYPE)
+                    or from_context(ReturnTypeAttrs.RETURN_DETAIL_TYPE)
                     or getattr(self, ReturnTypeAttrs.RETURN_DETAIL_TYPE, None)
                 )
             # подставляем общий return_type
             return_type = (
                 return_type
-                or context.get(ReturnTypeAttrs.RETURN_TYPE)
+                or from_context(ReturnTypeAttrs.RETURN_TYPE)
                 or getattr(self, ReturnTypeAttrs.RETURN_TYPE, None)
             )
             kwargs[ReturnTypeAttrs.RETURN_TYPE] = return_type
             return function(self, *args, **kwargs)
 
+        if inspect.iscoroutinefunction(function):
+
+            @wraps(function)
+            async def async_wrapper(self, *args, **kwargs):
+                return await wrapper(self, *args, **kwargs)
+
+            return async_wrapper
         return wrapper
 
     if target and isinstance(target, Callable):
@@ -104,6 +136,102 @@ def bind_return_type(target: Callable = None, *, detail: bool = False, paginated
     return decorator
 
 
+def _normalize(value: Any) -> Hashable:
+    """Приводит аргумент вызова к хэшируемому виду, одинаковому для равных значений"""
+    if isinstance(value, BaseModel):
+        return type(value), value.model_dump_json()
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(map(repr, value)))
+    if isinstance(value, Hashable):
+        return value
+    return repr(value)
+
+
+def coalesce(target: Callable = None, *, name: str = None):
+    """Объединяет одновременные одинаковые вызовы метода чтения в одно выполнение
+
+    Notes:
+        Вызовы с одинаковыми (метод, DTO, аргументы) в рамках процесса выполняются один раз, остальные потоки
+        дожидаются и получают глубокую копию его результата. Если задано `<method>_coalesce_shared_timeout`,
+        выполнение также объединяется между процессами через общий кэш: процесс ждет только выполнение,
+        начатое до его вызова, и не получает результаты завершенных выполнений
+        (см. [`SharedFlight`][contrib.clean_architecture.utils.cache.SharedFlight]). Каждый вызов при этом
+        выполняет несколько запросов к кэшу, а ожидание занимает воркер, поэтому объединение между процессами
+        включается только с Redis или memcached и таймаутом меньше `<method>_queue_timeout` представления
+
+        Объединение включается атрибутом `<method>_coalesce` с тем же приоритетом, что и типы
+        в `bind_return_type`: контекст, представление текущего запроса, атрибуты класса.
+        Декоратор применяется под `bind_return_type`, чтобы DTO входили в ключ вызова.
+        Вложенный вызов с тем же ключом (`super().retrieve(...)` из переопределенного метода) выполняется
+        без объединения, иначе поток ждал бы сам себя
+
+    Args:
+        target: Декорируемая функция
+        name: Имя метода, атрибуты которого читаются. По умолчанию имя clean method или функции
+
+    """
+
+    def decorator(function: Callable):
+        method_name = name or getattr(function, "__method_name__", function.__name__)
+        coalesce_attr = f"{method_name}_{CoalesceAttrs.COALESCE}"
+        shared_timeout_attr = f"{method_name}_{CoalesceAttrs.COALESCE_SHARED_TIMEOUT}"
+
+        @wraps(function)
+        def wrapper(self, *args, **kwargs):
+            context = get_root_context()
+            if not context.initialized:
+                context = {}
+            source = context.get(ReturnTypeAttrs.RETURN_TYPES_SOURCE)
+
+            def from_context(key: str):
+                value = context.get(key)
+                if value is None:
+                    value = getattr(source, key, None)
+                if value is None:
+                    value = getattr(self, key, None)
+                return value
+
+            if not from_context(coalesce_attr):
+                return function(self, *args, **kwargs)
+
+            label = f"{type(self).__name__}.{method_name}"
+            key = (type(self), method_name, _normalize(args), _normalize(kwargs))
+            call = partial(function, self, *args, **kwargs)
+
+            active_keys = _local.__dict__.setdefault("keys", set())
+            if key in active_keys:
+                return call()
+
+            shared_timeout = from_context(shared_timeout_attr)
+            if shared_timeout:
+                call = partial(_shared_flight.do, key, call, shared_timeout, label=label)
+
+            active_keys.add(key)
+            try:
+                return _single_flight.do(key, call, label=label, copy_result=deepcopy)
+            finally:
+                active_keys.discard(key)
+
+        return wrapper
+
+    if target and isinstance(target, Callable):
+        return decorator(target)
+    return decorator
+
+
+def get_coalesced_hits() -> dict[str, dict[str, int]]:
+    """Возвращает количество объединенных вызовов по методам
+
+    Returns:
+        Словарь вида {"local": {"Interactor.method": количество}, "shared": {...}}
+    """
+    return {"local": dict(_single_flight.hits), "shared": dict(_shared_flight.hits)}
+
+
 def with_repository_atomic(target: Callable | None = None, /, attr="repository", **atomic_kwargs):
     def decorator(function):
         @wraps(function)
@@ -116,3 +244,32 @@ def with_repository_atomic(target: Callable | None = None, /, attr="repository",
     if target and isinstance(target, Callable):
         return decorator(target)
     return decorator
+
+
+def export_formatter(*values: str) -> Callable[[Callable], Callable]:
+    """Помечает форматтер экспорта как работающий со значениями полей, а не с объектом
+
+    Notes:
+        Форматтер вызывается со значениями перечисленных полей (lookup вида `status__name`) в качестве
+        позиционных аргументов. Это позволяет экспорту получать колонки из БД через values_list,
+        не создавая объекты модели
+
+    Examples:
+        >>> {"status": export_formatter("status__name")(str)}
+
+    Args:
+        *values: Поля (lookup), значения которых передаются в форматтер
+
+    Returns:
+        Декоратор форматтера
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args):
+            return function(*args)
+
+        wrapper.export_values = values
+        return wrapper
+
+    return decorator
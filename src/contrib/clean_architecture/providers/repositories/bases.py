@@ -11,12 +11,14 @@ Classes:
     CreateRepositoryMixin: Миксин репозитория создания
     BulkCreateRepositoryMixin: Миксин репозитория массового создания
     UpdateOrCreateRepositoryMixin: Миксин репозитория обновления или создания
+    BulkUpsertRepositoryMixin: Миксин репозитория массового обновления или создания
     DetailOrCreateRepositoryMixin: Миксин репозитория получения деталей или создания
 
 ## Обновление
 
 Classes:
     UpdateOrCreateRepositoryMixin: Миксин репозитория обновления или создания
+    BulkUpsertRepositoryMixin: Миксин репозитория массового обновления или создания
     UpdateRepositoryMixin: Миксин репозитория обновления
     MultiUpdateRepositoryMixin: Миксин репозитория множественного обновления
 
@@ -40,6 +42,8 @@ Classes:
     GetByIdsRepositoryMixin: Миксин репозитория получения списка объектов по id
     RetrieveRepositoryMixin: Миксин репозитория получения списка объектов
     SearchRepositoryMixin: Миксин репозитория получения списка объектов по полнотекстовому поиску
+    AutocompleteRepositoryMixin: Миксин репозитория автодополнения по префиксу
+    ExportRepositoryMixin: Миксин репозитория потоковой выгрузки записей
     ExistsRepositoryMixin: Миксин репозитория проверки существования записи
 
 ## Прочее
@@ -64,15 +68,22 @@ Classes:
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Awaitable
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
 from contextlib import suppress
 from enum import Enum
+from itertools import islice
 from typing import Any
+from typing import Self
 
+from asgiref.sync import sync_to_async
 from contrib.clean_architecture.consts import CleanMethods
 from contrib.clean_architecture.consts import RepositoryMethodAttrs
+from contrib.clean_architecture.consts import WRITE_CLEAN_METHODS
 from contrib.clean_architecture.dto_based_objects.bases import BaseDTOBasedObjectsMixin
 from contrib.clean_architecture.dto_based_objects.dtos import M2MUpdateAction
 from contrib.clean_architecture.dto_based_objects.utils import convert_return
@@ -81,9 +92,12 @@ from contrib.clean_architecture.interfaces import DTO
 from contrib.clean_architecture.interfaces import Entity
 from contrib.clean_architecture.interfaces import Model
 from contrib.clean_architecture.interfaces import ObjectId
+from contrib.clean_architecture.interfaces import QuerySet
+from contrib.clean_architecture.providers.repositories.interfaces import IAutocompleteRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IBulkCreateRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IBulkDeleteRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IBulkUpdateRepositoryMixin
+from contrib.clean_architecture.providers.repositories.interfaces import IBulkUpsertRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import ICreateRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import ICreateUpdateBaseRepository
 from contrib.clean_architecture.providers.repositories.interfaces import IDeleteRepositoryMixin
@@ -92,6 +106,7 @@ from contrib.clean_architecture.providers.repositories.interfaces import IDetail
 from contrib.clean_architecture.providers.repositories.interfaces import IDetailOrCreateRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IDetailRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IExistsRepositoryMixin
+from contrib.clean_architecture.providers.repositories.interfaces import IExportRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IGetByIdsRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IGetSoloRepositoryMixin
 from contrib.clean_architecture.providers.repositories.interfaces import IMultiUpdateRepositoryMixin
@@ -106,6 +121,9 @@ from contrib.clean_architecture.providers.repositories.utils import has_field
 from contrib.clean_architecture.types import mixin_for
 from contrib.clean_architecture.utils.exceptions import BaseExceptionRedirect
 from contrib.clean_architecture.utils.exceptions import ExceptionRedirect
+from contrib.clean_architecture.utils.identity_map import get_identity_map
+from contrib.clean_architecture.utils.identity_map import IdentityMap
+from contrib.clean_architecture.utils.identity_map import invalidates_identity_map
 from contrib.clean_architecture.utils.method import clean_method
 from contrib.clean_architecture.utils.method import CleanMethodMixin
 from contrib.clean_architecture.utils.query_dict import parse_query_dict
@@ -140,6 +158,8 @@ class BaseRepository(
     convert_return_decorator = convert_return
     exceptions_redirects: tuple[BaseExceptionRedirect] = ()
     order_by_mapping: dict[str, str] = {}
+    identity_map: bool = False
+    async_thread_sensitive: bool = True
 
     def __init_subclass__(cls, repository_base: bool = False, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -173,6 +193,10 @@ class BaseRepository(
             if getattr(cls, f"{method_name}_{RepositoryMethodAttrs.ATOMIC}", False):
                 method = cls.atomic_decorator(method)
 
+            # Вешаем декоратор очистки карты идентичности после изменения записей
+            if method_name in WRITE_CLEAN_METHODS:
+                method = invalidates_identity_map(method)
+
             # Вешаем декоратор конвертации результата метода
             if getattr(cls, f"{method_name}_{RepositoryMethodAttrs.CONVERT_RETURN}", False):
                 convert_path = getattr(cls, f"{method_name}_{RepositoryMethodAttrs.CONVERT_PATH}", None)
@@ -235,6 +259,70 @@ class BaseRepository(
         filter_args, filter_kwargs = self._prepare_filters(*conditions, filter_dto=filter_dto, **filters)
         return objects.get(*filter_args, **filter_kwargs)
 
+    def _run_async(self, function: Callable[[Self], Any]) -> Awaitable[Any]:
+        """Выполняет синхронный метод репозитория в потоке, не блокируя цикл событий
+
+        Notes:
+            Метод выполняется целиком, вместе с конвертацией результата и перенаправлением исключений,
+            поэтому ленивая подгрузка связей при конвертации не попадает в цикл событий.
+
+            Функция получает копию репозитория с DTO, выбранными на момент вызова: пока она ждет потока,
+            другой вызов может выбрать у общего репозитория другое DTO через `with_dto`.
+
+            Если async_thread_sensitive выключен, независимые вызовы выполняются параллельно в разных потоках
+            и разных соединениях с БД, поэтому, например, записи и их количество могут быть прочитаны
+            из разных снимков данных
+
+        Args:
+            function: Функция, вызывающая синхронный метод у переданного ей репозитория
+
+        Returns:
+            Результат метода
+        """
+        repository = self.copy_with_dto_context()
+        return sync_to_async(function, thread_sensitive=self.async_thread_sensitive)(repository)
+
+    @staticmethod
+    def _get_current_user() -> Any:
+        """Возвращает сохраненного в БД пользователя текущего запроса
+
+        Returns:
+            Пользователь или None вне запроса, без запроса в контексте и для анонимного пользователя
+        """
+        context = get_root_context()
+        if not context.initialized:
+            return None
+        user = context.current_user
+        return user if user is not None and user.pk else None
+
+    def _get_identity_map(self, dto: type[DTO] | None) -> IdentityMap | None:
+        """Возвращает карту идентичности текущего запроса, если репозиторий ее использует
+
+        Notes:
+            Записи, читаемые со связями (select_related / prefetch_related), в карте не хранятся:
+            запись модели очищает из карты только записи своей модели, и загруженные связи остались бы устаревшими
+
+        Args:
+            dto: DTO, для которого читаются записи
+
+        Returns:
+            Карта идентичности или None
+        """
+        if not self.identity_map:
+            return None
+        relations = self._models_dtos_related.get((self.model, dto))
+        if relations and (relations.select_related or relations.prefetch_related):
+            return None
+        return get_identity_map()
+
+    def _get_identity_dto(self) -> type[DTO] | None:
+        """Возвращает DTO, для которого читаются записи. Входит в ключ карты идентичности
+
+        Notes:
+            Вызывается один раз за вызов метода, чтобы чтение и запись в карту шли по одному DTO
+        """
+        return self._models_dtos.get(self.model)
+
     def _match_order_by_fields(self, fields: Sequence[str]) -> tuple[str, ...]:
         """Матчит сортировки с полями
 
@@ -263,6 +351,162 @@ class BaseRepository(
         """Возвращает список полей m2m"""
         return []
 
+    def _get_value_fields(self) -> list[str]:
+        """Возвращает список полей, значения которых хранятся в самой записи"""
+        return []
+
+    def _values_update(self, fields: Sequence[str], rows: Sequence[tuple]) -> int:
+        """Обновляет записи по первичному ключу без их предварительного чтения
+
+        Args:
+            fields: Обновляемые поля
+            rows: Кортежи вида (первичный ключ, *значения полей)
+
+        Returns:
+            Количество обновленных записей
+        """
+        instances = [self.model(**{self.primary_key_attr: pk, **dict(zip(fields, values))}) for pk, *values in rows]
+        return self.objects.bulk_update(instances, list(fields))
+
+    def _can_fast_update(self, fields: Iterable[str]) -> bool:
+        """Возвращает, можно ли обновить поля запросом UPDATE без чтения записи
+
+        Args:
+            fields: Обновляемые поля
+
+        Returns:
+            Можно ли использовать быстрый путь обновления
+        """
+        return not set(fields) & set(self._get_m2m_fields())
+
+    def _fast_update(
+        self,
+        primary_key: ObjectId,
+        data: dict[str, Any],
+        returning: Sequence[str] = None,
+        primary_key_attr: str = None,
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Обновляет запись по первичному ключу без ее предварительного чтения
+
+        Args:
+            primary_key: Значение поля поиска записи
+            data: Значения полей
+            returning: Поля, значения которых необходимо вернуть после обновления
+            primary_key_attr: Поле поиска записи. По умолчанию - первичный ключ репозитория
+
+        Returns:
+            Количество обновленных записей и значения полей returning
+        """
+        lookup = {primary_key_attr or self.primary_key_attr: primary_key}
+        count = self.objects.filter(**lookup).update(**data)
+        if not count or not returning:
+            return count, None
+
+        instance = self._get(**lookup)
+        return count, {field: getattr(instance, field) for field in returning}
+
+    def _iterate_converted(self, objects: QuerySet, chunk_size: int) -> Iterator[Entity | DTO]:
+        """Итерирует записи курсором, конвертируя их по пачкам
+
+        Notes:
+            QuerySet.iterator(chunk_size) читает записи серверным курсором (если он поддерживается БД)
+            и выполняет prefetch_related для каждой пачки, поэтому в памяти не бывает больше chunk_size записей
+
+        Args:
+            objects: Набор записей
+            chunk_size: Количество записей, получаемых из БД и конвертируемых за раз
+
+        Returns:
+            Итератор Entity или DTO
+        """
+        # Декоратор берется из класса: через экземпляр функция была бы привязана как метод
+        convert_chunk = type(self).convert_return_decorator(self.model, self.entity)(_return_objects)
+        iterator = objects.iterator(chunk_size=chunk_size)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield from convert_chunk(self, chunk)
+
+    def _can_copy_create(self) -> bool:
+        """Возвращает, поддерживает ли хранилище создание записей потоковым копированием (COPY)"""
+        return False
+
+    def _copy_create(self, objects: list[Model], return_pks: bool = False) -> list[ObjectId] | None:
+        """Создает записи потоковым копированием (COPY)
+
+        Notes:
+            Базовая реализация создает записи через bulk_create. Хранилища с потоковым копированием
+            переопределяют метод вместе с `_can_copy_create`
+
+        Args:
+            objects: Экземпляры модели
+            return_pks: Вернуть ли первичные ключи созданных записей
+
+        Returns:
+            Список первичных ключей, если return_pks
+        """
+        self.objects.bulk_create(objects)
+        return [instance.pk for instance in objects] if return_pks else None
+
+    def _has_saved_receivers(self) -> bool:
+        """Возвращает, нужно ли сообщать о записях, сохраненных в обход сохранения модели"""
+        return False
+
+    def _send_saved(self, pks: Iterable[ObjectId]) -> None:
+        """Сообщает о записях, созданных или измененных в обход сохранения модели
+
+        Notes:
+            Вызывается массовыми методами, чтобы подписчики на сохранение модели (например, ленты изменений)
+            узнавали и об этих изменениях
+
+        Args:
+            pks: Первичные ключи записей
+        """
+
+    def _upsert(
+        self,
+        instances: Mapping[tuple, Model],
+        unique_fields: Sequence[str],
+        update_fields: Sequence[str],
+    ) -> tuple[list[ObjectId], list[ObjectId]]:
+        """Создает или обновляет записи по уникальным полям
+
+        Notes:
+            Базовая реализация определяет существующие записи запросом до вставки,
+            поэтому запись, созданная параллельно между запросами, считается созданной.
+            Хранилища с INSERT ... RETURNING переопределяют метод
+
+        Args:
+            instances: Экземпляры модели по значениям уникальных полей
+            unique_fields: Поля уникального ограничения
+            update_fields: Поля, обновляемые у существующих записей. Пустые - существующие записи не изменяются
+
+        Returns:
+            Кортеж из первичных ключей созданных и первичных ключей обновленных записей
+        """
+
+        def get_primary_keys() -> dict[tuple, ObjectId]:
+            objects = self.objects.filter(
+                **{f"{field}__in": {key[index] for key in instances} for index, field in enumerate(unique_fields)}
+            )
+            primary_keys = {}
+            for *key, pk in objects.values_list(*unique_fields, self.primary_key_attr):
+                if tuple(key) in instances:
+                    primary_keys[tuple(key)] = pk
+            return primary_keys
+
+        existing = get_primary_keys()
+        if update_fields:
+            self.objects.bulk_create(
+                list(instances.values()),
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
+            )
+        else:
+            self.objects.bulk_create(list(instances.values()), ignore_conflicts=True)
+
+        created = [pk for key, pk in get_primary_keys().items() if key not in existing]
+        return created, list(existing.values()) if update_fields else []
+
     def get_ids(
         self,
         *conditions: Any,
@@ -302,6 +546,34 @@ class CreateUpdateBaseRepository(ICreateUpdateBaseRepository, ABC, mixin_for(Bas
 
         return fields_to_process
 
+    def _bulk_update_m2m_relations(self, data: Mapping[ObjectId, dict[str, Any]]) -> set[str]:
+        """Обновляет значения связей m2m нескольких записей
+
+        Args:
+            data: Словарь вида {первичный ключ: словарь m2m полей с последовательностью M2MUpdateAction}
+
+        Returns:
+            Множество названий полей для обновления
+        """
+        m2m_fields = set(self._get_m2m_fields())
+
+        # Собираем действия всех записей по полям и применяем их одним вызовом на поле
+        fields_to_process = set()
+        field_actions: dict[str, dict[ObjectId, list[M2MUpdateAction]]] = {}
+        for primary_key, instance_data in data.items():
+            instance_fields = m2m_fields & instance_data.keys()
+            fields_to_process |= instance_fields
+            for field in instance_fields:
+                if (m2m_actions := instance_data[field]) is None:
+                    continue
+                actions = [M2MUpdateAction.model_validate(action) for action in m2m_actions]
+                field_actions.setdefault(field, {})[primary_key] = actions
+
+        for field, actions in field_actions.items():
+            self.m2m_manager.execute_many(self.model, field, actions)
+
+        return fields_to_process
+
 
 class CreateRepositoryMixin(ICreateRepositoryMixin, CreateUpdateBaseRepository, ABC, mixin_for(BaseRepository)):
     """Миксин репозитория создания"""
@@ -333,11 +605,11 @@ class CreateRepositoryMixin(ICreateRepositoryMixin, CreateUpdateBaseRepository,
         create_data = dict(**(entity.model_dump(**dump_kwargs) if entity else {}), **kwargs)
 
         # Записываем текущего пользователя и время
-        context = get_root_context()
-        if has_field(self.model, "created_by") and context.initialized and context.current_user.pk:
-            create_data["created_by"] = context.current_user
-        if has_field(self.model, "updated_by") and context.initialized and context.current_user.pk:
-            create_data["updated_by"] = context.current_user
+        if current_user := self._get_current_user():
+            if has_field(self.model, "created_by"):
+                create_data["created_by"] = current_user
+            if has_field(self.model, "updated_by"):
+                create_data["updated_by"] = current_user
 
         # Создаем необходимые модели
         instance = self.objects.create(**{k: v for k, v in create_data.items() if k not in self._get_m2m_fields()})
@@ -353,6 +625,11 @@ class CreateRepositoryMixin(ICreateRepositoryMixin, CreateUpdateBaseRepository,
                 "content_object": instance,
             }
             self.external_code_model.objects.create(**external_code_data)
+
+        # Созданная запись доступна последующим чтениям запроса без обращения к БД
+        dto = self._get_identity_dto()
+        if (identity_map := self._get_identity_map(dto)) is not None:
+            identity_map.set(self.model, instance.pk, instance, dto)
         return instance.pk
 
 
@@ -361,17 +638,22 @@ class BulkCreateRepositoryMixin(IBulkCreateRepositoryMixin, ABC, mixin_for(BaseR
 
     bulk_create_atomic: bool = True
     bulk_create_exceptions_redirects: tuple[BaseExceptionRedirect] = ()
+    bulk_create_batch_size: int = 1000
+    bulk_create_copy: bool = False
 
     @clean_method(name=CleanMethods.BULK_CREATE)
     def bulk_create(
         self,
-        entities: list[Entity] = None,
+        entities: Iterable[Entity] = None,
         exclude_unset: bool = True,
         exclude: set = None,
         include: set = None,
         extra_dump_kwargs: dict = None,
+        batch_size: int = None,
+        copy: bool = None,
+        return_pk_range: bool = False,
         **kwargs,
-    ) -> None:
+    ) -> tuple[ObjectId, ObjectId] | None:
         # Агрегируем данные для создания
         extra_dump_kwargs = extra_dump_kwargs if extra_dump_kwargs else {}
         dump_kwargs = dict(
@@ -380,20 +662,43 @@ class BulkCreateRepositoryMixin(IBulkCreateRepositoryMixin, ABC, mixin_for(BaseR
             include=include,
             **extra_dump_kwargs,
         )
-        context = get_root_context()
 
-        bulk_create_content: list[Model] = []
-        for entity in entities:
-            # Записываем текущего пользователя и время
+        # Записываем текущего пользователя
+        user_data = {}
+        if current_user := self._get_current_user():
+            if has_field(self.model, "created_by"):
+                user_data["created_by"] = current_user
+            if has_field(self.model, "updated_by"):
+                user_data["updated_by"] = current_user
+
+        def build_instance(entity: Entity | None) -> Model:
             create_data = dict(**(entity.model_dump(**dump_kwargs) if entity else {}), **kwargs)
-            if has_field(self.model, "created_by") and context.initialized and context.current_user.pk:
-                create_data["created_by"] = context.current_user
-            if has_field(self.model, "updated_by") and context.initialized and context.current_user.pk:
-                create_data["updated_by"] = context.current_user
-            bulk_create_content.append(self.model(**create_data))
+            create_data.update(user_data)
+            return self.model(**create_data)
+
+        copy = self.bulk_create_copy if copy is None else copy
+        copy = copy and self._can_copy_create()
+        batch_size = batch_size or self.bulk_create_batch_size
+        send_saved = self._has_saved_receivers()
+        return_pks = return_pk_range or send_saved
+
+        # Создаем модели пачками, не материализуя весь входной итератор
+        instances = map(build_instance, entities or ())
+        pk_range = None
+        while chunk := list(islice(instances, batch_size)):
+            if copy:
+                pks = self._copy_create(chunk, return_pks=return_pks)
+            else:
+                self.objects.bulk_create(chunk)
+                pks = [instance.pk for instance in chunk] if return_pks else None
 
-        # Создаем необходимые модели
-        self.objects.bulk_create(bulk_create_content)
+            if send_saved and pks:
+                self._send_saved(pks)
+            if pks and return_pk_range:
+                first, last = min(pks), max(pks)
+                pk_range = (min(first, pk_range[0]), max(last, pk_range[1])) if pk_range else (first, last)
+
+        return pk_range
 
 
 class UpdateRepositoryMixin(IUpdateRepositoryMixin, CreateUpdateBaseRepository, mixin_for(BaseRepository)):
@@ -401,6 +706,7 @@ class UpdateRepositoryMixin(IUpdateRepositoryMixin, CreateUpdateBaseRepository,
 
     update_atomic: bool = True
     update_exceptions_redirects: tuple[BaseExceptionRedirect] = ()
+    update_fast: bool = False
 
     @clean_method(name=CleanMethods.UPDATE)
     def update(
@@ -412,8 +718,10 @@ class UpdateRepositoryMixin(IUpdateRepositoryMixin, CreateUpdateBaseRepository,
         include: set = None,
         extra_dump_kwargs: dict = None,
         primary_key_attr: str = None,
+        fast: bool = None,
+        returning: Sequence[str] = None,
         **kwargs,
-    ) -> ObjectId:
+    ) -> ObjectId | dict[str, Any]:
         # Агрегируем данные для обновления
         extra_dump_kwargs = extra_dump_kwargs if extra_dump_kwargs else {}
         dump_kwargs = dict(
@@ -427,12 +735,22 @@ class UpdateRepositoryMixin(IUpdateRepositoryMixin, CreateUpdateBaseRepository,
         primary_key_attr = primary_key_attr or self.primary_key_attr
         # Получаем экземпляр целевой модели
         primary_key = updated_data.pop(primary_key_attr)
-        instance = self._get(**{primary_key_attr: primary_key})
 
         # Записываем текущего пользователя и время
-        context = get_root_context()
-        if has_field(self.model, "updated_by") and context.initialized and context.current_user.pk:
-            updated_data["updated_by"] = context.current_user
+        if has_field(self.model, "updated_by") and (current_user := self._get_current_user()):
+            updated_data["updated_by"] = current_user
+
+        # Обновляем одним запросом UPDATE, не читая запись
+        fast = self.update_fast if fast is None else fast
+        if fast and updated_data and self._can_fast_update(updated_data):
+            count, returned = self._fast_update(primary_key, updated_data, returning, primary_key_attr)
+            if not count:
+                raise self.object_does_not_exist_exception
+            if self._has_saved_receivers():
+                self._send_saved(self.get_ids(**{primary_key_attr: primary_key}))
+            return returned if returning else primary_key
+
+        instance = self._get(**{primary_key_attr: primary_key})
 
         # Обновляем переданные значения
         processed_fields = self._update_m2m_relations(instance, updated_data)
@@ -446,25 +764,29 @@ class UpdateRepositoryMixin(IUpdateRepositoryMixin, CreateUpdateBaseRepository,
         if updated_data:
             instance.save(update_fields=updated_data.keys())
 
+        if returning:
+            return {field: getattr(instance, field) for field in returning}
         return instance.pk
 
 
-class BulkUpdateRepositoryMixin(IBulkUpdateRepositoryMixin, ABC, mixin_for(BaseRepository)):
+class BulkUpdateRepositoryMixin(IBulkUpdateRepositoryMixin, CreateUpdateBaseRepository, ABC, mixin_for(BaseRepository)):
     """Миксин репозитория массового обновления"""
 
     bulk_update_atomic: bool = True
     bulk_update_exceptions_redirects: tuple[BaseExceptionRedirect] = ()
+    bulk_update_batch_size: int = 1000
 
     @clean_method(name=CleanMethods.BULK_UPDATE)
     def bulk_update(
         self,
-        entities: list[Entity] = None,
+        entities: Iterable[Entity] = None,
         exclude_unset: bool = True,
         exclude: set = None,
         include: set = None,
         extra_dump_kwargs: dict = None,
+        batch_size: int = None,
         **kwargs,
-    ) -> None:
+    ) -> int:
         # Агрегируем данные для обновления
         exclude = exclude or set()
         exclude.add("id")
@@ -476,28 +798,41 @@ class BulkUpdateRepositoryMixin(IBulkUpdateRepositoryMixin, ABC, mixin_for(BaseR
             include=include,
             **extra_dump_kwargs,
         )
-        context = get_root_context()
-
-        entities_with_ids = {item.id: item for item in entities}
-        bulk_update_content: list[Model] = []
-        objects = self.model.objects.filter(pk__in=entities_with_ids.keys())
+        batch_size = batch_size or self.bulk_update_batch_size
 
-        fields = set()
         extra_updated_fileds = {}
-        if has_field(self.model, "updated_by") and context.initialized and context.current_user.pk:
-            extra_updated_fileds["updated_by"] = context.current_user
-        for item in objects:
-            # Записываем текущего пользователя и время
-            entity = entities_with_ids[item.pk]
-            update_data = dict(**(entity.model_dump(**dump_kwargs) if entity else {}), **kwargs)
+        if has_field(self.model, "updated_by") and (current_user := self._get_current_user()):
+            extra_updated_fileds["updated_by"] = current_user
+
+        # Группируем записи по набору обновляемых полей
+        m2m_fields = set(self._get_m2m_fields())
+        m2m_data: dict[ObjectId, dict[str, Any]] = {}
+        groups: dict[tuple[str, ...], list[tuple]] = {}
+        for entity in entities or ():
+            primary_key = getattr(entity, self.primary_key_attr)
+            update_data = dict(**entity.model_dump(**dump_kwargs), **kwargs)
             update_data.update(extra_updated_fileds)
-            for key, value in update_data.items():
-                setattr(item, key, value)
-            bulk_update_content.append(item)
-            fields.update(update_data.keys())
 
-        # Обновляем модели
-        self.objects.bulk_update(bulk_update_content, list(fields))
+            if entity_m2m_fields := m2m_fields & update_data.keys():
+                m2m_data[primary_key] = {field: update_data.pop(field) for field in entity_m2m_fields}
+
+            if update_data:
+                fields = tuple(sorted(update_data))
+                groups.setdefault(fields, []).append((primary_key, *(update_data[field] for field in fields)))
+
+        # Обновляем связи m2m всех записей одним набором запросов на поле
+        if m2m_data:
+            self._bulk_update_m2m_relations(m2m_data)
+
+        # Обновляем модели одним запросом на пачку
+        updated_count = 0
+        for fields, rows in groups.items():
+            for start in range(0, len(rows), batch_size):
+                updated_count += self._values_update(fields, rows[start : start + batch_size])
+
+        if updated_count and self._has_saved_receivers():
+            self._send_saved({row[0] for rows in groups.values() for row in rows} | m2m_data.keys())
+        return updated_count
 
 
 class MultiUpdateRepositoryMixin(IMultiUpdateRepositoryMixin, ABC, mixin_for(BaseRepository)):
@@ -529,13 +864,15 @@ class MultiUpdateRepositoryMixin(IMultiUpdateRepositoryMixin, ABC, mixin_for(Bas
         updated_data = dict(**(entity.model_dump(**dump_kwargs) if entity else {}))
 
         # Записываем текущего пользователя и время
-        context = get_root_context()
-        if has_field(self.model, "updated_by") and context.initialized and context.current_user.pk:
-            updated_data["updated_by"] = context.current_user
+        if has_field(self.model, "updated_by") and (current_user := self._get_current_user()):
+            updated_data["updated_by"] = current_user
 
         # Обновляем значения
         if updated_data:
+            pks = list(self.get_ids(**conditions)) if self._has_saved_receivers() else None
             self._filter(**conditions).update(**updated_data)
+            if pks:
+                self._send_saved(pks)
 
 
 class _BaseOrCreate:
@@ -569,9 +906,9 @@ class _BaseOrCreate:
         defaults = defaults if defaults else {}
 
         # Записываем текущего пользователя и время
-        context = get_root_context()
-        if has_field(self.model, "updated_by") and context.initialized and context.current_user.pk:
-            defaults["updated_by"] = context.current_user
+        current_user = self._get_current_user()
+        if has_field(self.model, "updated_by") and current_user:
+            defaults["updated_by"] = current_user
 
         # Ищем по внешнему ключу и обновляем данные
         if from_external_code:
@@ -594,8 +931,8 @@ class _BaseOrCreate:
                 }
                 self.external_code_model.objects.create(**external_code_data)
             # Записываем текущего пользователя и время
-            if has_field(self.model, "created_by") and context.initialized and context.current_user.pk:
-                instance.created_by = context.current_user
+            if has_field(self.model, "created_by") and current_user:
+                instance.created_by = current_user
                 instance.save()
 
         if return_instance:
@@ -629,6 +966,113 @@ class UpdateOrCreateRepositoryMixin(IUpdateOrCreateRepositoryMixin, _BaseOrCreat
         )
 
 
+class BulkUpsertRepositoryMixin(IBulkUpsertRepositoryMixin, ABC, mixin_for(BaseRepository)):
+    """Миксин репозитория массового обновления или создания"""
+
+    bulk_upsert_atomic: bool = True
+    bulk_upsert_exceptions_redirects: tuple[BaseExceptionRedirect] = ()
+    bulk_upsert_batch_size: int = 1000
+    bulk_upsert_unique_fields: tuple[str, ...] = ()
+
+    @clean_method(name=CleanMethods.BULK_UPSERT)
+    def bulk_upsert(
+        self,
+        entities: Iterable[Entity] = None,
+        unique_fields: Sequence[str] = None,
+        update_fields: Sequence[str] = None,
+        exclude_unset: bool = True,
+        exclude: set = None,
+        include: set = None,
+        extra_dump_kwargs: dict = None,
+        batch_size: int = None,
+        **kwargs,
+    ) -> tuple[int, int]:
+        unique_fields = tuple(unique_fields or self.bulk_upsert_unique_fields)
+        if not unique_fields:
+            raise ValueError("Не заданы поля уникального ограничения для bulk_upsert")
+
+        # Агрегируем данные для создания / обновления
+        extra_dump_kwargs = extra_dump_kwargs if extra_dump_kwargs else {}
+        dump_kwargs = dict(
+            exclude_unset=exclude_unset,
+            exclude=exclude,
+            include=include,
+            **extra_dump_kwargs,
+        )
+        batch_size = batch_size or self.bulk_upsert_batch_size
+
+        # Записываем текущего пользователя: created_by только при создании, updated_by всегда
+        user_data = {}
+        if current_user := self._get_current_user():
+            if has_field(self.model, "created_by"):
+                user_data["created_by"] = current_user
+            if has_field(self.model, "updated_by"):
+                user_data["updated_by"] = current_user
+
+        # Проверяем уникальные поля до записи, чтобы ошибка в данных не оставила часть пачек сохраненной
+        upsert_rows = [
+            dict(**(entity.model_dump(**dump_kwargs) if entity else {}), **kwargs) for entity in entities or ()
+        ]
+        for upsert_data in upsert_rows:
+            if missing_fields := [field for field in unique_fields if field not in upsert_data]:
+                raise ValueError(f"Не заданы значения полей уникального ограничения для bulk_upsert: {missing_fields}")
+
+        created_count = updated_count = 0
+        groups: dict[tuple[str, ...], dict[tuple, dict[str, Any]]] = {}
+        for upsert_data in upsert_rows:
+            fields = tuple(sorted(upsert_data))
+            rows = groups.setdefault(fields, {})
+            rows[tuple(upsert_data[field] for field in unique_fields)] = upsert_data
+
+            if len(rows) >= batch_size:
+                del groups[fields]
+                created, updated = self._bulk_upsert_chunk(unique_fields, update_fields, fields, rows, user_data)
+                created_count, updated_count = created_count + created, updated_count + updated
+
+        for fields, rows in groups.items():
+            created, updated = self._bulk_upsert_chunk(unique_fields, update_fields, fields, rows, user_data)
+            created_count, updated_count = created_count + created, updated_count + updated
+
+        return created_count, updated_count
+
+    def _bulk_upsert_chunk(
+        self,
+        unique_fields: tuple[str, ...],
+        update_fields: Sequence[str] | None,
+        fields: tuple[str, ...],
+        rows: dict[tuple, dict[str, Any]],
+        user_data: dict[str, Any],
+    ) -> tuple[int, int]:
+        """Создает / обновляет пачку записей с одинаковым набором полей
+
+        Args:
+            unique_fields: Поля уникального ограничения
+            update_fields: Поля, обновляемые у существующих записей
+            fields: Переданные поля записей пачки
+            rows: Данные записей по значениям уникальных полей
+            user_data: Данные текущего пользователя
+
+        Returns:
+            Кортеж из количества созданных и количества обновленных записей
+        """
+        chunk_update_fields = [
+            field
+            for field in fields
+            if field not in unique_fields and (update_fields is None or field in update_fields)
+        ]
+        if chunk_update_fields:
+            if "updated_by" in user_data:
+                chunk_update_fields.append("updated_by")
+            if has_field(self.model, "updated_at") and "updated_at" not in chunk_update_fields:
+                chunk_update_fields.append("updated_at")
+
+        instances = {key: self.model(**{**row, **user_data}) for key, row in rows.items()}
+        created, updated = self._upsert(instances, unique_fields, chunk_update_fields)
+        if (created or updated) and self._has_saved_receivers():
+            self._send_saved([*created, *updated])
+        return len(created), len(updated)
+
+
 class DetailOrCreateRepositoryMixin(IDetailOrCreateRepositoryMixin, _BaseOrCreate, ABC, mixin_for(BaseRepository)):
     """Миксин репозитория получения деталей или создания"""
 
@@ -704,6 +1148,15 @@ class DetailRepositoryMixin(IDetailRepositoryMixin, ABC, mixin_for(BaseRepositor
             if raise_exception:
                 raise error
 
+    def adetail(
+        self, *conditions: Any, filter_dto: DTO = None, raise_exception=True, **filters
+    ) -> Awaitable[Entity | DTO]:
+        return self._run_async(
+            lambda repository: repository.detail(
+                *conditions, filter_dto=filter_dto, raise_exception=raise_exception, **filters
+            )
+        )
+
 
 class DetailByPKRepositoryMixin(IDetailByPKRepositoryMixin, ABC, mixin_for(BaseRepository)):
     """Миксин репозитория получения деталей по первичному ключу"""
@@ -713,14 +1166,29 @@ class DetailByPKRepositoryMixin(IDetailByPKRepositoryMixin, ABC, mixin_for(BaseR
 
     @clean_method(name=CleanMethods.DETAIL_BY_PK)
     def detail_by_pk(self, pk: ObjectId, raise_exception=True, **filters) -> Entity | DTO:
+        dto = self._get_identity_dto()
+        identity_map = None if filters else self._get_identity_map(dto)
+        if identity_map is not None and (instance := identity_map.get(self.model, pk, dto)) is not None:
+            return instance
+
         try:
-            return self._get(**{self.primary_key_attr: pk}, **filters)
+            instance = self._get(**{self.primary_key_attr: pk}, **filters)
         except (
             self.object_does_not_exist_exception,
             self.multiple_objects_returned_exception,
         ) as error:
             if raise_exception:
                 raise error
+            return None
+
+        if identity_map is not None:
+            identity_map.set(self.model, pk, instance, dto)
+        return instance
+
+    def adetail_by_pk(self, pk: ObjectId, raise_exception=True, **filters) -> Awaitable[Entity | DTO]:
+        return self._run_async(
+            lambda repository: repository.detail_by_pk(pk, raise_exception=raise_exception, **filters)
+        )
 
 
 class DetailByExternalCodeRepositoryMixin(IDetailByExternalCodeRepositoryMixin, ABC, mixin_for(BaseRepository)):
@@ -747,13 +1215,25 @@ class GetByIdsRepositoryMixin(IGetByIdsRepositoryMixin, ABC, mixin_for(BaseRepos
 
     def get_by_ids(self, ids: list[ObjectId]) -> list[Entity | DTO]:
         """Получить позиции по id."""
-        return self._filter(pk__in=ids)
+        dto = self._get_identity_dto()
+        if (identity_map := self._get_identity_map(dto)) is None:
+            return self._filter(pk__in=ids)
+
+        # Читаем из БД только записи, которых нет в карте идентичности
+        instances = identity_map.get_many(self.model, ids, dto)
+        if missing_ids := [pk for pk in ids if pk not in instances]:
+            fetched = list(self._filter(pk__in=missing_ids))
+            identity_map.set_many(self.model, fetched, dto)
+            instances.update((instance.pk, instance) for instance in fetched)
+        return [instances[pk] for pk in ids if pk in instances]
 
 
 class RetrieveRepositoryMixin(IRetrieveRepositoryMixin, ABC, mixin_for(BaseRepository)):
     """Миксин репозитория получения списка объектов"""
 
     retrieve_convert_return: bool = True
+    iterate_chunk_size: int = 2000
+    iterate_convert_return: bool = False
 
     @clean_method(name=CleanMethods.RETRIEVE)
     def retrieve(
@@ -769,7 +1249,29 @@ class RetrieveRepositoryMixin(IRetrieveRepositoryMixin, ABC, mixin_for(BaseRepos
         objects = self._filter(*conditions, filter_dto=filter_dto, **filters)
         order_by = self._match_order_by_fields(order_by)
         objects = get_distinct_query(objects, distinct)
-        return get_query_page(objects, limit, offset, order_by)
+        objects = get_query_page(objects, limit, offset, order_by)
+
+        # Прочитанные записи переиспользуются последующими detail_by_pk / get_by_ids запроса
+        dto = self._get_identity_dto()
+        if (identity_map := self._get_identity_map(dto)) is not None:
+            objects = list(objects)
+            identity_map.set_many(self.model, objects, dto)
+        return objects
+
+    @clean_method(name=CleanMethods.ITERATE)
+    def iterate(
+        self,
+        *conditions: Any,
+        order_by: tuple[str] = (),
+        distinct: bool | tuple[str] = None,
+        chunk_size: int = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Iterator[Entity | DTO]:
+        objects = self._filter(*conditions, filter_dto=filter_dto, **filters)
+        objects = get_distinct_query(objects, distinct)
+        objects = get_query_page(objects, None, None, self._match_order_by_fields(order_by) or (self.primary_key_attr,))
+        yield from self._iterate_converted(objects, chunk_size or self.iterate_chunk_size)
 
     @clean_method(name=CleanMethods.COUNT)
     def count(
@@ -782,6 +1284,42 @@ class RetrieveRepositoryMixin(IRetrieveRepositoryMixin, ABC, mixin_for(BaseRepos
         objects = self._filter(*conditions, filter_dto=filter_dto, **filters)
         return get_distinct_query(objects, distinct).count()
 
+    def aretrieve(
+        self,
+        *conditions: Any,
+        limit: int = None,
+        offset: int = None,
+        order_by: tuple[str] = (),
+        distinct: bool | tuple[str] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Awaitable[list[Entity | DTO]]:
+        # Результат вычисляется в список в потоке, чтобы ленивый QuerySet не вычислялся в цикле событий
+        return self._run_async(
+            lambda repository: list(
+                repository.retrieve(
+                    *conditions,
+                    limit=limit,
+                    offset=offset,
+                    order_by=order_by,
+                    distinct=distinct,
+                    filter_dto=filter_dto,
+                    **filters,
+                )
+            )
+        )
+
+    def acount(
+        self,
+        *conditions: Any,
+        filter_dto: DTO = None,
+        distinct: bool | tuple[str] = None,
+        **filters,
+    ) -> Awaitable[int]:
+        return self._run_async(
+            lambda repository: repository.count(*conditions, filter_dto=filter_dto, distinct=distinct, **filters)
+        )
+
 
 class SearchRepositoryMixin(ISearchRepositoryMixin, ABC, mixin_for(BaseRepository)):
     """Миксин репозитория получения списка объектов по полнотекстовому поиску"""
@@ -828,6 +1366,114 @@ class SearchRepositoryMixin(ISearchRepositoryMixin, ABC, mixin_for(BaseRepositor
         )
         return get_distinct_query(objects, distinct).count()
 
+    def asearch(
+        self,
+        search: str,
+        *conditions: Any,
+        limit: int = None,
+        offset: int = None,
+        order_by: tuple[str] = (),
+        distinct: bool | tuple[str] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Awaitable[list[Entity | DTO]]:
+        # Результат вычисляется в список в потоке, чтобы ленивый QuerySet не вычислялся в цикле событий
+        return self._run_async(
+            lambda repository: list(
+                repository.search(
+                    search,
+                    *conditions,
+                    limit=limit,
+                    offset=offset,
+                    order_by=order_by,
+                    distinct=distinct,
+                    filter_dto=filter_dto,
+                    **filters,
+                )
+            )
+        )
+
+    def asearch_count(
+        self,
+        search: str,
+        *conditions: Any,
+        filter_dto: DTO = None,
+        distinct: bool | tuple[str] = None,
+        **filters,
+    ) -> Awaitable[int]:
+        return self._run_async(
+            lambda repository: repository.search_count(
+                search, *conditions, filter_dto=filter_dto, distinct=distinct, **filters
+            )
+        )
+
+
+class AutocompleteRepositoryMixin(IAutocompleteRepositoryMixin, ABC, mixin_for(BaseRepository)):
+    """Миксин репозитория автодополнения по префиксу"""
+
+    required_attrs = ("autocomplete_expressions", "prefix_filter_function")
+
+    autocomplete_expressions: Sequence[str] = ("name",)
+    autocomplete_only_fields: Sequence[str] | None = None
+    autocomplete_convert_return: bool = True
+    prefix_filter_function: Callable
+
+    @clean_method(name=CleanMethods.AUTOCOMPLETE)
+    def autocomplete(
+        self,
+        search: str,
+        *conditions: Any,
+        limit: int = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[Entity | DTO]:
+        only_fields = self.autocomplete_only_fields or (self.primary_key_attr, *self.autocomplete_expressions)
+
+        objects = self._filter(*conditions, filter_dto=filter_dto, **filters)
+        objects = self.__class__.prefix_filter_function(objects, search, *self.autocomplete_expressions)
+        return get_query_page(objects.only(*only_fields), limit, None, tuple(self.autocomplete_expressions))
+
+
+def _return_objects(self, objects):
+    """Возвращает объекты без изменений. Используется для конвертации пачек через convert_return_decorator"""
+    return objects
+
+
+class ExportRepositoryMixin(IExportRepositoryMixin, ABC, mixin_for(BaseRepository)):
+    """Миксин репозитория потоковой выгрузки записей"""
+
+    export_chunk_size: int = 2000
+    export_convert_return: bool = False
+
+    @clean_method(name=CleanMethods.EXPORT)
+    def export(
+        self,
+        *conditions: Any,
+        search: str = None,
+        order_by: tuple[str] = (),
+        chunk_size: int = None,
+        values: Sequence[str] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Iterator[Entity | DTO | tuple]:
+        chunk_size = chunk_size or self.export_chunk_size
+
+        objects = self._filter(*conditions, filter_dto=filter_dto, **filters)
+        if search and getattr(self, "search_expressions", None):
+            objects = self.__class__.search_filter_function(
+                objects, search, *self.search_expressions, **getattr(self, "search_extra_replaces", {})
+            )
+        objects = get_query_page(objects, None, None, self._match_order_by_fields(order_by) or (self.primary_key_attr,))
+        if values:
+            # Только запрошенные колонки, без создания объектов модели и конвертации
+            yield from objects.values_list(*values).iterator(chunk_size=chunk_size)
+            return
+
+        yield from self._iterate_converted(objects, chunk_size)
+
+    def get_value_fields(self) -> set[str]:
+        return set(self._get_value_fields())
+
 
 class ExistsRepositoryMixin(IExistsRepositoryMixin, ABC, mixin_for(BaseRepository)):
     """Миксин репозитория проверки существования записи"""
@@ -884,5 +1530,7 @@ class CRUDRepositoryMixin(CreateUpdateDeleteRepositoryMixin, ReadRepositoryMixin
     """Миксин репозитория создание / чтение /обновление / удаление"""
 
 
-class PatchListRepositoryMixin(UpdateRepositoryMixin, BulkCreateRepositoryMixin, BulkDeleteRepositoryMixin, ABC):
+class PatchListRepositoryMixin(
+    UpdateRepositoryMixin, BulkCreateRepositoryMixin, BulkUpdateRepositoryMixin, BulkDeleteRepositoryMixin, ABC
+):
     """Миксин репозитория модификации списка объектов"""
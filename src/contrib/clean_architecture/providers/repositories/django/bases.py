@@ -6,17 +6,40 @@ Classes:
 """
 from __future__ import annotations
 
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from functools import partial
+from typing import Any
+from typing import Self
+
 from django.conf import settings
 from contrib.clean_architecture.dto_based_objects.django.bases import (
     DjangoDTOBasedObjectsMixin,
 )
+from contrib.clean_architecture.interfaces import ObjectId
 from contrib.clean_architecture.providers.repositories.bases import BaseRepository
+from contrib.clean_architecture.providers.repositories.django.signals import records_saved
+from contrib.clean_architecture.providers.repositories.django.utils import call_closing_connections
+from contrib.clean_architecture.providers.repositories.django.utils import copy_create
+from contrib.clean_architecture.providers.repositories.django.utils import prefix_filter
+from contrib.clean_architecture.providers.repositories.django.utils import returning_update
+from contrib.clean_architecture.providers.repositories.django.utils import returning_upsert
 from contrib.clean_architecture.providers.repositories.django.utils import search_filter
+from contrib.clean_architecture.providers.repositories.django.utils import values_update
 from django.core.exceptions import MultipleObjectsReturned
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections
+from django.db import router
 from django.db import transaction
 from django.db.models import F
+from django.db.models import Model
 from django.db.models import Q
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.utils import timezone
 
 
 class DjangoRepository(
@@ -32,9 +55,85 @@ class DjangoRepository(
     multiple_objects_returned_exception = MultipleObjectsReturned
 
     search_filter_function = search_filter
+    prefix_filter_function = prefix_filter
     condition_wrapper = Q
     find_wrapper = F
 
+    def _run_async(self, function: Callable[[Self], Any]) -> Awaitable[Any]:
+        if self.async_thread_sensitive:
+            return super()._run_async(function)
+        return super()._run_async(partial(call_closing_connections, function))
+
     def _get_m2m_fields(self) -> list[str]:
         model_fields = self.model._meta.get_fields()
         return [field.name for field in model_fields if field.many_to_many]
+
+    def _get_value_fields(self) -> list[str]:
+        return [field.attname for field in self.model._meta.concrete_fields]
+
+    def _values_update(self, fields: Sequence[str], rows: Sequence[tuple]) -> int:
+        using = router.db_for_write(self.model)
+        if connections[using].vendor != "postgresql":
+            return super()._values_update(fields, rows)
+        return values_update(self.model, fields, rows, using=using)
+
+    def _can_fast_update(self, fields: Iterable[str]) -> bool:
+        return (
+            super()._can_fast_update(fields)
+            and self.model.save is Model.save
+            and not pre_save.has_listeners(self.model)
+            and not post_save.has_listeners(self.model)
+        )
+
+    def _fast_update(
+        self,
+        primary_key: ObjectId,
+        data: dict[str, Any],
+        returning: Sequence[str] = None,
+        primary_key_attr: str = None,
+    ) -> tuple[int, dict[str, Any] | None]:
+        # QuerySet.update не заполняет поля auto_now, в отличие от Model.save
+        now = timezone.now()
+        data = {
+            **{
+                field.name: field.to_python(now)
+                for field in self.model._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            },
+            **data,
+        }
+
+        using = router.db_for_write(self.model)
+        if not returning or connections[using].vendor != "postgresql":
+            return super()._fast_update(primary_key, data, returning, primary_key_attr)
+        objects = self.objects.filter(**{primary_key_attr or self.primary_key_attr: primary_key})
+        return returning_update(objects, data, returning, using=using)
+
+    def _has_saved_receivers(self) -> bool:
+        return records_saved.has_listeners(self.model)
+
+    def _send_saved(self, pks: Iterable[ObjectId]) -> None:
+        records_saved.send(sender=self.model, pks=list(pks), using=router.db_for_write(self.model))
+
+    def _can_copy_create(self) -> bool:
+        connection = connections[router.db_for_write(self.model)]
+        return (
+            connection.vendor == "postgresql"
+            and connection.Database.__name__ == "psycopg2"
+            and not self._get_m2m_fields()
+        )
+
+    def _copy_create(self, objects: list[Model], return_pks: bool = False) -> list[ObjectId] | None:
+        return copy_create(self.model, objects, using=router.db_for_write(self.model), return_pks=return_pks)
+
+    def _upsert(
+        self,
+        instances: Mapping[tuple, Model],
+        unique_fields: Sequence[str],
+        update_fields: Sequence[str],
+    ) -> tuple[list[ObjectId], list[ObjectId]]:
+        using = router.db_for_write(self.model)
+        if connections[using].vendor != "postgresql":
+            return super()._upsert(instances, unique_fields, update_fields)
+        rows = returning_upsert(self.model, list(instances.values()), unique_fields, update_fields, using=using)
+        return [pk for pk, created in rows if created], [pk for pk, created in rows if not created]
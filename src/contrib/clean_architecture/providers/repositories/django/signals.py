@@ -0,0 +1,14 @@
+"""Модуль с сигналами репозиториев django
+
+Notes:
+    Массовые методы репозитория (bulk_create, bulk_update, bulk_upsert, multi_update, быстрый update)
+    изменяют записи в обход Model.save, поэтому post_save для них не отправляется.
+    Вместо него после изменения отправляется `records_saved` с первичными ключами записей
+
+"""
+from __future__ import annotations
+
+from django.dispatch import Signal
+
+records_saved = Signal()
+"""Записи созданы или изменены в обход Model.save. Аргументы: sender - модель, pks - первичные ключи, using - алиас БД"""
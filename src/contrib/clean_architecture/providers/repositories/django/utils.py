@@ -2,18 +2,45 @@
 
 Functions:
     search_filter: Функция поиска подстроки для django
+    prefix_filter: Функция поиска по префиксу для django
+    copy_create: Создает записи через COPY FROM STDIN (PostgreSQL, psycopg2)
+    values_update: Обновляет записи одним запросом UPDATE ... FROM (VALUES ...) (PostgreSQL)
+    returning_update: Обновляет записи запросом UPDATE ... RETURNING (PostgreSQL)
+    returning_upsert: Создает или обновляет записи запросом INSERT ... ON CONFLICT ... RETURNING (PostgreSQL)
+    call_closing_connections: Вызывает функцию, закрывая после нее устаревшие соединения с БД потока
 
 """
 from __future__ import annotations
 
+import io
+from collections.abc import Callable
+from collections.abc import Sequence
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from django.db import close_old_connections
+from django.db import connections
+from django.db.models import AutoField
+from django.db.models import BigAutoField
 from django.db.models import CharField
+from django.db.models import Model
+from django.db.models import QuerySet
+from django.db.models import Q
+from django.db.models import SmallAutoField
 from django.db.models import Value
+from django.utils import timezone
 from django.db.models.functions import Cast
 from django.db.models.functions import Concat
 from django.db.models.functions import Replace
+from django.db.models.sql import UpdateQuery
 
 BASE_REPLACES = {" ": "", "'": "", '"': "", "\t": "", "\n": "", "\\": ""}
 """Стандартные замены"""
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+"""Экранирование значений текстового формата COPY"""
+COPY_NULL = "\\N"
+"""Значение NULL текстового формата COPY"""
 
 
 def search_filter(objects, search: str, *expressions, **extra_replaces):
@@ -45,3 +72,288 @@ def search_filter(objects, search: str, *expressions, **extra_replaces):
         expression = Replace(expression, Value(old), Value(new))
 
     return objects.annotate(search=expression).filter(search__icontains=search)
+
+
+def prefix_filter(objects, search: str, *expressions):
+    """Функция поиска по префиксу для django
+
+    Notes:
+        Использует `istartswith`, который в PostgreSQL разворачивается в `UPPER(field) LIKE UPPER('prefix%')`,
+        поэтому может обслуживаться индексом `OpClass(Upper(field), name="text_pattern_ops")`
+
+    Args:
+        objects: QuerySet
+        search: Префикс
+        *expressions: Поля запроса ORM
+
+    Returns:
+        QuerySet
+
+    """
+    if not expressions:
+        return objects
+
+    return objects.filter(reduce(or_, (Q(**{f"{expression}__istartswith": search}) for expression in expressions)))
+
+
+def _get_copy_value(value: Any) -> str:
+    """Возвращает значение в текстовом формате COPY"""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    if hasattr(value, "adapted") and hasattr(value, "dumps"):
+        # psycopg2.extras.Json, который возвращает JSONField.get_db_prep_save
+        value = value.dumps(value.adapted)
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_create(
+    model: type[Model],
+    instances: Sequence[Model],
+    using: str,
+    return_pks: bool = False,
+) -> list[Any] | None:
+    """Создает записи через COPY FROM STDIN (PostgreSQL, psycopg2)
+
+    Notes:
+        Значения полей подготавливаются так же, как в QuerySet.bulk_create (pre_save и get_db_prep_save),
+        поэтому заполняются auto_now_add и значения по умолчанию. Сигналы не отправляются, m2m не сохраняются.
+
+        Если нужно вернуть первичные ключи, они заранее выделяются из последовательности первичного ключа
+        и передаются в COPY вместе с остальными колонками
+
+    Args:
+        model: Модель
+        instances: Экземпляры модели
+        using: Алиас БД
+        return_pks: Вернуть ли первичные ключи созданных записей
+
+    Returns:
+        Список первичных ключей, если return_pks
+    """
+    connection = connections[using]
+    opts = model._meta
+    pk_field = opts.pk
+    quote_name = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        auto_pk = isinstance(pk_field, (AutoField, BigAutoField, SmallAutoField))
+        missing_pks = [instance for instance in instances if instance.pk is None] if auto_pk else []
+        if missing_pks and (return_pks or len(missing_pks) != len(instances)):
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+                [quote_name(opts.db_table), pk_field.column, len(missing_pks)],
+            )
+            for instance, (pk,) in zip(missing_pks, cursor.fetchall()):
+                instance.pk = pk
+            missing_pks = []
+
+        fields = [
+            field
+            for field in opts.concrete_fields
+            if not getattr(field, "generated", False) and not (missing_pks and field is pk_field)
+        ]
+        buffer = io.StringIO()
+        for instance in instances:
+            buffer.write(
+                "\t".join(
+                    _get_copy_value(field.get_db_prep_save(field.pre_save(instance, True), connection))
+                    for field in fields
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+
+        columns = ", ".join(quote_name(field.column) for field in fields)
+        cursor.copy_expert(f"COPY {quote_name(opts.db_table)} ({columns}) FROM STDIN", buffer)
+
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = using
+
+    if return_pks:
+        return [instance.pk for instance in instances]
+
+
+def values_update(model: type[Model], fields: Sequence[str], rows: Sequence[tuple], using: str) -> int:
+    """Обновляет записи одним запросом UPDATE ... FROM (VALUES ...) (PostgreSQL)
+
+    Notes:
+        Записи не читаются перед обновлением. Поля с auto_now обновляются текущим временем.
+        Сигналы не отправляются
+
+    Args:
+        model: Модель
+        fields: Имена обновляемых полей (name или attname)
+        rows: Кортежи вида (первичный ключ, *значения полей)
+        using: Алиас БД
+
+    Returns:
+        Количество обновленных записей
+    """
+    connection = connections[using]
+    opts = model._meta
+    quote_name = connection.ops.quote_name
+
+    model_fields = [opts.get_field(field) for field in fields]
+    auto_now_fields = [
+        field for field in opts.concrete_fields if getattr(field, "auto_now", False) and field not in model_fields
+    ]
+    columns = [opts.pk, *model_fields]
+    placeholders = ", ".join(f"CAST(%s AS {field.cast_db_type(connection)})" for field in columns)
+
+    # Параметры auto_now идут в SET, то есть раньше параметров VALUES
+    now = timezone.now()
+    params = [field.get_db_prep_save(field.to_python(now), connection) for field in auto_now_fields]
+    for pk, *values in rows:
+        params.append(opts.pk.get_db_prep_save(pk, connection))
+        for field, value in zip(model_fields, values):
+            if field.is_relation and isinstance(value, Model):
+                value = value.pk
+            params.append(field.get_db_prep_save(value, connection))
+
+    table = quote_name(opts.db_table)
+    assignments = [f"{quote_name(field.column)} = v.{quote_name(field.column)}" for field in model_fields]
+    assignments.extend(f"{quote_name(field.column)} = %s" for field in auto_now_fields)
+
+    sql = (
+        f"UPDATE {table} SET {', '.join(assignments)} "
+        f"FROM (VALUES {', '.join([f'({placeholders})'] * len(rows))}) "
+        f"AS v({', '.join(quote_name(field.column) for field in columns)}) "
+        f"WHERE {table}.{quote_name(opts.pk.column)} = v.{quote_name(opts.pk.column)}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def returning_update(
+    queryset: QuerySet,
+    values: dict[str, Any],
+    returning: Sequence[str],
+    using: str,
+) -> tuple[int, dict[str, Any] | None]:
+    """Обновляет записи запросом UPDATE ... RETURNING (PostgreSQL)
+
+    Notes:
+        Аналог QuerySet.update, дополнительно возвращающий значения полей обновленной записи
+        без повторного чтения. Если обновлено несколько записей, возвращаются значения первой из них
+
+    Args:
+        queryset: Набор обновляемых записей
+        values: Значения полей
+        returning: Поля, значения которых необходимо вернуть
+        using: Алиас БД
+
+    Returns:
+        Количество обновленных записей и значения полей returning
+    """
+    connection = connections[using]
+    opts = queryset.model._meta
+    quote_name = connection.ops.quote_name
+
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    compiler = query.get_compiler(using)
+    compiler.pre_sql_setup()
+    sql, params = compiler.as_sql()
+
+    fields = [opts.get_field(field) for field in returning]
+    columns = ", ".join(f"{quote_name(opts.db_table)}.{quote_name(field.column)}" for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f"{sql} RETURNING {columns}", params)
+        rows = cursor.fetchall()
+
+    if not rows:
+        return 0, None
+    returned = {
+        name: field.from_db_value(value, None, connection) if hasattr(field, "from_db_value") else value
+        for name, field, value in zip(returning, fields, rows[0])
+    }
+    return len(rows), returned
+
+
+def returning_upsert(
+    model: type[Model],
+    instances: Sequence[Model],
+    unique_fields: Sequence[str],
+    update_fields: Sequence[str],
+    using: str,
+) -> list[tuple[Any, bool]]:
+    """Создает или обновляет записи запросом INSERT ... ON CONFLICT ... RETURNING (PostgreSQL)
+
+    Notes:
+        Значения полей подготавливаются так же, как в QuerySet.bulk_create (pre_save и get_db_prep_save).
+        Созданная запись отличается от обновленной по системной колонке xmax: у вставленной строки она равна 0.
+        Без update_fields существующие записи не изменяются и не возвращаются. Сигналы не отправляются
+
+    Args:
+        model: Модель
+        instances: Экземпляры модели с различными значениями уникальных полей
+        unique_fields: Поля уникального ограничения
+        update_fields: Поля, обновляемые у существующих записей
+        using: Алиас БД
+
+    Returns:
+        Список пар (первичный ключ, создана ли запись)
+    """
+    connection = connections[using]
+    opts = model._meta
+    pk_field = opts.pk
+    quote_name = connection.ops.quote_name
+
+    auto_pk = isinstance(pk_field, (AutoField, BigAutoField, SmallAutoField))
+    fields = [
+        field
+        for field in opts.concrete_fields
+        if not getattr(field, "generated", False)
+        and not (auto_pk and field is pk_field and any(instance.pk is None for instance in instances))
+    ]
+    params = [
+        field.get_db_prep_save(field.pre_save(instance, True), connection)
+        for instance in instances
+        for field in fields
+    ]
+
+    table = quote_name(opts.db_table)
+    placeholders = f"({', '.join(['%s'] * len(fields))})"
+    conflict = ", ".join(quote_name(opts.get_field(field).column) for field in unique_fields)
+    if update_fields:
+        columns = [quote_name(opts.get_field(field).column) for field in update_fields]
+        action = "DO UPDATE SET " + ", ".join(f"{column} = EXCLUDED.{column}" for column in columns)
+    else:
+        action = "DO NOTHING"
+
+    sql = (
+        f"INSERT INTO {table} ({', '.join(quote_name(field.column) for field in fields)}) "
+        f"VALUES {', '.join([placeholders] * len(instances))} "
+        f"ON CONFLICT ({conflict}) {action} "
+        f"RETURNING {table}.{quote_name(pk_field.column)}, ({table}.xmax = 0)"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [(pk, created) for pk, created in cursor.fetchall()]
+
+
+def call_closing_connections(function: Callable, *args, **kwargs) -> Any:
+    """Вызывает функцию, закрывая после нее устаревшие соединения с БД потока
+
+    Notes:
+        Используется для вызовов в пуле потоков вне запроса: сигнал request_finished, закрывающий
+        соединения, для этих потоков не отправляется
+
+    Args:
+        function: Функция
+        *args: Позиционные аргументы функции
+        **kwargs: Именованные аргументы функции
+
+    Returns:
+        Результат функции
+    """
+    try:
+        return function(*args, **kwargs)
+    finally:
+        close_old_connections()
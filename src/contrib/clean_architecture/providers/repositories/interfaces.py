@@ -11,12 +11,14 @@ Classes:
     ICreateRepositoryMixin: Абстрактный интерфейс для миксина репозитория создания
     IBulkCreateRepositoryMixin: Абстрактный интерфейс для миксина репозитория массового создания
     IUpdateOrCreateRepositoryMixin: Абстрактный интерфейс для миксина репозитория обновления или создания
+    IBulkUpsertRepositoryMixin: Абстрактный интерфейс для миксина репозитория массового обновления или создания
     IDetailOrCreateRepositoryMixin: Абстрактный интерфейс для миксина репозитория получения деталей или создания
 
 ## Обновление
 
 Classes:
     IUpdateOrCreateRepositoryMixin: Абстрактный интерфейс для миксина репозитория обновления или создания
+    IBulkUpsertRepositoryMixin: Абстрактный интерфейс для миксина репозитория массового обновления или создания
     IUpdateRepositoryMixin: Абстрактный интерфейс для миксина репозитория обновления
     IMultiUpdateRepositoryMixin: Абстрактный интерфейс для миксина репозитория множественного обновления
 
@@ -40,6 +42,8 @@ Classes:
     IGetByIdsRepositoryMixin: Абстрактный интерфейс для миксина репозитория получения списка объектов по id
     IRetrieveRepositoryMixin: Абстрактный интерфейс для миксина репозитория получения списка объектов
     ISearchRepositoryMixin: Абстрактный интерфейс для миксина репозитория получения списка объектов по полнотекстовому поиску
+    IAutocompleteRepositoryMixin: Абстрактный интерфейс для миксина репозитория автодополнения по префиксу
+    IExportRepositoryMixin: Абстрактный интерфейс для миксина репозитория потоковой выгрузки записей
     IExistsRepositoryMixin: Абстрактный интерфейс для миксина репозитория проверки существования записи
 
 ## Прочее
@@ -65,7 +69,10 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Awaitable
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
 from enum import Enum
@@ -102,6 +109,10 @@ class IRepository(IDTOBasedObjectsMixin, ABC):
     """Класс исключения, вызываемый при наличии нескольких записи в БД"""
     exceptions_redirects: tuple[BaseExceptionRedirect]
     """Кортеж перенаправления ошибок"""
+    identity_map: bool
+    """Переиспользовать ли прочитанные в рамках запроса записи (detail_by_pk, get_by_ids, retrieve)"""
+    async_thread_sensitive: bool
+    """Выполнять ли асинхронные методы в общем потоке запроса, а не параллельно в пуле потоков"""
     external_code_model: Any
     """Кортеж перенаправления ошибок"""
     order_by_mapping: dict[str, str]
@@ -178,62 +189,88 @@ class IBulkCreateRepositoryMixin(ABC, mixin_for(IRepository)):
     """Выполнить в одной транзакции"""
     bulk_create_exceptions_redirects: tuple[BaseExceptionRedirect]
     """Кортеж дополнительных перенаправлений исключений"""
+    bulk_create_batch_size: int
+    """Количество записей, создаваемых одним запросом"""
+    bulk_create_copy: bool
+    """Создавать ли записи через COPY FROM STDIN, если хранилище это поддерживает (PostgreSQL, модели без m2m)"""
 
     @abstractmethod
     def bulk_create(
         self,
-        entities: list[Entity] = None,
+        entities: Iterable[Entity] = None,
         *args,
         exclude_unset: bool = True,
         exclude: set = None,
         include: set = None,
         extra_dump_kwargs: dict = None,
+        batch_size: int = None,
+        copy: bool = None,
+        return_pk_range: bool = False,
         **kwargs,
-    ) -> None:
+    ) -> tuple[ObjectId, ObjectId] | None:
         """Создает записи в БД
 
+        Notes:
+            entities читаются лениво, пачками по batch_size, поэтому можно передать генератор
+
         Args:
-            entities: Список экземпляров Entity
+            entities: Итерируемый объект экземпляров Entity
             *args: Позиционные аргументы
             exclude_unset: Исключить все не переданные поля
             exclude: Множество полей, которые необходимо исключить
             include: Множество полей, которые необходимо включить
             extra_dump_kwargs: Словарь параметров для передачи в PydanticModel.model_dump
+            batch_size: Количество записей, создаваемых одним запросом. По умолчанию bulk_create_batch_size
+            copy: Создавать ли записи через COPY. По умолчанию bulk_create_copy
+            return_pk_range: Вернуть ли диапазон первичных ключей созданных записей
             **kwargs: Дополнительные данные для обновления записи
 
+        Returns:
+            Кортеж (минимальный, максимальный) первичный ключ созданных записей, если return_pk_range.
+            При конкурентной вставке диапазон может включать записи других транзакций
         """
 
 
 class IBulkUpdateRepositoryMixin(ABC, mixin_for(IRepository)):
     """Абстрактный интерфейс для миксина репозитория массового обновления"""
 
-    bulk_create_atomic: bool
+    bulk_update_atomic: bool
     """Выполнить в одной транзакции"""
-    bulk_create_exceptions_redirects: tuple[BaseExceptionRedirect]
+    bulk_update_exceptions_redirects: tuple[BaseExceptionRedirect]
     """Кортеж дополнительных перенаправлений исключений"""
+    bulk_update_batch_size: int
+    """Количество записей, обновляемых одним запросом"""
 
     @abstractmethod
     def bulk_update(
         self,
-        entities: list[Entity] = None,
+        entities: Iterable[Entity] = None,
         *args,
         exclude_unset: bool = True,
         exclude: set = None,
         include: set = None,
         extra_dump_kwargs: dict = None,
+        batch_size: int = None,
         **kwargs,
-    ) -> None:
+    ) -> int:
         """Обновляет записи в БД
 
+        Notes:
+            Записи не читаются перед обновлением. Entity группируются по набору обновляемых полей,
+            и каждая группа обновляется одним запросом на пачку из batch_size записей
+
         Args:
-            entities: Список экземпляров Entity
+            entities: Итерируемый объект экземпляров Entity с заполненным первичным ключом
             *args: Позиционные аргументы
             exclude_unset: Исключить все не переданные поля
             exclude: Множество полей, которые необходимо исключить
             include: Множество полей, которые необходимо включить
             extra_dump_kwargs: Словарь параметров для передачи в PydanticModel.model_dump
+            batch_size: Количество записей, обновляемых одним запросом. По умолчанию bulk_update_batch_size
             **kwargs: Дополнительные данные для создания записи
 
+        Returns:
+            Количество обновленных записей
         """
 
 
@@ -244,6 +281,8 @@ class IUpdateRepositoryMixin(ABC, mixin_for(IRepository)):
     """Выполнить в одной транзакции"""
     update_exceptions_redirects: tuple[BaseExceptionRedirect]
     """Кортеж дополнительных перенаправлений исключений"""
+    update_fast: bool
+    """Обновлять запись одним запросом UPDATE без ее предварительного чтения, если это возможно"""
 
     @abstractmethod
     def update(
@@ -254,8 +293,10 @@ class IUpdateRepositoryMixin(ABC, mixin_for(IRepository)):
         exclude: set = None,
         include: set = None,
         extra_dump_kwargs: dict = None,
+        fast: bool = None,
+        returning: Sequence[str] = None,
         **kwargs,
-    ) -> ObjectId:
+    ) -> ObjectId | dict[str, Any]:
         """Обновляет запись в БД
 
         Args:
@@ -265,10 +306,16 @@ class IUpdateRepositoryMixin(ABC, mixin_for(IRepository)):
             exclude: Множество полей, которые необходимо исключить
             include: Множество полей, которые необходимо включить
             extra_dump_kwargs: Словарь параметров для передачи в PydanticModel.model_dump
+            fast: Обновить запись одним запросом UPDATE. По умолчанию update_fast
+            returning: Поля, значения которых необходимо вернуть после обновления
             **kwargs: Дополнительные данные для обновления записи
 
         Returns:
-            Id обновленного объекта
+            Id обновленного объекта или словарь значений полей returning
+
+        Notes:
+            Быстрый путь не вызывает Model.save и сигналы. Он не используется, если среди полей есть m2m связи
+            или модель переопределяет save / имеет обработчики сигналов сохранения
         """
 
 
@@ -338,6 +385,56 @@ class IUpdateOrCreateRepositoryMixin(ABC, mixin_for(IRepository)):
         """
 
 
+class IBulkUpsertRepositoryMixin(ABC, mixin_for(IRepository)):
+    """Абстрактный интерфейс для миксина репозитория массового обновления или создания"""
+
+    bulk_upsert_atomic: bool
+    """Выполнить в одной транзакции"""
+    bulk_upsert_exceptions_redirects: tuple[BaseExceptionRedirect]
+    """Кортеж дополнительных перенаправлений исключений"""
+    bulk_upsert_batch_size: int
+    """Количество записей, создаваемых / обновляемых одним запросом"""
+    bulk_upsert_unique_fields: tuple[str, ...]
+    """Поля уникального ограничения, по которому определяется существующая запись"""
+
+    @abstractmethod
+    def bulk_upsert(
+        self,
+        entities: Iterable[Entity] = None,
+        *args,
+        unique_fields: Sequence[str] = None,
+        update_fields: Sequence[str] = None,
+        exclude_unset: bool = True,
+        exclude: set = None,
+        include: set = None,
+        extra_dump_kwargs: dict = None,
+        batch_size: int = None,
+        **kwargs,
+    ) -> tuple[int, int]:
+        """Создает записи или обновляет существующие по уникальным полям (INSERT ... ON CONFLICT)
+
+        Notes:
+            Entity группируются по набору переданных полей, поэтому не переданные поля существующих записей
+            не перезаписываются значениями по умолчанию. Из нескольких Entity с одинаковыми значениями
+            уникальных полей в пачке используется последняя
+
+        Args:
+            entities: Итерируемый объект экземпляров Entity
+            *args: Позиционные аргументы
+            unique_fields: Поля уникального ограничения. По умолчанию bulk_upsert_unique_fields
+            update_fields: Поля, обновляемые у существующих записей. По умолчанию все переданные поля
+            exclude_unset: Исключить все не переданные поля
+            exclude: Множество полей, которые необходимо исключить
+            include: Множество полей, которые необходимо включить
+            extra_dump_kwargs: Словарь параметров для передачи в PydanticModel.model_dump
+            batch_size: Количество записей в одном запросе. По умолчанию bulk_upsert_batch_size
+            **kwargs: Дополнительные данные для создания / обновления записей
+
+        Returns:
+            Кортеж из количества созданных и количества обновленных записей
+        """
+
+
 class IDetailOrCreateRepositoryMixin(ABC, mixin_for(IRepository)):
     """Абстрактный интерфейс для миксина репозитория получения деталей или создания"""
 
@@ -437,6 +534,22 @@ class IDetailRepositoryMixin(ABC, mixin_for(IRepository)):
             Entity или DTO записи, удовлетворяющей запросу
         """
 
+    @abstractmethod
+    def adetail(
+        self, *conditions: Any, filter_dto: DTO = None, raise_exception=True, **filters
+    ) -> Awaitable[Entity | DTO]:
+        """Асинхронно возвращает Entity или DTO записи, удовлетворяющей запросу
+
+        Args:
+            *conditions: Кортеж условий вида django.db.models.Q
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            raise_exception: Вызывать ли ошибку
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Entity или DTO записи, удовлетворяющей запросу
+        """
+
 
 class IDetailByPKRepositoryMixin(ABC, mixin_for(IRepository)):
     """Абстрактный интерфейс для миксина репозитория получения деталей по первичному ключу"""
@@ -458,6 +571,18 @@ class IDetailByPKRepositoryMixin(ABC, mixin_for(IRepository)):
             Entity или DTO записи, удовлетворяющей запросу
         """
 
+    @abstractmethod
+    def adetail_by_pk(self, pk: ObjectId, raise_exception=True) -> Awaitable[Entity | DTO]:
+        """Асинхронно возвращает Entity или DTO записи, по pk
+
+        Args:
+            pk: Первичный ключ
+            raise_exception: Вызывать ли ошибку
+
+        Returns:
+            Entity или DTO записи, удовлетворяющей запросу
+        """
+
 
 class IDetailByExternalCodeRepositoryMixin(ABC, mixin_for(IRepository)):
     """Абстрактный интерфейс для миксина репозитория получения деталей по внешнему коду"""
@@ -507,6 +632,10 @@ class IRetrieveRepositoryMixin(ABC, mixin_for(IRepository)):
 
     retrieve_convert_return: bool
     """Конвертировать ли результат функции"""
+    iterate_chunk_size: int
+    """Количество записей, получаемых из БД и конвертируемых за раз при итерации"""
+    iterate_convert_return: bool
+    """Конвертировать ли результат функции. Конвертация выполняется по пачкам внутри метода"""
 
     @abstractmethod
     def retrieve(
@@ -534,6 +663,34 @@ class IRetrieveRepositoryMixin(ABC, mixin_for(IRepository)):
             Последовательность Entity, DTO или QuerySet удовлетворяющих запросу
         """
 
+    @abstractmethod
+    def iterate(
+        self,
+        *conditions: Any,
+        order_by: tuple[str] = (),
+        distinct: bool | tuple[str] = None,
+        chunk_size: int = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Iterator[Entity | DTO]:
+        """Возвращает ленивый итератор Entity или DTO удовлетворяющих запросу
+
+        Notes:
+            Записи читаются из БД курсором по chunk_size штук, связи подгружаются и конвертация
+            выполняется для каждой пачки отдельно, поэтому в памяти не бывает больше chunk_size записей
+
+        Args:
+            *conditions: Кортеж условий вида django.db.models.Q
+            order_by: Кортеж сортировок записей. По умолчанию по первичному ключу
+            distinct: Применять ли distinct на запросе  или кортеж полей для удаления дублей
+            chunk_size: Количество записей, получаемых из БД за раз
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Итератор Entity или DTO удовлетворяющих запросу
+        """
+
     @abstractmethod
     def count(
         self,
@@ -554,6 +711,52 @@ class IRetrieveRepositoryMixin(ABC, mixin_for(IRepository)):
             Количество записей
         """
 
+    @abstractmethod
+    def aretrieve(
+        self,
+        *conditions: Any,
+        limit: int = None,
+        offset: int = None,
+        order_by: tuple[str] = (),
+        distinct: bool | tuple[str] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Awaitable[list[Entity | DTO]]:
+        """Асинхронно возвращает последовательность Entity, DTO или записей ORM удовлетворяющих запросу
+
+        Args:
+            *conditions: Кортеж условий вида django.db.models.Q
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            distinct: Применять ли distinct на запросе  или кортеж полей для удаления дублей
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Список Entity, DTO или записей ORM удовлетворяющих запросу
+        """
+
+    @abstractmethod
+    def acount(
+        self,
+        *conditions: Any,
+        filter_dto: DTO = None,
+        distinct: bool | tuple[str] = None,
+        **filters,
+    ) -> Awaitable[int]:
+        """Асинхронно возвращает количество записей удовлетворяющих запросу
+
+        Args:
+            *conditions: Кортеж условий вида django.db.models.Q
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            distinct: Применять ли distinct на запросе  или кортеж полей для удаления дублей
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Количество записей
+        """
+
 
 class ISearchRepositoryMixin(ABC, mixin_for(IRepository)):
     """Абстрактный интерфейс для миксина репозитория получения списка объектов по полнотекстовому поиску"""
@@ -617,6 +820,134 @@ class ISearchRepositoryMixin(ABC, mixin_for(IRepository)):
             Количество записей
         """
 
+    @abstractmethod
+    def asearch(
+        self,
+        search: str,
+        *conditions: Any,
+        limit: int = None,
+        offset: int = None,
+        order_by: tuple[str] = (),
+        distinct: bool | tuple[str] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Awaitable[list[Entity | DTO]]:
+        """Асинхронно возвращает последовательность Entity, DTO или записей ORM удовлетворяющих запросу
+
+        Args:
+            search: Текст запроса
+            *conditions: Кортеж условий вида django.db.models.Q
+            limit: Лимит количества записей
+            offset: Смещение записей
+            order_by: Кортеж сортировок записей
+            distinct: Применять ли distinct на запросе  или кортеж полей для удаления дублей
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Список Entity, DTO или записей ORM удовлетворяющих запросу
+        """
+
+    @abstractmethod
+    def asearch_count(
+        self,
+        search: str,
+        *conditions: Any,
+        filter_dto: DTO = None,
+        distinct: bool | tuple[str] = None,
+        **filters,
+    ) -> Awaitable[int]:
+        """Асинхронно возвращает количество записей удовлетворяющих запросу
+
+        Args:
+            search: Текст запроса
+            *conditions: Кортеж условий вида django.db.models.Q
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            distinct: Применять ли distinct на запросе  или кортеж полей для удаления дублей
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Количество записей
+        """
+
+
+class IAutocompleteRepositoryMixin(ABC, mixin_for(IRepository)):
+    """Абстрактный интерфейс для миксина репозитория автодополнения по префиксу"""
+
+    autocomplete_expressions: Sequence[str]
+    """Последовательность полей, по префиксу которых ищутся записи"""
+    autocomplete_only_fields: Sequence[str] | None
+    """Поля, которые нужно выбрать из БД. По умолчанию первичный ключ и autocomplete_expressions"""
+    autocomplete_convert_return: bool
+    """Конвертировать ли результат функции"""
+    prefix_filter_function: Callable
+    """функция, реализующая поиск по префиксу"""
+
+    @abstractmethod
+    def autocomplete(
+        self,
+        search: str,
+        *conditions: Any,
+        limit: int = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> list[Entity | DTO | QuerySet]:
+        """Возвращает первые limit записей, поля которых начинаются с search
+
+        Args:
+            search: Префикс
+            *conditions: Кортеж условий вида django.db.models.Q
+            limit: Лимит количества записей
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Последовательность Entity, DTO или QuerySet удовлетворяющих запросу
+        """
+
+
+class IExportRepositoryMixin(ABC, mixin_for(IRepository)):
+    """Абстрактный интерфейс для миксина репозитория потоковой выгрузки записей"""
+
+    export_chunk_size: int
+    """Количество записей, получаемых из БД и конвертируемых за раз"""
+    export_convert_return: bool
+    """Конвертировать ли результат функции. Конвертация выполняется по пачкам внутри метода"""
+
+    @abstractmethod
+    def export(
+        self,
+        *conditions: Any,
+        search: str = None,
+        order_by: tuple[str] = (),
+        chunk_size: int = None,
+        values: Sequence[str] = None,
+        filter_dto: DTO = None,
+        **filters,
+    ) -> Iterator[Entity | DTO | tuple]:
+        """Возвращает итератор записей, удовлетворяющих запросу, не загружая их в память целиком
+
+        Args:
+            *conditions: Кортеж условий вида django.db.models.Q
+            search: Строка полнотекстового поиска. Учитывается, если репозиторий поддерживает поиск
+            order_by: Кортеж сортировок записей
+            chunk_size: Количество записей, получаемых из БД за раз
+            values: Последовательность полей (lookup), значения которых нужно вернуть вместо объектов
+            filter_dto: Pydantic модель с полями фильтрации запроса
+            **filters: Словарь фильтров запроса
+
+        Returns:
+            Итератор Entity или DTO удовлетворяющих запросу. Если переданы values - итератор кортежей значений
+        """
+
+    @abstractmethod
+    def get_value_fields(self) -> set[str]:
+        """Возвращает имена полей, которые можно передать в values метода export
+
+        Returns:
+            Множество имен полей, значения которых хранятся в самой записи
+        """
+
 
 class IExistsRepositoryMixin(ABC, mixin_for(IRepository)):
     """Абстрактный интерфейс для миксина репозитория проверки существования записи"""
@@ -678,7 +1009,9 @@ class ICRUDRepositoryMixin(ICreateUpdateDeleteRepositoryMixin, IReadRepositoryMi
     """Абстрактный интерфейс для миксина репозитория создание / чтение /обновление / удаление"""
 
 
-class IPatchListRepositoryMixin(IUpdateRepositoryMixin, IBulkCreateRepositoryMixin, IBulkDeleteRepositoryMixin):
+class IPatchListRepositoryMixin(
+    IUpdateRepositoryMixin, IBulkCreateRepositoryMixin, IBulkUpdateRepositoryMixin, IBulkDeleteRepositoryMixin
+):
     """Абстрактный интерфейс для миксина репозитория модификации списка объектов"""
 
 
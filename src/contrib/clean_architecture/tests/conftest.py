@@ -14,23 +14,29 @@ from contrib.clean_architecture.tests.factories.providers.controllers import Foo
 from contrib.clean_architecture.tests.factories.providers.controllers import FooRetrieveController
 from contrib.clean_architecture.tests.factories.providers.controllers import FooSearchController
 from contrib.clean_architecture.tests.factories.providers.controllers import FooUpdateController
+from contrib.clean_architecture.tests.factories.providers.interactors import FooAutocompleteInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooCreateInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooDeleteInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooDetailByExternalCodeInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooDetailByPKInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooDetailInteractor
+from contrib.clean_architecture.tests.factories.providers.interactors import FooExportInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooPatchListInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooRetrieveInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooSearchInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooUpdateInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooValidationInteractor
+from contrib.clean_architecture.tests.factories.providers.repositories import FooAutocompleteRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooExportRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooBulkCreateRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooBulkDeleteRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooBulkUpdateRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooBulkUpsertRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDeleteRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailByExternalCodeRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailByPKRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooIdentityMapRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailOrCreateRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooExistsRepository
@@ -44,6 +50,12 @@ from contrib.clean_architecture.tests.factories.providers.repositories import Fo
 from contrib.clean_architecture.tests.factories.providers.repositories import FooUpdateRepository
 
 
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Тестам не нужна таблица кэша в БД
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
 @pytest.fixture(name="dto_based_objects")
 def get_dto_based_objects():
     return FooDTOBasedObjects()
@@ -79,6 +91,11 @@ def get_bulk_update_repository():
     return FooBulkUpdateRepository()
 
 
+@pytest.fixture(name="bulk_upsert_repository")
+def get_bulk_upsert_repository():
+    return FooBulkUpsertRepository()
+
+
 @pytest.fixture(name="get_by_ids_repository")
 def get_by_ids_repository():
     return FooGetBetIdsRepository()
@@ -124,6 +141,11 @@ def get_by_pk_repository():
     return FooDetailByPKRepository()
 
 
+@pytest.fixture(name="identity_map_repository")
+def get_identity_map_repository():
+    return FooIdentityMapRepository()
+
+
 @pytest.fixture(name="detail_by_external_code_repository")
 def get_by_external_code_repository():
     return FooDetailByExternalCodeRepository()
@@ -139,6 +161,16 @@ def get_search_repository():
     return FooSearchRepository()
 
 
+@pytest.fixture(name="autocomplete_repository")
+def get_autocomplete_repository():
+    return FooAutocompleteRepository()
+
+
+@pytest.fixture(name="export_repository")
+def get_export_repository():
+    return FooExportRepository()
+
+
 @pytest.fixture(name="solo_repository")
 def solo_repository():
     return FooGetSoloRepository()
@@ -218,6 +250,20 @@ def get_search_interactor(search_repository):
     return interactor
 
 
+@pytest.fixture(name="autocomplete_interactor")
+def get_autocomplete_interactor(autocomplete_repository):
+    interactor = FooAutocompleteInteractor()
+    interactor.repository = autocomplete_repository
+    return interactor
+
+
+@pytest.fixture(name="export_interactor")
+def get_export_interactor(export_repository):
+    interactor = FooExportInteractor()
+    interactor.repository = export_repository
+    return interactor
+
+
 @pytest.fixture(name="create_controller")
 def get_create_controller(create_interactor):
     controller = FooCreateController()
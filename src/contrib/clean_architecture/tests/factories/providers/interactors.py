@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+from contrib.clean_architecture.providers.interactors.bases import AutocompleteInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import CreateInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import DeleteInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import DetailByExternalCodeInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import DetailByPKInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import DetailInteractorMixin
+from contrib.clean_architecture.providers.interactors.bases import ExportXLSInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import Interactor
 from contrib.clean_architecture.providers.interactors.bases import PatchListInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import RetrieveInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import SearchInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import UpdateInteractorMixin
 from contrib.clean_architecture.providers.interactors.bases import ValidationInteractorMixin
+from contrib.clean_architecture.providers.interactors.utils import export_formatter
 from contrib.clean_architecture.tests.factories.general.dtos import FooDTO
+from contrib.clean_architecture.tests.factories.providers.repositories import FooAutocompleteRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDeleteRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailByExternalCodeRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailByPKRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooExportRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooPatchListRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooRetrieveRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooSearchRepository
@@ -68,6 +73,23 @@ class FooSearchInteractor(SearchInteractorMixin, Interactor):
     return_pagination_type = FooDTO.paginated
 
 
+class FooAutocompleteInteractor(AutocompleteInteractorMixin, Interactor):
+    repository: FooAutocompleteRepository
+    return_type = FooDTO
+
+
+class FooExportInteractor(ExportXLSInteractorMixin, Interactor):
+    repository: FooExportRepository
+    xls_file_name = "foo"
+    xls_sheet_name = "foo"
+
+    def _get_fields_mapping(self) -> dict[str, str]:
+        return {"foo_field1": "Поле 1", "foo_field3": "Поле 3", "foo_fields": "Поля"}
+
+    def _formatter_mapping(self):
+        return {"foo_fields": export_formatter("foo_field1", "foo_field3")(lambda first, third: f"{first}-{third}")}
+
+
 class FooValidationInteractor(ValidationInteractorMixin, ContextMixin, Interactor):
     required_fields: set = {}
     context_requires_fields: set[str] = context_property(default_factory=set)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from contrib.clean_architecture.providers.repositories.bases import AutocompleteRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import BulkCreateRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import BulkDeleteRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import BulkUpdateRepositoryMixin
+from contrib.clean_architecture.providers.repositories.bases import BulkUpsertRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import CreateRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import DeleteRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import DetailByExternalCodeRepositoryMixin
@@ -10,6 +12,7 @@ from contrib.clean_architecture.providers.repositories.bases import DetailByPKRe
 from contrib.clean_architecture.providers.repositories.bases import DetailOrCreateRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import DetailRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import ExistsRepositoryMixin
+from contrib.clean_architecture.providers.repositories.bases import ExportRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import GetByIdsRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import GetSoloRepositoryMixin
 from contrib.clean_architecture.providers.repositories.bases import MultiUpdateRepositoryMixin
@@ -48,6 +51,13 @@ class FooUpdateOrCreateRepository(UpdateOrCreateRepositoryMixin, FakeRepository)
     entity = FooEntity
 
 
+class FooBulkUpsertRepository(BulkUpsertRepositoryMixin, FakeRepository):
+    model = FooModel
+    entity = FooEntity
+
+    bulk_upsert_unique_fields = ("foo_field1",)
+
+
 class FooDetailOrCreateRepository(DetailOrCreateRepositoryMixin, FakeRepository):
     model = FooModel
     entity = FooEntity
@@ -73,6 +83,13 @@ class FooDetailByPKRepository(DetailByPKRepositoryMixin, FakeRepository):
     entity = FooEntity
 
 
+class FooIdentityMapRepository(DetailByPKRepositoryMixin, UpdateRepositoryMixin, FakeRepository):
+    model = FooModel
+    entity = FooEntity
+
+    identity_map = True
+
+
 class FooDetailByExternalCodeRepository(DetailByExternalCodeRepositoryMixin, FakeRepository):
     model = FooModel
     entity = FooEntity
@@ -90,6 +107,20 @@ class FooSearchRepository(SearchRepositoryMixin, FakeRepository):
     search_expressions = ("foo_field3", "foo_field4")
 
 
+class FooAutocompleteRepository(AutocompleteRepositoryMixin, FakeRepository):
+    model = FooModel
+    entity = FooEntity
+
+    autocomplete_expressions = ("foo_field3",)
+
+
+class FooExportRepository(ExportRepositoryMixin, FakeRepository):
+    model = FooModel
+    entity = FooEntity
+
+    search_expressions = ("foo_field3",)
+
+
 class FooExistsRepository(ExistsRepositoryMixin, FakeRepository):
     model = FooModel
     entity = FooEntity
@@ -98,6 +129,7 @@ class FooExistsRepository(ExistsRepositoryMixin, FakeRepository):
 class FooPatchListRepository(
     FooUpdateRepository,
     FooBulkCreateRepository,
+    FooBulkUpdateRepository,
     FooBulkDeleteRepository,
     FakeRepository,
 ):
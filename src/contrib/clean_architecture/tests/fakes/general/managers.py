@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from collections.abc import Mapping
 from copy import deepcopy
 from typing import Any
 from typing import TYPE_CHECKING
@@ -34,6 +35,8 @@ class FakeManager(IManager):
         self._exclude_filters = {}
         self._order_by = set()
         self._search_filter = None
+        self._values_list = ()
+        self._values_list_flat = False
 
     def __get__(self, instance, owner):
         if not self._model:
@@ -61,6 +64,8 @@ class FakeManager(IManager):
         for key, value in self._filters.items():
             if key == "pk__in":
                 result = filter(lambda item: item.id in value, result)
+            elif key.endswith("__in"):
+                result = filter(lambda item, key=key, value=value: getattr(item, key[:-4]) in value, result)
             else:
                 result = filter(lambda item: getattr(item, key) == value, result)
 
@@ -82,6 +87,9 @@ class FakeManager(IManager):
         _fake_instances[self._model] = []
 
     def all(self):
+        if self._values_list:
+            rows = [tuple(getattr(item, field) for field in self._values_list) for item in self._get_result()]
+            return [row[0] for row in rows] if self._values_list_flat else rows
         return self._get_result()
 
     def create(self, **kwargs):
@@ -90,17 +98,32 @@ class FakeManager(IManager):
         _fake_instances[self._model].append(instance)
         return instance
 
-    def bulk_create(self, objects: list[FakeModel]) -> None:
+    def bulk_create(
+        self,
+        objects: list[FakeModel],
+        ignore_conflicts: bool = False,
+        update_conflicts: bool = False,
+        unique_fields: list[str] = None,
+        update_fields: list[str] = None,
+    ) -> None:
         for instance in objects:
+            if unique_fields and (ignore_conflicts or update_conflicts):
+                existing = self.filter(**{field: getattr(instance, field) for field in unique_fields}).first()
+                self._filters = {}
+                if existing:
+                    for field in update_fields if update_conflicts else ():
+                        setattr(existing, field, getattr(instance, field))
+                    continue
             self._set_id(instance)
             _fake_instances[self._model].append(instance)
 
-    def bulk_update(self, objects: list[FakeModel], fields: list[str]) -> None:
+    def bulk_update(self, objects: list[FakeModel], fields: list[str]) -> int:
         for instance in objects:
             _object = self.get(id=instance.id)
             for field in fields:
                 value = getattr(instance, field, None)
                 setattr(_object, field, value)
+        return len(objects)
 
     def update(self, **kwargs):
         results = self._get_result()
@@ -108,6 +131,7 @@ class FakeManager(IManager):
             _object = self.get(id=result.id)
             for k, v in kwargs.items():
                 setattr(_object, k, v)
+        return len(results)
 
     def delete(self) -> None:
         results = self._get_result()
@@ -138,6 +162,17 @@ class FakeManager(IManager):
         self._order_by |= set(args)
         return self
 
+    def only(self, *args):
+        return self
+
+    def values_list(self, *fields, flat: bool = False):
+        self._values_list = fields
+        self._values_list_flat = flat
+        return self
+
+    def iterator(self, chunk_size: int = None):
+        return iter(self.all())
+
     def get(self, *args, **kwargs):
         result = self.filter(**kwargs)._get_result()
         if not result:
@@ -238,3 +273,7 @@ class FakeM2MManager(IM2MManager):
     @classmethod
     def execute(cls, instance: FakeModel, field: str, actions: list[M2MUpdateAction]) -> None:
         pass
+
+    @classmethod
+    def execute_many(cls, model: type[FakeModel], field: str, actions: Mapping[int, list[M2MUpdateAction]]) -> None:
+        pass
@@ -11,6 +11,7 @@ from contrib.clean_architecture.tests.fakes.general.models import FakeExternalCo
 from contrib.clean_architecture.tests.fakes.repositories.exceptions import FakeMultipleObjectsReturned
 from contrib.clean_architecture.tests.fakes.repositories.exceptions import FakeObjectDoesNotExist
 from contrib.clean_architecture.tests.fakes.repositories.utils import fake_atomic
+from contrib.clean_architecture.tests.fakes.repositories.utils import fake_prefix_filter
 from contrib.clean_architecture.tests.fakes.repositories.utils import fake_search_filter
 
 
@@ -27,6 +28,7 @@ class FakeRepository(
     multiple_objects_returned_exception = FakeMultipleObjectsReturned
 
     search_filter_function = fake_search_filter
+    prefix_filter_function = fake_prefix_filter
 
     def _prepare_filters(self, *conditions: Any, filter_dto: DTO = None, **filters):
         exclude_conditions = {}
@@ -37,3 +39,6 @@ class FakeRepository(
             **(filter_dto.model_dump() if filter_dto else {}),
             **filters,
         }
+
+    def _get_value_fields(self) -> list[str]:
+        return list(self.model.model_fields)
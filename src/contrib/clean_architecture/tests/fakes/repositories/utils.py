@@ -34,6 +34,18 @@ def fake_search_filter(objects: FakeManager, search: str, *expressions, **extra_
     return objects.search(_search_filter)
 
 
+def fake_prefix_filter(objects: FakeManager, search: str, *expressions):
+    if not expressions:
+        return objects
+
+    search = search.lower()
+
+    def _prefix_filter(item):
+        return any(str(getattr(item, _expression)).lower().startswith(search) for _expression in expressions)
+
+    return objects.search(_prefix_filter)
+
+
 class FakeAtomic:
     _instances = None
 
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from contrib.clean_architecture.dto_based_objects.django.loaders import RelationBatchLoader
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+
+def load_content_type(instance: Permission) -> str:
+    """Имитирует ленивую загрузку связи при конвертации записи"""
+    if "content_type" not in instance._state.fields_cache:
+        instance.content_type = ContentType(app_label="foo", model=instance.codename)
+    return instance.content_type.model
+
+
+class TestRelationBatchLoader:
+    def test_convert(self):
+        """Связь, загруженная при конвертации первой записи, подгружается для остальных одним вызовом"""
+        instances = [Permission(codename=f"foo_{index}") for index in range(3)]
+        loader = RelationBatchLoader(instances)
+
+        with mock.patch(
+            "contrib.clean_architecture.dto_based_objects.django.loaders.prefetch_related_objects"
+        ) as prefetch:
+            results = loader.convert(load_content_type)
+
+        assert results == ["foo_0", "foo_1", "foo_2"]
+        assert loader.loaded == {"content_type"}
+        prefetch.assert_called_once_with(instances[1:], "content_type")
+
+    def test_convert_last(self):
+        """После последней записи связи не подгружаются"""
+        instances = [Permission(codename="foo")]
+        loader = RelationBatchLoader(instances)
+
+        with mock.patch(
+            "contrib.clean_architecture.dto_based_objects.django.loaders.prefetch_related_objects"
+        ) as prefetch:
+            loader.convert(load_content_type)
+
+        prefetch.assert_not_called()
+
+    def test_prefetch_error(self):
+        """Ошибка подгрузки связи не прерывает конвертацию"""
+        instances = [Permission(codename=f"foo_{index}") for index in range(2)]
+        loader = RelationBatchLoader(instances)
+
+        with mock.patch(
+            "contrib.clean_architecture.dto_based_objects.django.loaders.prefetch_related_objects",
+            side_effect=ValueError,
+        ):
+            assert loader.convert(load_content_type) == ["foo_0", "foo_1"]
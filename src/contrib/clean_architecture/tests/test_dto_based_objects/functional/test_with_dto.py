@@ -70,6 +70,23 @@ class TestWithDTO:
         assert "extra_prefetch_related" in prefetch_related
         assert len(prefetch_related) == 3
 
+    def test_with_dto_extra_not_cached(self, dto_based_objects: FooDTOBasedObjects):
+        dto_based_objects.with_dto(FooDTOWithRelations, extra_select_related={"extra_select_related"})
+        dto_based_objects.clean_with_dto_context()
+        dto_based_objects.with_dto(FooDTOWithRelations)
+
+        relations = dto_based_objects._models_dtos_related[(FooModelWithRelations, FooDTOWithRelations)]
+        assert "extra_select_related" not in relations.select_related
+        assert len(relations.select_related) == 2
+
+    def test_get_relations_plan_copy(self, dto_based_objects: FooDTOBasedObjects):
+        plan = dto_based_objects.get_relations_plan(FooModelWithRelations, FooDTOWithRelations)
+        plan.select_related.add("extra_select_related")
+
+        relations = dto_based_objects.get_relations_plan(FooModelWithRelations, FooDTOWithRelations)
+        assert "extra_select_related" not in relations.select_related
+        assert len(relations.select_related) == 2
+
     def test_with_dto_other_dtos(self, dto_based_objects):
         dto_based_objects.with_dto(FooDTOWithRelations, other_dtos={BarModelWithRelations: BarDTOWithRelations})
 
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from contrib.clean_architecture.tests.factories.general.dtos import FooDTO
+from contrib.clean_architecture.tests.factories.providers.interactors import FooAutocompleteInteractor
+from contrib.clean_architecture.tests.factories.providers.interactors import FooCreateInteractor
+from contrib.clean_architecture.tests.test_interactors.functional.mixins import (
+    ListTestMixin,
+)
+
+
+class TestAutocompleteInteractor(ListTestMixin):
+    @staticmethod
+    def _prepare(create_interactor):
+        create_interactor.repository.objects.clear()
+        create_interactor.create(FooDTO(foo_field3="Пицца"))
+        create_interactor.create(FooDTO(foo_field3="Пирог"))
+
+    def test_autocomplete(
+        self,
+        create_interactor: FooCreateInteractor,
+        autocomplete_interactor: FooAutocompleteInteractor,
+    ):
+        self._prepare(create_interactor)
+        self._test_result(autocomplete_interactor.autocomplete("пи"), FooDTO)
+        autocomplete_interactor.repository.objects.clear()
+
+    def test_autocomplete_short_prefix(
+        self,
+        create_interactor: FooCreateInteractor,
+        autocomplete_interactor: FooAutocompleteInteractor,
+    ):
+        self._prepare(create_interactor)
+        assert autocomplete_interactor.autocomplete("  ") == []
+        autocomplete_interactor.repository.objects.clear()
+
+    def test_autocomplete_cached(
+        self,
+        create_interactor: FooCreateInteractor,
+        autocomplete_interactor: FooAutocompleteInteractor,
+    ):
+        self._prepare(create_interactor)
+        results = autocomplete_interactor.autocomplete("Пи")
+        create_interactor.create(FooDTO(foo_field3="Пирожное"))
+        assert autocomplete_interactor.autocomplete("пи") == results
+        autocomplete_interactor.clear_autocomplete_cache()
+        assert len(autocomplete_interactor.autocomplete("пи")) == 3
+        autocomplete_interactor.repository.objects.clear()
+
+    def test_autocomplete_cached_copy(
+        self,
+        create_interactor: FooCreateInteractor,
+        autocomplete_interactor: FooAutocompleteInteractor,
+    ):
+        """Изменение полученных DTO не влияет на закэшированный результат"""
+        self._prepare(create_interactor)
+        results = autocomplete_interactor.autocomplete("Пи")
+        results[0].foo_field3 = "Торт"
+        results.clear()
+
+        cached_results = autocomplete_interactor.autocomplete("Пи")
+        assert cached_results is not results
+        assert {result.foo_field3 for result in cached_results} == {"Пицца", "Пирог"}
+        autocomplete_interactor.repository.objects.clear()
@@ -52,6 +52,14 @@ class TestBindReturnType:
         assert issubclass(return_type, BarDTO)
         clear_context()
 
+    def test_bind_return_type_from_context_source(self):
+        context = get_context()
+        context.set(ReturnTypeAttrs.RETURN_TYPES_SOURCE, self._SelfWithMethodReturnType)
+
+        _, return_type, _ = bind_return_type(self._test_function)(self._SelfWithReturnType)
+        assert issubclass(return_type, BarDTO)
+        clear_context()
+
     def test_bind_return_type_from_self_detail(self):
         context = get_context()
         context.set(ReturnTypeAttrs.RETURN_TYPE, BarDTO)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+from contrib.clean_architecture.tests.factories.providers.interactors import FooExportInteractor
+from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
+
+
+class TestExportInteractor:
+    @staticmethod
+    def _prepare_data(create_repository):
+        create_repository.objects.clear()
+        create_repository.create(foo_field1="foo", foo_field3="Пицца")
+        create_repository.create(foo_field1="bar", foo_field3="Суп")
+
+    @pytest.mark.parametrize("export_values", [True, False])
+    def test_export_rows(
+        self,
+        create_repository: FooCreateRepository,
+        export_interactor: FooExportInteractor,
+        export_values: bool,
+    ):
+        self._prepare_data(create_repository)
+        export_interactor.export_values = export_values
+        rows = list(export_interactor.export_rows(fields=["foo_field1", "foo_field3", "foo_fields"]))
+        assert rows == [
+            ["Поле 1", "Поле 3", "Поля"],
+            ["foo", "Пицца", "foo-Пицца"],
+            ["bar", "Суп", "bar-Суп"],
+        ]
+        export_interactor.repository.objects.clear()
+
+    def test_export_plan_values(self, export_interactor: FooExportInteractor):
+        values, _ = export_interactor._compile_export_plan(["foo_field1", "foo_fields"])
+        assert values == ("foo_field1", "foo_field3")
+
+    def test_export_plan_objects(self, export_interactor: FooExportInteractor):
+        values, _ = export_interactor._compile_export_plan(["foo_field1", "unknown_field"])
+        assert values is None
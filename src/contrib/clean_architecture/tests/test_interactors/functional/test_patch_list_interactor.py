@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from unittest import mock
 
+import pytest
 from contrib.clean_architecture.providers.interactors.exceptions import (
     NothingToUpdateOrCreateException,
 )
@@ -10,6 +11,7 @@ from contrib.clean_architecture.tests.factories.general.dtos import FooPatchList
 from contrib.clean_architecture.tests.factories.general.dtos import FooPatchListItemDTO
 from contrib.clean_architecture.tests.factories.providers.interactors import FooCreateInteractor
 from contrib.clean_architecture.tests.factories.providers.interactors import FooPatchListInteractor
+from contrib.exceptions.exceptions import DoesNotExist
 
 
 class TestPatchListInteractor:
@@ -49,6 +51,26 @@ class TestPatchListInteractor:
         assert last_object.foo_field1 == "updated"
         patch_list_interactor.repository.objects.clear()
 
+    def test_patch_list_update_missing(
+        self,
+        create_interactor: FooCreateInteractor,
+        patch_list_interactor: FooPatchListInteractor,
+    ):
+        object_id = create_interactor.create(FooDTO(foo_field1="created"))
+
+        with pytest.raises(DoesNotExist):
+            patch_list_interactor.patch_list(
+                FooPatchListDTO(
+                    items=[
+                        FooPatchListItemDTO(id=object_id, foo_field1="updated"),
+                        FooPatchListItemDTO(id=object_id + 1000, foo_field1="updated"),
+                    ]
+                )
+            )
+
+        assert patch_list_interactor.repository.objects.last().foo_field1 == "created"
+        patch_list_interactor.repository.objects.clear()
+
     def test_patch_list_delete(
         self,
         create_interactor: FooCreateInteractor,
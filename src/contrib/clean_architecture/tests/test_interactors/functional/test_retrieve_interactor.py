@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from contrib.clean_architecture.tests.factories.general.dtos import BarDTO
 from contrib.clean_architecture.tests.factories.general.dtos import FooDTO
 from contrib.clean_architecture.tests.factories.providers.interactors import FooCreateInteractor
@@ -52,3 +54,30 @@ class TestRetrieveInteractor(ListTestMixin):
             BarDTO,
         )
         retrieve_interactor.repository.objects.clear()
+
+    def test_aretrieve_paginated_with_return_type(
+        self,
+        create_interactor: FooCreateInteractor,
+        retrieve_interactor: FooRetrieveInteractor,
+    ):
+        self._prepare(create_interactor)
+        self._test_paginated_result(
+            asyncio.run(
+                retrieve_interactor.aretrieve(
+                    paginated=True,
+                    return_type=BarDTO,
+                    return_pagination_type=BarDTO.paginated,
+                )
+            ),
+            BarDTO,
+        )
+        retrieve_interactor.repository.objects.clear()
+
+    def test_iterate_with_return_type(
+        self,
+        create_interactor: FooCreateInteractor,
+        retrieve_interactor: FooRetrieveInteractor,
+    ):
+        self._prepare(create_interactor)
+        self._test_result(list(retrieve_interactor.iterate(chunk_size=1, return_type=BarDTO)), BarDTO)
+        retrieve_interactor.repository.objects.clear()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from contrib.clean_architecture.tests.factories.providers.repositories import FooAutocompleteRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
+
+
+class TestAutocompleteRepository:
+    @staticmethod
+    def _prepare_data(create_repository):
+        create_repository.objects.clear()
+        create_repository.create(foo_field1="foo", foo_field3="Пицца")
+        create_repository.create(foo_field1="foo", foo_field3="пирог")
+        create_repository.create(foo_field1="bar", foo_field3="Пицца с грибами")
+        create_repository.create(foo_field1="foo", foo_field3="Суп")
+
+    def test_autocomplete_prefix(
+        self,
+        create_repository: FooCreateRepository,
+        autocomplete_repository: FooAutocompleteRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = autocomplete_repository.autocomplete("пи")
+        assert len(instances) == 3
+        autocomplete_repository.objects.clear()
+
+    def test_autocomplete_not_substring(
+        self,
+        create_repository: FooCreateRepository,
+        autocomplete_repository: FooAutocompleteRepository,
+    ):
+        self._prepare_data(create_repository)
+        assert autocomplete_repository.autocomplete("грибами") == []
+        autocomplete_repository.objects.clear()
+
+    def test_autocomplete_with_filters(
+        self,
+        create_repository: FooCreateRepository,
+        autocomplete_repository: FooAutocompleteRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = autocomplete_repository.autocomplete("пицца", foo_field1="foo")
+        assert len(instances) == 1
+        autocomplete_repository.objects.clear()
+
+    def test_autocomplete_limit(
+        self,
+        create_repository: FooCreateRepository,
+        autocomplete_repository: FooAutocompleteRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = autocomplete_repository.autocomplete("пи", limit=2)
+        assert len(instances) == 2
+        autocomplete_repository.objects.clear()
@@ -57,3 +57,30 @@ class TestBulkCreateRepository:
         bulk_create_repository.objects.clear()
         creator.objects.clear()
         clear_context()
+
+    def test_bulk_create_from_generator(self, bulk_create_repository: FooBulkCreateRepository):
+        instance_count_before = bulk_create_repository.objects.count()
+        pk_range = bulk_create_repository.bulk_create(
+            (FooEntity(foo_field1=f"generated_{index}") for index in range(5)),
+            batch_size=2,
+            return_pk_range=True,
+        )
+        instance_count_after = bulk_create_repository.objects.count()
+
+        assert instance_count_before + 5 == instance_count_after
+        assert pk_range == (bulk_create_repository.objects.first().id, bulk_create_repository.objects.last().id)
+        assert bulk_create_repository.objects.last().foo_field1 == "generated_4"
+        bulk_create_repository.objects.clear()
+
+    def test_bulk_create_without_pk_range(self, bulk_create_repository: FooBulkCreateRepository):
+        assert bulk_create_repository.bulk_create([FooEntity()]) is None
+        bulk_create_repository.objects.clear()
+
+    def test_copy_create_fallback(self, bulk_create_repository: FooBulkCreateRepository):
+        """Без поддержки COPY записи создаются через bulk_create"""
+        instances = [bulk_create_repository.model(foo_field1="copy") for _ in range(2)]
+        pks = bulk_create_repository._copy_create(instances, return_pks=True)
+
+        assert pks == [instance.id for instance in bulk_create_repository.objects.all()]
+        assert bulk_create_repository._copy_create([bulk_create_repository.model()]) is None
+        bulk_create_repository.objects.clear()
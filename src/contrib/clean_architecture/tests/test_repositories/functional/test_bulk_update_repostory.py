@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest import mock
+
 from contrib.clean_architecture.tests.factories.general.entities import FooEntity
 from contrib.clean_architecture.tests.factories.general.models import FooUserModel
 from contrib.clean_architecture.tests.factories.providers.repositories import FooBulkUpdateRepository
@@ -68,3 +70,62 @@ class TestBulkCreateRepository:
         instance = detail_by_pk_repository.detail_by_pk(object_id)
         assert instance.updated_by.id == creator.id
         clear_context()
+
+    def test_bulk_update_groups_by_fields(
+        self,
+        bulk_update_repository: FooBulkUpdateRepository,
+        create_repository: FooCreateRepository,
+        detail_by_pk_repository: FooDetailByPKRepository,
+    ):
+        object_ids = [create_repository.create() for _ in range(3)]
+        updated_count = bulk_update_repository.bulk_update(
+            [
+                FooEntity(id=object_ids[0], foo_field1="first"),
+                FooEntity(id=object_ids[1], foo_field1="second", foo_field2="second"),
+                FooEntity(id=object_ids[2], foo_field1="third"),
+            ],
+            batch_size=1,
+        )
+
+        assert updated_count == 3
+        assert detail_by_pk_repository.detail_by_pk(object_ids[0]).foo_field1 == "first"
+        assert detail_by_pk_repository.detail_by_pk(object_ids[1]).foo_field2 == "second"
+        assert detail_by_pk_repository.detail_by_pk(object_ids[2]).foo_field1 == "third"
+
+    def test_bulk_update_sends_saved(
+        self,
+        bulk_update_repository: FooBulkUpdateRepository,
+        create_repository: FooCreateRepository,
+    ):
+        object_id = create_repository.create()
+        object2_id = create_repository.create()
+
+        with (
+            mock.patch.object(FooBulkUpdateRepository, "_has_saved_receivers", return_value=True),
+            mock.patch.object(FooBulkUpdateRepository, "_send_saved") as send_saved,
+        ):
+            bulk_update_repository.bulk_update(
+                [FooEntity(id=object_id, foo_field1="saved"), FooEntity(id=object2_id, foo_field2="saved")]
+            )
+
+        send_saved.assert_called_once_with({object_id, object2_id})
+
+    def test_bulk_update_m2m_once_per_field(self, bulk_update_repository: FooBulkUpdateRepository):
+        """Связи m2m всех записей обновляются одним вызовом на поле"""
+        data = {
+            1: {"foo_m2m": [{"id": 10}, {"id": 11, "delete": True}], "bar_m2m": [{"id": 20}]},
+            2: {"foo_m2m": [{"id": 10, "delete": True}], "bar_m2m": None},
+        }
+
+        with (
+            mock.patch.object(FooBulkUpdateRepository, "_get_m2m_fields", return_value=["foo_m2m", "bar_m2m"]),
+            mock.patch.object(bulk_update_repository.m2m_manager, "execute_many") as execute_many,
+        ):
+            fields = bulk_update_repository._bulk_update_m2m_relations(data)
+
+        assert fields == {"foo_m2m", "bar_m2m"}
+        assert execute_many.call_count == 2
+        calls = {call.args[1]: call.args[2] for call in execute_many.call_args_list}
+        assert set(calls["foo_m2m"]) == {1, 2}
+        assert [action.delete for action in calls["foo_m2m"][1]] == [False, True]
+        assert list(calls["bar_m2m"]) == [1]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from contrib.clean_architecture.tests.factories.general.entities import FooEntity
+from contrib.clean_architecture.tests.factories.general.models import FooUserModel
+from contrib.clean_architecture.tests.factories.providers.repositories import FooBulkUpsertRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
+from contrib.clean_architecture.tests.utils import clear_context
+from contrib.clean_architecture.tests.utils import set_user_context
+
+
+class TestBulkUpsertRepository:
+    def test_bulk_upsert(
+        self,
+        bulk_upsert_repository: FooBulkUpsertRepository,
+        create_repository: FooCreateRepository,
+    ):
+        create_repository.objects.clear()
+        create_repository.create(foo_field1="pizza", foo_field2="old", foo_field3="kept")
+
+        created, updated = bulk_upsert_repository.bulk_upsert(
+            [
+                FooEntity(foo_field1="pizza", foo_field2="new"),
+                FooEntity(foo_field1="soup", foo_field2="new"),
+                FooEntity(foo_field1="salad", foo_field2="new"),
+            ],
+            batch_size=2,
+        )
+
+        assert (created, updated) == (2, 1)
+        assert bulk_upsert_repository.objects.count() == 3
+        pizza = bulk_upsert_repository.objects.get(foo_field1="pizza")
+        assert pizza.foo_field2 == "new"
+        assert pizza.foo_field3 == "kept"
+        bulk_upsert_repository.objects.clear()
+
+    def test_bulk_upsert_deduplicates_chunk(self, bulk_upsert_repository: FooBulkUpsertRepository):
+        bulk_upsert_repository.objects.clear()
+        created, updated = bulk_upsert_repository.bulk_upsert(
+            [FooEntity(foo_field1="pizza", foo_field2="first"), FooEntity(foo_field1="pizza", foo_field2="last")]
+        )
+
+        assert (created, updated) == (1, 0)
+        assert bulk_upsert_repository.objects.get(foo_field1="pizza").foo_field2 == "last"
+        bulk_upsert_repository.objects.clear()
+
+    def test_bulk_upsert_with_user_context(
+        self,
+        bulk_upsert_repository: FooBulkUpsertRepository,
+        create_repository: FooCreateRepository,
+        creator: FooUserModel,
+        updater: FooUserModel,
+    ):
+        create_repository.objects.clear()
+        set_user_context(creator)
+        create_repository.create(foo_field1="pizza")
+        set_user_context(updater)
+
+        bulk_upsert_repository.bulk_upsert([FooEntity(foo_field1="pizza", foo_field2="new")])
+
+        pizza = bulk_upsert_repository.objects.get(foo_field1="pizza")
+        assert pizza.created_by.id == creator.id
+        assert pizza.updated_by.id == updater.id
+        bulk_upsert_repository.objects.clear()
+        creator.objects.clear()
+        clear_context()
+
+    def test_bulk_upsert_sends_saved(
+        self,
+        bulk_upsert_repository: FooBulkUpsertRepository,
+        create_repository: FooCreateRepository,
+    ):
+        create_repository.objects.clear()
+        object_id = create_repository.create(foo_field1="pizza")
+
+        with (
+            mock.patch.object(FooBulkUpsertRepository, "_has_saved_receivers", return_value=True),
+            mock.patch.object(FooBulkUpsertRepository, "_send_saved") as send_saved,
+        ):
+            bulk_upsert_repository.bulk_upsert(
+                [FooEntity(foo_field1="pizza", foo_field2="new"), FooEntity(foo_field1="soup", foo_field2="new")]
+            )
+
+        soup_id = bulk_upsert_repository.objects.get(foo_field1="soup").id
+        send_saved.assert_called_once_with([soup_id, object_id])
+        bulk_upsert_repository.objects.clear()
+
+    def test_bulk_upsert_missing_unique_field(self, bulk_upsert_repository: FooBulkUpsertRepository):
+        bulk_upsert_repository.objects.clear()
+
+        with pytest.raises(ValueError, match="foo_field1"):
+            bulk_upsert_repository.bulk_upsert(
+                [FooEntity(foo_field1="pizza", foo_field2="new"), FooEntity(foo_field2="new")],
+                batch_size=1,
+            )
+
+        assert bulk_upsert_repository.objects.count() == 0
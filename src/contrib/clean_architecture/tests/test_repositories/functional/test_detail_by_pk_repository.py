@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from contrib.clean_architecture.tests.factories.general.dtos import FooDTO
 from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooDetailByPKRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooIdentityMapRepository
+from contrib.clean_architecture.tests.utils import clear_context
+from contrib.clean_architecture.tests.utils import get_context
 
 
 class TestDetailByPKRepository:
@@ -15,3 +19,46 @@ class TestDetailByPKRepository:
 
         assert instance.id == object_id
         detail_by_pk_repository.objects.clear()
+
+    def test_detail_by_pk_identity_map(
+        self,
+        create_repository: FooCreateRepository,
+        identity_map_repository: FooIdentityMapRepository,
+    ):
+        get_context()
+        object_id = create_repository.create()
+        identity_map_repository.detail_by_pk(object_id)
+        identity_map_repository.objects.clear()
+
+        instance = identity_map_repository.detail_by_pk(object_id)
+
+        assert instance.id == object_id
+        clear_context()
+
+    def test_identity_map_invalidated_on_write(
+        self,
+        create_repository: FooCreateRepository,
+        identity_map_repository: FooIdentityMapRepository,
+    ):
+        get_context()
+        object_id = create_repository.create()
+        identity_map_repository.detail_by_pk(object_id)
+        identity_map_repository.update(id=object_id, foo_field1="identity_map")
+        identity_map_repository.objects.clear()
+
+        assert identity_map_repository.detail_by_pk(object_id, raise_exception=False) is None
+        clear_context()
+
+    def test_identity_map_skips_relations(
+        self,
+        create_repository: FooCreateRepository,
+        identity_map_repository: FooIdentityMapRepository,
+    ):
+        get_context()
+        object_id = create_repository.create()
+        identity_map_repository.with_dto(FooDTO, extra_select_related={"created_by"})
+        identity_map_repository.detail_by_pk(object_id)
+        identity_map_repository.objects.clear()
+
+        assert identity_map_repository.detail_by_pk(object_id, raise_exception=False) is None
+        clear_context()
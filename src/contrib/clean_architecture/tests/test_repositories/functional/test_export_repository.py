@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from contrib.clean_architecture.tests.factories.general.entities import FooEntity
+from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
+from contrib.clean_architecture.tests.factories.providers.repositories import FooExportRepository
+
+
+class TestExportRepository:
+    @staticmethod
+    def _prepare_data(create_repository):
+        create_repository.objects.clear()
+        create_repository.create(foo_field1="foo", foo_field3="Пицца")
+        create_repository.create(foo_field1="foo", foo_field3="Суп")
+        create_repository.create(foo_field1="bar", foo_field3="Пицца с грибами")
+
+    def test_export_lazy(
+        self,
+        create_repository: FooCreateRepository,
+        export_repository: FooExportRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = export_repository.export()
+        assert isinstance(instances, Iterator)
+        export_repository.objects.clear()
+
+    def test_export_chunks(
+        self,
+        create_repository: FooCreateRepository,
+        export_repository: FooExportRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = list(export_repository.export(chunk_size=2))
+        assert len(instances) == 3
+        assert all(isinstance(instance, FooEntity) for instance in instances)
+        assert [instance.id for instance in instances] == sorted(instance.id for instance in instances)
+        export_repository.objects.clear()
+
+    def test_export_with_filters(
+        self,
+        create_repository: FooCreateRepository,
+        export_repository: FooExportRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = list(export_repository.export(foo_field1="foo"))
+        assert len(instances) == 2
+        export_repository.objects.clear()
+
+    def test_export_with_search(
+        self,
+        create_repository: FooCreateRepository,
+        export_repository: FooExportRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = list(export_repository.export(search="Пицца"))
+        assert len(instances) == 2
+        export_repository.objects.clear()
+
+    def test_export_values(
+        self,
+        create_repository: FooCreateRepository,
+        export_repository: FooExportRepository,
+    ):
+        self._prepare_data(create_repository)
+        rows = list(export_repository.export(foo_field1="foo", values=("foo_field1", "foo_field3")))
+        assert rows == [("foo", "Пицца"), ("foo", "Суп")]
+        assert {"foo_field1", "foo_field3"} <= export_repository.get_value_fields()
+        export_repository.objects.clear()
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
+
+from contrib.clean_architecture.tests.factories.general.dtos import BarDTO
+from contrib.clean_architecture.tests.factories.general.dtos import FooDTO
+from contrib.clean_architecture.tests.factories.general.entities import FooEntity
 from contrib.clean_architecture.tests.factories.providers.repositories import FooCreateRepository
 from contrib.clean_architecture.tests.factories.providers.repositories import FooRetrieveRepository
 from contrib.pydantic.model import PydanticModel
@@ -60,6 +66,41 @@ class TestRetrieveRepository:
         assert retrieve_repository.count(foo_field1="foo") == 2
         retrieve_repository.objects.clear()
 
+    def test_aretrieve_and_acount(
+        self,
+        create_repository: FooCreateRepository,
+        retrieve_repository: FooRetrieveRepository,
+    ):
+        self._prepare_data(create_repository)
+
+        async def retrieve_and_count():
+            return await asyncio.gather(
+                retrieve_repository.aretrieve(foo_field1="foo"),
+                retrieve_repository.acount(foo_field1="foo"),
+            )
+
+        instances, count = asyncio.run(retrieve_and_count())
+        assert isinstance(instances, list)
+        assert len(instances) == count == 2
+        retrieve_repository.objects.clear()
+
+    def test_aretrieve_keeps_selected_dto(
+        self,
+        create_repository: FooCreateRepository,
+        retrieve_repository: FooRetrieveRepository,
+    ):
+        self._prepare_data(create_repository)
+
+        async def retrieve_with_dtos():
+            foo_instances = retrieve_repository.with_dto(FooDTO).aretrieve(foo_field1="foo")
+            bar_instances = retrieve_repository.with_dto(BarDTO).aretrieve(foo_field1="foo")
+            return await asyncio.gather(foo_instances, bar_instances)
+
+        foo_instances, bar_instances = asyncio.run(retrieve_with_dtos())
+        assert all(isinstance(instance, FooDTO) for instance in foo_instances)
+        assert all(isinstance(instance, BarDTO) for instance in bar_instances)
+        retrieve_repository.objects.clear()
+
     def test_limit(
         self,
         create_repository: FooCreateRepository,
@@ -93,3 +134,31 @@ class TestRetrieveRepository:
         assert len(instances_with_order_by) == 2
         assert instances[0].id == instances_with_order_by[-1].id
         retrieve_repository.objects.clear()
+
+    def test_iterate_chunks(
+        self,
+        create_repository: FooCreateRepository,
+        retrieve_repository: FooRetrieveRepository,
+    ):
+        self._prepare_data(create_repository)
+        instances = retrieve_repository.iterate(foo_field1="foo", chunk_size=1)
+        assert isinstance(instances, Iterator)
+
+        instances = list(instances)
+        assert len(instances) == 2
+        assert all(isinstance(instance, FooEntity) for instance in instances)
+        retrieve_repository.objects.clear()
+
+    def test_iterate_matches_retrieve(
+        self,
+        create_repository: FooCreateRepository,
+        retrieve_repository: FooRetrieveRepository,
+    ):
+        """Пачки, меньшие количества записей, дают те же сконвертированные записи, что и retrieve"""
+        self._prepare_data(create_repository)
+        instances = list(retrieve_repository.with_dto(FooDTO).iterate(chunk_size=2))
+        expected = retrieve_repository.with_dto(FooDTO).retrieve()
+
+        assert all(isinstance(instance, FooDTO) for instance in instances)
+        assert [instance.model_dump() for instance in instances] == [item.model_dump() for item in expected]
+        retrieve_repository.objects.clear()
@@ -46,6 +46,42 @@ class TestUpdateRepository:
         assert instance.foo_field2 == "update_with_kwargs"
         update_repository.objects.clear()
 
+    def test_fast_update_with_returning(
+        self,
+        create_repository: FooCreateRepository,
+        update_repository: FooUpdateRepository,
+    ):
+        object_id = create_repository.create(foo_field2="fast_update")
+        returned = update_repository.update(
+            id=object_id,
+            foo_field1="fast_update",
+            fast=True,
+            returning=("foo_field1", "foo_field2"),
+        )
+
+        assert returned == {"foo_field1": "fast_update", "foo_field2": "fast_update"}
+        assert update_repository.objects.last().foo_field1 == "fast_update"
+        update_repository.objects.clear()
+
+    def test_fast_update_by_primary_key_attr(
+        self,
+        create_repository: FooCreateRepository,
+        update_repository: FooUpdateRepository,
+    ):
+        create_repository.create(foo_field1="fast_update_key", foo_field2="created")
+        create_repository.create(foo_field1="other_key", foo_field2="created")
+
+        update_repository.update(
+            foo_field1="fast_update_key",
+            foo_field2="updated",
+            primary_key_attr="foo_field1",
+            fast=True,
+        )
+
+        assert update_repository.objects.get(foo_field1="fast_update_key").foo_field2 == "updated"
+        assert update_repository.objects.get(foo_field1="other_key").foo_field2 == "created"
+        update_repository.objects.clear()
+
     def test_update_with_user_context(
         self,
         create_repository: FooCreateRepository,
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import pytest
+from contrib.django.admission import AdmissionGate
+from contrib.django.admission import AdmissionMiddleware
+from contrib.django.admission import metrics_view
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import Http404
+from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory
+
+
+def search_action():
+    pass
+
+
+search_action.__method_name__ = "search"
+
+
+class FooAdmissionViewSet:
+    clean_methods = {"search_action": search_action}
+    search_max_concurrency = 1
+    search_retry_after = 7
+
+
+def view_func():
+    pass
+
+
+view_func.cls = FooAdmissionViewSet
+view_func.actions = {"get": "search_action"}
+
+
+@pytest.fixture(name="shared_gate")
+def get_shared_gate(monkeypatch):
+    cache.clear()
+    monkeypatch.setattr(AdmissionGate, "shared_backends", (LocMemCache,))
+    return AdmissionGate("foo", shared_max_concurrency=2)
+
+
+class TestAdmissionGate:
+    def test_acquire_release(self):
+        """Место освобождается после release и занимается повторно"""
+        gate = AdmissionGate("foo", max_concurrency=1)
+
+        assert gate.acquire()
+        assert not gate.acquire()
+        gate.release()
+        assert gate.acquire()
+
+        assert (gate.active, gate.admitted, gate.rejected, gate.waiting) == (1, 2, 1, 0)
+
+    def test_shared_reject(self, shared_gate):
+        """Запрос сверх общего лимита отклоняется, отклоненный запрос не занимает место"""
+        assert shared_gate.acquire()
+        assert shared_gate.acquire()
+        assert not shared_gate.acquire()
+
+        assert shared_gate.get_shared_active() == 2
+        shared_gate.release()
+        assert shared_gate.get_shared_active() == 1
+
+    def test_shared_release_not_below_zero(self, shared_gate):
+        """Освобождение места после истечения счетчика не опускает его ниже 0"""
+        assert shared_gate.acquire()
+        cache.delete(shared_gate.shared_key)
+        cache.set(shared_gate.shared_key, 0)
+
+        shared_gate.release()
+
+        assert shared_gate.get_shared_active() == 0
+
+    def test_shared_touch(self, shared_gate, settings, monkeypatch):
+        """Время жизни счетчика продлевается при занятии места"""
+        settings.ADMISSION_SHARED_TIMEOUT = 60
+        touched = []
+        monkeypatch.setattr(cache, "touch", lambda key, timeout: touched.append((key, timeout)))
+
+        assert shared_gate.acquire()
+
+        assert touched == [(shared_gate.shared_key, 60)]
+
+    def test_shared_unsupported_cache(self):
+        """Для кэша без атомарного incr общий лимит действует как лимит процесса"""
+        cache.clear()
+        gate = AdmissionGate("foo", shared_max_concurrency=1)
+
+        assert not gate.shared_enabled
+        assert gate.acquire()
+        assert not gate.acquire()
+        assert gate.get_shared_active() is None
+        gate.release()
+        assert cache.get(gate.shared_key) is None
+
+    def test_shared_cache_error(self, shared_gate, monkeypatch):
+        """При ошибке кэша запрос допускается по лимиту процесса"""
+
+        def fail(*args, **kwargs):
+            raise ConnectionError
+
+        for method in ("add", "incr", "decr", "get"):
+            monkeypatch.setattr(cache, method, fail)
+
+        assert shared_gate.acquire()
+        assert shared_gate.acquire()
+        assert not shared_gate.acquire()
+        assert shared_gate.get_shared_active() is None
+        shared_gate.release()
+        assert shared_gate.acquire()
+
+
+class TestAdmissionMiddleware:
+    def test_reject(self):
+        """Пока место занято, запрос отклоняется с 503 и Retry-After, после ответа место освобождается"""
+        middleware = AdmissionMiddleware(lambda request: HttpResponse())
+        request = RequestFactory().get("/")
+
+        assert middleware.process_view(request, view_func, (), {}) is None
+        rejected = middleware.process_view(RequestFactory().get("/"), view_func, (), {})
+        assert rejected.status_code == 503
+        assert rejected["Retry-After"] == "7"
+
+        middleware.process_response(request, HttpResponse())
+        assert middleware.process_view(request, view_func, (), {}) is None
+        middleware.process_response(request, HttpResponse())
+
+    def test_streaming_release_on_close(self):
+        """Место потокового ответа освобождается при закрытии ответа"""
+        middleware = AdmissionMiddleware(lambda request: None)
+        request = RequestFactory().get("/")
+
+        assert middleware.process_view(request, view_func, (), {}) is None
+        response = middleware.process_response(request, StreamingHttpResponse(iter([b"a", b"b"])))
+        assert middleware.process_view(RequestFactory().get("/"), view_func, (), {}).status_code == 503
+
+        assert b"".join(response.streaming_content) == b"ab"
+        response.close()
+
+        request = RequestFactory().get("/")
+        assert middleware.process_view(request, view_func, (), {}) is None
+        middleware.process_response(request, HttpResponse())
+
+    def test_streaming_release_without_reading(self):
+        """Место освобождается, если клиент отключился до чтения ответа"""
+        middleware = AdmissionMiddleware(lambda request: None)
+        request = RequestFactory().get("/")
+
+        assert middleware.process_view(request, view_func, (), {}) is None
+        middleware.process_response(request, StreamingHttpResponse(iter([b"a"]))).close()
+
+        request = RequestFactory().get("/")
+        assert middleware.process_view(request, view_func, (), {}) is None
+        middleware.process_response(request, HttpResponse())
+
+
+class TestMetricsView:
+    def test_trusted_proxy(self, settings):
+        """За доверенным прокси адрес клиента берется из X-Forwarded-For"""
+        settings.INTERNAL_IPS = ["10.0.0.5"]
+        settings.ADMISSION_TRUSTED_PROXIES = ["10.0.0.1"]
+
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="10.0.0.5")
+        assert metrics_view(request).status_code == 200
+
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="10.0.0.5, 1.2.3.4")
+        with pytest.raises(Http404):
+            metrics_view(request)
+
+    def test_token(self, settings):
+        """С ADMISSION_METRICS_TOKEN метрики доступны только по токену"""
+        settings.ADMISSION_METRICS_TOKEN = "secret"
+
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION="Bearer secret")
+        assert metrics_view(request).status_code == 200
+
+        with pytest.raises(Http404):
+            metrics_view(RequestFactory().get("/", REMOTE_ADDR="127.0.0.1"))
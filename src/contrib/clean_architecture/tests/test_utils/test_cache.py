@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from contrib.clean_architecture.providers.interactors.utils import coalesce
+from contrib.clean_architecture.providers.interactors.utils import get_coalesced_hits
+from contrib.clean_architecture.utils.cache import LocalCache
+from contrib.clean_architecture.utils.cache import SharedFlight
+from contrib.clean_architecture.utils.cache import SingleFlight
+
+
+class FooCoalesceInteractor:
+    retrieve_coalesce = True
+
+    def __init__(self):
+        self.calls = 0
+
+    @coalesce(name="retrieve")
+    def retrieve(self, *, limit: int = 20, **filters):
+        self.calls += 1
+        time.sleep(0.1)
+        return [limit, filters]
+
+    @coalesce(name="retrieve")
+    def retrieve_nested(self, *, limit: int = 20, **filters):
+        return self.retrieve(limit=limit, **filters)
+
+
+def run_concurrently(function, count: int = 5):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(function())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    def test_coalesced_hits(self):
+        """Одновременные вызовы с одним ключом выполняются один раз"""
+        single_flight = SingleFlight()
+        calls = []
+
+        def function():
+            calls.append(1)
+            time.sleep(0.1)
+            return 1
+
+        results = run_concurrently(lambda: single_flight.do("key", function, label="foo"))
+
+        assert results == [1] * 5
+        assert len(calls) == 1
+        assert single_flight.coalesced == 4
+        assert single_flight.hits["foo"] == 4
+
+
+class TestSharedFlight:
+    def test_do(self):
+        """Блокировка снимается, результат завершенного выполнения не возвращается следующему вызову"""
+        from django.core.cache import cache
+
+        shared_flight = SharedFlight()
+        assert shared_flight.do(("foo", 1), lambda: [1], timeout=1) == [1]
+        assert shared_flight.do(("foo", 1), lambda: [2], timeout=1) == [2]
+
+        cache_key = shared_flight.get_cache_key(("foo", 1))
+        assert cache.get(f"{cache_key}:lock") is None
+        assert shared_flight.coalesced == 0
+
+    def test_wait_running(self):
+        """Вызов, заставший выполнение, получает его результат"""
+        shared_flight = SharedFlight()
+        calls = []
+
+        def function():
+            calls.append(1)
+            time.sleep(0.2)
+            return [len(calls)]
+
+        results = run_concurrently(lambda: shared_flight.do(("foo", 2), function, timeout=5), count=2)
+
+        assert results == [[1], [1]]
+        assert len(calls) == 1
+        assert shared_flight.coalesced == 1
+
+
+class TestLocalCache:
+    def test_clear_during_compute(self):
+        """Значение, вычисленное до очистки кэша, не записывается в кэш"""
+        local_cache = LocalCache()
+
+        def function():
+            local_cache.clear()
+            return 1
+
+        assert local_cache.get_or_set("key", function) == 1
+        assert local_cache.get("key") is None
+
+
+class TestCoalesce:
+    def test_same_kwargs(self):
+        """Одинаковые вызовы интерактора получают результат одного выполнения"""
+        interactor = FooCoalesceInteractor()
+        hits = get_coalesced_hits()["local"].get("FooCoalesceInteractor.retrieve", 0)
+
+        results = run_concurrently(lambda: interactor.retrieve(limit=10, name__in=["a", "b"]))
+
+        assert interactor.calls == 1
+        assert all(result == results[0] for result in results)
+        assert len({id(result) for result in results}) == 5
+        assert get_coalesced_hits()["local"]["FooCoalesceInteractor.retrieve"] == hits + 4
+
+    def test_different_kwargs(self):
+        """Вызовы с разными аргументами не объединяются"""
+        interactor = FooCoalesceInteractor()
+
+        limits = iter(range(5))
+        run_concurrently(lambda: interactor.retrieve(limit=next(limits)))
+
+        assert interactor.calls == 5
+
+    def test_disabled(self):
+        """Без `<method>_coalesce` вызовы выполняются отдельно"""
+        interactor = FooCoalesceInteractor()
+        interactor.retrieve_coalesce = False
+
+        run_concurrently(lambda: interactor.retrieve(limit=10))
+
+        assert interactor.calls == 5
+
+    def test_nested_same_key(self):
+        """Вложенный вызов с тем же ключом выполняется в том же потоке без ожидания"""
+        interactor = FooCoalesceInteractor()
+
+        assert interactor.retrieve_nested(limit=10) == [10, {}]
+        assert interactor.calls == 1
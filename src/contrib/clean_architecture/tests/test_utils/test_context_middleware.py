@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from contrib.context import get_current_request
+from contrib.context import get_root_context
+from contrib.context.middleware import ContextMiddleware
+from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory
+
+
+class TestContextMiddleware:
+    def test_reset(self):
+        """Кадр запроса сбрасывается после ответа"""
+        middleware = ContextMiddleware(lambda request: HttpResponse())
+        request = RequestFactory().get("/")
+        initialized = get_root_context().initialized
+
+        middleware.process_request(request)
+        assert get_current_request() is request
+
+        middleware.process_response(request, HttpResponse())
+        assert get_root_context().initialized == initialized
+
+    def test_streaming_reset_on_close(self):
+        """Кадр потокового ответа доступен при формировании тела и сбрасывается при закрытии ответа"""
+        middleware = ContextMiddleware(lambda request: None)
+        request = RequestFactory().get("/")
+
+        def content():
+            yield b"a" if get_current_request() is request else b"-"
+
+        initialized = get_root_context().initialized
+        middleware.process_request(request)
+        response = middleware.process_response(request, StreamingHttpResponse(content()))
+
+        assert b"".join(response.streaming_content) == b"a"
+        assert get_current_request() is request
+        response.close()
+        assert get_root_context().initialized == initialized
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from contrib.django.warmup import build_pydantic_models
+from contrib.pydantic.model import get_deferred_models
+from contrib.pydantic.model import PydanticModel
+
+
+class TestDeferredModels:
+    def test_warm_up_builds_deferred(self):
+        """Модели и классы пагинации собираются прогревом, а не при объявлении"""
+
+        class FooDeferredDTO(PydanticModel, with_paginated=True):
+            foo: int
+
+        deferred = get_deferred_models()
+        assert FooDeferredDTO in deferred
+        assert FooDeferredDTO.paginated in deferred
+        assert not FooDeferredDTO.__pydantic_complete__
+
+        assert build_pydantic_models() >= 2
+
+        assert FooDeferredDTO.__pydantic_complete__
+        assert FooDeferredDTO.paginated.__pydantic_complete__
+        assert FooDeferredDTO not in get_deferred_models()
+        assert FooDeferredDTO(foo="1").foo == 1
+
+    def test_unresolved_model_skipped(self):
+        """Модель с неразрешенной аннотацией пропускается прогревом и остается в реестре до сборки"""
+
+        class FooLazyDTO(PydanticModel):
+            bar: FooLaterDTO
+
+        build_pydantic_models()
+        assert FooLazyDTO in get_deferred_models()
+
+        class FooLaterDTO(PydanticModel):
+            baz: int
+
+        FooLazyDTO.model_rebuild(_types_namespace={"FooLaterDTO": FooLaterDTO})
+        assert FooLazyDTO(bar={"baz": 1}).bar.baz == 1
+        assert FooLazyDTO not in get_deferred_models()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+from contrib.django import exports
+from contrib.django.exports import cleanup_export_jobs
+from contrib.django.exports import get_export_file
+from contrib.django.exports import get_export_job
+from contrib.django.exports import start_export_job
+from contrib.pydantic.model import ExportStreamResponseDTO
+
+
+@pytest.fixture
+def exports_root(settings, tmp_path, monkeypatch):
+    settings.EXPORTS_ROOT = str(tmp_path / "exports")
+    settings.EXPORTS_TTL = 60
+    monkeypatch.setattr(exports, "run_in_background", lambda function, *args: function(*args))
+    return tmp_path / "exports"
+
+
+def export_function():
+    return ExportStreamResponseDTO(
+        file_content=[b"a;b\n", b"1;2\n"],
+        file_name="foo",
+        file_extension="csv",
+        content_type="text/csv",
+    )
+
+
+class TestExportJob:
+    def test_done_for_owner(self, exports_root):
+        """Результат доступен владельцу задачи вне MEDIA_ROOT"""
+        job = start_export_job(export_function, owner_id=1)
+
+        assert get_export_job(job.job_id, owner_id=1, url="/file").model_dump() == {
+            "job_id": job.job_id,
+            "status": "done",
+            "url": "/file",
+        }
+        path = get_export_file(job.job_id, owner_id=1)
+        assert path.startswith(str(exports_root))
+        with open(path, "rb") as file:
+            assert file.read() == b"a;b\n1;2\n"
+
+    def test_other_owner(self, exports_root):
+        """Статус и файл задачи недоступны другому и анонимному пользователю"""
+        job = start_export_job(export_function, owner_id=1)
+
+        assert get_export_job(job.job_id, owner_id=2) is None
+        assert get_export_file(job.job_id, owner_id=2) is None
+        assert get_export_job(job.job_id) is None
+        assert get_export_file(job.job_id) is None
+
+    def test_failed(self, exports_root, monkeypatch):
+        """Ошибка экспорта отражается в статусе задачи"""
+        jobs = []
+        monkeypatch.setattr(exports, "run_in_background", lambda function, *args: jobs.append(args))
+
+        def failing_export():
+            raise ValueError
+
+        job = start_export_job(failing_export, owner_id=1)
+        with pytest.raises(ValueError):
+            exports._write_export(*jobs[0])
+
+        assert get_export_job(job.job_id, owner_id=1).status == "failed"
+        assert get_export_file(job.job_id, owner_id=1) is None
+
+    def test_cleanup(self, exports_root):
+        """Задачи старше EXPORTS_TTL удаляются, свежие остаются"""
+        old_job = start_export_job(export_function, owner_id=1)
+        new_job = start_export_job(export_function, owner_id=1)
+        expired = time.time() - 120
+        for name in os.listdir(exports_root / old_job.job_id):
+            os.utime(exports_root / old_job.job_id / name, (expired, expired))
+
+        assert cleanup_export_jobs() == 1
+        assert not (exports_root / old_job.job_id).exists()
+        assert get_export_job(new_job.job_id, owner_id=1).status == "done"
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from contrib.images.services import build_image_variants
+from contrib.images.services import HASH_LENGTH
+from contrib.images.services import render_variant
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from PIL import Image
+
+
+def get_image_file(name: str = "product/pizza.png", size: tuple[int, int] = (200, 100), mode: str = "RGBA") -> File:
+    output = io.BytesIO()
+    Image.new(mode, size, (255, 0, 0, 0) if mode == "RGBA" else (255, 0, 0)).save(output, format="PNG")
+    output.seek(0)
+    return File(output, name=name)
+
+
+@pytest.fixture(name="storage")
+def get_storage(tmp_path) -> FileSystemStorage:
+    return FileSystemStorage(location=str(tmp_path))
+
+
+class TestRenderVariant:
+    def test_no_upscale(self):
+        """Изображение уменьшается до ширины варианта и не увеличивается"""
+        image = Image.new("RGB", (200, 100))
+
+        assert Image.open(io.BytesIO(render_variant(image, 80, "webp"))).size == (80, 40)
+        assert Image.open(io.BytesIO(render_variant(image, 640, "webp"))).size == (200, 100)
+
+    def test_jpeg_flatten_alpha(self):
+        """Прозрачность для JPEG заменяется белым фоном"""
+        image = Image.new("RGBA", (10, 10), (255, 0, 0, 0))
+
+        variant = Image.open(io.BytesIO(render_variant(image, 10, "jpeg")))
+
+        assert variant.mode == "RGB"
+        assert all(channel > 250 for channel in variant.getpixel((5, 5)))
+
+
+class TestBuildImageVariants:
+    def test_variants(self, storage):
+        """Ширины больше исходной заменяются исходной, имена содержат ширину и хэш содержимого"""
+        result = build_image_variants(get_image_file(), storage, widths=(80, 320, 640), formats=("webp", "jpeg"))
+
+        assert result["source"] == "product/pizza.png"
+        assert result["width"] == 200
+        assert set(result["variants"]) == {"webp", "jpeg"}
+        assert set(result["variants"]["webp"]) == {"80", "200"}
+
+        name = result["variants"]["jpeg"]["80"]
+        assert name.startswith("product/variants/pizza-80w.")
+        assert name.endswith(".jpg")
+        assert len(name.split(".")[-2]) == HASH_LENGTH
+        assert all(storage.exists(name) for widths in result["variants"].values() for name in widths.values())
+
+    def test_same_content(self, storage):
+        """Повторная генерация не сохраняет новые файлы"""
+        first = build_image_variants(get_image_file(), storage, widths=(80,), formats=("webp",))
+        second = build_image_variants(get_image_file(), storage, widths=(80,), formats=("webp",))
+
+        assert first == second
+        assert len(storage.listdir("product/variants")[1]) == 1
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+from contrib.imports.management.commands.audit_imports import Command
+from contrib.openapi.lazy import LazyAutoSchema
+from django.conf import settings
+from django.core.management.base import CommandError
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   contrib.pydantic
+import time:       200 |        300 | contrib.clean_architecture.views
+import time:        50 |         50 |     django.db
+"""
+
+
+class TestLazyImports:
+    def test_views_without_optional_packages(self):
+        """Импорт представлений не загружает опциональные пакеты"""
+        code = (
+            "import django, json, sys; django.setup(); import contrib.clean_architecture.views.bases; "
+            "print(json.dumps([name for name in sys.argv[1:] if name in sys.modules]))"
+        )
+        optional = ["xlwt", "redis", "requests", "xmltodict", "contrib.openapi.views"]
+
+        process = subprocess.run(
+            [sys.executable, "-c", code, *optional],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=settings.BASE_DIR,
+        )
+
+        assert json.loads(process.stdout) == []
+
+    def test_lazy_auto_schema(self):
+        """AutoSchema создается при первом обращении"""
+        from contrib.openapi.views import AutoSchema
+
+        lazy_schema = LazyAutoSchema(tags=["foo"])
+        assert lazy_schema._schema is None
+
+        schema = lazy_schema.get_schema()
+
+        assert isinstance(schema, AutoSchema)
+        assert lazy_schema.get_schema() is schema
+
+
+class TestAuditImports:
+    @staticmethod
+    def run(**kwargs):
+        process = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=IMPORT_TIME_OUTPUT)
+        with mock.patch("subprocess.run", return_value=process):
+            Command().handle(module="foo", depth=kwargs.pop("depth", 1), top=20, repeat=1, **kwargs)
+
+    def test_output(self, tmp_path):
+        """Время импорта суммируется по пакетам заданной глубины"""
+        output = tmp_path / "imports.json"
+
+        self.run(depth=1, output=str(output))
+
+        result = json.loads(output.read_text())
+        assert result["total_ms"] == 0.35
+        assert result["packages_ms"] == {"contrib": 0.3, "django": 0.05}
+
+    def test_budget(self):
+        """Превышение бюджета завершает команду ошибкой"""
+        with pytest.raises(CommandError):
+            self.run(budget=0.1)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import pytest
+from contrib.django.media import HashedFileSystemStorage
+from contrib.django.media import serve
+from django.core.files.base import ContentFile
+from django.http import Http404
+from django.test import RequestFactory
+
+CONTENT = b"0123456789"
+
+
+@pytest.fixture(name="media_root")
+def get_media_root(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.MEDIA_URL = "/media/"
+    (tmp_path / "foo.txt").write_bytes(CONTENT)
+    return tmp_path
+
+
+def get(path: str = "foo.txt", method: str = "get", **headers):
+    request = getattr(RequestFactory(), method)(f"/media/{path}", headers=headers)
+    return serve(request, path)
+
+
+def read(response) -> bytes:
+    content = b"".join(response.streaming_content)
+    response.close()
+    return content
+
+
+class TestServe:
+    def test_file(self, media_root):
+        """Файл отдается с ETag, Last-Modified и коротким временем кэширования"""
+        response = get()
+
+        assert response.status_code == 200
+        assert read(response) == CONTENT
+        assert response["Content-Length"] == str(len(CONTENT))
+        assert response["Cache-Control"] == "public, max-age=3600"
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["ETag"] and response["Last-Modified"]
+
+    def test_not_modified(self, media_root):
+        """Совпадающий If-None-Match или If-Modified-Since возвращает 304"""
+        response = get()
+        read(response)
+
+        assert get(**{"If-None-Match": response["ETag"]}).status_code == 304
+        assert get(**{"If-None-Match": f"W/{response['ETag']}"}).status_code == 304
+        assert get(**{"If-Modified-Since": response["Last-Modified"]}).status_code == 304
+        modified = get(**{"If-None-Match": '"other"', "If-Modified-Since": response["Last-Modified"]})
+        assert modified.status_code == 200
+        read(modified)
+
+    def test_range(self, media_root):
+        """Одиночный диапазон и диапазон от конца файла возвращают 206"""
+        response = get(Range="bytes=2-4")
+        assert response.status_code == 206
+        assert response["Content-Range"] == "bytes 2-4/10"
+        assert response["Content-Length"] == "3"
+        assert read(response) == b"234"
+
+        response = get(Range="bytes=-3")
+        assert response.status_code == 206
+        assert response["Content-Range"] == "bytes 7-9/10"
+        assert read(response) == b"789"
+
+        response = get(Range="bytes=8-")
+        assert response.status_code == 206
+        assert read(response) == b"89"
+
+    def test_range_not_satisfiable(self, media_root):
+        """Диапазон за пределами файла возвращает 416"""
+        for header in ("bytes=10-", "bytes=5-2", "bytes=-0"):
+            response = get(Range=header)
+            assert response.status_code == 416
+            assert response["Content-Range"] == "bytes */10"
+
+    def test_if_range_mismatch(self, media_root):
+        """При несовпадении If-Range файл отдается целиком"""
+        response = get(Range="bytes=2-4", **{"If-Range": '"other"'})
+
+        assert response.status_code == 200
+        assert read(response) == CONTENT
+
+    def test_head(self, media_root):
+        """HEAD возвращает длину без тела"""
+        response = get(method="head", Range="bytes=0-1")
+
+        assert response.status_code == 206
+        assert response["Content-Length"] == "2"
+        assert response.content == b""
+
+    def test_sendfile(self, media_root, settings):
+        """С MEDIA_SENDFILE_HEADER тело отдает прокси сервер"""
+        settings.MEDIA_SENDFILE_HEADER = "X-Accel-Redirect"
+        settings.MEDIA_SENDFILE_PREFIX = "/protected/"
+
+        response = get(Range="bytes=2-4")
+
+        assert response.status_code == 200
+        assert response["X-Accel-Redirect"] == "/protected/foo.txt"
+        assert response.content == b""
+        assert "Content-Range" not in response
+        assert "Content-Length" not in response
+
+    def test_not_found(self, media_root):
+        """Выход за MEDIA_ROOT, отсутствующий файл и директория возвращают 404"""
+        (media_root / "folder").mkdir()
+        for path in ("../secret.txt", "missing.txt", "folder"):
+            with pytest.raises(Http404):
+                get(path)
+
+    def test_hashed_name(self, media_root):
+        """Файл с хэшем в имени кэшируется навсегда, хэш используется как ETag"""
+        name = HashedFileSystemStorage().save("bar.txt", ContentFile(CONTENT))
+
+        response = get(name)
+
+        assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert response["ETag"] == f'"{name.split(".")[1]}"'
+        read(response)
+
+
+class TestHashedFileSystemStorage:
+    def test_save(self, media_root):
+        """Одинаковое содержимое сохраняется один раз, новое получает новое имя"""
+        storage = HashedFileSystemStorage()
+
+        name = storage.save("product/pizza.png", ContentFile(b"pizza"))
+        same_name = storage.save("product/pizza.png", ContentFile(b"pizza"))
+        other_name = storage.save("product/pizza.png", ContentFile(b"other"))
+
+        assert name == same_name
+        assert name.startswith("product/pizza.") and name.endswith(".png")
+        assert other_name != name
+        assert sorted(path.name for path in (media_root / "product").iterdir()) == sorted(
+            [name.split("/")[1], other_name.split("/")[1]]
+        )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from contrib.clean_architecture.tests.utils import clear_context
+from contrib.clean_architecture.tests.utils import get_context
+from contrib.module_manager import Lifetime
+from contrib.module_manager import ModuleManager
+from contrib.module_manager.profiling import STAGE_CONSTRUCT
+from contrib.module_manager.profiling import STAGE_INJECT
+from contrib.module_manager.profiling import StartupProfile
+
+
+class FooAppModule:
+    app_label = "foo_module"
+    imports = ()
+
+
+class FooProvider:
+    created = 0
+
+    def __init__(self):
+        FooProvider.created += 1
+
+
+@pytest.fixture(name="app_module")
+def get_app_module():
+    app_module = FooAppModule()
+    ModuleManager._provider_factories[app_module][FooProvider] = FooProvider
+    yield app_module
+    for registry in (ModuleManager._provider_factories, ModuleManager._lifetimes, ModuleManager._providers_by_module):
+        registry.pop(app_module, None)
+
+
+def get_provider_while_locked(app_module) -> object:
+    """Получает провайдер, пока глобальная блокировка менеджера модулей занята другим потоком"""
+    locked, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with ModuleManager.lock:
+            locked.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    locked.wait(5)
+
+    results = []
+    getter = threading.Thread(target=lambda: results.append(ModuleManager._get_provider(app_module, FooProvider)))
+    getter.start()
+    getter.join(1)
+    resolved_while_locked = bool(results)
+    release.set()
+    thread.join()
+    getter.join()
+    assert resolved_while_locked
+    return results[0]
+
+
+class TestModuleManagerLifetimes:
+    def test_transient(self, app_module):
+        """TRANSIENT провайдер создается при каждом обращении без глобальной блокировки"""
+        ModuleManager._lifetimes[app_module][FooProvider] = Lifetime.TRANSIENT
+
+        provider = get_provider_while_locked(app_module)
+
+        assert isinstance(provider, FooProvider)
+        assert ModuleManager._get_provider(app_module, FooProvider) is not provider
+
+    def test_request(self, app_module):
+        """REQUEST провайдер один в рамках контекста запроса и создается без глобальной блокировки"""
+        ModuleManager._lifetimes[app_module][FooProvider] = Lifetime.REQUEST
+        get_context()
+        try:
+            provider = ModuleManager._get_provider(app_module, FooProvider)
+            assert ModuleManager._get_provider(app_module, FooProvider) is provider
+        finally:
+            clear_context()
+
+        assert ModuleManager._get_provider(app_module, FooProvider) is not provider
+        assert isinstance(get_provider_while_locked(app_module), FooProvider)
+
+    def test_singleton(self, app_module):
+        """SINGLETON провайдер создается один раз"""
+        provider = ModuleManager._get_provider(app_module, FooProvider)
+
+        assert ModuleManager._get_provider(app_module, FooProvider) is provider
+
+
+class TestModuleManagerLazy:
+    def test_created_on_first_lookup(self, app_module):
+        """Провайдер создается при первом обращении, а не при регистрации"""
+        created = FooProvider.created
+        assert FooProvider not in ModuleManager._providers_by_module[app_module]
+
+        provider = ModuleManager._get_provider(app_module, FooProvider)
+
+        assert FooProvider.created == created + 1
+        assert ModuleManager._providers_by_module[app_module][FooProvider] is provider
+
+    def test_profile(self, app_module, monkeypatch):
+        """Профиль запуска учитывает создание и внедрение зависимостей провайдера"""
+        profile = StartupProfile()
+        monkeypatch.setattr(ModuleManager, "profile", profile)
+
+        ModuleManager._get_provider(app_module, FooProvider)
+
+        assert set(profile.timings[("foo_module", "FooProvider")]) == {STAGE_CONSTRUCT, STAGE_INJECT}
+        assert profile.by_module()["foo_module"][STAGE_CONSTRUCT] >= 0
+        assert "FooProvider" in profile.report()
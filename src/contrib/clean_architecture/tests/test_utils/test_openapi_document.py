@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+from contrib.openapi.schema_generators import CustomSchemaGenerator
+
+
+@pytest.fixture(name="schema_generator")
+def get_schema_generator(monkeypatch):
+    schema_generator = CustomSchemaGenerator(patterns=[])
+    schema_generator.builds = 0
+
+    def build_document():
+        schema_generator.builds += 1
+        return {"openapi": "3.0.2", "paths": {}, "build": schema_generator.builds}
+
+    monkeypatch.setattr(schema_generator, "build_document", build_document)
+    return schema_generator
+
+
+class TestOpenAPIDocument:
+    def test_cached(self, schema_generator):
+        """Документ генерируется один раз, версия не меняется между запросами"""
+        document, version = schema_generator.get_document()
+
+        assert schema_generator.get_document() == (document, version)
+        assert schema_generator.get_request_document(None) == (document, version)
+        assert schema_generator.builds == 1
+
+    def test_clear_document(self, schema_generator):
+        """После clear_document документ генерируется заново и получает новую версию"""
+        _, version = schema_generator.get_document()
+
+        schema_generator.clear_document()
+        document, new_version = schema_generator.get_document()
+
+        assert document["build"] == 2
+        assert new_version != version
+
+    def test_setting_changed(self, schema_generator, settings):
+        """Изменение настроек сбрасывает закэшированный документ"""
+        schema_generator.get_document()
+
+        settings.OPENAPI_SCHEMA_FILE = None
+        schema_generator.get_document()
+
+        assert schema_generator.builds == 2
+
+    def test_schema_file(self, schema_generator, tmp_path):
+        """Документ читается из файла и перечитывается после его изменения"""
+        schema_file = tmp_path / "openapi.json"
+        schema_file.write_text(json.dumps({"paths": {}, "file": 1}))
+        schema_generator.schema_file = str(schema_file)
+
+        document, version = schema_generator.get_document()
+        assert document["file"] == 1
+        assert schema_generator.get_document()[1] == version
+
+        schema_file.write_text(json.dumps({"paths": {}, "file": 2}))
+        mtime = os.stat(schema_file).st_mtime + 10
+        os.utime(schema_file, (mtime, mtime))
+
+        document, new_version = schema_generator.get_document()
+        assert document["file"] == 2
+        assert new_version != version
+        assert schema_generator.builds == 0
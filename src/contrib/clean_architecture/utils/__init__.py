@@ -1,6 +1,7 @@
 """Модуль утилиты для чистой архитектуры
 
 Modules:
+    cache: Утилиты локального кэширования результатов методов
     exceptions: Утилиты для работы с исключениями
     method: Утилиты для работы с методами репозиториев, интеракторов, контроллеров и представлений
 
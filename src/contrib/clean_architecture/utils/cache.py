@@ -0,0 +1,292 @@
+"""Модуль с утилитами локального (в рамках процесса) кэширования результатов методов
+
+Classes:
+    SingleFlight: Объединяет одновременные одинаковые вызовы в одно выполнение
+    SharedFlight: Объединяет одинаковые вызовы разных процессов через общий кэш django
+    LocalCache: Потокобезопасный LRU кэш с временем жизни записей
+
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """Выполняющийся вызов"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Объединяет одновременные одинаковые вызовы в одно выполнение
+
+    Notes:
+        Пока вызов с ключом `key` выполняется, остальные потоки с тем же ключом не выполняют функцию,
+        а ждут и получают ее результат (или исключение)
+
+    Examples:
+        >>> single_flight = SingleFlight()
+        >>> single_flight.do(("search", "пиц"), lambda: ["Пицца"])
+        ['Пицца']
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.coalesced = 0
+        """Количество вызовов, получивших результат чужого выполнения"""
+        self.hits: Counter[Hashable] = Counter()
+        """Количество вызовов, получивших результат чужого выполнения, по меткам"""
+
+    def do(
+        self,
+        key: Hashable,
+        function: Callable[[], Any],
+        label: Hashable = None,
+        copy_result: Callable[[Any], Any] = None,
+    ) -> Any:
+        """Выполняет функцию или дожидается результата уже выполняющегося вызова с тем же ключом
+
+        Args:
+            key: Ключ вызова
+            function: Функция без аргументов
+            label: Метка вызова для счетчика `hits` (например имя метода)
+            copy_result: Функция копирования результата для ожидавших потоков. По умолчанию
+                все потоки получают один и тот же объект
+
+        Returns:
+            Результат функции
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+                if label is not None:
+                    self.hits[label] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy_result(call.result) if copy_result else call.result
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+        return call.result
+
+
+class SharedFlight:
+    """Объединяет одинаковые вызовы разных процессов через общий кэш django
+
+    Notes:
+        Первый процесс захватывает блокировку (`cache.add` с уникальным токеном выполнения) и выполняет функцию,
+        результат записывается в кэш под ключом этого выполнения на `result_timeout` секунд. Процесс, заставший
+        блокировку, ждет результат именно этого выполнения; если блокировка снята без результата или истекла,
+        он выполняет функцию сам. Вызов, пришедший после завершения выполнения, не получает его результат,
+        поэтому объединение не превращается в кэш результатов. Результат должен сериализоваться pickle. Между процессами вызовы объединяются только при общем
+        для них бэкенде кэша (redis, memcached, БД), с `LocMemCache` каждый процесс выполняет функцию сам
+
+    Examples:
+        >>> shared_flight = SharedFlight()
+        >>> shared_flight.do(("search", "пиц"), lambda: ["Пицца"], timeout=5)
+        ['Пицца']
+    """
+
+    key_prefix = "shared-flight"
+    """Префикс ключей кэша"""
+    result_timeout: int = 1
+    """Время жизни результата выполнения в кэше в секундах, за которое его читают ожидающие процессы"""
+
+    def __init__(self, alias: str = "default", poll_interval: float = 0.05):
+        """
+
+        Args:
+            alias: Имя кэша django
+            poll_interval: Интервал опроса кэша ожидающими процессами в секундах
+        """
+        self.alias = alias
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self.coalesced = 0
+        """Количество вызовов, получивших результат другого процесса"""
+        self.hits: Counter[Hashable] = Counter()
+        """Количество вызовов, получивших результат другого процесса, по меткам"""
+
+    def get_cache_key(self, key: Hashable) -> str:
+        """Возвращает ключ кэша для ключа вызова
+
+        Args:
+            key: Ключ вызова
+
+        Returns:
+            Строковый ключ фиксированной длины
+        """
+        return f"{self.key_prefix}:{hashlib.sha256(repr(key).encode()).hexdigest()}"
+
+    def do(self, key: Hashable, function: Callable[[], Any], timeout: float, label: Hashable = None) -> Any:
+        """Выполняет функцию или дожидается ее результата от процесса, уже выполняющего вызов с тем же ключом
+
+        Args:
+            key: Ключ вызова
+            function: Функция без аргументов
+            timeout: Время жизни блокировки и максимальное время ожидания в секундах
+            label: Метка вызова для счетчика `hits` (например имя метода)
+
+        Returns:
+            Результат функции
+        """
+        from django.core.cache import caches
+
+        cache = caches[self.alias]
+        cache_key = self.get_cache_key(key)
+        lock_key = f"{cache_key}:lock"
+
+        token = uuid.uuid4().hex
+        if cache.add(lock_key, token, timeout):
+            try:
+                result = function()
+                try:
+                    cache.set(f"{cache_key}:result:{token}", result, self.result_timeout)
+                except Exception:
+                    logger.warning("Shared flight result for %s is not cached", label or cache_key, exc_info=True)
+                return result
+            finally:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+
+        # Ожидается только выполнение, блокировку которого застал вызов
+        token = cache.get(lock_key)
+        if token is None:
+            return function()
+
+        missing = object()
+        result_key = f"{cache_key}:result:{token}"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            result = cache.get(result_key, missing)
+            # Результат мог быть записан между чтением результата и снятием блокировки
+            if result is missing and cache.get(lock_key) != token:
+                result = cache.get(result_key, missing)
+                if result is missing:
+                    # Блокировка снята без результата - выполнение завершилось ошибкой
+                    break
+            if result is not missing:
+                with self._lock:
+                    self.coalesced += 1
+                    if label is not None:
+                        self.hits[label] += 1
+                return result
+        return function()
+
+
+class LocalCache:
+    """Потокобезопасный LRU кэш с временем жизни записей
+
+    Notes:
+        Промахи по одному ключу объединяются через [`SingleFlight`][contrib.clean_architecture.utils.cache.SingleFlight]
+    """
+
+    def __init__(self, maxsize: int = 1024, timeout: float = 60):
+        """
+
+        Args:
+            maxsize: Максимальное количество записей
+            timeout: Время жизни записи в секундах
+        """
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._single_flight = SingleFlight()
+        self._generation = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Возвращает значение по ключу
+
+        Args:
+            key: Ключ
+            default: Значение по умолчанию
+
+        Returns:
+            Значение или default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Записывает значение по ключу
+
+        Args:
+            key: Ключ
+            value: Значение
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Возвращает значение из кэша или вычисляет его, объединяя одновременные вычисления
+
+        Args:
+            key: Ключ
+            function: Функция без аргументов, вычисляющая значение
+
+        Returns:
+            Значение
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        def _compute():
+            generation = self._generation
+            result = function()
+            # Значение, вычисленное до clear, может быть устаревшим
+            if generation == self._generation:
+                self.set(key, result)
+            return result
+
+        return self._single_flight.do(key, _compute)
+
+    def clear(self) -> None:
+        """Очищает кэш. Вычисляющиеся в момент очистки значения не записываются"""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
@@ -0,0 +1,158 @@
+"""Модуль с картой идентичности записей в рамках запроса
+
+Notes:
+    Карта хранится в корневом контексте (`get_root_context()`), который инициализируется заново
+    на каждый запрос, поэтому прочитанные записи переиспользуются только внутри одного запроса.
+    Записи хранятся по ключу (модель, первичный ключ, DTO), так как набор подгружаемых связей зависит от DTO
+
+Classes:
+    IdentityMap: Карта идентичности записей
+
+Functions:
+    get_identity_map: Возвращает карту идентичности текущего запроса
+    invalidate_identity_map: Удаляет из карты идентичности текущего запроса записи модели
+    invalidates_identity_map: Декоратор метода репозитория, очищающий записи его модели перед вызовом
+
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from functools import wraps
+from typing import Any
+
+from contrib.clean_architecture.interfaces import DTO
+from contrib.clean_architecture.interfaces import Model
+from contrib.clean_architecture.interfaces import ObjectId
+from contrib.context import get_root_context
+
+IDENTITY_MAP_CONTEXT_KEY = "identity_map"
+"""Ключ карты идентичности в корневом контексте"""
+
+
+class IdentityMap:
+    """Карта идентичности записей
+
+    Examples:
+        >>> identity_map = IdentityMap()
+        >>> identity_map.set(Order, 1, order)
+        >>> identity_map.get(Order, 1) is order
+        True
+    """
+
+    def __init__(self):
+        self._objects: dict[type[Model], dict[tuple[ObjectId, type[DTO] | None], Any]] = {}
+
+    def get(self, model: type[Model], pk: ObjectId, dto: type[DTO] = None, default: Any = None) -> Any:
+        """Возвращает запись
+
+        Args:
+            model: Модель ORM
+            pk: Первичный ключ
+            dto: DTO, для которого была прочитана запись
+            default: Значение, если записи нет в карте
+
+        Returns:
+            Запись или default
+        """
+        return self._objects.get(model, {}).get((pk, dto), default)
+
+    def get_many(self, model: type[Model], pks: Iterable[ObjectId], dto: type[DTO] = None) -> dict[ObjectId, Any]:
+        """Возвращает записи, которые есть в карте
+
+        Args:
+            model: Модель ORM
+            pks: Первичные ключи
+            dto: DTO, для которого были прочитаны записи
+
+        Returns:
+            Словарь вида {первичный ключ: запись}
+        """
+        objects = self._objects.get(model, {})
+        return {pk: objects[(pk, dto)] for pk in pks if (pk, dto) in objects}
+
+    def set(self, model: type[Model], pk: ObjectId, instance: Any, dto: type[DTO] = None) -> None:
+        """Сохраняет запись
+
+        Args:
+            model: Модель ORM
+            pk: Первичный ключ
+            instance: Запись
+            dto: DTO, для которого была прочитана запись
+        """
+        self._objects.setdefault(model, {})[(pk, dto)] = instance
+
+    def set_many(self, model: type[Model], instances: Iterable[Any], dto: type[DTO] = None) -> None:
+        """Сохраняет записи по их первичным ключам
+
+        Args:
+            model: Модель ORM
+            instances: Записи
+            dto: DTO, для которого были прочитаны записи
+        """
+        objects = self._objects.setdefault(model, {})
+        objects.update(((instance.pk, dto), instance) for instance in instances)
+
+    def invalidate(self, model: type[Model]) -> None:
+        """Удаляет записи модели
+
+        Args:
+            model: Модель ORM
+        """
+        self._objects.pop(model, None)
+
+    def clear(self) -> None:
+        """Удаляет все записи"""
+        self._objects.clear()
+
+
+def get_identity_map(create: bool = True) -> IdentityMap | None:
+    """Возвращает карту идентичности текущего запроса
+
+    Args:
+        create: Создать ли карту, если ее еще нет в контексте
+
+    Returns:
+        Карта идентичности или None, если контекст запроса не инициализирован
+    """
+    context = get_root_context()
+    try:
+        if not context.initialized:
+            return None
+        if create:
+            return context.setdefault(IDENTITY_MAP_CONTEXT_KEY, IdentityMap())
+        return context.get(IDENTITY_MAP_CONTEXT_KEY)
+    except LookupError:
+        # Контекст инициализирован в другом потоке
+        return None
+
+
+def invalidate_identity_map(model: type[Model]) -> None:
+    """Удаляет из карты идентичности текущего запроса записи модели
+
+    Args:
+        model: Модель ORM
+    """
+    if identity_map := get_identity_map(create=False):
+        identity_map.invalidate(model)
+
+
+def invalidates_identity_map(method: Callable) -> Callable:
+    """Декоратор метода репозитория, очищающий записи его модели перед вызовом
+
+    Notes:
+        Записи очищаются до изменения, чтобы метод мог сам положить в карту созданную запись
+
+    Args:
+        method: Метод репозитория, изменяющий записи
+
+    Returns:
+        Декорированный метод
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        invalidate_identity_map(self.model)
+        return method(self, *args, **kwargs)
+
+    return wrapper
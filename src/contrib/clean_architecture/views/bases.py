@@ -5,6 +5,7 @@
 Classes:
     CleanViewSetMeta: Мета класс базового представления
     CleanViewSet: Базовое представление
+    AsyncCleanViewSetMixin: Миксин представления с асинхронным dispatch
 
 ## Создание
 
@@ -34,11 +35,13 @@ Classes:
 Classes:
     RetrieveCleanViewSetMixin: Миксин представления получения списка объектов
     SearchCleanViewSetMixin: Миксин представления получения списка объектов по полнотекстовому поиску
+    AutocompleteCleanViewSetMixin: Миксин представления автодополнения по префиксу
 
 ## Экспорт записей
 
 Classes:
-    ExportXLSCleanViewSetMixin: Миксин представления экспорта списка объектов
+    ExportJobCleanViewSetMixin: Миксин представления получения статуса и файла фоновой задачи экспорта
+    ExportXLSCleanViewSetMixin: Миксин представления экспорта списка объектов (xls / csv, в том числе в фоне)
 
 ## Комбинации интерфейсов миксинов представлений
 
@@ -52,18 +55,35 @@ Classes:
     ReadCleanViewSetMixin: Миксин представления получения деталей / списка объектов
     CRUDCleanViewSetMixin: Миксин представления создание / чтение /обновление / удаление
 
+## Асинхронные представления
+
+Classes:
+    AsyncDetailCleanViewSetMixin: Миксин асинхронного представления получения деталей
+    AsyncDetailByPKCleanViewSetMixin: Миксин асинхронного представления получения деталей по первичному ключу
+    AsyncRetrieveCleanViewSetMixin: Миксин асинхронного представления получения списка объектов
+    AsyncSearchCleanViewSetMixin: Миксин асинхронного представления получения списка объектов по полнотекстовому поиску
+    AsyncDetailsCleanViewSetMixin: Миксин асинхронного представления получения деталей
+    AsyncListCleanViewSetMixin: Миксин асинхронного представления получения списка объектов
+    AsyncReadCleanViewSetMixin: Миксин асинхронного представления получения деталей / списка объектов
+
 """
 from __future__ import annotations
 
+import inspect
+import os
 import re
 from abc import ABCMeta
+from functools import partial
 from typing import Any
 
+from asgiref.sync import markcoroutinefunction
+from asgiref.sync import sync_to_async
 from contrib.clean_architecture.consts import CleanMethods
 from contrib.clean_architecture.consts import ReturnTypeAttrs
 from contrib.clean_architecture.consts import ViewActionAttrs
 from contrib.clean_architecture.interfaces import DTO
 from contrib.clean_architecture.interfaces import RequestDTO
+from contrib.clean_architecture.providers.controllers.bases import AutocompleteControllerMixin
 from contrib.clean_architecture.providers.controllers.bases import Controller
 from contrib.clean_architecture.providers.controllers.bases import CreateControllerMixin
 from contrib.clean_architecture.providers.controllers.bases import CreateDeleteControllerMixin
@@ -90,20 +110,30 @@ from contrib.clean_architecture.utils.method import CleanMethodMixin
 from contrib.clean_architecture.utils.names import to_snake_case
 from contrib.clean_architecture.views.utils import exception_handler
 from contrib.context import get_root_context
+from contrib.django.exports import get_export_file
+from contrib.django.exports import get_export_job
+from contrib.django.exports import start_export_job
 from contrib.exceptions.exceptions import ActionImpossible
+from contrib.exceptions.exceptions import DoesNotExist
+from contrib.exceptions.exceptions import ServiceUnavailable
 from contrib.exceptions.utils import responses_from_exceptions
 from contrib.localization.services import gettext_lazy as _
 from contrib.module_manager.decorators import inject
 from contrib.openapi.decorators import action
 from contrib.openapi.decorators import endpoint_permissions
-from contrib.openapi.views import AutoSchema
+from contrib.openapi.lazy import LazyAutoSchema
+from contrib.pydantic.model import AutocompleteQueryDTO
+from contrib.pydantic.model import ExportJobDTO
+from contrib.pydantic.model import ExportStreamResponseDTO
 from contrib.pydantic.model import ExportXLSQueryDTO
 from contrib.pydantic.model import FilterQueryDTO
 from contrib.pydantic.model import PaginatedModel
 from contrib.pydantic.model import ResultIdDTO
 from contrib.pydantic.model import SearchQueryDTO
+from django.http import FileResponse
 from django.http import HttpRequest
 from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.utils.encoding import escape_uri_path
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -157,7 +187,7 @@ class CleanViewSet(CleanMethodMixin, ViewSetMixin, APIView, metaclass=CleanViewS
     def __init_subclass__(cls, view_set_base: bool = False, **kwargs):
         # Добавляем генератор схемы в класс
         if not view_set_base:
-            cls.schema = AutoSchema(
+            cls.schema = LazyAutoSchema(
                 tags=(cls.tags if cls.tags is not None else [cls.get_snake_view_name_by_class()]),
                 operation_id_base=cls.get_camel_view_name_by_class(),
             )
@@ -171,25 +201,9 @@ class CleanViewSet(CleanMethodMixin, ViewSetMixin, APIView, metaclass=CleanViewS
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Записываем все return_type в контекст
+        # Записываем в контекст представление, return_type читаются из его атрибутов при вызове
         if self.set_return_context:
-            context = get_root_context()
-            context.set(ReturnTypeAttrs.RETURN_TYPE, self.return_type)
-            context.set(ReturnTypeAttrs.RETURN_DETAIL_TYPE, self.return_detail_type)
-            context.set(ReturnTypeAttrs.RETURN_PAGINATION_TYPE, self.return_pagination_type)
-
-            for method_name in self.clean_methods_names:
-                method_return_type = getattr(self, f"{method_name}_{ReturnTypeAttrs.RETURN_TYPE}", None)
-                method_return_pagination_type = getattr(
-                    self,
-                    f"{method_name}_{ReturnTypeAttrs.RETURN_PAGINATION_TYPE}",
-                    None,
-                )
-                context.set(f"{method_name}_{ReturnTypeAttrs.RETURN_TYPE}", method_return_type)
-                context.set(
-                    f"{method_name}_{ReturnTypeAttrs.RETURN_PAGINATION_TYPE}",
-                    method_return_pagination_type,
-                )
+            get_root_context().set(ReturnTypeAttrs.RETURN_TYPES_SOURCE, self)
 
     @classmethod
     def get_camel_view_name_by_class(cls) -> str:
@@ -264,6 +278,47 @@ class CleanViewSet(CleanMethodMixin, ViewSetMixin, APIView, metaclass=CleanViewS
         return exception_handler
 
 
+class AsyncCleanViewSetMixin(mixin_for(CleanViewSet)):
+    """Миксин представления с асинхронным dispatch
+
+    Notes:
+        Аутентификация, проверка разрешений и троттлинг выполняются в потоке, асинхронные действия
+        ожидаются в цикле событий, синхронные действия выполняются в потоке. Под ASGI воркер не занят
+        на время ожидания БД и может обслуживать другие запросы. Миксин указывается перед CleanViewSet
+    """
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        # Django ожидает результат представления, только если оно помечено как корутина
+        return markcoroutinefunction(super().as_view(*args, **initkwargs))
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if inspect.iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
 class CreateCleanViewSetMixin(mixin_for(CleanViewSet)):
     """Миксин представления создания"""
 
@@ -645,6 +700,10 @@ class DetailCleanViewSetMixin(mixin_for(CleanViewSet)):
 
     detail_return_type: type[DTO] = None
     """DTO которое, нужно вернуть для метода"""
+    detail_coalesce: bool = None
+    """Объединять одновременные одинаковые запросы в рамках процесса. None - настройка интерактора"""
+    detail_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей запросы разных процессов. None - настройка интерактора"""
 
     @classmethod
     def get_detail_methods(cls):
@@ -761,6 +820,10 @@ class DetailByPKCleanViewSetMixin(mixin_for(CleanViewSet)):
 
     detail_by_pk_return_type: type[DTO] = None
     """DTO которое, нужно вернуть для метода"""
+    detail_by_pk_coalesce: bool = None
+    """Объединять одновременные одинаковые запросы в рамках процесса. None - настройка интерактора"""
+    detail_by_pk_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей запросы разных процессов. None - настройка интерактора"""
 
     @classmethod
     def get_detail_methods(cls):
@@ -879,6 +942,10 @@ class DetailByExternalCodeCleanViewSetMixin(mixin_for(CleanViewSet)):
 
     detail_by_external_code_return_type: type[DTO] = None
     """DTO которое, нужно вернуть для метода"""
+    detail_by_external_code_coalesce: bool = None
+    """Объединять одновременные одинаковые запросы в рамках процесса. None - настройка интерактора"""
+    detail_by_external_code_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей запросы разных процессов. None - настройка интерактора"""
 
     @classmethod
     def get_detail_by_external_code_methods(cls):
@@ -1006,6 +1073,10 @@ class RetrieveCleanViewSetMixin(mixin_for(CleanViewSet)):
     """DTO, которое нужно вернуть"""
     retrieve_return_pagination_type: type[PaginatedModel] = None
     """DTO с пагинацией, которое нужно вернуть"""
+    retrieve_coalesce: bool = None
+    """Объединять одновременные одинаковые запросы в рамках процесса. None - настройка интерактора"""
+    retrieve_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей запросы разных процессов. None - настройка интерактора"""
 
     @classmethod
     def get_retrieve_methods(cls):
@@ -1127,6 +1198,14 @@ class SearchCleanViewSetMixin(mixin_for(CleanViewSet)):
     """Список тегов"""
     search_controller_extra_kwargs = None
     """Дополнительные параметры, передаваемые в контроллер"""
+    search_max_concurrency: int = None
+    """Количество одновременных запросов в процессе. None - без ограничения"""
+    search_shared_max_concurrency: int = None
+    """Количество одновременных запросов во всех процессах. None - без ограничения"""
+    search_queue_timeout: float = 0
+    """Время ожидания места в секундах, после которого запрос отклоняется с 503"""
+    search_retry_after: int = None
+    """Значение заголовка Retry-After при отклонении запроса"""
 
     search_paginated = True
     """Нужна ли пагинация"""
@@ -1134,6 +1213,10 @@ class SearchCleanViewSetMixin(mixin_for(CleanViewSet)):
     """DTO, которое нужно вернуть"""
     search_return_pagination_type: type[PaginatedModel] = None
     """DTO с пагинацией, которое нужно вернуть"""
+    search_coalesce: bool = None
+    """Объединять одновременные одинаковые запросы в рамках процесса. None - настройка интерактора"""
+    search_coalesce_shared_timeout: float = None
+    """Время блокировки в общем кэше, объединяющей запросы разных процессов. None - настройка интерактора"""
 
     @classmethod
     def get_search_methods(cls):
@@ -1225,7 +1308,332 @@ class SearchCleanViewSetMixin(mixin_for(CleanViewSet)):
         )
 
 
-class ExportXLSCleanViewSetMixin(mixin_for(CleanViewSet)):
+class AutocompleteCleanViewSetMixin(mixin_for(CleanViewSet)):
+    """Миксин представления автодополнения по префиксу"""
+
+    controller: AutocompleteControllerMixin
+
+    autocomplete_methods = ["get"]
+    """Список HTTP методов"""
+    autocomplete_permissions = ()
+    """Кортеж разрешений"""
+    autocomplete_url_path = None
+    """Путь URL"""
+    autocomplete_url_name = None
+    """Имя URL"""
+    autocomplete_request_model = AutocompleteQueryDTO
+    """Модель запроса"""
+    autocomplete_response_schema = None
+    """Модель ответа"""
+    autocomplete_responses = responses_from_exceptions()
+    """Возможные варианты ответа"""
+    autocomplete_status_map = {"GET": status.HTTP_200_OK}
+    """Маппинг HTTP методов и статусов ответа"""
+    autocomplete_description = _("Автодополнение по началу строки")
+    """Описание эндпоинта"""
+    autocomplete_summary = None
+    """Краткое описание эндпоинта"""
+    autocomplete_tags = None
+    """Список тегов"""
+    autocomplete_controller_extra_kwargs = None
+    """Дополнительные параметры, передаваемые в контроллер"""
+
+    autocomplete_return_type: type[DTO] = None
+    """DTO, которое нужно вернуть"""
+
+    @classmethod
+    def get_autocomplete_methods(cls):
+        """Возвращает список HTTP методов"""
+        return cls.autocomplete_methods
+
+    @classmethod
+    def get_autocomplete_permissions(cls):
+        """Возвращает кортеж разрешений"""
+        return cls.autocomplete_permissions
+
+    @classmethod
+    def get_autocomplete_url_path(cls):
+        """Возвращает путь URL"""
+        if cls.autocomplete_url_path is not None:
+            return cls.autocomplete_url_path
+        return f"{cls.get_path_prefix()}/autocomplete"
+
+    @classmethod
+    def get_autocomplete_url_name(cls):
+        """Возвращает имя URL"""
+        if cls.autocomplete_url_name is not None:
+            return cls.autocomplete_url_name
+        return f"{cls.get_snake_view_name_by_class()}-autocomplete"
+
+    @classmethod
+    def get_autocomplete_request_model(cls):
+        """Возвращает модель запроса"""
+        return cls.autocomplete_request_model
+
+    @classmethod
+    def get_autocomplete_response_schema(cls):
+        """Возвращает модель ответа"""
+        return cls.autocomplete_response_schema or cls.autocomplete_return_type or cls.return_type
+
+    @classmethod
+    def get_autocomplete_responses(cls):
+        """Возвращает возможные варианты ответа"""
+        return cls.autocomplete_responses
+
+    @classmethod
+    def get_autocomplete_status_map(cls):
+        """Возвращает маппинг HTTP методов и статусов ответа"""
+        return cls.autocomplete_status_map
+
+    @classmethod
+    def get_autocomplete_description(cls):
+        """Возвращает описание эндпоинта"""
+        return cls.autocomplete_description
+
+    @classmethod
+    def get_autocomplete_summary(cls):
+        """Возвращает краткое описание эндпоинта"""
+        return cls.autocomplete_summary
+
+    @classmethod
+    def get_autocomplete_tags(cls):
+        """Возвращает список тегов"""
+        return cls.autocomplete_tags
+
+    @classmethod
+    def get_autocomplete_controller_extra_kwargs(cls):
+        """Возвращает дополнительные параметры, передаваемые в контроллер"""
+        return cls.autocomplete_controller_extra_kwargs
+
+    @clean_method(name=CleanMethods.AUTOCOMPLETE)
+    def autocomplete_action(self, request: HttpRequest, payload: RequestDTO, *args, **kwargs):
+        """Возвращает последовательность DTO, поля которых начинаются с переданной строки
+
+        Args:
+            request: Экземпляр HTTP запроса
+            payload: Данные запроса
+            *args: позиционные аргументы
+            **kwargs: именованные аргументы
+
+        """
+        return self.controller.autocomplete(
+            **payload.model_dump(exclude_none=True),
+            **(self.get_autocomplete_controller_extra_kwargs() or {}),
+        )
+
+
+class ExportJobCleanViewSetMixin(mixin_for(CleanViewSet)):
+    """Миксин представления получения статуса и файла фоновой задачи экспорта
+
+    Notes:
+        Статус и файл задачи доступны только пользователю, запустившему экспорт
+    """
+
+    export_job_methods = ["get"]
+    """Список HTTP методов"""
+    export_job_permissions = ()
+    """Кортеж разрешений"""
+    export_job_url_path = None
+    """Путь URL"""
+    export_job_url_name = None
+    """Имя URL"""
+    export_job_request_model = None
+    """Модель запроса"""
+    export_job_response_schema = ExportJobDTO
+    """Модель ответа"""
+    export_job_responses = responses_from_exceptions(DoesNotExist)
+    """Возможные варианты ответа"""
+    export_job_status_map = {"GET": status.HTTP_200_OK}
+    """Маппинг HTTP методов и статусов ответа"""
+    export_job_description = _("Статус фоновой задачи экспорта")
+    """Описание эндпоинта"""
+    export_job_summary = None
+    """Краткое описание эндпоинта"""
+    export_job_tags = None
+    """Список тегов"""
+
+    export_file_methods = ["get"]
+    """Список HTTP методов"""
+    export_file_permissions = ()
+    """Кортеж разрешений"""
+    export_file_url_path = None
+    """Путь URL"""
+    export_file_url_name = None
+    """Имя URL"""
+    export_file_request_model = None
+    """Модель запроса"""
+    export_file_response_schema = None
+    """Модель ответа"""
+    export_file_responses = responses_from_exceptions(DoesNotExist)
+    """Возможные варианты ответа"""
+    export_file_status_map = {"GET": status.HTTP_200_OK}
+    """Маппинг HTTP методов и статусов ответа"""
+    export_file_description = _("Файл фоновой задачи экспорта")
+    """Описание эндпоинта"""
+    export_file_summary = None
+    """Краткое описание эндпоинта"""
+    export_file_tags = None
+    """Список тегов"""
+
+    @classmethod
+    def get_export_job_methods(cls):
+        """Возвращает список HTTP методов"""
+        return cls.export_job_methods
+
+    @classmethod
+    def get_export_job_permissions(cls):
+        """Возвращает кортеж разрешений"""
+        return cls.export_job_permissions
+
+    @classmethod
+    def get_export_job_url_path(cls):
+        """Возвращает путь URL"""
+        if cls.export_job_url_path is not None:
+            return cls.export_job_url_path
+        return rf"{cls.get_path_prefix()}/export/jobs/(?P<job_id>[0-9a-f]{{32}})"
+
+    @classmethod
+    def get_export_job_url_name(cls):
+        """Возвращает имя URL"""
+        if cls.export_job_url_name is not None:
+            return cls.export_job_url_name
+        return f"{cls.get_snake_view_name_by_class()}-export-job"
+
+    @classmethod
+    def get_export_job_request_model(cls):
+        """Возвращает модель запроса"""
+        return cls.export_job_request_model
+
+    @classmethod
+    def get_export_job_response_schema(cls):
+        """Возвращает модель ответа"""
+        return cls.export_job_response_schema
+
+    @classmethod
+    def get_export_job_responses(cls):
+        """Возвращает возможные варианты ответа"""
+        return cls.export_job_responses
+
+    @classmethod
+    def get_export_job_status_map(cls):
+        """Возвращает маппинг HTTP методов и статусов ответа"""
+        return cls.export_job_status_map
+
+    @classmethod
+    def get_export_job_description(cls):
+        """Возвращает описание эндпоинта"""
+        return cls.export_job_description
+
+    @classmethod
+    def get_export_job_summary(cls):
+        """Возвращает краткое описание эндпоинта"""
+        return cls.export_job_summary
+
+    @classmethod
+    def get_export_job_tags(cls):
+        """Возвращает список тегов"""
+        return cls.export_job_tags
+
+    @clean_method(name=CleanMethods.EXPORT_JOB)
+    def export_job_action(self, request: HttpRequest, job_id: str, *args, **kwargs):
+        """Возвращает статус фоновой задачи экспорта
+
+        Args:
+            request: Экземпляр HTTP запроса
+            job_id: ID задачи
+            *args: позиционные аргументы
+            **kwargs: именованные аргументы
+
+        Returns:
+            ExportJobDTO
+        """
+        url = self.reverse_action(self.get_export_file_url_name(), kwargs={"job_id": job_id})
+        job = get_export_job(job_id, owner_id=request.user.pk, url=url)
+        if job is None:
+            raise DoesNotExist
+        return job
+
+    @classmethod
+    def get_export_file_methods(cls):
+        """Возвращает список HTTP методов"""
+        return cls.export_file_methods
+
+    @classmethod
+    def get_export_file_permissions(cls):
+        """Возвращает кортеж разрешений"""
+        return cls.export_file_permissions
+
+    @classmethod
+    def get_export_file_url_path(cls):
+        """Возвращает путь URL"""
+        if cls.export_file_url_path is not None:
+            return cls.export_file_url_path
+        return rf"{cls.get_path_prefix()}/export/jobs/(?P<job_id>[0-9a-f]{{32}})/file"
+
+    @classmethod
+    def get_export_file_url_name(cls):
+        """Возвращает имя URL"""
+        if cls.export_file_url_name is not None:
+            return cls.export_file_url_name
+        return f"{cls.get_snake_view_name_by_class()}-export-file"
+
+    @classmethod
+    def get_export_file_request_model(cls):
+        """Возвращает модель запроса"""
+        return cls.export_file_request_model
+
+    @classmethod
+    def get_export_file_response_schema(cls):
+        """Возвращает модель ответа"""
+        return cls.export_file_response_schema
+
+    @classmethod
+    def get_export_file_responses(cls):
+        """Возвращает возможные варианты ответа"""
+        return cls.export_file_responses
+
+    @classmethod
+    def get_export_file_status_map(cls):
+        """Возвращает маппинг HTTP методов и статусов ответа"""
+        return cls.export_file_status_map
+
+    @classmethod
+    def get_export_file_description(cls):
+        """Возвращает описание эндпоинта"""
+        return cls.export_file_description
+
+    @classmethod
+    def get_export_file_summary(cls):
+        """Возвращает краткое описание эндпоинта"""
+        return cls.export_file_summary
+
+    @classmethod
+    def get_export_file_tags(cls):
+        """Возвращает список тегов"""
+        return cls.export_file_tags
+
+    @clean_method(name=CleanMethods.EXPORT_FILE)
+    def export_file_action(self, request: HttpRequest, job_id: str, *args, **kwargs):
+        """Возвращает файл фоновой задачи экспорта
+
+        Args:
+            request: Экземпляр HTTP запроса
+            job_id: ID задачи
+            *args: позиционные аргументы
+            **kwargs: именованные аргументы
+
+        Returns:
+            FileResponse
+        """
+        path = get_export_file(job_id, owner_id=request.user.pk)
+        if path is None:
+            raise DoesNotExist
+        response = FileResponse(open(path, "rb"), as_attachment=True, filename=os.path.basename(path))
+        response["Cache-Control"] = "private, no-store"
+        return response
+
+
+class ExportXLSCleanViewSetMixin(ExportJobCleanViewSetMixin):
     """Миксин представления экспорта списка объектов"""
 
     controller: ExportXLSControllerMixin
@@ -1242,7 +1650,7 @@ class ExportXLSCleanViewSetMixin(mixin_for(CleanViewSet)):
     """Имя URL"""
     export_xls_request_model = ExportXLSQueryDTO
     """Модель запроса"""
-    export_xls_responses = responses_from_exceptions()
+    export_xls_responses = responses_from_exceptions(ActionImpossible, ServiceUnavailable)
     """Возможные варианты ответа"""
     export_xls_status_map = {"GET": status.HTTP_200_OK}
     """Маппинг HTTP методов и статусов ответа"""
@@ -1254,6 +1662,14 @@ class ExportXLSCleanViewSetMixin(mixin_for(CleanViewSet)):
     """Список тегов"""
     export_xls_controller_extra_kwargs = None
     """Дополнительные параметры, передаваемые в контроллер"""
+    export_xls_max_concurrency: int = 2
+    """Количество одновременных запросов в процессе. None - без ограничения"""
+    export_xls_shared_max_concurrency: int = None
+    """Количество одновременных запросов во всех процессах. None - без ограничения"""
+    export_xls_queue_timeout: float = 0
+    """Время ожидания места в секундах, после которого запрос отклоняется с 503"""
+    export_xls_retry_after: int = 30
+    """Значение заголовка Retry-After при отклонении запроса"""
 
     @classmethod
     def get_export_xls_methods(cls):
@@ -1316,7 +1732,12 @@ class ExportXLSCleanViewSetMixin(mixin_for(CleanViewSet)):
 
     @clean_method(name=CleanMethods.EXPORT_XLS)
     def export_xls_action(self, request: HttpRequest, payload: RequestDTO, *args, **kwargs):
-        """Возвращает ExportXLSResponseDTO
+        """Возвращает файл экспорта или фоновую задачу экспорта
+
+        Notes:
+            Формат csv отдается потоково (StreamingHttpResponse): записи читаются из БД пачками
+            по мере отправки ответа. При background=True экспорт выполняется в фоне,
+            а в ответе возвращается ExportJobDTO, статус которого доступен в export_job_action
 
         Args:
             request: Экземпляр HTTP запроса
@@ -1325,18 +1746,50 @@ class ExportXLSCleanViewSetMixin(mixin_for(CleanViewSet)):
             **kwargs: именованные аргументы
 
         """
-        result = self.controller.export_xls(
-            **payload.model_dump(exclude_none=True),
+        file_format = getattr(payload, "file_format", "xls")
+        export_function = partial(
+            self._export,
+            file_format,
+            **payload.model_dump(exclude_none=True, exclude={"file_format", "background"}),
             **(self.get_export_xls_controller_extra_kwargs() or {}),
         )
-
-        response = HttpResponse(result.file_content)
-        response["Content-Type"] = "application/xls"
-        response["Content-Disposition"] = f"attachment; filename={escape_uri_path(result.file_name)}.xls"
-        response["Content-Transfer-Encoding"] = "binary"
+        if getattr(payload, "background", False):
+            return start_export_job(export_function, owner_id=request.user.pk)
+
+        result = export_function()
+        if file_format == "xls":
+            response = HttpResponse(b"".join(result.file_content))
+            response["Content-Transfer-Encoding"] = "binary"
+        else:
+            response = StreamingHttpResponse(result.file_content)
+        response["Content-Type"] = result.content_type
+        response["Content-Disposition"] = (
+            f"attachment; filename={escape_uri_path(result.file_name)}.{result.file_extension}"
+        )
 
         return response
 
+    def _export(self, file_format: str, **kwargs) -> ExportStreamResponseDTO:
+        """Вызывает экспорт контроллера в нужном формате
+
+        Args:
+            file_format: Формат файла
+            **kwargs: Параметры экспорта
+
+        Returns:
+            ExportStreamResponseDTO
+        """
+        if file_format == "csv":
+            return self.controller.export_csv(**kwargs)
+
+        result = self.controller.export_xls(**kwargs)
+        return ExportStreamResponseDTO(
+            file_content=[result.file_content],
+            file_name=result.file_name,
+            file_extension="xls",
+            content_type="application/xls",
+        )
+
 
 class CreateUpdateCleanViewSetMixin(CreateCleanViewSetMixin, UpdateCleanViewSetMixin):
     """Миксин представления создания / обновления"""
@@ -1384,3 +1837,105 @@ class CRUDCleanViewSetMixin(CreateUpdateDeleteCleanViewSetMixin, ReadCleanViewSe
     """Миксин представления создание / чтение /обновление / удаление"""
 
     controller: CRUDControllerMixin
+
+
+class AsyncDetailCleanViewSetMixin(AsyncCleanViewSetMixin, DetailCleanViewSetMixin):
+    """Миксин асинхронного представления получения деталей"""
+
+    @clean_method(name=CleanMethods.DETAIL)
+    async def detail_action(self, request: HttpRequest, payload: RequestDTO = None, *args, **kwargs):
+        """Возвращает DTO записи, удовлетворяющей запросу
+
+        Args:
+            request: Экземпляр HTTP запроса
+            payload: Данные запроса
+            *args: позиционные аргументы
+            **kwargs: именованные аргументы
+
+        Returns:
+            self.get_detail_response_schema()
+        """
+        return await self.controller.adetail(
+            **(payload.model_dump(exclude_none=True) if payload else {}),
+            **(self.get_detail_controller_extra_kwargs() or {}),
+        )
+
+
+class AsyncDetailByPKCleanViewSetMixin(AsyncCleanViewSetMixin, DetailByPKCleanViewSetMixin):
+    """Миксин асинхронного представления получения деталей по первичному ключу"""
+
+    @clean_method(name=CleanMethods.DETAIL_BY_PK)
+    async def detail_by_pk_action(self, request: HttpRequest, pk: int, *args, **kwargs):
+        """Возвращает DTO записи, по первичному ключу
+
+        Args:
+            request: Экземпляр HTTP запроса
+            pk: Первичный ключ
+            *args: позиционные аргументы
+            **kwargs: именованные аргументы
+
+        Returns:
+            self.get_detail_by_pk_response_schema()
+        """
+        return await self.controller.adetail_by_pk(pk, **(self.get_detail_by_pk_controller_extra_kwargs() or {}))
+
+
+class AsyncRetrieveCleanViewSetMixin(AsyncCleanViewSetMixin, RetrieveCleanViewSetMixin):
+    """Миксин асинхронного представления получения списка объектов"""
+
+    @clean_method(name=CleanMethods.RETRIEVE)
+    async def retrieve_action(self, request: HttpRequest, payload: RequestDTO, *args, **kwargs):
+        """Возвращает последовательность DTO удовлетворяющих запросу
+
+        Args:
+            request: Экземпляр HTTP запроса
+            payload: Данные запроса
+            *args: позиционные аргументы
+            **kwargs: именованные аргументы
+
+        """
+        return await self.controller.aretrieve(
+            paginated=self.retrieve_paginated,
+            **kwargs,
+            **payload.model_dump(exclude_none=True),
+            **(self.get_retrieve_controller_extra_kwargs() or {}),
+        )
+
+
+class AsyncSearchCleanViewSetMixin(AsyncCleanViewSetMixin, SearchCleanViewSetMixin):
+    """Миксин асинхронного представления получения списка объектов по полнотекстовому поиску"""
+
+    @clean_method(name=CleanMethods.SEARCH)
+    async def search_action(self, request: HttpRequest, payload: RequestDTO, *args, **kwargs):
+        """Возвращает последовательность DTO удовлетворяющих запросу
+
+        Args:
+            request: Экземпляр HTTP запроса
+            payload: Данные запроса
+            *args: позиционные аргументы
+            **kwargs: именованные аргументы
+
+        """
+        return await self.controller.asearch(
+            paginated=self.search_paginated,
+            **payload.model_dump(exclude_none=True),
+            **(self.get_search_controller_extra_kwargs() or {}),
+        )
+
+
+class AsyncDetailsCleanViewSetMixin(AsyncDetailCleanViewSetMixin, AsyncDetailByPKCleanViewSetMixin):
+    """Миксин асинхронного представления получения деталей"""
+
+    controller: DetailsControllerMixin
+
+
+class AsyncListCleanViewSetMixin(AsyncRetrieveCleanViewSetMixin, AsyncSearchCleanViewSetMixin):
+    """Миксин асинхронного представления получения списка объектов"""
+
+    controller: ListControllerMixin
+
+
+class AsyncReadCleanViewSetMixin(AsyncListCleanViewSetMixin, AsyncDetailsCleanViewSetMixin):
+    """Миксин асинхронного представления получения деталей / списка объектов"""
+
+    controller: ReadControllerMixin
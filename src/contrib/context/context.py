@@ -4,6 +4,7 @@ import uuid
 from collections.abc import Hashable
 from collections.abc import MutableMapping
 from contextvars import ContextVar
+from contextvars import Token
 from copy import deepcopy
 from typing import Any
 from typing import Generic
@@ -13,89 +14,116 @@ T = TypeVar("T", bound=dict[Hashable, Any], covariant=True)
 
 
 class Context(Generic[T]):
+    """Контекст, данные которого хранятся в кадре текущего запроса / потока
+
+    Notes:
+        `init_context` только кладет в ContextVar корневого контекста новый пустой кадр, а `reset_context`
+        возвращает предыдущий. Данные корневого и дочерних контекстов создаются в кадре при первом
+        обращении (копия initial_data), поэтому неиспользуемые в запросе контексты ничего не стоят,
+        а после сброса кадра все данные запроса освобождаются
+    """
+
     parent: Context | None
 
     __slots__ = [
         "_context_var",
         "_initial_data",
-        "_child_context",
-        "_initialized",
+        "_key",
+        "_root",
         "parent",
     ]
 
     def __init__(self, **initial_data: dict[Hashable, Any]) -> None:
-        self._context_var = ContextVar[T](uuid.uuid4().hex)
+        self._key = uuid.uuid4().hex
+        self._context_var = ContextVar[dict[str, Any]](self._key)
         self._initial_data = initial_data
-        self._child_context: list[Context[Any]] = []
-        self._initialized: bool = None
+        self._root: Context = self
         self.parent: Context | None = None
 
     def _check_initialized(self):
         if not self.initialized:
             raise RuntimeError("Context is not initialized")
 
+    def _data(self) -> T:
+        frame = self._root._context_var.get()
+        data = frame.get(self._key)
+        if data is None:
+            data = frame[self._key] = deepcopy(self._initial_data) if self._initial_data else {}
+        return data
+
     @property
-    def initialized(self):
-        return self._initialized
+    def initialized(self) -> bool:
+        return self._root._context_var.get(None) is not None
+
+    def init_context(self) -> Token:
+        """Кладет новый пустой кадр контекста
+
+        Returns:
+            Токен для `reset_context`
+        """
+        return self._root._context_var.set({})
+
+    def reset_context(self, token: Token) -> None:
+        """Возвращает кадр контекста, действовавший до `init_context`
 
-    def init_context(self) -> None:
-        self._context_var.set(deepcopy(self._initial_data))  # type: ignore
-        for ctx in self._child_context:
-            ctx.init_context()
-        self._initialized = True
+        Args:
+            token: Токен, полученный из `init_context`
+        """
+        try:
+            self._root._context_var.reset(token)
+        except (RuntimeError, ValueError):
+            # Токен уже использован или создан в другом contextvars.Context
+            self._root._context_var.set(None)
 
     def new_child_context(self, **initial_data: dict[Hashable, Any]):
         ctx = type(self)(**initial_data)
         ctx.parent = self
-        self._child_context.append(ctx)
-        if self.initialized:
-            ctx.init_context()
+        ctx._root = self._root
         return ctx
 
     def get(self, key: Hashable, default: Any = None):
         self._check_initialized()
-        return self._context_var.get().get(key, default)
+        return self._data().get(key, default)
 
     def set(self, key: Hashable, value: Any):
         self._check_initialized()
-        self._context_var.get()[key] = value
+        self._data()[key] = value
 
     def pop(self, key: Hashable, default: Any = None):
         self._check_initialized()
-        return self._context_var.get().pop(key, default)
+        return self._data().pop(key, default)
 
     def popitem(self):
         self._check_initialized()
-        return self._context_var.get().popitem()
+        return self._data().popitem()
 
     def clear(self):
         self._check_initialized()
-        for key in list(self._context_var.get().keys()):
-            self._context_var.get().pop(key)
+        self._data().clear()
 
     def update(self, data: dict[Hashable, Any] | list[tuple[Hashable, Any]]):
         self._check_initialized()
-        self._context_var.get().update(data)
+        self._data().update(data)
 
     def has_key(self, key: Hashable):
         self._check_initialized()
-        return key in self._context_var.get()
+        return key in self._data()
 
     def setdefault(self, key: Hashable, default: Any = None):
         self._check_initialized()
-        return self._context_var.get().setdefault(key, default)
+        return self._data().setdefault(key, default)
 
     def items(self):
         self._check_initialized()
-        return self._context_var.get().items()
+        return self._data().items()
 
     def keys(self):
         self._check_initialized()
-        return self._context_var.get().keys()
+        return self._data().keys()
 
     def values(self):
         self._check_initialized()
-        return self._context_var.get().values()
+        return self._data().values()
 
     @property
     def current_user(self):
@@ -105,10 +133,10 @@ class Context(Generic[T]):
         return self.has_key(key)
 
     def __len__(self):
-        return len(self._context_var.get())
+        return len(self._data())
 
     def __iter__(self):
-        return iter(self._context_var.get())
+        return iter(self._data())
 
     def __getitem__(self, key: Hashable):
         return self.get(key)
@@ -120,7 +148,7 @@ class Context(Generic[T]):
         self.pop(key)
 
     def __bool__(self):
-        return bool(self._context_var.get())
+        return bool(self._data())
 
 
 MutableMapping.register(Context)  # type: ignore
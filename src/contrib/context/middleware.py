@@ -1,13 +1,40 @@
 from __future__ import annotations
 
+from functools import partial
+
+from contrib.django.utils import call_on_close
 from django.http import HttpRequest
+from django.http import HttpResponseBase
 from django.utils.deprecation import MiddlewareMixin
 
 from .root_context import get_root_context
 
 
 class ContextMiddleware(MiddlewareMixin):
+    """Кладет кадр корневого контекста на время запроса
+
+    Notes:
+        Кадр сбрасывается в `process_response`, который вызывается и при исключении в представлении,
+        поэтому запрос не остается в контексте потока после ответа. Для потоковых ответов сброс
+        откладывается до закрытия ответа, так как тело формируется уже после `process_response`
+    """
+
+    context_token_attr = "_context_token"
+
     def process_request(self, request: HttpRequest):
         ctx = get_root_context()
-        ctx.init_context()
+        setattr(request, self.context_token_attr, ctx.init_context())
         ctx.set("request", request)
+
+    def process_response(self, request: HttpRequest, response: HttpResponseBase):
+        token = getattr(request, self.context_token_attr, None)
+        if token is None:
+            return response
+
+        delattr(request, self.context_token_attr)
+        reset = partial(get_root_context().reset_context, token)
+        if response.streaming:
+            call_on_close(response, reset)
+        else:
+            reset()
+        return response
@@ -0,0 +1,406 @@
+"""Модуль с ограничением одновременных запросов к тяжелым эндпоинтам
+
+Notes:
+    Экспорт и поиск без индекса выполняются долго. Когда их набирается больше, чем воркеров,
+    быстрые запросы (оформление заказа) ждут в очереди сервера и завершаются по таймауту.
+    Для эндпоинта объявляется лимит одновременных запросов атрибутами представления
+    (`<method>_max_concurrency`, `<method>_shared_max_concurrency`, `<method>_queue_timeout`,
+    `<method>_retry_after`). Запрос, не получивший место за `<method>_queue_timeout` секунд, получает 503
+    с заголовком `Retry-After` без выполнения представления. Ожидание места занимает воркер, поэтому
+    `<method>_queue_timeout` должен быть коротким, с 0 запрос отклоняется сразу. Эндпоинты без лимита не ограничиваются.
+
+    Лимит процесса - семафор, он имеет смысл только для воркеров с несколькими потоками. Лимит всех процессов -
+    счетчик в общем кэше django (`ADMISSION_CACHE_ALIAS`), он включается только для кэша Redis или memcached,
+    в которых incr атомарен. С другим кэшем, а также при ошибке кэша (недоступен Redis) действует только
+    лимит процесса, а общий лимит ограничивает каждый процесс отдельно - ограничитель не должен превращать
+    сбой кэша в ошибки запросов. Время жизни счетчика `ADMISSION_SHARED_TIMEOUT` секунд
+    продлевается при каждом занятии места, поэтому места, не освобожденные упавшим процессом, возвращаются
+    после простоя эндпоинта. Счетчик не опускается ниже 0.
+
+    Настройки:
+        ADMISSION_CACHE_ALIAS: Имя кэша для общего счетчика (по умолчанию default)
+        ADMISSION_SHARED_TIMEOUT: Время жизни общего счетчика в секундах (по умолчанию 300)
+        ADMISSION_RETRY_AFTER: Значение Retry-After по умолчанию в секундах (по умолчанию 5)
+        ADMISSION_METRICS_TOKEN: Токен доступа к метрикам (заголовок `Authorization: Bearer <token>`)
+        ADMISSION_TRUSTED_PROXIES: Адреса обратных прокси, X-Forwarded-For которых учитывается для метрик
+
+Classes:
+    AdmissionGate: Ограничитель одновременных запросов к эндпоинту
+    AdmissionMiddleware: Middleware, отклоняющее запросы к перегруженным эндпоинтам
+
+Functions:
+    get_gate: Возвращает ограничитель эндпоинта представления
+    get_metrics: Возвращает метрики ограничителей
+    metrics_view: Отдает метрики ограничителей в формате prometheus
+
+"""
+from __future__ import annotations
+
+import hmac
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from contrib.clean_architecture.consts import ViewActionAttrs
+from contrib.django.utils import call_on_close
+from contrib.exceptions.exceptions import ServiceUnavailable
+from django.conf import settings
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+from django.http import Http404
+from django.http import HttpRequest
+from django.http import HttpResponse
+from django.http import HttpResponseBase
+from django.http import JsonResponse
+from django.utils.deprecation import MiddlewareMixin
+
+logger = logging.getLogger(__name__)
+
+_gates: dict[tuple[type, str], AdmissionGate | None] = {}
+_gates_lock = threading.Lock()
+_unsupported_cache_aliases: set[str] = set()
+
+
+class AdmissionGate:
+    """Ограничитель одновременных запросов к эндпоинту
+
+    Examples:
+        >>> gate = AdmissionGate("ProductViewSet.search", max_concurrency=4, queue_timeout=0.5)
+        >>> if gate.acquire():
+        >>>     try:
+        >>>         ...
+        >>>     finally:
+        >>>         gate.release()
+    """
+
+    poll_interval: float = 0.05
+    """Интервал повторного захвата места в общем счетчике в секундах"""
+    shared_backends: tuple[type, ...] = (RedisCache, BaseMemcachedCache)
+    """Бэкенды кэша с атомарным incr, для которых включается общий счетчик"""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = None,
+        shared_max_concurrency: int = None,
+        queue_timeout: float = 0,
+        retry_after: int = None,
+    ):
+        """
+
+        Args:
+            name: Имя эндпоинта
+            max_concurrency: Количество одновременных запросов в процессе. None - без ограничения
+            shared_max_concurrency: Количество одновременных запросов во всех процессах. None - без ограничения
+            queue_timeout: Время ожидания места в секундах. 0 - отклонять сразу
+            retry_after: Значение заголовка Retry-After в секундах
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.shared_max_concurrency = shared_max_concurrency
+        self.queue_timeout = queue_timeout or 0
+        self.retry_after = retry_after or getattr(settings, "ADMISSION_RETRY_AFTER", 5)
+        # Общий лимит ограничивает и процесс: без общего счетчика он остается лимитом процесса
+        process_max_concurrency = max_concurrency or shared_max_concurrency
+        self._semaphore = threading.BoundedSemaphore(process_max_concurrency) if process_max_concurrency else None
+        self._lock = threading.Lock()
+        self._shared_enabled: bool | None = None
+
+        self.active = 0
+        """Количество выполняющихся запросов"""
+        self.waiting = 0
+        """Количество запросов, ожидающих места (глубина очереди)"""
+        self.admitted = 0
+        """Количество допущенных запросов"""
+        self.rejected = 0
+        """Количество отклоненных запросов"""
+
+    @property
+    def shared_key(self) -> str:
+        """Ключ общего счетчика в кэше"""
+        return f"admission:{self.name}"
+
+    def _get_cache_alias(self) -> str:
+        return getattr(settings, "ADMISSION_CACHE_ALIAS", "default")
+
+    def _get_cache(self):
+        from django.core.cache import caches
+
+        return caches[self._get_cache_alias()]
+
+    @property
+    def shared_enabled(self) -> bool:
+        """Используется ли общий счетчик. Для кэша без атомарного incr общий лимит не включается"""
+        if self._shared_enabled is None:
+            enabled = bool(self.shared_max_concurrency)
+            if enabled and not isinstance(self._get_cache(), self.shared_backends):
+                enabled = False
+                alias = self._get_cache_alias()
+                if alias not in _unsupported_cache_aliases:
+                    _unsupported_cache_aliases.add(alias)
+                    logger.warning(
+                        "Cache %s does not support shared admission limits, per-process limits are used", alias
+                    )
+            self._shared_enabled = enabled
+        return self._shared_enabled
+
+    def _acquire_shared(self, deadline: float) -> bool:
+        """Занимает место в общем счетчике, ожидая его до deadline. При ошибке кэша запрос допускается"""
+        try:
+            cache = self._get_cache()
+            timeout = getattr(settings, "ADMISSION_SHARED_TIMEOUT", 300)
+            while True:
+                cache.add(self.shared_key, 0, timeout)
+                try:
+                    value = cache.incr(self.shared_key)
+                except ValueError:
+                    # Счетчик истек между add и incr
+                    continue
+                # Время жизни отсчитывается от последнего занятия места, а не от создания счетчика
+                cache.touch(self.shared_key, timeout)
+                if value <= self.shared_max_concurrency:
+                    return True
+                self._release_shared()
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(self.poll_interval)
+        except Exception:
+            logger.warning("Shared admission counter of %s is unavailable", self.name, exc_info=True)
+            return True
+
+    def _release_shared(self) -> None:
+        """Освобождает место в общем счетчике, не опуская его ниже 0"""
+        try:
+            cache = self._get_cache()
+            value = cache.decr(self.shared_key)
+            if value < 0:
+                # Счетчик истек и создан заново, пока запрос выполнялся
+                cache.incr(self.shared_key, -value)
+        except ValueError:
+            pass
+        except Exception:
+            logger.warning("Shared admission counter of %s is unavailable", self.name, exc_info=True)
+
+    def get_shared_active(self) -> int | None:
+        """Возвращает количество запросов во всех процессах по общему счетчику"""
+        if not self.shared_enabled:
+            return None
+        try:
+            return self._get_cache().get(self.shared_key, 0)
+        except Exception:
+            logger.warning("Shared admission counter of %s is unavailable", self.name, exc_info=True)
+            return None
+
+    def acquire(self) -> bool:
+        """Занимает место для запроса
+
+        Returns:
+            Получено ли место за queue_timeout
+        """
+        deadline = time.monotonic() + self.queue_timeout
+        with self._lock:
+            self.waiting += 1
+        try:
+            if self._semaphore:
+                if self.queue_timeout:
+                    acquired = self._semaphore.acquire(timeout=self.queue_timeout)
+                else:
+                    acquired = self._semaphore.acquire(blocking=False)
+                if not acquired:
+                    return self._reject()
+            if self.shared_enabled and not self._acquire_shared(deadline):
+                if self._semaphore:
+                    self._semaphore.release()
+                return self._reject()
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+        with self._lock:
+            self.active += 1
+            self.admitted += 1
+        return True
+
+    def _reject(self) -> bool:
+        with self._lock:
+            self.rejected += 1
+        logger.info("Request to %s rejected: %d active, %d waiting", self.name, self.active, self.waiting)
+        return False
+
+    def release(self) -> None:
+        """Освобождает место запроса"""
+        if self.shared_enabled:
+            self._release_shared()
+        if self._semaphore:
+            self._semaphore.release()
+        with self._lock:
+            self.active -= 1
+
+
+def get_gate(view_class: type, method_name: str) -> AdmissionGate | None:
+    """Возвращает ограничитель эндпоинта представления
+
+    Notes:
+        Ограничитель создается при первом запросе по атрибутам `<method>_max_concurrency`,
+        `<method>_shared_max_concurrency`, `<method>_queue_timeout` и `<method>_retry_after`
+
+    Args:
+        view_class: Класс представления
+        method_name: Имя метода (clean method) представления
+
+    Returns:
+        Ограничитель или None, если для эндпоинта нет лимитов
+    """
+    key = (view_class, method_name)
+    if key in _gates:
+        return _gates[key]
+
+    with _gates_lock:
+        if key not in _gates:
+
+            def get_attr(attr_name: str) -> Any:
+                return getattr(view_class, f"{method_name}_{attr_name}", None)
+
+            max_concurrency = get_attr(ViewActionAttrs.MAX_CONCURRENCY)
+            shared_max_concurrency = get_attr(ViewActionAttrs.SHARED_MAX_CONCURRENCY)
+            _gates[key] = (
+                AdmissionGate(
+                    f"{view_class.__name__}.{method_name}",
+                    max_concurrency=max_concurrency,
+                    shared_max_concurrency=shared_max_concurrency,
+                    queue_timeout=get_attr(ViewActionAttrs.QUEUE_TIMEOUT),
+                    retry_after=get_attr(ViewActionAttrs.RETRY_AFTER),
+                )
+                if max_concurrency or shared_max_concurrency
+                else None
+            )
+    return _gates[key]
+
+
+def get_metrics() -> list[dict[str, Any]]:
+    """Возвращает метрики ограничителей процесса
+
+    Returns:
+        Список словарей с именем эндпоинта, лимитами и счетчиками
+    """
+    return [
+        {
+            "name": gate.name,
+            "max_concurrency": gate.max_concurrency,
+            "shared_max_concurrency": gate.shared_max_concurrency,
+            "active": gate.active,
+            "shared_active": gate.get_shared_active(),
+            "waiting": gate.waiting,
+            "admitted": gate.admitted,
+            "rejected": gate.rejected,
+        }
+        for gate in list(_gates.values())
+        if gate is not None
+    ]
+
+
+def _get_client_ip(request: HttpRequest) -> str | None:
+    """Возвращает адрес клиента с учетом X-Forwarded-For доверенных прокси
+
+    Notes:
+        Адреса X-Forwarded-For просматриваются справа налево, пока они принадлежат доверенным прокси,
+        поэтому подставленный клиентом заголовок не подменяет адрес
+    """
+    trusted_proxies = getattr(settings, "ADMISSION_TRUSTED_PROXIES", ())
+    client_ip = request.META.get("REMOTE_ADDR")
+    if client_ip not in trusted_proxies:
+        return client_ip
+
+    forwarded_for = [ip.strip() for ip in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if ip.strip()]
+    for ip in reversed(forwarded_for):
+        client_ip = ip
+        if ip not in trusted_proxies:
+            break
+    return client_ip
+
+
+def _has_metrics_access(request: HttpRequest) -> bool:
+    """Проверяет доступ к метрикам по токену или адресу клиента"""
+    token = getattr(settings, "ADMISSION_METRICS_TOKEN", None)
+    if token:
+        return hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}")
+    return _get_client_ip(request) in settings.INTERNAL_IPS
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Отдает метрики ограничителей процесса в текстовом формате prometheus
+
+    Notes:
+        С настройкой ADMISSION_METRICS_TOKEN доступно по токену, иначе только с адресов INTERNAL_IPS
+        (за обратным прокси адрес берется из X-Forwarded-For, если прокси указан в ADMISSION_TRUSTED_PROXIES).
+        Метрики относятся к процессу, обработавшему запрос, `admission_shared_active` - ко всем процессам
+    """
+    if not _has_metrics_access(request):
+        raise Http404
+
+    lines = []
+    for name, kind, description in (
+        ("active", "gauge", "Requests in progress"),
+        ("shared_active", "gauge", "Requests in progress in all processes"),
+        ("waiting", "gauge", "Requests waiting for a slot"),
+        ("admitted", "counter", "Admitted requests"),
+        ("rejected", "counter", "Rejected requests"),
+    ):
+        metric = f"admission_{name}" + ("_total" if kind == "counter" else "")
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for item in get_metrics():
+            if item[name] is not None:
+                lines.append(f'{metric}{{endpoint="{item["name"]}"}} {item[name]}')
+    return HttpResponse("\n".join(lines) + "\n", content_type="text/plain; version=0.0.4")
+
+
+class AdmissionMiddleware(MiddlewareMixin):
+    """Middleware, отклоняющее запросы к перегруженным эндпоинтам
+
+    Notes:
+        Эндпоинт определяется в `process_view` по классу и действию ViewSet, поэтому middleware
+        располагается после аутентификации. Место освобождается в `process_response`,
+        для потоковых ответов (экспорт csv) - после закрытия ответа.
+        Ожидание места блокирует поток, поэтому middleware только синхронное
+    """
+
+    async_capable = False
+    gate_attr = "_admission_gate"
+
+    def process_view(self, request: HttpRequest, view_func: Callable, view_args: tuple, view_kwargs: dict):
+        view_class = getattr(view_func, "cls", None)
+        action = (getattr(view_func, "actions", None) or {}).get(request.method.lower())
+        method = getattr(view_class, "clean_methods", {}).get(action)
+        method_name = getattr(method, "__method_name__", None)
+        if method_name is None:
+            return None
+
+        gate = get_gate(view_class, method_name)
+        if gate is None:
+            return None
+
+        if not gate.acquire():
+            retry_after = str(math.ceil(gate.retry_after))
+            exception = ServiceUnavailable(message=retry_after)
+            response = JsonResponse(exception.model_dump(), status=exception.status_code)
+            response["Retry-After"] = retry_after
+            return response
+
+        setattr(request, self.gate_attr, gate)
+        return None
+
+    def process_response(self, request: HttpRequest, response: HttpResponseBase):
+        gate = getattr(request, self.gate_attr, None)
+        if gate is None:
+            return response
+
+        delattr(request, self.gate_attr)
+        if response.streaming:
+            call_on_close(response, gate.release)
+        else:
+            gate.release()
+        return response
@@ -0,0 +1,81 @@
+"""Модуль для выполнения задач в фоне без брокера сообщений
+
+Notes:
+    Задачи выполняются в пуле потоков текущего процесса. Подходит для коротких идемпотентных задач
+    (генерация превью, прогрев кэшей, выгрузки), результат которых можно пересчитать повторным запуском.
+    Задача выполняется в копии contextvars вызывающего кода, поэтому ей доступен контекст запроса.
+
+Functions:
+    run_in_background: Выполняет функцию в фоновом потоке
+    run_in_background_on_commit: Выполняет функцию в фоновом потоке после фиксации текущей транзакции
+
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Возвращает пул потоков, создавая его при первом обращении"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "BACKGROUND_WORKERS", 2),
+                    thread_name_prefix="background",
+                )
+    return _executor
+
+
+def _run(function: Callable, *args, **kwargs):
+    """Выполняет функцию, закрывая соединения с БД потока до и после выполнения"""
+    close_old_connections()
+    try:
+        return function(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", getattr(function, "__qualname__", function))
+        raise
+    finally:
+        close_old_connections()
+
+
+def run_in_background(function: Callable, *args, **kwargs) -> Future:
+    """Выполняет функцию в фоновом потоке
+
+    Args:
+        function: Функция
+        *args: Позиционные аргументы функции
+        **kwargs: Именованные аргументы функции
+
+    Returns:
+        Future с результатом функции
+    """
+    return _get_executor().submit(contextvars.copy_context().run, _run, function, *args, **kwargs)
+
+
+def run_in_background_on_commit(function: Callable, *args, using: str = None, **kwargs) -> None:
+    """Выполняет функцию в фоновом потоке после фиксации текущей транзакции
+
+    Args:
+        function: Функция
+        *args: Позиционные аргументы функции
+        using: Алиас БД
+        **kwargs: Именованные аргументы функции
+    """
+    transaction.on_commit(partial(run_in_background, function, *args, **kwargs), using=using)
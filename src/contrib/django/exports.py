@@ -0,0 +1,200 @@
+"""Модуль фоновых задач экспорта в файл
+
+Notes:
+    Задача записывает содержимое во временный файл на диске (память не растет с размером выгрузки),
+    затем сохраняет его в закрытое хранилище экспорта в `<job_id>/`. Статус задачи определяется
+    содержимым этой директории, поэтому он доступен из любого процесса с тем же хранилищем.
+
+    Хранилище находится вне MEDIA_ROOT и не раздается MediaMiddleware: файл отдается только
+    представлением после проверки владельца задачи (файл `.owner` в директории задачи).
+    Директории задач старше `EXPORTS_TTL` секунд удаляются при запуске следующей задачи.
+
+    Настройки:
+        EXPORTS_ROOT: Директория хранилища экспорта (по умолчанию BASE_DIR/exports)
+        EXPORTS_TTL: Время хранения результата в секундах (по умолчанию 86400)
+
+Functions:
+    get_exports_storage: Возвращает хранилище экспорта
+    start_export_job: Запускает фоновую задачу экспорта
+    get_export_job: Возвращает статус задачи экспорта
+    get_export_file: Возвращает путь к файлу задачи экспорта
+    cleanup_export_jobs: Удаляет устаревшие задачи экспорта
+
+"""
+from __future__ import annotations
+
+import os
+import posixpath
+import re
+import tempfile
+import uuid
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+
+from contrib.django.background import run_in_background
+from contrib.pydantic.model import ExportJobDTO
+from contrib.pydantic.model import ExportStreamResponseDTO
+
+
+ERROR_FILE_NAME = ".error"
+"""Имя файла-признака ошибки экспорта"""
+OWNER_FILE_NAME = ".owner"
+"""Имя файла с ID владельца задачи"""
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+"""Шаблон ID задачи"""
+
+
+def get_exports_storage() -> FileSystemStorage:
+    """Возвращает хранилище экспорта
+
+    Returns:
+        FileSystemStorage без base_url в директории EXPORTS_ROOT
+    """
+    location = getattr(settings, "EXPORTS_ROOT", None) or os.path.join(settings.BASE_DIR, "exports")
+    return FileSystemStorage(location=location, base_url=None)
+
+
+def _get_job_files(storage: FileSystemStorage, job_id: str) -> list[str]:
+    """Возвращает имена файлов в директории задачи"""
+    try:
+        _, files = storage.listdir(job_id)
+    except FileNotFoundError:
+        files = []
+    return files
+
+
+def _check_owner(storage: FileSystemStorage, job_id: str, owner_id: Any) -> bool:
+    """Проверяет, что задача запущена владельцем. Задачи без владельца недоступны"""
+    if owner_id is None:
+        return False
+    try:
+        with storage.open(posixpath.join(job_id, OWNER_FILE_NAME)) as file:
+            return file.read().decode() == str(owner_id)
+    except FileNotFoundError:
+        return False
+
+
+def _write_export(job_id: str, export_function: Callable[[], ExportStreamResponseDTO]) -> str:
+    """Выполняет экспорт и сохраняет файл в хранилище
+
+    Returns:
+        Имя сохраненного файла
+    """
+    storage = get_exports_storage()
+    cleanup_export_jobs(exclude=job_id)
+    try:
+        result = export_function()
+        with tempfile.TemporaryFile() as file:
+            for chunk in result.file_content:
+                file.write(chunk)
+            file.seek(0)
+            return storage.save(posixpath.join(job_id, f"{result.file_name}.{result.file_extension}"), File(file))
+    except Exception:
+        storage.save(posixpath.join(job_id, ERROR_FILE_NAME), ContentFile(b""))
+        raise
+
+
+def start_export_job(export_function: Callable[[], ExportStreamResponseDTO], owner_id: Any = None) -> ExportJobDTO:
+    """Запускает фоновую задачу экспорта
+
+    Args:
+        export_function: Функция без аргументов, возвращающая ExportStreamResponseDTO
+        owner_id: ID пользователя, которому доступен результат
+
+    Returns:
+        ExportJobDTO со статусом pending
+    """
+    job_id = uuid.uuid4().hex
+    get_exports_storage().save(posixpath.join(job_id, OWNER_FILE_NAME), ContentFile(str(owner_id).encode()))
+    run_in_background(_write_export, job_id, export_function)
+    return ExportJobDTO(job_id=job_id, status="pending")
+
+
+def get_export_job(job_id: str, owner_id: Any = None, url: str = None) -> ExportJobDTO | None:
+    """Возвращает статус задачи экспорта
+
+    Args:
+        job_id: ID задачи
+        owner_id: ID пользователя, запрашивающего статус
+        url: URL скачивания файла задачи
+
+    Returns:
+        ExportJobDTO или None, если задача не найдена или запущена другим пользователем
+    """
+    if not JOB_ID_PATTERN.match(job_id):
+        return None
+
+    storage = get_exports_storage()
+    if not _check_owner(storage, job_id, owner_id):
+        return None
+
+    files = _get_job_files(storage, job_id)
+    if ERROR_FILE_NAME in files:
+        return ExportJobDTO(job_id=job_id, status="failed")
+    if any(not name.startswith(".") for name in files):
+        return ExportJobDTO(job_id=job_id, status="done", url=url)
+    return ExportJobDTO(job_id=job_id, status="pending")
+
+
+def get_export_file(job_id: str, owner_id: Any = None) -> str | None:
+    """Возвращает путь к файлу задачи экспорта
+
+    Args:
+        job_id: ID задачи
+        owner_id: ID пользователя, запрашивающего файл
+
+    Returns:
+        Абсолютный путь к файлу или None, если файл не готов или задача запущена другим пользователем
+    """
+    if not JOB_ID_PATTERN.match(job_id):
+        return None
+
+    storage = get_exports_storage()
+    if not _check_owner(storage, job_id, owner_id):
+        return None
+
+    for name in _get_job_files(storage, job_id):
+        if not name.startswith("."):
+            return storage.path(posixpath.join(job_id, name))
+    return None
+
+
+def cleanup_export_jobs(exclude: str = None) -> int:
+    """Удаляет задачи экспорта старше EXPORTS_TTL секунд
+
+    Args:
+        exclude: ID задачи, которую не нужно удалять
+
+    Returns:
+        Количество удаленных задач
+    """
+    storage = get_exports_storage()
+    try:
+        job_ids, _ = storage.listdir("")
+    except FileNotFoundError:
+        return 0
+
+    expire_before = timezone.now() - timedelta(seconds=getattr(settings, "EXPORTS_TTL", 86400))
+    deleted = 0
+    for job_id in job_ids:
+        if job_id == exclude or not JOB_ID_PATTERN.match(job_id):
+            continue
+        files = _get_job_files(storage, job_id)
+        try:
+            if files and storage.get_modified_time(posixpath.join(job_id, files[0])) >= expire_before:
+                continue
+            for name in files:
+                storage.delete(posixpath.join(job_id, name))
+            os.rmdir(storage.path(job_id))
+        except OSError:
+            # Директорию уже удалил другой процесс
+            continue
+        deleted += 1
+    return deleted
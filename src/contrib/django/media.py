@@ -0,0 +1,275 @@
+"""Модуль для раздачи медиафайлов с кэшированием
+
+Notes:
+    Аналог whitenoise для MEDIA_ROOT. Файлы с хэшем содержимого в имени (`<stem>.<hash>.<ext>`) неизменяемы
+    и отдаются с `Cache-Control: immutable` на год, остальные - с коротким временем жизни.
+    Поддерживаются ETag/Last-Modified (304), запросы `Range` (206) и передача файла через `FileResponse`,
+    что позволяет WSGI серверу использовать `sendfile`.
+
+    Если задана настройка `MEDIA_SENDFILE_HEADER` (например `X-Accel-Redirect`), тело файла не читается
+    Python вовсе: ответ содержит только заголовки, а файл отдает прокси сервер по пути
+    `MEDIA_SENDFILE_PREFIX + path`.
+
+    Настройки:
+        MEDIA_MAX_AGE: Время кэширования файлов без хэша в имени (по умолчанию 3600)
+        MEDIA_IMMUTABLE_MAX_AGE: Время кэширования файлов с хэшем в имени (по умолчанию 31536000)
+        MEDIA_SENDFILE_HEADER: Заголовок для передачи файла прокси серверу
+        MEDIA_SENDFILE_PREFIX: Префикс пути для заголовка MEDIA_SENDFILE_HEADER (по умолчанию MEDIA_URL)
+
+Classes:
+    HashedFileSystemStorage: Файловое хранилище, добавляющее хэш содержимого в имена файлов
+    MediaMiddleware: Middleware, раздающее медиафайлы до остальной обработки запроса
+
+Functions:
+    is_hashed_name: Проверяет, содержит ли имя файла хэш содержимого
+    serve: Отдает медиафайл
+
+"""
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import posixpath
+import re
+import stat
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.http import FileResponse
+from django.http import Http404
+from django.http import HttpRequest
+from django.http import HttpResponse
+from django.http import HttpResponseNotAllowed
+from django.http import HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.utils.http import parse_etags
+from django.views.static import was_modified_since
+
+HASH_LENGTH = 16
+"""Длина хэша содержимого в имени файла"""
+HASHED_NAME_PATTERN = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}\.[^./]+$")
+"""Шаблон имени файла с хэшем содержимого"""
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+"""Шаблон заголовка Range (поддерживается один диапазон)"""
+
+
+def is_hashed_name(name: str) -> bool:
+    """Проверяет, содержит ли имя файла хэш содержимого
+
+    Args:
+        name: Имя файла
+
+    Returns:
+        Содержит ли имя хэш
+    """
+    return bool(HASHED_NAME_PATTERN.search(name))
+
+
+class HashedFileSystemStorage(FileSystemStorage):
+    """Файловое хранилище, добавляющее хэш содержимого в имена файлов
+
+    Notes:
+        `product/pizza.png` сохраняется как `product/pizza.<sha256[:16]>.png`. Одинаковые файлы
+        не дублируются, а новое содержимое всегда получает новый URL, поэтому его можно кэшировать навсегда
+    """
+
+    def save(self, name: str, content, max_length: int = None) -> str:
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        if not is_hashed_name(name):
+            name = self.get_hashed_name(name, content)
+            if self.exists(name):
+                return name
+
+        return super().save(name, content, max_length=max_length)
+
+    @staticmethod
+    def get_hashed_name(name: str, content: File) -> str:
+        """Возвращает имя файла с хэшем содержимого
+
+        Args:
+            name: Имя файла
+            content: Содержимое файла
+
+        Returns:
+            Имя файла вида `<stem>.<hash>.<ext>`
+        """
+        content_hash = hashlib.sha256()
+        for chunk in content.chunks():
+            content_hash.update(chunk)
+        content.seek(0)
+
+        root, extension = posixpath.splitext(name)
+        return f"{root}.{content_hash.hexdigest()[:HASH_LENGTH]}{extension}"
+
+
+class _FileRange:
+    """Файлоподобный объект, ограничивающий чтение диапазоном байт"""
+
+    def __init__(self, file, length: int):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _get_etag(path: str, file_stat) -> str:
+    """Возвращает ETag файла"""
+    if match := HASHED_NAME_PATTERN.search(path):
+        return f'"{match.group()[1:HASH_LENGTH + 1]}"'
+    return f'"{file_stat.st_size:x}-{int(file_stat.st_mtime):x}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Проверяет заголовок If-None-Match / If-Range на совпадение с ETag (слабое сравнение)"""
+    etags = parse_etags(header)
+    return "*" in etags or etag.removeprefix("W/") in (item.removeprefix("W/") for item in etags)
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Возвращает границы диапазона (включительно) из заголовка Range
+
+    Returns:
+        Границы диапазона или None, если заголовок не поддерживается
+
+    Raises:
+        ValueError: Диапазон не может быть удовлетворен
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    start, end = match.groups()
+    if not start:
+        length = int(end)
+        if not length:
+            raise ValueError(header)
+        return max(0, size - length), size - 1
+
+    start, end = int(start), int(end) if end else size - 1
+    if start >= size or end < start:
+        raise ValueError(header)
+    return start, min(end, size - 1)
+
+
+def serve(request: HttpRequest, path: str, document_root: str = None) -> HttpResponse:
+    """Отдает медиафайл
+
+    Args:
+        request: Запрос
+        path: Путь к файлу относительно document_root
+        document_root: Корневая директория. По умолчанию MEDIA_ROOT
+
+    Returns:
+        Ответ с файлом, 206 для запросов Range, 304 если файл не изменился
+
+    Raises:
+        Http404: Файл не найден
+    """
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET", "HEAD"])
+
+    try:
+        full_path = Path(safe_join(document_root or settings.MEDIA_ROOT, path))
+        file_stat = full_path.stat()
+    except (SuspiciousFileOperation, OSError):
+        raise Http404(path)
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise Http404(path)
+
+    etag = _get_etag(path, file_stat)
+    max_age = (
+        getattr(settings, "MEDIA_IMMUTABLE_MAX_AGE", 31536000)
+        if is_hashed_name(path)
+        else getattr(settings, "MEDIA_MAX_AGE", 3600)
+    )
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(file_stat.st_mtime),
+        "Cache-Control": f"public, max-age={max_age}" + (", immutable" if is_hashed_name(path) else ""),
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("If-None-Match")
+    if (if_none_match and _etag_matches(if_none_match, etag)) or (
+        not if_none_match and not was_modified_since(request.headers.get("If-Modified-Since"), file_stat.st_mtime)
+    ):
+        return HttpResponseNotModified(headers=headers)
+
+    content_type, encoding = mimetypes.guess_type(str(full_path))
+    content_type = content_type or "application/octet-stream"
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    size = file_stat.st_size
+    status, start, end = 200, 0, size - 1
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and size and (not if_range or _etag_matches(if_range, etag)):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            return HttpResponse(status=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        if byte_range:
+            status, (start, end) = 206, byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    sendfile_header = getattr(settings, "MEDIA_SENDFILE_HEADER", None)
+    if request.method == "HEAD" or sendfile_header:
+        response = HttpResponse(status=status, content_type=content_type, headers=headers)
+        response["Content-Length"] = end - start + 1
+        if sendfile_header and request.method != "HEAD":
+            prefix = getattr(settings, "MEDIA_SENDFILE_PREFIX", settings.MEDIA_URL)
+            response[sendfile_header] = posixpath.join(prefix, path)
+            # Диапазон и длину обрабатывает прокси сервер
+            del response["Content-Length"]
+            response.headers.pop("Content-Range", None)
+            response.status_code = 200
+        return response
+
+    file = full_path.open("rb")
+    if start:
+        file.seek(start)
+    # Диапазон до конца файла отдается самим файлом, что сохраняет возможность sendfile
+    filelike = file if end == size - 1 else _FileRange(file, end - start + 1)
+    response = FileResponse(filelike, status=status, content_type=content_type, headers=headers)
+    response["Content-Length"] = end - start + 1
+    return response
+
+
+class MediaMiddleware:
+    """Middleware, раздающее медиафайлы до остальной обработки запроса
+
+    Notes:
+        Располагается сразу после SecurityMiddleware, чтобы запросы к MEDIA_URL не проходили
+        через сессии, аутентификацию и остальные middleware
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.MEDIA_URL if settings.MEDIA_URL.startswith("/") else f"/{settings.MEDIA_URL}"
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.path_info.startswith(self.prefix):
+            try:
+                return serve(request, request.path_info.removeprefix(self.prefix))
+            except Http404:
+                pass
+        return self.get_response(request)
@@ -1,7 +1,54 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+
 from django.conf import settings
+from django.http import StreamingHttpResponse
 
 
 def is_app_installed(app):
     return app in settings.INSTALLED_APPS
+
+
+class _ClosingContent:
+    """Содержимое потокового ответа, вызывающее функцию при закрытии ответа
+
+    Notes:
+        Django вызывает close содержимого при закрытии ответа, в том числе если клиент отключился
+        до начала чтения
+    """
+
+    def __init__(self, content: Iterable | AsyncIterable, on_close: Callable[[], None]):
+        self.content = content
+        self.on_close = on_close
+        self._closed = False
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.on_close()
+
+
+class _SyncClosingContent(_ClosingContent):
+    def __iter__(self) -> Iterator:
+        return iter(self.content)
+
+
+class _AsyncClosingContent(_ClosingContent):
+    def __aiter__(self) -> AsyncIterator:
+        return aiter(self.content)
+
+
+def call_on_close(response: StreamingHttpResponse, on_close: Callable[[], None]) -> None:
+    """Вызывает функцию один раз при закрытии потокового ответа
+
+    Args:
+        response: Потоковый ответ
+        on_close: Функция без аргументов
+    """
+    content_class = _AsyncClosingContent if response.is_async else _SyncClosingContent
+    response.streaming_content = content_class(response.streaming_content, on_close)
@@ -0,0 +1,177 @@
+"""Модуль с прогревом процесса перед fork воркеров
+
+Notes:
+    Первые запросы каждого воркера выполняют одну и ту же дорогую работу: создание провайдеров модулей,
+    сборку валидаторов и сериализаторов pydantic, сбор relations для DTO и генерацию схем openapi.
+    При `preload_app` gunicorn загружает приложение в master процессе, и прогрев, выполненный там до fork,
+    наследуется всеми воркерами. Чтобы унаследованные страницы памяти оставались общими (copy-on-write),
+    сборщик мусора отключается в master процессе, объекты замораживаются (`gc.freeze`) перед fork
+    и сборщик включается заново в воркере
+
+Functions:
+    warm_up: Прогревает процесс
+    resolve_providers: Создает провайдеры модулей со временем жизни процесса
+    build_pydantic_models: Собирает валидаторы и сериализаторы моделей pydantic, сборка которых отложена
+    compile_relations_plans: Собирает relations для DTO, которые возвращают представления
+    build_openapi_schemas: Генерирует и кэширует документы openapi
+    freeze_gc: Замораживает объекты процесса перед fork
+
+"""
+from __future__ import annotations
+
+import gc
+import logging
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from time import perf_counter
+from typing import Any
+
+from contrib.clean_architecture.consts import ReturnTypeAttrs
+from contrib.clean_architecture.dto_based_objects.bases import BaseDTOBasedObjectsMixin
+from contrib.clean_architecture.views.bases import CleanViewSet
+from contrib.context import get_root_context
+from contrib.module_manager import ModuleManager
+from contrib.openapi.schema_generators import CustomSchemaGenerator
+from contrib.pydantic.model import build_deferred_models
+from contrib.pydantic.model import PydanticModel
+from django.db import connections
+from django.urls import get_resolver
+from django.urls import URLResolver
+
+logger = logging.getLogger(__name__)
+
+_RETURN_TYPE_ATTRS_SUFFIXES = (ReturnTypeAttrs.RETURN_TYPE, ReturnTypeAttrs.RETURN_DETAIL_TYPE)
+
+
+def _iter_url_callbacks(patterns: Iterable[Any]) -> Iterator[Callable]:
+    """Рекурсивно возвращает обработчики url"""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_url_callbacks(pattern.url_patterns)
+        else:
+            yield pattern.callback
+
+
+def _iter_return_types(obj: Any) -> Iterator[type[PydanticModel]]:
+    """Возвращает DTO из атрибутов `<method>_return_type` и `<method>_return_detail_type`"""
+    for name in dir(obj):
+        if not name.endswith(_RETURN_TYPE_ATTRS_SUFFIXES):
+            continue
+        value = getattr(obj, name, None)
+        if isinstance(value, type) and issubclass(value, PydanticModel):
+            yield value
+
+
+def resolve_providers() -> int:
+    """Создает провайдеры модулей со временем жизни процесса
+
+    Returns:
+        Количество провайдеров
+    """
+    ModuleManager.resolve_all()
+    return sum(1 for _ in ModuleManager.iter_providers())
+
+
+def build_pydantic_models() -> int:
+    """Собирает валидаторы и сериализаторы моделей pydantic, сборка которых отложена
+
+    Notes:
+        Включая классы пагинации, созданные через `PaginatedModel.build_class`
+
+    Returns:
+        Количество собранных моделей
+    """
+    return build_deferred_models()
+
+
+def compile_relations_plans() -> int:
+    """Собирает relations для DTO, которые возвращают представления
+
+    Notes:
+        Репозиторий представления находится через его контроллер и интерактор,
+        DTO - по атрибутам возвращаемых типов представления и интерактора
+
+    Returns:
+        Количество собранных relations
+    """
+    compiled = 0
+    view_classes = {getattr(callback, "cls", None) for callback in _iter_url_callbacks(get_resolver().url_patterns)}
+    for view_class in view_classes:
+        if not (isinstance(view_class, type) and issubclass(view_class, CleanViewSet)):
+            continue
+
+        interactor = getattr(getattr(view_class(), "controller", None), "interactor", None)
+        repository = getattr(interactor, "repository", None)
+        if not isinstance(repository, BaseDTOBasedObjectsMixin):
+            continue
+
+        for dto in {*_iter_return_types(view_class), *_iter_return_types(interactor)}:
+            repository.get_relations_plan(repository.model, dto)
+            compiled += 1
+    return compiled
+
+
+def build_openapi_schemas() -> int:
+    """Генерирует и кэширует документы openapi
+
+    Returns:
+        Количество сгенерированных документов
+    """
+    built = 0
+    for callback in _iter_url_callbacks(get_resolver().url_patterns):
+        schema_generator = getattr(callback, "initkwargs", {}).get("schema_generator")
+        if isinstance(schema_generator, CustomSchemaGenerator):
+            schema_generator.get_document()
+            built += 1
+    return built
+
+
+_STEPS: dict[str, Callable[[], int]] = {
+    "providers": resolve_providers,
+    "pydantic_models": build_pydantic_models,
+    "relations_plans": compile_relations_plans,
+    "openapi_schemas": build_openapi_schemas,
+}
+
+
+def warm_up(steps: Iterable[str] = None) -> dict[str, float]:
+    """Прогревает процесс
+
+    Notes:
+        Шаги выполняются в отдельном контексте запроса. Ошибка шага логируется и не прерывает прогрев.
+        Соединения с БД, открытые при прогреве, закрываются, чтобы воркеры не унаследовали их сокеты
+
+    Args:
+        steps: Названия шагов. По умолчанию все шаги
+
+    Returns:
+        Словарь вида {название шага: время выполнения в секундах}
+    """
+    context = get_root_context()
+    token = context.init_context()
+    timings = {}
+    try:
+        for step in steps or _STEPS:
+            start = perf_counter()
+            try:
+                count = _STEPS[step]()
+            except Exception:
+                logger.exception("Warm up step %s failed", step)
+                continue
+            timings[step] = perf_counter() - start
+            logger.info("Warm up step %s: %d objects in %.3fs", step, count, timings[step])
+    finally:
+        context.reset_context(token)
+        connections.close_all()
+    return timings
+
+
+def freeze_gc() -> None:
+    """Замораживает объекты процесса перед fork
+
+    Notes:
+        Замороженные объекты не обходятся сборщиком мусора в воркерах, поэтому их страницы памяти
+        не копируются при записи счетчиков сборщика
+    """
+    gc.freeze()
@@ -99,7 +99,8 @@ class BaseHTTPException(_BaseHTTPException, metaclass=HTTPExceptionManager):
         if cls.error_code in cls._existed_errors_codes:
             raise AttributeError(f"Код ошибки {cls.error_code} уже занят")
 
-        cls._set_response_model()
+        # Модель ответа собирается при первом обращении (ответ с ошибкой или схема openapi)
+        cls._response_model = None
         cls._existed_errors_codes.add(cls.error_code)
 
     def __init__(self, message: str = None, data: Any = None, errors: Any = None):
@@ -114,10 +115,10 @@ class BaseHTTPException(_BaseHTTPException, metaclass=HTTPExceptionManager):
         self.detail = self.detail.format(message=message or self.default_message)
 
     @classmethod
-    def _set_response_model(cls):
-        """Записывает модель ошибки для дальнейшего получения схемы"""
+    def get_response_model(cls) -> type[BaseModel]:
+        """Возвращает модель ошибки, создавая ее при первом обращении"""
         if cls._response_model:
-            return
+            return cls._response_model
 
         class ResponseModel(BaseModel):
             detail: str = cls.detail.format(message=cls.default_message)
@@ -125,12 +126,13 @@ class BaseHTTPException(_BaseHTTPException, metaclass=HTTPExceptionManager):
             if cls.contains_errors:
                 errors: list[cls.error_item_type]
 
+        ResponseModel.__name__ = cls.__name__
         cls._response_model = ResponseModel
-        cls._response_model.__name__ = cls.__name__
+        return ResponseModel
 
     def model_dump(self):
         """Возвращает словарь с данными об ошибке"""
-        return self._response_model.model_validate(self, from_attributes=True).model_dump()
+        return self.get_response_model().model_validate(self, from_attributes=True).model_dump()
 
     @property
     def response(self):
@@ -146,7 +148,7 @@ class BaseHTTPException(_BaseHTTPException, metaclass=HTTPExceptionManager):
     def get_schema(cls, schema_generator=AdaptedGenerateJsonSchema):
         """Возвращает схему в спецификации openapi"""
         ref_template = "#/components/schemas/{model}"
-        return cls._response_model.model_json_schema(ref_template=ref_template, schema_generator=schema_generator)
+        return cls.get_response_model().model_json_schema(ref_template=ref_template, schema_generator=schema_generator)
 
     @classmethod
     def get_openapi_response(cls):
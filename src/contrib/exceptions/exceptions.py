@@ -30,6 +30,14 @@ class ThrottledRequest(BaseHTTPException):
     error_code = "throttled"
 
 
+class ServiceUnavailable(BaseHTTPException):
+    """Эндпоинт перегружен"""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = _("Сервис перегружен. Повторный запрос возможен через {message} сек.")
+    error_code = "service_unavailable"
+
+
 class DoesNotExist(BaseHTTPException):
     """Запись не найдена"""
 
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from collections.abc import Mapping
+from typing import Any
+
 from contrib.exceptions.bases import BaseHTTPException
 from contrib.exceptions.exceptions import InvalidCredentials
 from contrib.exceptions.exceptions import NotHandledError
@@ -7,7 +11,39 @@ from contrib.exceptions.exceptions import PermissionDenied
 from contrib.exceptions.exceptions import ValidationError
 
 
-def responses_from_exceptions(*exceptions: type[BaseHTTPException], with_default_errors=True) -> dict:
+class LazyResponses(Mapping):
+    """Схемы ответов ошибок, которые собираются при первом обращении (генерации документации API)"""
+
+    def __init__(self, exceptions: tuple[type[BaseHTTPException], ...]):
+        """
+
+        Args:
+            exceptions: Кортеж исключений
+        """
+        self.exceptions = exceptions
+        self._responses: dict[int, dict[str, Any]] | None = None
+
+    @property
+    def responses(self) -> dict[int, dict[str, Any]]:
+        """Маппинг кодов статуса и схем ответов"""
+        if self._responses is None:
+            self._responses = dict(map(lambda exception: exception.get_openapi_response(), self.exceptions))
+        return self._responses
+
+    def __getitem__(self, status_code: int) -> dict[str, Any]:
+        return self.responses[status_code]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.responses)
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(exception.__name__ for exception in self.exceptions)})"
+
+
+def responses_from_exceptions(*exceptions: type[BaseHTTPException], with_default_errors=True) -> LazyResponses:
     """Возвращает схемы ответа ошибки для отображения в документации API
 
     Args:
@@ -15,7 +51,7 @@ def responses_from_exceptions(*exceptions: type[BaseHTTPException], with_default
         with_default_errors: Добавить стандартные ошибки
 
     Returns:
-        Маппинг исключений и схем ответов
+        Маппинг кодов статуса и схем ответов, который собирается при первом обращении
 
     """
     if with_default_errors:
@@ -26,4 +62,4 @@ def responses_from_exceptions(*exceptions: type[BaseHTTPException], with_default
             PermissionDenied,
             NotHandledError,
         )
-    return dict(map(lambda exception: exception.get_openapi_response(), exceptions))
+    return LazyResponses(exceptions)
@@ -0,0 +1,7 @@
+"""Модуль для обработки изображений
+
+Modules:
+    services: Генерация вариантов изображений (размеры, форматы) с именами по хэшу содержимого
+
+"""
+from __future__ import annotations
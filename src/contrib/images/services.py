@@ -0,0 +1,158 @@
+"""Модуль генерации вариантов изображений
+
+Notes:
+    Варианты сохраняются в хранилище поля под именами вида `<dir>/variants/<stem>-<width>w.<hash>.<ext>`,
+    где hash - префикс sha256 содержимого. Такие имена неизменяемы и могут отдаваться с долгим кэшированием.
+
+    Результат генерации - словарь вида:
+
+    ``` json
+    {"source": "product/pizza.png", "variants": {"webp": {"80": "product/variants/pizza-80w.1f2e.webp"}}}
+    ```
+
+Functions:
+    render_variant: Возвращает содержимое варианта изображения
+    build_image_variants: Генерирует и сохраняет варианты изображения
+    get_variants_urls: Возвращает URL вариантов изображения
+    get_srcset: Возвращает значения атрибута srcset для каждого формата
+
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import posixpath
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Any
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from PIL import Image
+from PIL import ImageOps
+
+DEFAULT_WIDTHS = (80, 160, 320, 640)
+"""Ширины вариантов по умолчанию"""
+DEFAULT_FORMATS = ("webp", "jpeg")
+"""Форматы вариантов по умолчанию"""
+FORMATS_EXTENSIONS = {"webp": "webp", "jpeg": "jpg", "png": "png"}
+"""Расширения файлов для форматов"""
+FORMATS_SAVE_KWARGS = {
+    "webp": {"quality": 80, "method": 6},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+"""Параметры сохранения для форматов"""
+HASH_LENGTH = 16
+"""Длина хэша содержимого в имени файла"""
+
+
+def render_variant(image: Image.Image, width: int, image_format: str) -> bytes:
+    """Возвращает содержимое варианта изображения
+
+    Args:
+        image: Исходное изображение
+        width: Ширина варианта. Изображение не увеличивается
+        image_format: Формат варианта
+
+    Returns:
+        Байты закодированного изображения
+    """
+    variant = image.copy()
+    if variant.width > width:
+        height = max(1, round(variant.height * width / variant.width))
+        variant = variant.resize((width, height), Image.Resampling.LANCZOS)
+
+    has_alpha = variant.mode in ("RGBA", "LA") or (variant.mode == "P" and "transparency" in variant.info)
+    if image_format == "jpeg" and has_alpha:
+        background = Image.new("RGB", variant.size, (255, 255, 255))
+        background.paste(variant.convert("RGBA"), mask=variant.convert("RGBA").getchannel("A"))
+        variant = background
+    elif image_format == "jpeg" or variant.mode not in ("RGB", "RGBA"):
+        variant = variant.convert("RGBA" if has_alpha else "RGB")
+
+    output = io.BytesIO()
+    variant.save(output, format=image_format.upper(), **FORMATS_SAVE_KWARGS.get(image_format, {}))
+    return output.getvalue()
+
+
+def _get_variant_name(source_name: str, width: int, image_format: str, content: bytes) -> str:
+    """Возвращает имя файла варианта с хэшем содержимого"""
+    directory, file_name = posixpath.split(source_name)
+    stem = posixpath.splitext(file_name)[0]
+    content_hash = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    extension = FORMATS_EXTENSIONS.get(image_format, image_format)
+    return posixpath.join(directory, "variants", f"{stem}-{width}w.{content_hash}.{extension}")
+
+
+def build_image_variants(
+    file: Any,
+    storage: Storage,
+    widths: Sequence[int] = DEFAULT_WIDTHS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+) -> dict[str, Any]:
+    """Генерирует и сохраняет варианты изображения
+
+    Args:
+        file: Файл изображения (например, FieldFile). Должен иметь атрибут name
+        storage: Хранилище, в которое сохраняются варианты
+        widths: Ширины вариантов
+        formats: Форматы вариантов
+
+    Returns:
+        Словарь с именем исходного файла и именами вариантов по форматам и ширинам
+    """
+    file.open("rb")
+    try:
+        with Image.open(file) as image:
+            image = ImageOps.exif_transpose(image)
+            image.load()
+    finally:
+        file.close()
+
+    # Не увеличиваем изображение: ширины больше исходной заменяются исходной
+    variant_widths = sorted({min(width, image.width) for width in widths})
+
+    variants: dict[str, dict[str, str]] = {}
+    for image_format in formats:
+        for width in variant_widths:
+            content = render_variant(image, width, image_format)
+            name = _get_variant_name(file.name, width, image_format, content)
+            if not storage.exists(name):
+                name = storage.save(name, ContentFile(content))
+            variants.setdefault(image_format, {})[str(width)] = name
+
+    return {"source": file.name, "width": image.width, "variants": variants}
+
+
+def get_variants_urls(image_variants: dict[str, Any], url_function: Callable[[str], str]) -> dict[str, dict[str, str]]:
+    """Возвращает URL вариантов изображения
+
+    Args:
+        image_variants: Результат build_image_variants
+        url_function: Функция получения URL по имени файла
+
+    Returns:
+        Словарь вида {формат: {ширина: url}}
+    """
+    return {
+        image_format: {width: url_function(name) for width, name in widths.items()}
+        for image_format, widths in (image_variants or {}).get("variants", {}).items()
+    }
+
+
+def get_srcset(variants_urls: dict[str, dict[str, str]]) -> dict[str, str]:
+    """Возвращает значения атрибута srcset для каждого формата
+
+    Args:
+        variants_urls: Результат get_variants_urls
+
+    Returns:
+        Словарь вида {формат: "url 80w, url 320w"}
+    """
+    return {
+        image_format: ", ".join(
+            f"{url} {width}w" for width, url in sorted(widths.items(), key=lambda item: int(item[0]))
+        )
+        for image_format, widths in variants_urls.items()
+    }
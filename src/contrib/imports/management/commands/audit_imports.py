@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$")
+_CHILD_CODE = "import django, importlib, sys; django.setup(); importlib.import_module(sys.argv[1])"
+
+
+class Command(BaseCommand):
+    help = (
+        "Отчет по времени импорта пакетов (python -X importtime) при загрузке модуля после django.setup(). "
+        "С --budget завершается ошибкой, если медиана общего времени импорта превышает бюджет"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--module",
+            default=settings.WSGI_APPLICATION.rsplit(".", 1)[0],
+            help="Импортируемый модуль. По умолчанию модуль WSGI приложения",
+        )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=1,
+            help="Глубина имени пакета в отчете (1 - contrib, 2 - contrib.pydantic)",
+        )
+        parser.add_argument("--top", type=int, default=20, help="Количество пакетов в отчете")
+        parser.add_argument("--repeat", type=int, default=3, help="Количество процессов для замера")
+        parser.add_argument("--budget", type=float, help="Допустимая медиана общего времени импорта, мс")
+        parser.add_argument("--output", help="Путь к json файлу с результатом замера")
+
+    def handle(
+        self,
+        *args,
+        module: str,
+        depth: int,
+        top: int,
+        repeat: int,
+        budget: float | None = None,
+        output: str | None = None,
+        **options,
+    ):
+        runs = [self._measure(module, depth) for _ in range(repeat)]
+
+        packages = {package: statistics.median(run.get(package, 0) for run in runs) for package in set().union(*runs)}
+        total = statistics.median(sum(run.values()) for run in runs)
+
+        self.stdout.write(f"{'package':<40} {'self, ms':>10} {'share':>7}")
+        for package, duration in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+            self.stdout.write(f"{package:<40} {duration / 1000:>10.1f} {duration / total:>7.1%}")
+        self.stdout.write(f"{'total':<40} {total / 1000:>10.1f}")
+
+        if output:
+            with open(output, "w", encoding="utf-8") as file:
+                packages_ms = {package: duration / 1000 for package, duration in packages.items()}
+                json.dump({"module": module, "total_ms": total / 1000, "packages_ms": packages_ms}, file, indent=2)
+
+        if budget is not None and total / 1000 > budget:
+            raise CommandError(f"Import time {total / 1000:.1f}ms exceeds budget {budget:.1f}ms")
+
+    @staticmethod
+    def _measure(module: str, depth: int) -> dict[str, int]:
+        """Импортирует модуль в отдельном процессе и возвращает время импорта по пакетам в микросекундах"""
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _CHILD_CODE, module],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "romashka.settings")},
+        )
+        if process.returncode:
+            raise CommandError(process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "Import failed")
+
+        packages: dict[str, int] = defaultdict(int)
+        for line in process.stderr.splitlines():
+            if match := _IMPORT_TIME_LINE.match(line):
+                self_time, _, name = match.groups()
+                packages[".".join(name.split(".")[:depth])] += int(self_time)
+        return packages
@@ -6,6 +6,7 @@ from .module_manager import ModuleManager
 from .types import Depend
 from .types import DependencyInjectorProto
 from .types import FabricProvider
+from .types import Lifetime
 
 get_app_module = ModuleManager.get_app_module
 load_modules = ModuleManager.load_modules
@@ -21,4 +22,5 @@ __all__ = [
     "Depend",
     "DependencyInjectorProto",
     "FabricProvider",
+    "Lifetime",
 ]
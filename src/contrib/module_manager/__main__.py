@@ -0,0 +1,104 @@
+"""Профилирование и замер холодного старта загрузки модулей ModuleManager
+
+Examples:
+    Отчет по этапам загрузки для каждого модуля и провайдера:
+
+    >>> python -m contrib.module_manager --profile
+
+    Замер холодного старта в отдельных процессах. С --budget завершается с кодом 1,
+    если медиана превышает бюджет (для CI):
+
+    >>> python -m contrib.module_manager --repeat 5 --budget 4.0
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+
+def _setup(profile: bool) -> dict[str, float]:
+    start = perf_counter()
+    import django
+
+    from .module_manager import ModuleManager
+    from .profiling import StartupProfile
+
+    if profile:
+        ModuleManager.profile = StartupProfile()
+
+    django.setup()
+    setup_time = perf_counter() - start
+
+    # Провайдеры создаются лениво, первый запрос заплатит за создание всех используемых
+    ModuleManager.resolve_all()
+    return {"setup": setup_time, "ready": perf_counter() - start}
+
+
+def _run_child(args: argparse.Namespace) -> int:
+    print(json.dumps(_setup(profile=False)))
+    return 0
+
+
+def _run_profile(args: argparse.Namespace) -> int:
+    from .module_manager import ModuleManager
+    from .profiling import STAGES
+
+    timings = _setup(profile=True)
+    profile = ModuleManager.profile
+    print(profile.report())
+    print()
+    print(", ".join(f"{stage}: {profile.total(stage) * 1000:.1f}ms" for stage in STAGES))
+    print(f"django.setup: {timings['setup'] * 1000:.1f}ms, ready: {timings['ready'] * 1000:.1f}ms")
+    return 0
+
+
+def _run_benchmark(args: argparse.Namespace) -> int:
+    runs = []
+    for _ in range(args.repeat):
+        start = perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-m", "contrib.module_manager", "--child"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append({**json.loads(output.strip().splitlines()[-1]), "process": perf_counter() - start})
+
+    for key in ("setup", "ready", "process"):
+        values = [run[key] for run in runs]
+        print(
+            f"{key:>8}: median {statistics.median(values):.3f}s, "
+            f"min {min(values):.3f}s, max {max(values):.3f}s"
+        )
+
+    median = statistics.median(run["process"] for run in runs)
+    if args.budget is not None and median > args.budget:
+        print(f"Cold start {median:.3f}s exceeds budget {args.budget:.3f}s", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main() -> int:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "romashka.settings")
+
+    parser = argparse.ArgumentParser(prog="python -m contrib.module_manager", description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", action="store_true", help="Отчет по этапам загрузки модулей и провайдеров")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество процессов для замера холодного старта")
+    parser.add_argument("--budget", type=float, help="Допустимая медиана холодного старта процесса, секунды")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return _run_child(args)
+    if args.profile:
+        return _run_profile(args)
+    return _run_benchmark(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
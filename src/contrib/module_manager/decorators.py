@@ -30,7 +30,8 @@ def inject(*modules: str) -> Callable[[_FuncOrType], _FuncOrType]:
 
         @wraps(func_or_cls)
         def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
-            if hasattr(func_or_cls, "injected_kwargs"):
+            # Зависимости с временем жизни запроса / transient нельзя кэшировать между вызовами
+            if hasattr(func_or_cls, "injected_kwargs") and not ModuleManager.has_scoped_providers():
                 inject_kwargs = func_or_cls.injected_kwargs
             else:
                 inject_kwargs = ModuleManager.get_depends(
@@ -8,3 +8,6 @@ class DependencyNotInstalledError(BaseModuleManagerError): ...
 
 
 class DependencyTypeError(BaseModuleManagerError): ...
+
+
+class DependencyLifetimeError(BaseModuleManagerError): ...
@@ -7,18 +7,27 @@ from collections import defaultdict
 from collections import OrderedDict
 from collections.abc import Callable
 from collections.abc import Hashable
+from collections.abc import Iterator
 from collections.abc import Sequence
+from contextlib import nullcontext
 from copy import copy
+from threading import local
 from threading import RLock
 from typing import Any
 from typing import cast
 from typing import TypeVar
 
+from .exceptions import DependencyLifetimeError
 from .exceptions import DependencyNotInstalledError
 from .exceptions import DependencyTypeError
+from .profiling import STAGE_CONSTRUCT
+from .profiling import STAGE_IMPORT
+from .profiling import STAGE_INJECT
+from .profiling import StartupProfile
 from .types import _EMPTY
 from .types import DependencyInjectorProto
 from .types import FabricProvider
+from .types import Lifetime
 from .utils import extract_hints_depends
 from .utils import get_all_depends_types
 from .utils import get_app_label
@@ -33,16 +42,26 @@ _T = TypeVar("_T")
 
 _modules_file_name = "module"
 
+_REQUEST_PROVIDERS_CONTEXT_KEY = "module_providers"
+"""Ключ провайдеров с временем жизни запроса в корневом контексте"""
+
+_local = local()
+
 
 class ModuleManager(ABCMeta):
     _registered: dict[str, AppModule] = OrderedDict()
     _modules_by_app_label: dict[str, AppModule] = {}
     _installed_modules: tuple[str, ...] = ()
     _exports: dict[str, dict[type[Any], object]] = defaultdict(dict)
+    _export_types: dict[str, set[type[Any]]] = defaultdict(set)
     _providers_by_module: dict[AppModule, dict[type[Any], object]] = defaultdict(dict)
+    _provider_factories: dict[AppModule, dict[type[Any], type[Any] | FabricProvider]] = defaultdict(dict)
+    _lifetimes: dict[AppModule, dict[type[Any], Lifetime]] = defaultdict(dict)
     _modules_file_name: str = _modules_file_name
 
     loaded = False
+    lazy = True
+    profile: StartupProfile | None = None
     lock = RLock()
 
     def __new__(mcls, name, bases, attrs):
@@ -68,7 +87,179 @@ class ModuleManager(ABCMeta):
 
     @classmethod
     def get_dep_for_app_module(cls, app_module: AppModule, dep_type: type[_T]) -> _T:
-        return cls._providers_by_module[app_module].get(dep_type) or cls._exports[app_module.app_label].get(dep_type)
+        return cls._get_provider(app_module, dep_type) or cls._get_export(app_module, dep_type)
+
+    @classmethod
+    def _measure(cls, stage: str, app_label: str, name: str = ""):
+        if cls.profile is None:
+            return nullcontext()
+        return cls.profile.measure(stage, app_label, name)
+
+    @classmethod
+    def get_lifetime(cls, app_module: AppModule, dep_type: type[Any]) -> Lifetime:
+        return cls._lifetimes[app_module].get(dep_type, Lifetime.SINGLETON)
+
+    @classmethod
+    def _get_request_providers(cls) -> dict[tuple[str, type[Any]], object] | None:
+        from contrib.context.root_context import get_root_context
+
+        context = get_root_context()
+        try:
+            if not context.initialized:
+                return None
+            return context.setdefault(_REQUEST_PROVIDERS_CONTEXT_KEY, {})
+        except LookupError:
+            # Контекст инициализирован в другом потоке
+            return None
+
+    @classmethod
+    def _get_provider(cls, app_module: AppModule, dep_type: type[Any]) -> object | None:
+        providers = cls._providers_by_module[app_module]
+        if dep_type in providers:
+            return providers[dep_type]
+
+        factory = cls._provider_factories[app_module].get(dep_type)
+        if factory is None:
+            return None
+
+        lifetime = cls.get_lifetime(app_module, dep_type)
+        if lifetime is Lifetime.TRANSIENT:
+            return cls._create_provider(app_module, dep_type, factory)
+        if lifetime is Lifetime.REQUEST:
+            request_providers = cls._get_request_providers()
+            # Вне запроса (management команды, фоновые задачи) экземпляр живет до конца вызова
+            if request_providers is None:
+                return cls._create_provider(app_module, dep_type, factory)
+            key = (app_module.app_label, dep_type)
+            if key not in request_providers:
+                request_providers[key] = cls._create_provider(app_module, dep_type, factory)
+            return request_providers[key]
+
+        with cls.lock:
+            if dep_type in providers:
+                return providers[dep_type]
+            provider = cls._create_provider(app_module, dep_type, factory)
+            providers[dep_type] = provider
+            return provider
+
+    @classmethod
+    def _get_resolving(cls) -> dict[tuple[AppModule, type[Any]], object]:
+        """Возвращает провайдеры, зависимости которых сейчас внедряются в текущем потоке"""
+        return _local.__dict__.setdefault("resolving", {})
+
+    @classmethod
+    def _create_provider(
+        cls,
+        app_module: AppModule,
+        dep_type: type[Any],
+        factory: type[Any] | FabricProvider,
+    ) -> object:
+        """Создает провайдер и внедряет его зависимости
+
+        Notes:
+            Блокировка не берется: провайдеры REQUEST / TRANSIENT создаются потоками параллельно,
+            единственность SINGLETON обеспечивает `_get_provider`. Циклические зависимости
+            отслеживаются отдельно для каждого потока
+        """
+        resolving = cls._get_resolving()
+        # Провайдер, зависимости которого сейчас внедряются в этом же потоке (циклическая зависимость)
+        if (app_module, dep_type) in resolving:
+            return resolving[(app_module, dep_type)]
+
+        name = getattr(dep_type, "__qualname__", str(dep_type))
+        with cls._measure(STAGE_CONSTRUCT, app_module.app_label, name):
+            if isinstance(factory, FabricProvider):
+                provider = factory.klass(*(factory.args or ()), **(factory.kwargs or {}))
+            else:
+                provider = factory()
+
+        # Провайдер публикуется для других потоков только после внедрения всех зависимостей
+        resolving[(app_module, dep_type)] = provider
+        try:
+            with cls._measure(STAGE_INJECT, app_module.app_label, name):
+                cls.inject_to_obj(
+                    {app_module.app_label} | set(app_module.imports),
+                    provider,
+                    find_in_module=True,
+                )
+        finally:
+            del resolving[(app_module, dep_type)]
+
+        return provider
+
+    @classmethod
+    def _get_export(cls, app_module: AppModule, dep_type: type[Any]) -> object | None:
+        exports = cls._exports[app_module.app_label]
+        if dep_type in exports:
+            return exports[dep_type]
+        if dep_type not in cls._export_types[app_module.app_label]:
+            return None
+
+        export = cls._get_provider(app_module, dep_type) or dep_type
+        if cls.get_lifetime(app_module, dep_type) is Lifetime.SINGLETON:
+            exports[dep_type] = export
+        return export
+
+    @classmethod
+    def iter_providers(cls) -> Iterator[tuple[AppModule, type[Any]]]:
+        for app_module in cls._registered.values():
+            for dep_type in cls._provider_factories[app_module]:
+                yield app_module, dep_type
+
+    @classmethod
+    def resolve_all(cls) -> None:
+        for app_module, dep_type in cls.iter_providers():
+            if cls.get_lifetime(app_module, dep_type) is Lifetime.SINGLETON:
+                cls._get_provider(app_module, dep_type)
+
+    @classmethod
+    def has_scoped_providers(cls) -> bool:
+        return any(cls._lifetimes.values())
+
+    @classmethod
+    def _get_provider_dependencies(cls, dep_type: type[Any]) -> Iterator[tuple[AppModule, type[Any]]]:
+        dep_types = [_type for _, _type in extract_hints_depends(dep_type)]
+        if isinstance(getattr(dep_type, "__inject__", None), Callable):
+            type_hints = get_safe_type_hints(dep_type.__inject__, localns=get_all_depends_types())
+            dep_types.extend(get_type(_type) for name, _type in type_hints.items() if name != "return")
+
+        for _type in dep_types:
+            dep_module = cls.get_app_module(getattr(_type, "__appmodule_name__", None))
+            if not is_loaded_depend_type(_type) or dep_module is None:
+                continue
+            # Адаптеры-функции выбирают реализацию при внедрении, поэтому не проверяются
+            mapped_type = dep_module.mapping.get(_type, _type)
+            if not inspect.isfunction(mapped_type) and mapped_type in cls._provider_factories[dep_module]:
+                yield dep_module, mapped_type
+
+    @classmethod
+    def _is_request_bound(
+        cls,
+        app_module: AppModule,
+        dep_type: type[Any],
+        seen: set[tuple[AppModule, type[Any]]],
+    ) -> bool:
+        lifetime = cls.get_lifetime(app_module, dep_type)
+        if lifetime is Lifetime.REQUEST:
+            return True
+        if lifetime is Lifetime.SINGLETON or (app_module, dep_type) in seen:
+            return False
+        # Transient провайдер привязан к запросу, если зависит от провайдера запроса
+        seen.add((app_module, dep_type))
+        return any(cls._is_request_bound(*dependency, seen) for dependency in cls._get_provider_dependencies(dep_type))
+
+    @classmethod
+    def validate_lifetimes(cls) -> None:
+        for app_module, dep_type in cls.iter_providers():
+            if cls.get_lifetime(app_module, dep_type) is not Lifetime.SINGLETON:
+                continue
+            for dep_module, dependency in cls._get_provider_dependencies(dep_type):
+                if cls._is_request_bound(dep_module, dependency, set()):
+                    raise DependencyLifetimeError(
+                        f"Singleton `{dep_type.__module__}.{dep_type.__qualname__}` in module `{app_module.app_label}`"
+                        f" depends on request scoped `{dependency.__module__}.{dependency.__qualname__}`"
+                        f" from module `{dep_module.app_label}`"
+                    )
 
     @classmethod
     def get_app_module_name_from_dep(cls, dep_type: type[Any]) -> str:
@@ -95,7 +286,7 @@ class ModuleManager(ABCMeta):
 
         if find_in_module:
             return cls.get_dep_for_app_module(app_module, dep_type)
-        return cls._exports[app_module.app_label].get(dep_type)
+        return cls._get_export(app_module, dep_type)
 
     @classmethod
     def get_depends(
@@ -193,6 +384,7 @@ class ModuleManager(ABCMeta):
         cls,
         installed_modules: Sequence[str],
         modules_file_name: str = _modules_file_name,
+        lazy: bool = None,
     ):
         if cls.loaded:
             return
@@ -202,53 +394,48 @@ class ModuleManager(ABCMeta):
             all_apps_labels: set[str] = set()
             for package_name in cls.installed_modules:
                 module_name = f"{package_name}.{cls.modules_file_name}"
-                all_apps_labels.add(get_app_label(package_name))
+                app_label = get_app_label(package_name)
+                all_apps_labels.add(app_label)
                 try:
-                    __import__(module_name)
+                    with cls._measure(STAGE_IMPORT, app_label):
+                        __import__(module_name)
                 except ImportError as e:
                     if e.name != module_name:
                         raise e
 
-            all_providers: list[object] = []
-
             for package_name, app_module in cls._registered.items():
                 cls._modules_by_app_label[app_module.app_label] = app_module
+                cls._providers_by_module[app_module].clear()
+                cls._provider_factories[app_module].clear()
+                cls._lifetimes[app_module].clear()
+                cls._exports[app_module.app_label].clear()
+                cls._export_types[app_module.app_label].clear()
                 for key in app_module.mapping.keys():
                     key.__appmodule_name__ = app_module.app_label
 
+                # Провайдеры создаются и получают зависимости при первом обращении
                 for provider_type in app_module.providers:
-                    klass = provider_type
-                    if isinstance(provider_type, FabricProvider):
-                        cls._providers_by_module[app_module][provider_type.klass] = provider_type.klass(
-                            *(provider_type.args or ()),
-                            **(provider_type.kwargs or {}),
-                        )
-                        klass = provider_type.klass
-                    else:
-                        cls._providers_by_module[app_module][provider_type] = provider_type()
+                    klass = provider_type.klass if isinstance(provider_type, FabricProvider) else provider_type
+                    cls._provider_factories[app_module][klass] = provider_type
+                    lifetime = Lifetime(app_module.lifetimes.get(klass, Lifetime.SINGLETON))
+                    if lifetime is not Lifetime.SINGLETON:
+                        cls._lifetimes[app_module][klass] = lifetime
                     klass.__appmodule_name__ = app_module.app_label
 
                 for export_type in app_module.exports:
-                    dep = cls.get_dep_for_app_module(app_module, export_type)
-                    cls._exports[app_module.app_label][export_type] = dep or export_type
-                    all_providers.append(cls._exports[app_module.app_label][export_type])
+                    cls._export_types[app_module.app_label].add(export_type)
                     export_type.__appmodule_name__ = app_module.app_label
 
             for package_name, app_module in cls._registered.items():
-                find_in_app_modules = {app_module.app_label} | set(app_module.imports)
                 for app_label in app_module.dependencies:
                     if app_label not in all_apps_labels:
                         raise DependencyNotInstalledError(
                             f"Module `{app_module.app_label}` depends on module `{app_label}`"
                         )
-                for dep_type in app_module.providers:
-                    klass = dep_type.klass if isinstance(dep_type, FabricProvider) else dep_type
-                    cls.inject_to_obj(
-                        find_in_app_modules,
-                        cls.get_dep_for_app_module(app_module, klass),
-                        find_in_module=True,
-                    )
+            cls.validate_lifetimes()
 
+            if not (cls.lazy if lazy is None else lazy):
+                cls.resolve_all()
             cls.loaded = True
 
 
@@ -263,6 +450,7 @@ class BaseAppModule(ABC):
             cls.instance.imports = copy(cls.instance.imports)
             cls.instance.exports = copy(cls.instance.exports)
             cls.instance.providers = copy(cls.instance.providers)
+            cls.instance.lifetimes = copy(cls.instance.lifetimes)
         return cls.instance
 
 
@@ -273,6 +461,7 @@ class AppModule(BaseAppModule, metaclass=ModuleManager):
     imports: Sequence[str] = []
     exports: Sequence[type[Any]] = []
     providers: Sequence[type[Any] | FabricProvider] = []
+    lifetimes: dict[type[Any], Lifetime] = {}
     __package_name = None
 
     @property
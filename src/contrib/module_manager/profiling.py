@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+STAGE_IMPORT = "import"
+STAGE_CONSTRUCT = "construct"
+STAGE_INJECT = "inject"
+STAGES = (STAGE_IMPORT, STAGE_CONSTRUCT, STAGE_INJECT)
+
+
+class StartupProfile:
+    """Время загрузки модулей ModuleManager по этапам: импорт module.py, создание и внедрение зависимостей провайдеров
+
+    Notes:
+        Время этапов вложенных провайдеров входит во время создавшего их провайдера (зависимости
+        создаются при внедрении), поэтому сумма по провайдерам может превышать общее время загрузки
+    """
+
+    def __init__(self):
+        self.timings: dict[tuple[str, str], dict[str, float]] = defaultdict(dict)
+
+    @contextmanager
+    def measure(self, stage: str, module: str, name: str = "") -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[(module, name)][stage] = perf_counter() - start
+
+    def by_module(self) -> dict[str, dict[str, float]]:
+        modules: dict[str, dict[str, float]] = defaultdict(lambda: dict.fromkeys(STAGES, 0.0))
+        for (module, _), stages in self.timings.items():
+            for stage, seconds in stages.items():
+                modules[module][stage] += seconds
+        return dict(modules)
+
+    def total(self, stage: str) -> float:
+        return sum(stages.get(stage, 0.0) for stages in self.timings.values())
+
+    def report(self) -> str:
+        header = f"{'module / provider':<60}" + "".join(f"{stage:>12}" for stage in STAGES)
+        lines = [header, "-" * len(header)]
+        providers = sorted(
+            ((module, name, stages) for (module, name), stages in self.timings.items() if name),
+            key=lambda item: (item[0], -sum(item[2].values())),
+        )
+        for module, stages in sorted(self.by_module().items(), key=lambda item: -sum(item[1].values())):
+            lines.append(f"{module:<60}" + "".join(f"{stages[stage] * 1000:>10.1f}ms" for stage in STAGES))
+            for _, name, provider_stages in filter(lambda item: item[0] == module, providers):
+                lines.append(
+                    f"  {name:<58}"
+                    + "".join(f"{provider_stages.get(stage, 0.0) * 1000:>10.1f}ms" for stage in STAGES)
+                )
+        return "\n".join(lines)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from enum import Enum
 from typing import Annotated
 from typing import Any
 from typing import NamedTuple
@@ -8,7 +9,7 @@ from typing import runtime_checkable
 from typing import TypeAlias
 from typing import TypeVar
 
-__all__ = ["Depend", "DependencyInjectorProto"]
+__all__ = ["Depend", "DependencyInjectorProto", "Lifetime"]
 
 _T = TypeVar("_T")
 
@@ -34,3 +35,12 @@ class FabricProvider(NamedTuple):
     klass: type[Any]
     args: tuple[Any, ...] | None = None
     kwargs: dict[str, Any] | None = None
+
+
+class Lifetime(str, Enum):
+    SINGLETON = "singleton"
+    """Один экземпляр на процесс"""
+    REQUEST = "request"
+    """Один экземпляр на запрос, хранится в контексте запроса и освобождается вместе с ним"""
+    TRANSIENT = "transient"
+    """Новый экземпляр при каждом внедрении"""
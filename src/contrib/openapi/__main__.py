@@ -0,0 +1,50 @@
+"""Генерация документа openapi при сборке
+
+Examples:
+    Документ записывается в файл, который сервер читает вместо генерации (`OPENAPI_SCHEMA_FILE`):
+
+    >>> python -m contrib.openapi --output /code/openapi.json
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from time import perf_counter
+
+
+def main() -> int:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "romashka.settings")
+
+    parser = argparse.ArgumentParser(prog="python -m contrib.openapi", description=__doc__.splitlines()[0])
+    parser.add_argument("--output", required=True, help="Путь к файлу документа")
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+
+    from django.urls import get_resolver
+    from django.urls import URLResolver
+
+    from .schema_generators import CustomSchemaGenerator
+
+    patterns = list(get_resolver().url_patterns)
+    while patterns:
+        pattern = patterns.pop(0)
+        if isinstance(pattern, URLResolver):
+            patterns[:0] = pattern.url_patterns
+            continue
+        schema_generator = getattr(pattern.callback, "initkwargs", {}).get("schema_generator")
+        if isinstance(schema_generator, CustomSchemaGenerator):
+            start = perf_counter()
+            schema_generator.write_document(args.output)
+            print(f"{args.output}: generated in {perf_counter() - start:.3f}s")
+            return 0
+
+    print("Schema view with CustomSchemaGenerator not found in urls", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,14 @@ Functions:
 """
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable
 from collections.abc import Sequence
 from functools import wraps
 from typing import Any
 from typing import get_type_hints
 
+from asgiref.sync import sync_to_async
 from contrib.clean_architecture.interfaces import RequestDTO
 from contrib.inspect.services import sequence_type_check
 from contrib.pydantic.model import PydanticModel
@@ -20,6 +22,7 @@ from contrib.pydantic.model import ResultIdDTO
 from django.core.files import File
 from django.http import HttpRequest
 from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from pydantic import BaseModel
 from rest_framework.decorators import action as rest_action
 from rest_framework.permissions import BasePermission
@@ -40,6 +43,9 @@ def _dump_response_model_function(
         response
 
     """
+    if isinstance(response, StreamingHttpResponse):
+        return response
+
     is_response = False
     content_attr = None
     if isinstance(response, (Response, HttpResponse)):
@@ -185,6 +191,9 @@ def action(
         * Если в аргументах функции указан аргумент, типизированный аналогичной моделью `request_model`,
         то в этот аргумент будет помещен экземпляр провалидированной модели тела запроса.
 
+        * Асинхронные (`async def`) методы оборачиваются асинхронной оберткой и выполняются
+        в асинхронном dispatch представления (AsyncCleanViewSetMixin).
+
     Args:
         methods: Список имен HTTP-методов, на которые реагирует это действие. По умолчанию только GET.
         detail: Определяет, применимо ли это действие к запросам экземпляров или коллекций
@@ -237,8 +246,7 @@ def action(
         if not function.__doc__:
             function.__doc__ = description
 
-        @wraps(function)
-        def wrapper(self, request: Request, *args, **kwargs):
+        def prepare_kwargs(request: Request, kwargs: dict[str, Any]) -> dict[str, Any]:
             if request_model is not None and auto_validate:
                 payload = _extract_payload(request, request_model)
                 if payload_attr := _get_payload_attr(hints, request_model):
@@ -249,8 +257,9 @@ def action(
 
             if hints.get("response_schema"):
                 kwargs["response_schema"] = response_schema
+            return kwargs
 
-            result = function(self, request, *args, **kwargs)
+        def prepare_result(request: Request, result: Any) -> Response | HttpResponse:
             if dump_response_model:
                 result = _dump_response_model_function(result, response_schema)
 
@@ -258,7 +267,17 @@ def action(
                 result.status_code = function.status_map[request.method]
             return result
 
-        return wrapper
+        @wraps(function)
+        def wrapper(self, request: Request, *args, **kwargs):
+            result = function(self, request, *args, **prepare_kwargs(request, kwargs))
+            return prepare_result(request, result)
+
+        @wraps(function)
+        async def async_wrapper(self, request: Request, *args, **kwargs):
+            result = await function(self, request, *args, **prepare_kwargs(request, kwargs))
+            return prepare_result(request, result)
+
+        return async_wrapper if inspect.iscoroutinefunction(function) else wrapper
 
     return decorator
 
@@ -267,8 +286,7 @@ def endpoint_permissions(*permissions) -> Callable:
     """Навешивает разрешения на декорируемую функцию"""
 
     def decorator(endpoint: Callable) -> Callable:
-        @wraps(endpoint)
-        def wrapped(self, request: HttpRequest, *args, **kwargs):
+        def check_permissions(self, request: HttpRequest):
             for permission_class in permissions:
                 permission = permission_class()
                 if not permission.has_permission(request, self):
@@ -278,8 +296,16 @@ def endpoint_permissions(*permissions) -> Callable:
                         code=getattr(permission, "code", None),
                     )
 
+        @wraps(endpoint)
+        def wrapped(self, request: HttpRequest, *args, **kwargs):
+            check_permissions(self, request)
             return endpoint(self, request, *args, **kwargs)
 
-        return wrapped
+        @wraps(endpoint)
+        async def async_wrapped(self, request: HttpRequest, *args, **kwargs):
+            await sync_to_async(check_permissions)(self, request)
+            return await endpoint(self, request, *args, **kwargs)
+
+        return async_wrapped if inspect.iscoroutinefunction(endpoint) else wrapped
 
     return decorator
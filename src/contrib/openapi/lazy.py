@@ -0,0 +1,47 @@
+"""Модуль с ленивым генератором схемы представления
+
+Notes:
+    `contrib.openapi.views` загружает генераторы схем pydantic, рендереры и инспекторы DRF.
+    Представления создают генератор схемы при объявлении класса, поэтому без ленивой обертки
+    весь модуль загружался бы при импорте любого представления, даже если документация не запрашивается
+
+Classes:
+    LazyAutoSchema: Дескриптор схемы представления, создающий AutoSchema при первом обращении
+
+"""
+from __future__ import annotations
+
+from typing import Any
+
+
+class LazyAutoSchema:
+    """Дескриптор схемы представления, создающий AutoSchema при первом обращении
+
+    Examples:
+        >>> class FooViewSet(CleanViewSet):
+        >>>     schema = LazyAutoSchema(tags=["foo"], operation_id_base="Foo")
+        >>> FooViewSet.schema  # AutoSchema
+    """
+
+    def __init__(self, **kwargs: Any):
+        """
+
+        Args:
+            **kwargs: Аргументы AutoSchema
+        """
+        self.kwargs = kwargs
+        self._schema = None
+
+    def get_schema(self):
+        """Возвращает AutoSchema, создавая его при первом обращении"""
+        if self._schema is None:
+            from contrib.openapi.views import AutoSchema
+
+            self._schema = AutoSchema(**self.kwargs)
+        return self._schema
+
+    def __get__(self, instance, owner):
+        return self.get_schema().__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self.get_schema().__set__(instance, value)
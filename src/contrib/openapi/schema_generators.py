@@ -1,13 +1,57 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from threading import Lock
+from typing import Any
+from urllib.parse import urljoin
+from weakref import WeakSet
+
+from contrib.exceptions.bases import HTTPExceptionManager
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.http import Http404
 from rest_framework import exceptions
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.schemas.openapi import SchemaGenerator
 
+_SCHEMAS_REF_PREFIX = "#/components/schemas/"
+
+_generators: WeakSet[CustomSchemaGenerator] = WeakSet()
+
+
+def _collect_refs(value: Any, refs: set[str]) -> None:
+    """Рекурсивно собирает имена схем из ссылок `$ref`"""
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_SCHEMAS_REF_PREFIX):
+            refs.add(ref[len(_SCHEMAS_REF_PREFIX) :])
+        for item in value.values():
+            _collect_refs(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_refs(item, refs)
+
 
 class CustomSchemaGenerator(SchemaGenerator):
+    def __init__(self, *args, schema_file: str = None, **kwargs):
+        """
+
+        Args:
+            *args: Позиционные аргументы SchemaGenerator
+            schema_file: Путь к файлу с документом, сгенерированным при сборке (`python -m contrib.openapi`)
+            **kwargs: Именованные аргументы SchemaGenerator
+        """
+        super().__init__(*args, **kwargs)
+        self.schema_file = schema_file
+        self._document: dict[str, Any] | None = None
+        self._version: str | None = None
+        self._document_mtime: float | None = None
+        self._lock = Lock()
+        _generators.add(self)
+
     def has_view_permissions(self, path, method, view):
         """
         Return `True` if the incoming request has the correct view permissions.
@@ -20,3 +64,154 @@ class CustomSchemaGenerator(SchemaGenerator):
         except (exceptions.APIException, Http404, PermissionDenied):
             return False
         return True
+
+    def build_document(self) -> dict[str, Any]:
+        """Генерирует полный документ openapi со всеми endpoints и схемами ошибок"""
+        schema = self.get_schema(request=None, public=True)
+
+        errors_components = {}
+        for error in HTTPExceptionManager.get_objects():
+            error_schema = error.get_schema()
+            errors_components.setdefault(error.__name__, error_schema)
+            for item_name, def_item in error_schema.pop("$defs", {}).items():
+                errors_components.setdefault(item_name, def_item)
+
+        if schema.get("components"):
+            schema["components"]["schemas"].update(errors_components)
+            schema["components"]["securitySchemes"] = {
+                "Token Auth": {
+                    "type": "apiKey",
+                    "name": "Authorization",
+                    "in": "header",
+                }
+            }
+        schema["paths"] = {path: methods for path, methods in sorted(schema["paths"].items(), key=lambda x: x[0])}
+        return schema
+
+    def write_document(self, path: str) -> None:
+        """Записывает сгенерированный документ в файл
+
+        Args:
+            path: Путь к файлу
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.build_document(), file, ensure_ascii=False, default=str)
+
+    def get_document(self) -> tuple[dict[str, Any], str]:
+        """Возвращает полный документ openapi и его версию
+
+        Notes:
+            Документ генерируется (или читается из `schema_file`) один раз на процесс. Документ из файла
+            перечитывается, если файл изменился, сгенерированный - после `clear_document`
+            или изменения настроек (`override_settings`)
+
+        Returns:
+            Документ и хэш его содержимого
+        """
+        if self._document is None or self._document_mtime != self._get_schema_file_mtime():
+            with self._lock:
+                mtime = self._get_schema_file_mtime()
+                if self._document is None or self._document_mtime != mtime:
+                    if mtime is not None:
+                        with open(self.schema_file, encoding="utf-8") as file:
+                            document = json.load(file)
+                    else:
+                        document = self.build_document()
+                    content = json.dumps(document, ensure_ascii=False, default=str)
+                    self._version = hashlib.sha256(content.encode()).hexdigest()[:32]
+                    self._document_mtime = mtime
+                    self._document = document
+        return self._document, self._version
+
+    def clear_document(self) -> None:
+        """Сбрасывает закэшированный документ, следующий запрос сгенерирует его заново"""
+        with self._lock:
+            self._document = None
+            self._version = None
+            self._document_mtime = None
+
+    def _get_schema_file_mtime(self) -> float | None:
+        """Возвращает время изменения файла документа или None, если файла нет"""
+        if not self.schema_file:
+            return None
+        try:
+            return os.stat(self.schema_file).st_mtime
+        except OSError:
+            return None
+
+    def get_allowed_operations(self, request) -> set[tuple[str, str]]:
+        """Возвращает операции, доступные пользователю запроса
+
+        Args:
+            request: Запрос
+
+        Returns:
+            Множество вида {(путь в документе, метод)}
+        """
+        self._initialise_endpoints()
+        _, view_endpoints = self._get_paths_and_endpoints(request)
+
+        allowed = set()
+        for path, method, view in view_endpoints:
+            if not self.has_view_permissions(path, method, view):
+                continue
+            # Путь нормализуется так же, как в SchemaGenerator.get_schema
+            if path.startswith("/"):
+                path = path[1:]
+            allowed.add((urljoin(self.url or "/", path), method.lower()))
+        return allowed
+
+    def get_request_document(self, request, public: bool = False) -> tuple[dict[str, Any], str]:
+        """Возвращает документ openapi для запроса
+
+        Notes:
+            Из закэшированного документа исключаются операции, недоступные пользователю,
+            и схемы, на которые ссылались только они. Проверка разрешений не генерирует схемы заново
+
+        Args:
+            request: Запрос
+            public: Вернуть документ без проверки разрешений
+
+        Returns:
+            Документ и его версия
+        """
+        document, version = self.get_document()
+        if public or request is None or settings.DEBUG:
+            return document, version
+
+        allowed = self.get_allowed_operations(request)
+        paths = {}
+        excluded = 0
+        for path, methods in document["paths"].items():
+            operations = {method: operation for method, operation in methods.items() if (path, method) in allowed}
+            excluded += len(methods) - len(operations)
+            if operations:
+                paths[path] = operations
+        if not excluded:
+            return document, version
+
+        filtered = {**document, "paths": paths}
+        if "schemas" in document.get("components", {}):
+            schemas = document["components"]["schemas"]
+            refs: set[str] = set()
+            _collect_refs(paths, refs)
+            stack = list(refs)
+            while stack:
+                nested: set[str] = set()
+                _collect_refs(schemas.get(stack.pop()), nested)
+                stack.extend(nested - refs)
+                refs |= nested
+            filtered["components"] = {
+                **document["components"],
+                "schemas": {name: schema for name, schema in schemas.items() if name in refs},
+            }
+
+        operations_hash = hashlib.sha256(repr(sorted(allowed)).encode()).hexdigest()[:8]
+        return filtered, f"{version}-{operations_hash}"
+
+
+@receiver(setting_changed, dispatch_uid="openapi_clear_documents")
+def _clear_documents(**kwargs) -> None:
+    """Сбрасывает документы openapi при изменении настроек"""
+    for schema_generator in list(_generators):
+        schema_generator.clear_document()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from contrib.openapi.schema_generators import CustomSchemaGenerator
 from contrib.openapi.views import SchemaView
+from django.conf import settings
 from rest_framework.settings import api_settings
 
 
@@ -17,6 +18,7 @@ def get_schema_view(
     authentication_classes=api_settings.DEFAULT_AUTHENTICATION_CLASSES,
     permission_classes=api_settings.DEFAULT_PERMISSION_CLASSES,
     version=None,
+    schema_file=None,
 ):
     if generator_class is None:
         generator_class = CustomSchemaGenerator
@@ -28,6 +30,7 @@ def get_schema_view(
         urlconf=urlconf,
         patterns=patterns,
         version=version,
+        schema_file=schema_file or getattr(settings, "OPENAPI_SCHEMA_FILE", None),
     )
     return SchemaView.as_view(
         renderer_classes=renderer_classes,
@@ -7,13 +7,13 @@ from typing import Any
 from typing import Literal
 
 from contrib.clean_architecture.utils.names import to_pascale_case
-from contrib.exceptions.bases import HTTPExceptionManager
 from contrib.pydantic.schema_generator import AdaptedGenerateJsonSchema
 from django.shortcuts import render
 from django.utils.encoding import smart_str
+from django.utils.http import parse_etags
+from django.utils.translation import get_language
 from pydantic import BaseModel
 from pydantic_core import PydanticUndefined
-from rest_framework import exceptions
 from rest_framework import renderers
 from rest_framework import status
 from rest_framework.permissions import AllowAny
@@ -317,29 +317,15 @@ class SchemaView(APIView):
                 self.renderer_classes += [renderers.BrowsableAPIRenderer]
 
     def get(self, request, *args, **kwargs):
-        schema = self.schema_generator.get_schema(request, self.public)
-
-        errors_components = {}
-        for error in HTTPExceptionManager.get_objects():
-            error_schema = error.get_schema()
-            errors_components.setdefault(error.__name__, error_schema)
-            for item_name, def_item in error_schema.pop("$defs", {}).items():
-                errors_components.setdefault(item_name, def_item)
-
-        if schema is None:
-            raise exceptions.PermissionDenied()
-
-        if schema.get("components"):
-            schema["components"]["schemas"].update(errors_components)
-            schema["components"]["securitySchemes"] = {
-                "Token Auth": {
-                    "type": "apiKey",
-                    "name": "Authorization",
-                    "in": "header",
-                }
-            }
-        schema["paths"] = {path: methods for path, methods in sorted(schema["paths"].items(), key=lambda x: x[0])}
-        return Response(schema)
+        # Документ генерируется один раз на процесс, запрос только отфильтровывает недоступные операции
+        schema, version = self.schema_generator.get_request_document(request, self.public)
+
+        # Переводы заголовков зависят от языка запроса
+        etag = f'"{version}-{get_language()}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Language"}
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(schema, headers=headers)
 
     def handle_exception(self, exc):
         self.renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES
@@ -0,0 +1,73 @@
+"""Замер времени короткой команды manage.py с отложенной сборкой моделей pydantic и без нее
+
+Examples:
+    Сравнение `manage.py check` в отдельных процессах:
+
+    >>> python -m contrib.pydantic --repeat 5
+
+    Другая команда и количество отложенных моделей после ее загрузки:
+
+    >>> python -m contrib.pydantic --command showmigrations --deferred
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+
+_MANAGE_PY = Path(__file__).resolve().parents[2] / "manage.py"
+
+
+def _run_command(command: list[str], defer_build: bool) -> float:
+    env = {**os.environ, "DJANGO_PYDANTIC_DEFER_BUILD": str(defer_build)}
+    start = perf_counter()
+    subprocess.run([sys.executable, str(_MANAGE_PY), *command], check=True, capture_output=True, env=env)
+    return perf_counter() - start
+
+
+def _print_deferred() -> None:
+    import django
+
+    django.setup()
+
+    from .model import build_deferred_models
+    from .model import get_deferred_models
+
+    print(f"deferred models: {len(get_deferred_models())}")
+    start = perf_counter()
+    built = build_deferred_models()
+    print(f"built on warm up: {built} in {perf_counter() - start:.3f}s")
+
+
+def main() -> int:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "romashka.settings")
+
+    parser = argparse.ArgumentParser(prog="python -m contrib.pydantic", description=__doc__.splitlines()[0])
+    parser.add_argument("--command", nargs="+", default=["check"], help="Команда manage.py и ее аргументы")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество процессов для каждого режима")
+    parser.add_argument("--deferred", action="store_true", help="Количество и время сборки отложенных моделей")
+    args = parser.parse_args()
+
+    medians = {}
+    for defer_build in (False, True):
+        values = [_run_command(args.command, defer_build) for _ in range(args.repeat)]
+        medians[defer_build] = statistics.median(values)
+        print(
+            f"{'deferred' if defer_build else 'eager':>8}: median {medians[defer_build]:.3f}s, "
+            f"min {min(values):.3f}s, max {max(values):.3f}s"
+        )
+
+    reduction = 1 - medians[True] / medians[False]
+    print(f"reduction: {(medians[False] - medians[True]) * 1000:.0f}ms ({reduction:.0%})")
+
+    if args.deferred:
+        _print_deferred()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
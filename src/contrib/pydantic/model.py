@@ -16,19 +16,37 @@ Classes:
     OrderByMixin: DTO сортировки
     FilterQueryDTO: DTO фильтрации
     SearchQueryDTO: DTO поиска
+    AutocompleteQueryDTO: DTO запроса автодополнения
     ExportXLSQueryDTO: DTO запроса экспорта xls
     ExportXLSResponseDTO: DTO ответа экспорта xls
+    ExportStreamResponseDTO: DTO ответа потокового экспорта
+    ExportJobDTO: DTO фоновой задачи экспорта
+    BulkUpsertResultDTO: DTO результата массовой вставки / обновления
     ValidationErrorItemDTO: DTO ошибки валидации
     ResultIdDTO: DTO ответа с id
 
+## Отложенная сборка моделей
+
+Notes:
+    При `PYDANTIC_DEFER_BUILD` схемы, валидаторы и сериализаторы моделей собираются не при импорте,
+    а при первом использовании модели. Отложенные модели регистрируются, чтобы сервер мог собрать их
+    заранее (`build_deferred_models`), а короткие команды (`manage.py check`, миграции) не тратили на это время
+
+Functions:
+    register_deferred_model: Регистрирует модель, сборка которой отложена
+    get_deferred_models: Возвращает еще не собранные отложенные модели
+    build_deferred_models: Собирает отложенные модели
+
 """
 from __future__ import annotations
 
+import logging
 import sys
 from math import ceil
 from typing import Any
 from typing import ClassVar
 from typing import Literal
+from weakref import WeakSet
 
 from django.conf import settings
 from contrib.clean_architecture.dto_based_objects.fields import NestedEntity
@@ -42,10 +60,58 @@ from contrib.subclass_control.mixins import ImportedStringAttrsMixin
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PydanticUndefinedAnnotation
+from pydantic import PydanticUserError
 from pydantic._internal._model_construction import ModelMetaclass
 from pydantic.fields import FieldInfo
 
 
+logger = logging.getLogger(__name__)
+
+_deferred_models: WeakSet[type[BaseModel]] = WeakSet()
+"""Модели, сборка которых отложена до первого использования"""
+
+
+def register_deferred_model(model: type[BaseModel]) -> None:
+    """Регистрирует модель, сборка которой отложена
+
+    Args:
+        model: Модель
+    """
+    if not model.__pydantic_complete__:
+        _deferred_models.add(model)
+
+
+def get_deferred_models() -> list[type[BaseModel]]:
+    """Возвращает еще не собранные отложенные модели
+
+    Returns:
+        Список моделей
+    """
+    return [model for model in list(_deferred_models) if not model.__pydantic_complete__]
+
+
+def build_deferred_models() -> int:
+    """Собирает отложенные модели
+
+    Notes:
+        Модель, которую не удалось собрать (например, из-за неразрешенной аннотации),
+        пропускается и будет собрана при первом использовании
+
+    Returns:
+        Количество собранных моделей
+    """
+    built = 0
+    for model in get_deferred_models():
+        try:
+            model.model_rebuild()
+        except (PydanticUndefinedAnnotation, PydanticUserError):
+            logger.debug("Model %s can not be built", model.__qualname__, exc_info=True)
+        else:
+            built += 1
+    return built
+
+
 class PydanticIgnore:
     pass
 
@@ -55,6 +121,8 @@ class PaginatedModel(BaseModel):
 
     __is_paginated_model__: ClassVar[bool] = True
 
+    model_config = ConfigDict(defer_build=getattr(settings, "PYDANTIC_DEFER_BUILD", True))
+
     current_page: int = Field(title=_("Текущая страница"))
     """Текущая страница"""
     max_pages: int = Field(title=_("Количество страниц"))
@@ -103,6 +171,7 @@ class PaginatedModel(BaseModel):
         new_class = type(name, bases, attrs)
 
         setattr(sys.modules[new_class.__module__], name, new_class)
+        register_deferred_model(new_class)
 
         return new_class
 
@@ -172,6 +241,7 @@ class PydanticModelMeta(ImportedStringAttrsMixin, ModelMetaclass):
 
         # Создаем новый класс
         cls: type = super().__new__(mcs, name, bases, attrs, **kwargs)
+        register_deferred_model(cls)
 
         # Добавляем класс пагинации
         if with_paginated:
@@ -204,6 +274,7 @@ class PydanticModel(ExtendedAttrsMixin, BaseModel, metaclass=PydanticModelMeta):
         arbitrary_types_allowed=True,
         validate_default=True,
         ignored_types=(NestedEntity, PydanticIgnore),
+        defer_build=getattr(settings, "PYDANTIC_DEFER_BUILD", True),
     )
 
     paginated: ClassVar[type[PaginatedModel] | None] = None
@@ -406,11 +477,19 @@ class SearchQueryDTO(SearchMixin, FilterQueryDTO):
     """DTO поиска"""
 
 
+class AutocompleteQueryDTO(SearchMixin, request_model=True):
+    """DTO запроса автодополнения"""
+
+    limit: int = Field(title=_("Количество записей в выборке"), default=10, ge=1, le=50)
+
+
 class ExportXLSQueryDTO(PydanticModel, request_model=True):
     """DTO запроса экспорта xls"""
 
     ids: list[int] | None = Field(title=_("ID объектов"), default=None)
     fields: list[str] = Field(title=_("Список полей для экспорта"), default_factory=list)
+    file_format: Literal["xls", "csv"] = Field(title=_("Формат файла"), default="xls")
+    background: bool = Field(title=_("Выполнить экспорт в фоне и вернуть задачу"), default=False)
 
 
 class ExportXLSResponseDTO(PydanticModel):
@@ -420,6 +499,31 @@ class ExportXLSResponseDTO(PydanticModel):
     file_name: str
 
 
+class ExportStreamResponseDTO(PydanticModel):
+    """DTO ответа потокового экспорта"""
+
+    file_content: Any
+    """Итерируемый объект с частями файла в байтах"""
+    file_name: str
+    file_extension: str
+    content_type: str
+
+
+class ExportJobDTO(PydanticModel, response_model=True):
+    """DTO фоновой задачи экспорта"""
+
+    job_id: str = Field(title=_("ID задачи"))
+    status: Literal["pending", "done", "failed"] = Field(title=_("Статус задачи"))
+    url: str | None = Field(title=_("URL файла"), default=None)
+
+
+class BulkUpsertResultDTO(PydanticModel, response_model=True):
+    """DTO результата массовой вставки / обновления"""
+
+    created: int = Field(title=_("Создано записей"))
+    updated: int = Field(title=_("Обновлено записей"))
+
+
 class ValidationErrorItemDTO(PydanticModel):
     """DTO ошибки валидации"""
 
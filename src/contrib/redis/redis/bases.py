@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import TYPE_CHECKING
 
-import redis
 from config.redis import redis_pool
 from contrib.redis.bases import BaseRedisClient
 from contrib.redis.bases import BaseRedisManager
@@ -10,9 +10,14 @@ from contrib.redis.types import RedisName
 from contrib.redis.utils import redis_decode
 from contrib.redis.utils import redis_encode
 
+if TYPE_CHECKING:
+    import redis
+
 
 class RedisClient(BaseRedisClient):
     def get_client(self, *args, **kwargs) -> redis.Redis:
+        import redis
+
         return redis.Redis(*args, **kwargs)
 
     def expire(self, name: RedisName, expire_time: int = None, **kwargs) -> None:
@@ -21,11 +21,11 @@ from contrib.rest.exceptions import RestRequestException
 from contrib.rest.schemas import RestMethodResponse
 from contrib.rest.schemas import RestRedirectMixin
 from contrib.subclass_control.mixins import SingletonMixin
-from requests import Response
-from requests import Session
-from requests.cookies import cookiejar_from_dict
 
 if TYPE_CHECKING:
+    from requests import Response
+    from requests import Session
+
     from contrib.rest.method import RestMethod
     from contrib.rest.models import RestLog
 
@@ -83,6 +83,10 @@ class RestClient(SingletonMixin, IRestClient, ABC, singleton_args=("config",)):
             self._authenticate(raise_exceptions=False)
 
     def __init_client__(self):
+        # requests загружается при создании первого клиента, а не при импорте сервисов
+        from requests import Session
+        from requests.cookies import cookiejar_from_dict
+
         session = Session()
         session.headers = self.config.HEADERS
         session.proxies = self.config.PROXIES
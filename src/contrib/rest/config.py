@@ -5,8 +5,6 @@ from typing import Any
 
 from appconf import AppConf
 from contrib.rest.enums import TokenTypes
-from requests.hooks import default_hooks
-from requests.models import DEFAULT_REDIRECT_LIMIT
 
 
 class RestConfig(AppConf):
@@ -37,7 +35,7 @@ class RestConfig(AppConf):
     # Прокси
     PROXIES: dict[str, str] = {}
     # Прокси
-    HOOKS: dict[str, str] = default_hooks()
+    HOOKS: dict[str, str] = {"response": []}  # requests.hooks.default_hooks(), без импорта requests
     # Прокси
     PARAMS: dict[str, Any] = {}
     # Стримить контент
@@ -47,7 +45,7 @@ class RestConfig(AppConf):
     # Путь до сертификата
     CERT: str = None
     # Максимальное количество редиректов
-    MAX_REDIRECTS: int = DEFAULT_REDIRECT_LIMIT
+    MAX_REDIRECTS: int = 30  # requests.models.DEFAULT_REDIRECT_LIMIT
     # Куки
     COOKIES: dict[str, str] = {}
 
@@ -5,14 +5,16 @@ from functools import cached_property
 from json import JSONDecodeError
 from typing import ClassVar
 from typing import Generic
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
-import xmltodict
 from contrib.pydantic.model import PydanticModel
 from pydantic import Field
 from pydantic import HttpUrl
 from pydantic import model_validator
-from requests import Response
+
+if TYPE_CHECKING:
+    from requests import Response
 
 DataType = TypeVar("DataType")
 
@@ -82,6 +84,8 @@ class XmlResponse(RestMethodResponse[DataType], RestDataMixin[DataType], Generic
         if isinstance(response, dict):
             return response
 
+        import xmltodict
+
         data = None
         try:
             data = xmltodict.parse(response.content)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import TYPE_CHECKING
 from typing import TypedDict
 
-from requests.auth import AuthBase
+if TYPE_CHECKING:
+    from requests.auth import AuthBase
 
 MERGED_REQUEST_KWARGS = {
     "paths",
@@ -7,8 +7,11 @@ from contrib.clean_architecture.providers.repositories.interfaces import (
     IRetrieveRepositoryMixin,
     ICreateRepositoryMixin,
     IDetailByPKRepositoryMixin,
+    IExportRepositoryMixin,
 )
 
 
-class IOrderRepository(IDetailByPKRepositoryMixin, IRetrieveRepositoryMixin, ICreateRepositoryMixin, IRepository, ABC):
+class IOrderRepository(
+    IDetailByPKRepositoryMixin, IRetrieveRepositoryMixin, ICreateRepositoryMixin, IExportRepositoryMixin, IRepository, ABC
+):
     """Репозиторий заказа."""
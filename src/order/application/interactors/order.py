@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import string
 import random
+from datetime import datetime
 
-from contrib.clean_architecture.providers.interactors.bases import Interactor, RetrieveInteractorMixin
+from django.utils.translation import gettext as _
+
+from contrib.clean_architecture.providers.interactors.bases import Interactor, RetrieveInteractorMixin, \
+    ExportXLSInteractorMixin
+from contrib.clean_architecture.providers.interactors.utils import export_formatter
 
 from contrib.module_manager import Depend
 from order.application.boundaries.dtos import OrderCreateDTO, OrderCreateResultDTO
@@ -14,13 +19,20 @@ from catalog.application.boundaries.repositories import IProductRepository
 from order.application.domain.entities import OrderItemEntity, OrderEntity
 
 
-class OrderInteractor(RetrieveInteractorMixin, Interactor):
+def _format_datetime(value: datetime | None) -> str:
+    return value.strftime("%d.%m.%Y %H:%M") if value else ""
+
+
+class OrderInteractor(ExportXLSInteractorMixin, RetrieveInteractorMixin, Interactor):
 
     repository: Depend[IOrderRepository]
     status_repository: Depend[IOrderStatusRepository]
     order_item_repository: Depend[IOrderItemRepository]
     product_repository: Depend[IProductRepository]
 
+    xls_file_name = _("Заказы")
+    xls_sheet_name = _("Заказы")
+
     def create(self, dto: OrderCreateDTO, *args, **kwargs) -> int:
 
         products = self.product_repository.retrieve()
@@ -62,3 +74,21 @@ class OrderInteractor(RetrieveInteractorMixin, Interactor):
         order = self.repository.detail_by_pk(order_id)
 
         return OrderCreateResultDTO(hash=order.hash)
+
+    def _get_fields_mapping(self) -> dict[str, str]:
+        return {
+            "id": _("Номер"),
+            "created_at": _("Дата и время создания"),
+            "status": _("Статус"),
+            "total": _("Итог"),
+            "delivery_address": _("Адрес доставки"),
+            "delivery_time": _("Время доставки"),
+            "additional_info": _("Пожелания"),
+            "hash": _("Хэш"),
+        }
+
+    def _formatter_mapping(self):
+        return {
+            "created_at": export_formatter("created_at")(_format_datetime),
+            "status": export_formatter("status__name")(str),
+        }
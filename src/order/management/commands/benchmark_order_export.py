@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import csv
+import io
+from decimal import Decimal
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from contrib.module_manager import get_app_module
+from order.application.interactors import OrderInteractor
+from order.models import Order, OrderStatus
+
+
+class Command(BaseCommand):
+    help = (
+        "Замеряет время экспорта заказов в csv через объекты и через values_list. "
+        "Тестовые заказы создаются в транзакции, которая откатывается после замера"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000, help="Количество создаваемых заказов")
+        parser.add_argument("--repeat", type=int, default=3, help="Количество замеров каждого режима")
+        parser.add_argument("--fields", nargs="*", help="Поля экспорта. По умолчанию все поля")
+
+    def handle(self, *args, rows: int, repeat: int, fields: list[str] | None = None, **options):
+        interactor: OrderInteractor = get_app_module("order").get_service_instance(OrderInteractor)
+
+        with transaction.atomic():
+            self._create_orders(rows)
+            for export_values in (False, True):
+                interactor.export_values = export_values
+                timings = [self._export(interactor, fields) for _ in range(repeat)]
+                best, size, exported = min(timings)
+                self.stdout.write(
+                    f"{'values_list' if export_values else 'objects':>11}: "
+                    f"best {best:.2f}s, {exported:,} rows, {exported / best:,.0f} rows/s, {size / 1024 / 1024:.1f} MiB"
+                )
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _create_orders(rows: int):
+        status, _ = OrderStatus.objects.get_or_create(name="Benchmark", defaults={"is_default": False})
+        Order.objects.bulk_create(
+            (
+                Order(
+                    status=status,
+                    hash=f"benchmark:{index}",
+                    total=Decimal(index % 10_000) / 100,
+                    delivery_address=f"ул. Тестовая, д. {index % 200}",
+                    delivery_time="12:00",
+                    additional_info="",
+                )
+                for index in range(rows)
+            ),
+            batch_size=5_000,
+        )
+
+    @staticmethod
+    def _export(interactor: OrderInteractor, fields: list[str] | None) -> tuple[float, int, int]:
+        """Возвращает время экспорта, размер файла и количество выгруженных строк без заголовка"""
+        start = perf_counter()
+        result = interactor.export_csv(fields=fields or [])
+        chunks = list(result.file_content)
+        duration = perf_counter() - start
+
+        content = io.StringIO(b"".join(chunks).decode("utf-8-sig"), newline="")
+        exported = sum(1 for _ in csv.reader(content)) - 1
+        return duration, sum(len(chunk) for chunk in chunks), exported
@@ -0,0 +1,53 @@
+"""Конфигурация gunicorn для production
+
+Notes:
+    Приложение загружается и прогревается в master процессе до fork воркеров (`preload_app`),
+    воркеры стартуют прогретыми и разделяют страницы памяти master процесса (copy-on-write).
+
+    Запуск: `gunicorn -c python:romashka.gunicorn_conf`
+
+"""
+import gc
+import multiprocessing
+import os
+
+wsgi_app = "romashka.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 1))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+preload_app = True
+# Перезапущенный воркер тоже создается fork прогретого master процесса
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+warm_up = os.environ.get("GUNICORN_WARM_UP", "True") == "True"
+
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    # Сборщик мусора не должен освобождать память между прогретыми объектами master процесса
+    if warm_up:
+        gc.disable()
+
+
+def when_ready(server):
+    if not warm_up:
+        return
+
+    from contrib.django.warmup import freeze_gc
+    from contrib.django.warmup import warm_up as warm_up_process
+
+    timings = warm_up_process()
+    freeze_gc()
+    server.log.info("Warm up finished in %.3fs", sum(timings.values()))
+
+
+def post_fork(server, worker):
+    if warm_up:
+        gc.enable()
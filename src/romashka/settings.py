@@ -18,12 +18,14 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     "whitenoise.runserver_nostatic",
     'corsheaders',
+    'contrib.imports',
     'catalog',
     'order',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'contrib.django.media.MediaMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -32,6 +34,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'contrib.context.middleware.ContextMiddleware',
+    'contrib.django.admission.AdmissionMiddleware',
 ]
 
 ROOT_URLCONF = 'romashka.urls'
@@ -57,6 +60,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'romashka.wsgi.application'
+ASGI_APPLICATION = 'romashka.asgi.application'
 
 DATABASES = {
     'default': {
@@ -96,6 +100,8 @@ LOCALE_LAZY_GETTEXT_SERVICE = "django.utils.translation.gettext_lazy"
 DEFAULT_PYDANTIC_REQUEST_MODEL_MIXIN = "contrib.pydantic.mixins.django.model.DjangoRequestModelMixin"
 DEFAULT_PYDANTIC_RESPONSE_MODEL_MIXIN = "contrib.pydantic.mixins.django.model.DjangoResponseModelMixin"
 DEFAULT_PYDANTIC_PROXY_MODEL_MIXIN = "contrib.pydantic.mixins.django.model.DjangoProxyModelMixin"
+# Собирать модели pydantic при первом использовании, а не при импорте (сервер собирает их при прогреве)
+PYDANTIC_DEFER_BUILD = os.environ.get('DJANGO_PYDANTIC_DEFER_BUILD', 'True') == 'True'
 
 EXTERNAL_CODE_MODEL = None
 
@@ -112,6 +118,18 @@ STATICFILES_DIRS = [
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+MEDIA_MAX_AGE = 3600
+MEDIA_IMMUTABLE_MAX_AGE = 31536000
+MEDIA_SENDFILE_HEADER = os.environ.get('DJANGO_MEDIA_SENDFILE_HEADER')  # например X-Accel-Redirect для nginx
+
+# Результаты фонового экспорта (contrib.django.exports) хранятся вне MEDIA_ROOT и отдаются после проверки владельца
+EXPORTS_ROOT = os.environ.get('DJANGO_EXPORTS_ROOT', os.path.join(BASE_DIR, 'exports'))
+EXPORTS_TTL = 86400
+
+STORAGES = {
+    "default": {"BACKEND": "contrib.django.media.HashedFileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
 
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # для Vite/Vue
@@ -121,6 +139,23 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
+# Общий для всех процессов кэш: общие лимиты contrib.django.admission, троттлинг.
+# Без DJANGO_REDIS_URL используется кэш процесса, общие лимиты действуют как лимиты процесса
+REDIS_URL = os.environ.get('DJANGO_REDIS_URL')
+if REDIS_URL:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}}
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Ограничение одновременных запросов к тяжелым эндпоинтам (contrib.django.admission)
+ADMISSION_RETRY_AFTER = 5
+ADMISSION_METRICS_TOKEN = os.environ.get('DJANGO_ADMISSION_METRICS_TOKEN')
+ADMISSION_TRUSTED_PROXIES = [ip for ip in os.environ.get('DJANGO_TRUSTED_PROXIES', '').split(',') if ip]
+INTERNAL_IPS = os.environ.get('DJANGO_INTERNAL_IPS', '127.0.0.1').split(',')
+
+# Документ openapi, сгенерированный при сборке: python -m contrib.openapi --output <путь>
+OPENAPI_SCHEMA_FILE = os.environ.get('DJANGO_OPENAPI_SCHEMA_FILE')
+
 PROJECT_URL = "http://192.168.1.115:8000"
 
 from .local_settings import *
@@ -4,12 +4,10 @@ from django.contrib import admin
 from django.urls import path, include
 
 from rest_framework.renderers import OpenAPIRenderer
+from contrib.django.admission import metrics_view
 from contrib.openapi.utils import get_schema_view
 from contrib.openapi.views import swagger_view
 
-from django.conf.urls.static import static
-from django.conf import settings
-
 
 openapi_schema_urls = [
     path(r"api/", include("catalog.api.urls")),
@@ -27,6 +25,7 @@ schema_urlpatterns = [
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path("metrics/admission", metrics_view, name="admission-metrics"),
     path("api/schema/", (schema_urlpatterns, "api-v1-schema", "api-v1-schema")),
     path(
         "api/schema/docs/",
@@ -37,5 +36,3 @@ urlpatterns = [
 ]
 
 urlpatterns += openapi_schema_urls
-
-urlpatterns.extend(static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT))